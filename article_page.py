@@ -0,0 +1,443 @@
+"""
+文章页面抓取（单次下载 + 单次解析）
+
+日期校正（fetcher.enrich_article_dates）与 LLM 正文上下文（translator）共用：
+每个 URL 只下载一次、用 BeautifulSoup 解析一次，同时得到
+  - published_date  页面发布时间（YYYY-MM-DD）
+  - canonical_url   <link rel="canonical"> / og:url，缺省为跳转后的最终 URL
+  - body_snippet    正文前 500 字
+
+结果写入 data/page_cache/（内容寻址）：
+  urls/<sha256(url)>.json      → 抓取状态 + 页面内容摘要
+  pages/<sha256(content)>.json → 解析结果（内容相同的页面只存一份）
+TTL 内重跑、retranslate 均直接读缓存，不再访问源站。
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+import http_session
+from config import PAGE_CACHE_DIR, PAGE_CACHE_TTL_DAYS, PAGE_CACHE_NEGATIVE_TTL_HOURS
+from rate_limit import get_limiter
+
+logger = logging.getLogger(__name__)
+
+_PAGE_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html",
+    "Accept-Language": "en-US,en;q=0.9,zh-CN;q=0.8,zh;q=0.7,ja;q=0.6,ko;q=0.5",
+}
+
+BODY_SNIPPET_LEN = 500
+
+
+@dataclass
+class ArticlePage:
+    """一次页面抓取的解析结果。status=0 表示网络失败。"""
+    url: str
+    status: int = 0
+    final_url: str = ""
+    canonical_url: str = ""
+    published_date: Optional[str] = None
+    body_snippet: str = ""
+    fetched_at: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 400
+
+
+# ─── 内容寻址磁盘缓存 ─────────────────────────────────────────────────
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _atomic_write_json(path: Path, payload: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+class PageCache:
+    """URL → 内容摘要 → 解析结果 的两级磁盘缓存，带 TTL。"""
+
+    def __init__(self, root: str = PAGE_CACHE_DIR,
+                 ttl_days: float = PAGE_CACHE_TTL_DAYS,
+                 negative_ttl_hours: float = PAGE_CACHE_NEGATIVE_TTL_HOURS):
+        self.root = Path(root)
+        self.ttl = ttl_days * 86400
+        self.negative_ttl = negative_ttl_hours * 3600
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _url_path(self, url: str) -> Path:
+        key = _digest(url.strip().encode("utf-8"))
+        return self.root / "urls" / key[:2] / f"{key}.json"
+
+    def _page_path(self, content_digest: str) -> Path:
+        return self.root / "pages" / content_digest[:2] / f"{content_digest}.json"
+
+    def _expired(self, entry: dict, now: float) -> bool:
+        ttl = self.ttl if 200 <= entry.get("status", 0) < 400 else self.negative_ttl
+        return now - entry.get("fetched_at", 0) > ttl
+
+    def get(self, url: str) -> Optional[ArticlePage]:
+        entry = _read_json(self._url_path(url))
+        page = None
+        if entry and not self._expired(entry, time.time()):
+            parsed = {}
+            if entry.get("content"):
+                parsed = _read_json(self._page_path(entry["content"]))
+            if parsed is not None:
+                page = ArticlePage(
+                    url=url,
+                    status=entry.get("status", 0),
+                    final_url=entry.get("final_url", ""),
+                    canonical_url=parsed.get("canonical_url", ""),
+                    published_date=parsed.get("published_date"),
+                    body_snippet=parsed.get("body_snippet", ""),
+                    fetched_at=entry.get("fetched_at", 0),
+                )
+        with self._lock:
+            if page is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return page
+
+    def put(self, page: ArticlePage, content_digest: str = "") -> None:
+        if content_digest:
+            _atomic_write_json(self._page_path(content_digest), {
+                "canonical_url": page.canonical_url,
+                "published_date": page.published_date,
+                "body_snippet": page.body_snippet,
+            })
+        _atomic_write_json(self._url_path(page.url), {
+            "url": page.url,
+            "status": page.status,
+            "final_url": page.final_url,
+            "content": content_digest,
+            "fetched_at": page.fetched_at,
+        })
+
+    def prune(self) -> int:
+        """删除过期的 URL 条目及不再被引用的页面，返回删除的文件数。"""
+        if not self.root.exists():
+            return 0
+        now = time.time()
+        removed = 0
+        referenced = set()
+        for path in (self.root / "urls").glob("*/*.json"):
+            entry = _read_json(path)
+            if entry is None or self._expired(entry, now):
+                path.unlink(missing_ok=True)
+                removed += 1
+            elif entry.get("content"):
+                referenced.add(entry["content"])
+        for path in (self.root / "pages").glob("*/*.json"):
+            if path.stem not in referenced:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+_page_cache: Optional[PageCache] = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> PageCache:
+    global _page_cache
+    with _page_cache_lock:
+        if _page_cache is None:
+            _page_cache = PageCache(PAGE_CACHE_DIR)
+        return _page_cache
+
+
+# ─── 解析 ────────────────────────────────────────────────────────────
+
+_DATE_CLASSES = re.compile(
+    r"\b(?:date|time|published|updated|posted|created|pubdate|timestamp|byline|article-meta)\b",
+    re.IGNORECASE,
+)
+
+
+def extract_published_date(soup: BeautifulSoup) -> Optional[str]:
+    """
+    从已解析页面提取发布时间。
+    优先级: article:published_time > datePublished JSON-LD > <time> 标签 > 日期容器 > 页头文字
+    """
+    # 1. Open Graph / article meta 标签
+    for prop in [
+        "article:published_time", "og:article:published_time",
+        "datePublished", "date", "pubdate", "article:modified_time",
+    ]:
+        tag = soup.find("meta", {"property": prop}) or soup.find("meta", {"name": prop})
+        if tag and tag.get("content"):
+            d = _parse_iso_date(tag["content"])
+            if d:
+                return d
+
+    # 2. JSON-LD
+    for script in soup.find_all("script", {"type": "application/ld+json"}):
+        try:
+            data = json.loads(script.string or "")
+            # data 可能是 dict 或 list
+            entries = data if isinstance(data, list) else [data]
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    continue
+                for key in ("datePublished", "dateCreated"):
+                    val = entry.get(key, "")
+                    d = _parse_iso_date(str(val))
+                    if d:
+                        return d
+        except (json.JSONDecodeError, TypeError, AttributeError):
+            continue
+
+    # 3. <time> 标签 - 先检查属性，再检查文本内容
+    for time_tag in soup.find_all("time"):
+        for attr in ("datetime", "pubdate", "content"):
+            val = time_tag.get(attr, "")
+            d = _parse_iso_date(str(val))
+            if d:
+                return d
+        # 检查 <time> 标签的可见文字（如 "February 26, 2026"）
+        d = _parse_human_date(time_tag.get_text(" ", strip=True))
+        if d:
+            return d
+
+    # 4. 在常见的日期容器元素中搜索（class 含 date / time / published / meta 等）
+    for el in soup.find_all(class_=_DATE_CLASSES):
+        text = el.get_text(" ", strip=True)
+        d = _parse_iso_date(text) or _parse_human_date(text)
+        if d:
+            return d
+
+    # 5. 在 <header> / <article> 头部搜索可见日期文字（最多扫描前 2000 字符正文）
+    for container in (soup.find("header"), soup.find("article"), soup.find("main")):
+        if container is None:
+            continue
+        snippet = container.get_text(" ", strip=True)[:2000]
+        d = _parse_human_date(snippet)
+        if d:
+            return d
+    return None
+
+
+def extract_canonical_url(soup: BeautifulSoup, fallback: str = "") -> str:
+    link = soup.find("link", rel=lambda v: v and "canonical" in (v if isinstance(v, list) else [v]))
+    if link and (link.get("href") or "").startswith("http"):
+        return link["href"].strip()
+    og = soup.find("meta", {"property": "og:url"})
+    if og and (og.get("content") or "").startswith("http"):
+        return og["content"].strip()
+    return fallback
+
+
+def extract_body_snippet(soup: BeautifulSoup, limit: int = BODY_SNIPPET_LEN) -> str:
+    """提取正文前 limit 字。会移除 script/nav/header 等标签，须在其他提取之后调用。"""
+    for tag in soup(["script", "style", "nav", "footer", "header", "aside", "noscript"]):
+        tag.decompose()
+    # 优先提取语义化正文区域
+    for selector in ("article", "main", "[class*='article-body']",
+                     "[class*='post-content']", "[class*='entry-content']"):
+        el = soup.select_one(selector)
+        if el:
+            text = re.sub(r"\s+", " ", el.get_text(" ", strip=True))
+            if len(text) > 80:
+                return text[:limit]
+    # 兜底：body 全文
+    body = soup.find("body")
+    if body:
+        return re.sub(r"\s+", " ", body.get_text(" ", strip=True))[:limit]
+    return ""
+
+
+def parse_article_html(url: str, html: str, status: int = 200, final_url: str = "") -> ArticlePage:
+    soup = BeautifulSoup(html, "html.parser")
+    final_url = final_url or url
+    published = extract_published_date(soup)
+    canonical = extract_canonical_url(soup, final_url)
+    body = extract_body_snippet(soup)
+    return ArticlePage(
+        url=url,
+        status=status,
+        final_url=final_url,
+        canonical_url=canonical,
+        published_date=published,
+        body_snippet=body,
+        fetched_at=time.time(),
+    )
+
+
+# ─── 抓取入口 ────────────────────────────────────────────────────────
+
+def fetch_article_page(url: str, timeout: int = 8, cached_only: bool = False) -> Optional[ArticlePage]:
+    """
+    获取文章页面解析结果：缓存命中直接返回；否则下载并解析一次后写入缓存。
+    cached_only=True 时只查缓存，不访问网络。非 http(s) URL 返回 None。
+    """
+    if not url or not url.startswith("http"):
+        return None
+    cache = get_page_cache()
+    page = cache.get(url)
+    if page is not None or cached_only:
+        return page
+
+    limiter = get_limiter()
+    try:
+        limiter.acquire(url)
+        resp = http_session.get(url, headers=_PAGE_HEADERS, timeout=timeout, allow_redirects=True)
+        limiter.feedback(url, resp.status_code, resp.headers.get("Retry-After"))
+    except Exception as e:
+        logger.debug(f"[页面抓取] {url}: {e}")
+        page = ArticlePage(url=url, status=0, fetched_at=time.time())
+        _safe_put(cache, page)
+        return page
+
+    if not resp.ok:
+        page = ArticlePage(url=url, status=resp.status_code, final_url=resp.url or url,
+                           fetched_at=time.time())
+        _safe_put(cache, page)
+        return page
+
+    try:
+        page = parse_article_html(url, resp.text, resp.status_code, resp.url or url)
+    except Exception as e:
+        logger.debug(f"[页面解析] {url}: {e}")
+        page = ArticlePage(url=url, status=resp.status_code, final_url=resp.url or url,
+                           fetched_at=time.time())
+    _safe_put(cache, page, _digest(resp.content or b""))
+    return page
+
+
+def _safe_put(cache: PageCache, page: ArticlePage, content_digest: str = "") -> None:
+    try:
+        cache.put(page, content_digest)
+    except OSError as e:
+        logger.debug(f"[页面缓存] 写入失败 {page.url}: {e}")
+
+
+# ─── 日期解析工具 ─────────────────────────────────────────────────────
+
+def _parse_iso_date(s: str) -> Optional[str]:
+    """从 ISO 8601 字符串提取 YYYY-MM-DD，超出今天则忽略"""
+    if not s:
+        return None
+    s = s.strip()
+    # 常见格式: 2026-02-15T10:30:00Z / 2026-02-15 / 20260215
+    for fmt in ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ",
+                "%Y-%m-%dT%H:%M:%S%z", "%Y%m%d"):
+        try:
+            dt = datetime.strptime(s[:len(fmt.replace('%Y','0000').replace('%m','00')
+                                        .replace('%d','00').replace('%H','00')
+                                        .replace('%M','00').replace('%S','00')
+                                        .replace('%z',''))], fmt)
+            result = dt.strftime("%Y-%m-%d")
+            # 合理性校验：2020-01-01 ~ 今天
+            if "2020-01-01" <= result <= datetime.now().strftime("%Y-%m-%d"):
+                return result
+        except ValueError:
+            continue
+    # 简单提取 YYYY-MM-DD
+    m = re.search(r"(202[0-9]-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01]))", s)
+    if m:
+        candidate = m.group(1)
+        if candidate <= datetime.now().strftime("%Y-%m-%d"):
+            return candidate
+    return None
+
+
+# 月份名称映射（英文全称和缩写）
+_MONTH_MAP = {
+    "january": 1, "february": 2, "march": 3, "april": 4,
+    "may": 5, "june": 6, "july": 7, "august": 8,
+    "september": 9, "october": 10, "november": 11, "december": 12,
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4,
+    "jun": 6, "jul": 7, "aug": 8,
+    "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+
+def _parse_human_date(text: str) -> Optional[str]:
+    """
+    从自然语言文本中提取英文日期，如 'February 26, 2026' 或 '26 Feb 2026'。
+    返回 YYYY-MM-DD，失败返回 None。
+    """
+    if not text:
+        return None
+    today = datetime.now().strftime("%Y-%m-%d")
+    tl = text.lower()
+
+    # 格式1: "Month DD, YYYY" 或 "Month DD YYYY"
+    m = re.search(
+        r'\b(january|february|march|april|may|june|july|august|september|october|november|december'
+        r'|jan|feb|mar|apr|jun|jul|aug|sep|oct|nov|dec)'
+        r'\s+(\d{1,2}),?\s+(20[2-9]\d)\b',
+        tl,
+    )
+    if m:
+        month = _MONTH_MAP.get(m.group(1))
+        day, year = int(m.group(2)), int(m.group(3))
+        if month:
+            try:
+                result = datetime(year, month, day).strftime("%Y-%m-%d")
+                if "2020-01-01" <= result <= today:
+                    return result
+            except ValueError:
+                pass
+
+    # 格式2: "DD Month YYYY" (英国/欧洲格式)
+    m = re.search(
+        r'\b(\d{1,2})\s+(january|february|march|april|may|june|july|august|september|october|november|december'
+        r'|jan|feb|mar|apr|jun|jul|aug|sep|oct|nov|dec)'
+        r'\s+(20[2-9]\d)\b',
+        tl,
+    )
+    if m:
+        day, month_name, year = int(m.group(1)), m.group(2), int(m.group(3))
+        month = _MONTH_MAP.get(month_name)
+        if month:
+            try:
+                result = datetime(year, month, day).strftime("%Y-%m-%d")
+                if "2020-01-01" <= result <= today:
+                    return result
+            except ValueError:
+                pass
+
+    return None
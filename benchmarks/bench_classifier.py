@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+classify_article 基准：预编译规则扫描引擎 vs 逐条 re.findall
+
+语料：data/monitor.db 中 legislation（含 legislation_archive）的原文标题 + 摘要，
+以及中文译文标题 + 摘要（覆盖中日韩规则），信源名与区域按库内记录传入。
+先校验两种实现的区域/管辖区/分类/状态/影响评分完全一致，再计时。
+
+用法: python benchmarks/bench_classifier.py [--db data/monitor.db] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import DATABASE_PATH  # noqa: E402
+from tests.fixtures.corpus import classifier_articles, load_rows  # noqa: E402
+from tests.fixtures.legacy_classifier import classification_key, legacy_classify  # noqa: E402
+
+
+def _time_per_article(fn, corpus: list, repeat: int) -> float:
+    best = float("inf")
+    # 每轮用新 dict 且全部保持存活：features_for 按 id() 缓存 dict 的特征，
+    # 复用或回收后复用同一 id 都会只测到缓存命中
+    rounds = [[dict(a) for a in corpus] for _ in range(repeat)]
+    for articles in rounds:
+        t0 = time.perf_counter()
+        for article in articles:
+            fn(article)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(corpus)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=DATABASE_PATH)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = classifier_articles(load_rows(args.db))
+    if not corpus:
+        print("语料为空")
+        return
+    mismatches = [a for a in corpus if legacy_classify(a) != classification_key(a)]
+    print(f"语料 {len(corpus)} 篇，分类结果不一致 {len(mismatches)} 篇")
+    for a in mismatches[:10]:
+        print(f"  ✗ {a['title'][:80]}")
+        print(f"      逐条: {legacy_classify(a)}")
+        print(f"      引擎: {classification_key(a)}")
+
+    legacy = _time_per_article(legacy_classify, corpus, args.repeat)
+    engine = _time_per_article(classification_key, corpus, args.repeat)
+    print(f"逐条 re.findall : {legacy * 1e6:8.1f} µs/篇")
+    print(f"规则扫描引擎    : {engine * 1e6:8.1f} µs/篇")
+    print(f"加速            : {legacy / engine:8.1f}x")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+monitor._deduplicate_items 基准：分桶 + 前缀过滤候选索引 vs 两两比较
+
+语料：以 data/monitor.db 中的标题（原文 + 中文译文）为种子，合成指定规模的条目：
+按种子词表随机组句，随机区域 / 大类 / 状态 / 信源 / 30 天内日期，
+约四成为已生成标题的轻微改写（制造重复）。
+LLM 验证以确定性桩函数代替，阶段 2 的 sleep 跳过。先校验两种实现保留的条目与
+合并后的时间轴完全一致（仅在不超过 --legacy-max 的规模上运行基线），再计时。
+
+用法: python benchmarks/bench_dedup.py [--db data/monitor.db] [--sizes 1000,10000,50000]
+                                       [--legacy-max 2000] [--seed 7]
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import monitor  # noqa: E402
+from config import DATABASE_PATH  # noqa: E402
+from tests.fixtures.corpus import load_rows, make_items, seed_titles  # noqa: E402
+from tests.fixtures.legacy_dedup import legacy_deduplicate_items, run  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=DATABASE_PATH)
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--legacy-max", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    titles = seed_titles(load_rows(args.db))
+    if not titles:
+        print("语料为空")
+        return
+    logging.disable(logging.INFO)
+    failed = False
+    for size in (int(s) for s in args.sizes.split(",")):
+        rows = make_items(titles, size, args.seed)
+        indexed, kept = run(monitor._deduplicate_items, rows)
+        line = f"{size:>6} 条 → 保留 {len(kept):>6}  候选索引 {indexed:8.2f}s"
+        if size <= args.legacy_max:
+            legacy, legacy_kept = run(legacy_deduplicate_items, rows)
+            same = kept == legacy_kept
+            failed |= not same
+            line += f"  两两比较 {legacy:8.2f}s  加速 {legacy / indexed:6.1f}x  " \
+                    f"{'结果一致' if same else '结果不一致'}"
+        print(line)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
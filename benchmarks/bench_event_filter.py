@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Database.filter_new_events 基准：EventIndex 候选索引 vs 逐条扫描 existing + accepted
+
+语料：tests/fixtures/corpus.make_items 合成的条目（补上与区域对应的管辖区），前一半写入临时库
+作为 30 天窗口内的历史记录，后一半作为本轮新条目。先校验两种实现接受/丢弃的条目
+完全一致，再计时（每轮重建新条目对象，避免复用已挂载的特征缓存）。
+
+用法: python benchmarks/bench_event_filter.py [--db data/monitor.db] [--sizes 1000,5000]
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import DATABASE_PATH  # noqa: E402
+from models import Database  # noqa: E402
+from tests.fixtures.corpus import load_rows, make_event_rows, seed_titles  # noqa: E402
+from tests.fixtures.legacy_event_filter import (  # noqa: E402
+    build_database, legacy_filter_new_events, run,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=DATABASE_PATH)
+    parser.add_argument("--sizes", default="1000,5000")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    titles = seed_titles(load_rows(args.db))
+    if not titles:
+        print("语料为空")
+        return
+    logging.disable(logging.INFO)
+    failed = False
+    for size in (int(s) for s in args.sizes.split(",")):
+        rows = make_event_rows(titles, 2 * size, args.seed)
+        history = [r for r in rows[:size] if r["date"] != "unknown"]
+        incoming = rows[size:]
+        with tempfile.TemporaryDirectory() as tmp:
+            db = build_database(str(Path(tmp) / "bench.db"), history)
+            try:
+                legacy, *legacy_result = run(legacy_filter_new_events, db, incoming)
+                indexed, *result = run(Database.filter_new_events, db, incoming)
+            finally:
+                db.close()
+        same = result == legacy_result
+        failed |= not same
+        print(f"历史 {len(history):>6} 条 + 新条目 {size:>6} 条 → 接受 {len(result[0]):>6}  "
+              f"逐条扫描 {legacy:8.2f}s  候选索引 {indexed:8.2f}s  加速 {legacy / indexed:6.1f}x  "
+              f"{'结果一致' if same else '结果不一致'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+is_legislation_relevant 基准：预编译组合匹配器 vs 逐条 re.search
+
+语料：data/monitor.db 中 legislation（含 legislation_archive）的标题 + 摘要，
+每条分别以普通信源（tier=""）和官方信源（tier="official"）各判定一次，
+覆盖游戏信号与数字行业信号两条分支。先校验两种实现判定完全一致，再计时。
+
+用法: python benchmarks/bench_relevance.py [--db data/monitor.db] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fetcher  # noqa: E402
+from config import DATABASE_PATH  # noqa: E402
+from tests.fixtures.corpus import load_rows, relevance_articles  # noqa: E402
+from tests.fixtures.legacy_relevance import legacy_is_legislation_relevant  # noqa: E402
+
+
+def _time_per_article(fn, corpus: list, repeat: int) -> float:
+    best = float("inf")
+    # 每轮用新 dict 且全部保持存活：features_for 按 id() 缓存 dict 的特征，
+    # 复用或回收后复用同一 id 都会只测到缓存命中
+    rounds = [[dict(a) for a in corpus] for _ in range(repeat)]
+    for articles in rounds:
+        t0 = time.perf_counter()
+        for article in articles:
+            fn(article)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(corpus)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=DATABASE_PATH)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = relevance_articles(load_rows(args.db))
+    if not corpus:
+        print("语料为空")
+        return
+    mismatches = [
+        a for a in corpus
+        if legacy_is_legislation_relevant(a) != fetcher.is_legislation_relevant(a)
+    ]
+    print(f"语料 {len(corpus)} 次判定，结论不一致 {len(mismatches)} 条")
+    for a in mismatches[:10]:
+        print(f"  ✗ [{a['tier'] or '-'}] {a['title'][:80]}")
+
+    legacy = _time_per_article(legacy_is_legislation_relevant, corpus, args.repeat)
+    compiled = _time_per_article(fetcher.is_legislation_relevant, corpus, args.repeat)
+    print(f"逐条 re.search : {legacy * 1e6:8.1f} µs/篇")
+    print(f"组合匹配器      : {compiled * 1e6:8.1f} µs/篇")
+    print(f"加速            : {legacy / compiled:8.1f}x")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
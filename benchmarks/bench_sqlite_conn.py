@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+sqlite_conn.connect 基准：默认连接（回滚日志、synchronous=FULL）vs 统一 PRAGMA（WAL 等）
+
+在 data/monitor.db 的两份临时副本上分别测量：
+  1. 逐条写入：Database.upsert_item 每行一次提交（monitor.py 里回写翻译、标记等路径）
+  2. 报表读取：query_items(days=0) 全表读取与日报查询各重复若干次
+  3. 读写并发：写线程持续逐条写入的同时，读线程反复执行日报查询，
+     记录读查询的 p50/max 延迟与 database is locked 次数
+
+用法: python benchmarks/bench_sqlite_conn.py [--db data/monitor.db] [--writes 300] [--reads 50]
+"""
+
+import argparse
+import contextlib
+import logging
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import sqlite_conn  # noqa: E402
+from config import DATABASE_PATH  # noqa: E402
+from llm_telemetry import percentile  # noqa: E402
+from models import Database, LegislationItem  # noqa: E402
+from tests.fixtures.corpus import load_rows, make_items, seed_titles  # noqa: E402
+
+_DAILY_SQL = """
+    SELECT title, title_zh, summary_zh, region, status, source_url, date, created_at,
+           impact_score, source_name, features_json
+    FROM legislation
+    WHERE created_at >= datetime('now', '-30 days') AND COALESCE(impact_score, 1.0) > 0
+    ORDER BY impact_score DESC
+"""
+
+
+def legacy_connect(db_path, *, readonly: bool = False, check_same_thread: bool = True):
+    """连接工厂上线前各处的 sqlite3.connect(db_path)。"""
+    return sqlite3.connect(str(db_path), check_same_thread=check_same_thread)
+
+
+@contextlib.contextmanager
+def factory(connect):
+    original = sqlite_conn.connect
+    sqlite_conn.connect = connect
+    try:
+        yield
+    finally:
+        sqlite_conn.connect = original
+
+
+def bench_writes(path: str, rows: list) -> float:
+    db = Database(path)
+    try:
+        t0 = time.perf_counter()
+        for row in rows:
+            db.upsert_item(LegislationItem(**row))
+        return time.perf_counter() - t0
+    finally:
+        db.close()
+
+
+def bench_reads(path: str, repeats: int) -> float:
+    db = Database(path)
+    reader = sqlite_conn.connect(path, readonly=True)
+    try:
+        t0 = time.perf_counter()
+        for _ in range(repeats):
+            db.query_items(days=0)
+            reader.execute(_DAILY_SQL).fetchall()
+        return time.perf_counter() - t0
+    finally:
+        reader.close()
+        db.close()
+
+
+def bench_concurrent(path: str, rows: list) -> tuple:
+    """返回（读查询延迟列表，locked 次数）。"""
+    done = threading.Event()
+
+    def writer():
+        db = Database(path)
+        try:
+            for row in rows:
+                db.upsert_item(LegislationItem(**row))
+        finally:
+            db.close()
+            done.set()
+
+    thread = threading.Thread(target=writer)
+    reader = sqlite_conn.connect(path, readonly=True)
+    latencies, locked = [], 0
+    thread.start()
+    try:
+        while not done.is_set():
+            t0 = time.perf_counter()
+            try:
+                reader.execute(_DAILY_SQL).fetchall()
+                latencies.append(time.perf_counter() - t0)
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e):
+                    raise
+                locked += 1
+    finally:
+        thread.join()
+        reader.close()
+    return latencies, locked
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=DATABASE_PATH)
+    parser.add_argument("--writes", type=int, default=300)
+    parser.add_argument("--reads", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    titles = seed_titles(load_rows(args.db))
+    if not titles:
+        print("语料为空")
+        return
+    logging.disable(logging.INFO)
+    rows = make_items(titles, 2 * args.writes, args.seed)
+    for label, connect in (("默认连接", legacy_connect), ("连接工厂", sqlite_conn.connect)):
+        with tempfile.TemporaryDirectory() as tmp, factory(connect):
+            path = str(Path(tmp) / "monitor.db")
+            shutil.copyfile(args.db, path)
+            Database(path).close()   # 先补齐迁移，避免计入首次建列
+            writes = bench_writes(path, rows[:args.writes])
+            reads = bench_reads(path, args.reads)
+            latencies, locked = bench_concurrent(path, rows[args.writes:])
+        print(f"{label}  逐条写入 {args.writes} 条 {writes:7.2f}s  "
+              f"读取 ×{args.reads} {reads:6.2f}s  "
+              f"并发读 {len(latencies):>5} 次 p50 {1000 * (percentile(latencies, 50) or 0):7.1f}ms "
+              f"max {1000 * max(latencies, default=0):7.1f}ms  locked {locked}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Database.upsert_many 基准：单事务 executemany vs 逐条 upsert_item（每行一次 commit）
+
+语料：tests/fixtures/corpus.make_items 合成的条目。每个规模先向空库写入全部条目（纯新增），
+再以同一批条目重写一次（纯更新），两种实现各用独立的临时库，最后校验两库内容一致。
+
+用法: python benchmarks/bench_upsert.py [--db data/monitor.db] [--sizes 500,2000]
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import DATABASE_PATH  # noqa: E402
+from models import Database, LegislationItem  # noqa: E402
+from tests.fixtures.corpus import load_rows, make_items, seed_titles  # noqa: E402
+
+
+def per_row(db: Database, items: list) -> None:
+    for item in items:
+        db.upsert_item(item)
+
+
+def bulk(db: Database, items: list) -> None:
+    db.upsert_many(items)
+
+
+def run(fn, path: str, rows: list) -> tuple:
+    """返回（首次写入耗时，重写耗时，库内容快照）。"""
+    db = Database(path)
+    try:
+        timings = []
+        for _ in range(2):
+            items = [LegislationItem(**row) for row in rows]
+            t0 = time.perf_counter()
+            fn(db, items)
+            timings.append(time.perf_counter() - t0)
+        snapshot = db.conn.execute(
+            "SELECT title, source_url, title_zh, event_key FROM legislation ORDER BY title, source_url"
+        ).fetchall()
+    finally:
+        db.close()
+    return timings[0], timings[1], [tuple(r) for r in snapshot]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=DATABASE_PATH)
+    parser.add_argument("--sizes", default="500,2000")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    titles = seed_titles(load_rows(args.db))
+    if not titles:
+        print("语料为空")
+        return
+    logging.disable(logging.INFO)
+    failed = False
+    for size in (int(s) for s in args.sizes.split(",")):
+        rows = make_items(titles, size, args.seed)
+        with tempfile.TemporaryDirectory() as tmp:
+            legacy_insert, legacy_update, legacy_rows = run(per_row, str(Path(tmp) / "a.db"), rows)
+            bulk_insert, bulk_update, bulk_rows = run(bulk, str(Path(tmp) / "b.db"), rows)
+        same = legacy_rows == bulk_rows
+        failed |= not same
+        print(f"{size:>6} 条  逐条 新增 {legacy_insert:7.2f}s 更新 {legacy_update:7.2f}s  "
+              f"批量 新增 {bulk_insert:7.2f}s 更新 {bulk_update:7.2f}s  "
+              f"加速 {(legacy_insert + legacy_update) / (bulk_insert + bulk_update):6.1f}x  "
+              f"{'结果一致' if same else '结果不一致'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
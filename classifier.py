@@ -12,13 +12,15 @@
 
 import json
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
 from config import (
     CATEGORIES, MONITORED_REGIONS, STATUS_LABELS,
     SOURCE_TIER_MAP, SOURCE_TIER_PATTERNS,
 )
+from features import features_for
 from models import LegislationItem
 from utils import (
     VALID_JURISDICTIONS, _get_region_group, normalize_applicability_scope, normalize_jurisdiction,
@@ -45,8 +47,9 @@ _reload_noise_sources()
 PUSH_DECISIONS = {"push", "pool_only"}
 NOISE_REASONS = {
     "高价值监管动态", "非电子游戏", "产品资讯", "行业评论", "单一厂商纠纷",
-    "信息不足", "弱信源", "无新增监管动作", "判定失败",
+    "信息不足", "弱信源", "无新增监管动作", "判定失败", "模型预筛",
 }
+DECISION_SOURCES = {"llm", "rule", "fallback", "model"}
 
 _OBVIOUS_NON_GAME = re.compile(
     r"电动汽车|银行(?:与|和)?金融|股票|足球|赛前|球队|联赛|公共广场"
@@ -91,7 +94,7 @@ def normalize_push_assessment_v1(
         score = 0
     decision = push_decision if push_decision in PUSH_DECISIONS else "pool_only"
     reason = noise_reason if noise_reason in NOISE_REASONS else "判定失败"
-    source = decision_source if decision_source in {"llm", "rule", "fallback"} else "fallback"
+    source = decision_source if decision_source in DECISION_SOURCES else "fallback"
 
     text = " ".join(filter(None, [title, summary]))
     if _OBVIOUS_NON_GAME.search(text):
@@ -240,7 +243,7 @@ def normalize_push_assessment_v2(
         score = 0
     decision = push_decision if push_decision in PUSH_DECISIONS else "pool_only"
     reason = noise_reason if noise_reason in NOISE_REASONS else "判定失败"
-    source = decision_source if decision_source in {"llm", "rule", "fallback"} else "fallback"
+    source = decision_source if decision_source in DECISION_SOURCES else "fallback"
     raw_text = " ".join(filter(None, (raw_title, raw_summary)))
 
     game_connection = bool(_RAW_GAME_CONNECTION.search(raw_text))
@@ -782,12 +785,291 @@ _GOOGLE_APPLE_MENTION = re.compile(
 )
 
 
-def _is_hardware_noise(text: str) -> bool:
-    """返回 True 表示纯硬件/系统文章，应将 impact_score 归零。"""
-    for p in _HARDWARE_NOISE_PATTERNS:
-        if re.search(p, text, re.IGNORECASE):
+# ─── 规则扫描引擎 ────────────────────────────────────────────────────
+#
+# COUNTRY / CATEGORY / STATUS / 高风险 / 硬件噪音五张规则表在导入时一次性编译为
+# 带标签的模式组，每篇文章只做一次 lower() 并由 ScoringEngine.scan() 产出全部计数，
+# classify_article / score_impact 共用同一份 RuleScan。
+#
+# 计数语义与逐条 re.findall 完全一致（各模式独立统计不重叠命中），因此不能把
+# 整张表合并成单个交替式一遍 finditer —— 那样重叠命中只会被计一次。取而代之：
+#   - 纯字面量且不含大小写字母的模式（全量管辖区的中文名）直接用 str.count
+#   - 其余模式预编译，并从每个顶层分支提取"必含字面量"（如 loot.?box → loot）；
+#     文本中一个都不出现时该模式必然零命中，跳过正则引擎
+
+# re.IGNORECASE 额外视为等价、但 str.lower() 不会归一的字符（含 İ 小写后的组合点）。
+# 文本含这些字符时不走字面量预筛，直接跑正则，保证与逐条匹配结果一致。
+_CASEFOLD_SPECIALS = re.compile(
+    "[ıſµμͅιιΐΐΰΰ"
+    "βϐεϵθϑκϰπϖρϱ"
+    "ςσφϕṡẛﬅﬆ̇]"
+)
+_REGEX_META = set(".^$*+?{}[]|()")
+
+
+def _as_literal(pattern: str):
+    """模式等价于不区分大小写的纯字面量时返回该字面量，否则返回 None。"""
+    literal = re.sub(r"\\(.)", r"\1", pattern, flags=re.S)
+    if literal and re.escape(literal) == pattern and literal.lower() == literal.upper():
+        return literal
+    return None
+
+
+def _split_alternatives(pattern: str) -> list:
+    """按顶层 | 拆分分支（不拆括号/字符类内部）。"""
+    branches, current, depth, in_class, i = [], "", 0, False, 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            current += pattern[i:i + 2]
+            i += 2
+            continue
+        if in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            branches.append(current)
+            current = ""
+            i += 1
+            continue
+        current += ch
+        i += 1
+    branches.append(current)
+    return branches
+
+
+def _required_literal(branch: str):
+    """分支中任何匹配都必然包含的最长字面量（已小写）；提取不到返回 None。
+
+    只看括号外的连续普通字符；后接 ? * {m,n} 的字符可能不出现，不计入。
+    """
+    runs, current, depth, in_class, i = [], "", 0, False, 0
+
+    def flush():
+        nonlocal current
+        if current:
+            runs.append(current)
+        current = ""
+
+    while i < len(branch):
+        ch = branch[i]
+        if in_class:
+            in_class = ch != "]"
+            i += 2 if ch == "\\" else 1
+            continue
+        if ch == "\\":
+            nxt = branch[i + 1:i + 2]
+            i += 2
+            if depth or not nxt or nxt.isalnum():  # \b \w \s \d 等
+                flush()
+                continue
+            literal = nxt
+        elif ch == "[":
+            flush()
+            in_class = True
+            i += 1
+            continue
+        elif ch in "()":
+            flush()
+            depth += 1 if ch == "(" else -1
+            i += 1
+            continue
+        elif depth or ch in _REGEX_META:
+            flush()
+            i += 1
+            continue
+        else:
+            literal = ch
+            i += 1
+        if i < len(branch) and branch[i] in "?*{":
+            flush()
+            continue
+        current += literal
+        if i < len(branch) and branch[i] == "+":
+            flush()
+    flush()
+    if not runs:
+        return None
+    longest = max(runs, key=len)
+    # İ 等小写后长度变化的字符无法按位置比较，放弃预筛
+    return longest.lower() if len(longest.lower()) == len(longest) else None
+
+
+def _anchors(pattern: str):
+    """模式的预筛字面量元组；任一分支提取不到时返回 None（必须跑正则）。"""
+    anchors = []
+    for branch in _split_alternatives(pattern):
+        literal = _required_literal(branch)
+        if literal is None:
+            return None
+        anchors.append(literal)
+    return tuple(dict.fromkeys(anchors))
+
+
+class _TaggedPatterns:
+    """同一标签下的一组模式（例如某个国家、某个 L2 分类）。
+
+    count/search 的 haystack 为 text 的小写形式，用于字面量预筛；传 None 时不预筛。
+    """
+
+    __slots__ = ("tag", "literals", "regexes")
+
+    def __init__(self, tag, patterns: list):
+        self.tag = tag
+        self.literals = []
+        self.regexes = []
+        for p in patterns:
+            literal = _as_literal(p)
+            if literal is not None:
+                self.literals.append(literal)
+            else:
+                self.regexes.append((re.compile(p, re.IGNORECASE), _anchors(p)))
+
+    def count(self, text: str, haystack: Optional[str] = None) -> int:
+        """等价于 sum(len(re.findall(p, text, re.I)) for p in patterns)。"""
+        n = 0
+        for literal in self.literals:
+            n += text.count(literal)
+        for regex, anchors in self.regexes:
+            if haystack is not None and anchors and not any(a in haystack for a in anchors):
+                continue
+            n += len(regex.findall(text))
+        return n
+
+    def search(self, text: str, haystack: Optional[str] = None) -> bool:
+        """等价于 any(re.search(p, text, re.I) for p in patterns)。"""
+        if any(literal in text for literal in self.literals):
             return True
-    return False
+        for regex, anchors in self.regexes:
+            if haystack is not None and anchors and not any(a in haystack for a in anchors):
+                continue
+            if regex.search(text):
+                return True
+        return False
+
+
+def _haystack(text: str, text_lower: Optional[str] = None) -> Optional[str]:
+    """字面量预筛用的小写文本；含 IGNORECASE 特殊等价字符时返回 None（不预筛）。"""
+    if text_lower is None:
+        text_lower = text.lower()
+    return None if _CASEFOLD_SPECIALS.search(text_lower) else text_lower
+
+
+@dataclass
+class RuleScan:
+    """一篇文章对全部规则表的命中结果（只保留计数 > 0 的标签，顺序同规则表）。"""
+    countries: Dict[str, int] = field(default_factory=dict)
+    categories: Dict[str, int] = field(default_factory=dict)
+    subcategories: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    statuses: Dict[str, int] = field(default_factory=dict)
+    high_risk_bonus: float = 0.0
+    hardware_noise: bool = False
+
+
+class ScoringEngine:
+    """预编译的分类/评分规则表。"""
+
+    def __init__(self):
+        self.countries = [
+            _TaggedPatterns(country, patterns)
+            for country, patterns in COUNTRY_PATTERNS.items()
+        ]
+        self.categories = [
+            (
+                _TaggedPatterns(l1, sub_patterns.get("_l1", [])),
+                [
+                    _TaggedPatterns(l2, patterns)
+                    for l2, patterns in sub_patterns.items()
+                    if l2 != "_l1"
+                ],
+            )
+            for l1, sub_patterns in CATEGORY_PATTERNS.items()
+        ]
+        self.statuses = [
+            _TaggedPatterns(status, patterns)
+            for status, patterns in STATUS_PATTERNS.items()
+        ]
+        self.high_risk = [
+            _TaggedPatterns(add, patterns) for add, patterns in _HIGH_RISK_PATTERNS
+        ]
+        self.hardware_noise = _TaggedPatterns("hardware", _HARDWARE_NOISE_PATTERNS)
+
+    # 以下各规则表入参为已小写文本（硬件噪音除外，沿用原文 + IGNORECASE）
+
+    def count_countries(self, text_lower: str) -> Dict[str, int]:
+        haystack = _haystack(text_lower, text_lower)
+        counts = {}
+        for group in self.countries:
+            n = group.count(text_lower, haystack)
+            if n:
+                counts[group.tag] = n
+        return counts
+
+    def count_categories(self, text_lower: str) -> Tuple[Dict[str, int], Dict[str, Dict[str, int]]]:
+        """L1 计数；L2 只对 L1 有命中的分类计算（未命中的 L1 不可能被选中）。"""
+        haystack = _haystack(text_lower, text_lower)
+        l1_counts, l2_counts = {}, {}
+        for l1_group, l2_groups in self.categories:
+            n = l1_group.count(text_lower, haystack)
+            if not n:
+                continue
+            l1_counts[l1_group.tag] = n
+            l2_counts[l1_group.tag] = {
+                g.tag: c for g in l2_groups if (c := g.count(text_lower, haystack))
+            }
+        return l1_counts, l2_counts
+
+    def count_statuses(self, text_lower: str) -> Dict[str, int]:
+        haystack = _haystack(text_lower, text_lower)
+        counts = {}
+        for group in self.statuses:
+            n = group.count(text_lower, haystack)
+            if n:
+                counts[group.tag] = n
+        return counts
+
+    def high_risk_bonus(self, text_lower: str) -> float:
+        haystack = _haystack(text_lower, text_lower)
+        bonus = 0.0
+        for group in self.high_risk:
+            if group.search(text_lower, haystack):
+                bonus += group.tag
+        return bonus
+
+    def is_hardware_noise(self, text: str, text_lower: Optional[str] = None) -> bool:
+        return self.hardware_noise.search(text, _haystack(text, text_lower))
+
+    def scan(self, text: str) -> RuleScan:
+        text_lower = text.lower()
+        categories, subcategories = self.count_categories(text_lower)
+        return RuleScan(
+            countries=self.count_countries(text_lower),
+            categories=categories,
+            subcategories=subcategories,
+            statuses=self.count_statuses(text_lower),
+            high_risk_bonus=self.high_risk_bonus(text_lower),
+            hardware_noise=self.is_hardware_noise(text, text_lower),
+        )
+
+
+_ENGINE = ScoringEngine()
+
+
+def scan_rules(text: str) -> RuleScan:
+    """对文本做一次全规则扫描，结果可传给 _detect_* / score_impact 复用。"""
+    return _ENGINE.scan(text)
+
+
+def _is_hardware_noise(text: str, scan: Optional[RuleScan] = None) -> bool:
+    """返回 True 表示纯硬件/系统文章，应将 impact_score 归零。"""
+    if scan is not None:
+        return scan.hardware_noise
+    return _ENGINE.is_hardware_noise(text)
 
 
 def _is_google_apple_non_core(text: str) -> bool:
@@ -814,19 +1096,14 @@ def get_source_tier(source_name: str) -> str:
     return "news"
 
 
-def _high_risk_bonus(text: str) -> float:
+def _high_risk_bonus(text: str, scan: Optional[RuleScan] = None) -> float:
     """
     检测文章是否触及高风险合规场景，返回累计附加分。
     每组模式只计一次（命中第一条即止），各组可叠加。
     """
-    text_lower = text.lower()
-    bonus = 0.0
-    for add, patterns in _HIGH_RISK_PATTERNS:
-        for p in patterns:
-            if re.search(p, text_lower, re.IGNORECASE):
-                bonus += add
-                break
-    return bonus
+    if scan is not None:
+        return scan.high_risk_bonus
+    return _ENGINE.high_risk_bonus(text.lower())
 
 
 def compute_composite_score(
@@ -837,6 +1114,7 @@ def compute_composite_score(
     region: str = "",
     source_name: str = "",
     text: str = "",
+    scan: Optional[RuleScan] = None,
 ) -> float:
     """
     基于 LLM 四维风险评估计算综合影响评分 (1.0–10.0)。
@@ -848,7 +1126,7 @@ def compute_composite_score(
     噪音过滤和高噪音来源降分逻辑与 score_impact() 保持一致。
     """
     # 硬件噪音 / Google-Apple 非核心文章 → 直接归零
-    if text and (_is_hardware_noise(text) or _is_google_apple_non_core(text)):
+    if text and (_is_hardware_noise(text, scan) or _is_google_apple_non_core(text)):
         return 0.0
 
     weighted = (
@@ -871,6 +1149,7 @@ def score_impact(
     source_name: str,
     region: str = "",
     text: str = "",
+    scan: Optional[RuleScan] = None,
 ) -> float:
     """
     计算影响评分 (1.0–10.0):
@@ -882,9 +1161,11 @@ def score_impact(
                    跨平台数据/强制年龄验证 +0.5 各一次
 
     高风险 ≥9.0 / 中风险 ≥7.0 / 关注 ≥5.0 / 低优先 <5.0
+
+    scan 为同一 text 的 scan_rules() 结果；传入时不再重复扫描。
     """
     # 硬件噪音 / Google-Apple 非核心文章 → 直接归零，不进入评分链
-    if text and (_is_hardware_noise(text) or _is_google_apple_non_core(text)):
+    if text and (_is_hardware_noise(text, scan) or _is_google_apple_non_core(text)):
         return 0.0
 
     base = _IMPACT_STATUS_BASE.get(status, 2.0)
@@ -894,7 +1175,7 @@ def score_impact(
 
     market_bonus = 2.0 if region in _CORE_MARKETS else 0.0
 
-    risk_bonus = _high_risk_bonus(text) if text else 0.0
+    risk_bonus = _high_risk_bonus(text, scan) if text else 0.0
 
     total = base + tier_bonus + market_bonus + risk_bonus
 
@@ -911,11 +1192,13 @@ def score_impact(
 def classify_article(article: dict) -> LegislationItem:
     """对一篇文章进行区域、分类、状态、影响评分判定"""
     text = f"{article.get('title', '')} {article.get('summary', '')}".strip()
+    scan = features_for(article).rule_scan
 
     jurisdiction, applicability_scope, jurisdiction_source = _detect_geography(
         text,
         fallback=article.get("region", ""),
         source_name=article.get("source", ""),
+        scan=scan,
     )
     region = (
         region_for_jurisdiction(jurisdiction)
@@ -924,10 +1207,10 @@ def classify_article(article: dict) -> LegislationItem:
     )
     if applicability_scope in {"global", "multi", "unknown"} and not jurisdiction:
         region = "其他"
-    l1, l2 = _detect_category(text)
-    status = _detect_status(text)
+    l1, l2 = _detect_category(text, scan)
+    status = _detect_status(text, scan)
     source_name = article.get("source", "")
-    impact = score_impact(status, source_name, region=region, text=text)
+    impact = score_impact(status, source_name, region=region, text=text, scan=scan)
 
     return LegislationItem(
         region=region,
@@ -985,6 +1268,10 @@ _JURISDICTION_AUTHORITY_PATTERNS = {
     "韩国": r"게임물관리위원회|문화체육관광부|\bGRAC\b",
     "澳大利亚": r"\bACCC\b|\bOAIC\b|eSafety commissioner",
 }
+_JURISDICTION_AUTHORITY_RES = {
+    country: re.compile(pattern, re.IGNORECASE)
+    for country, pattern in _JURISDICTION_AUTHORITY_PATTERNS.items()
+}
 
 
 def _detect_geography(
@@ -992,20 +1279,21 @@ def _detect_geography(
     fallback: str = "",
     source_name: str = "",
     allow_locale_fallback: bool = True,
+    scan: Optional[RuleScan] = None,
 ) -> tuple[str, str, str]:
     """识别主要管辖区、适用范围和证据来源。"""
-    text_combined = text.lower()
+    if scan is not None:
+        country_hits = scan.countries
+    else:
+        country_hits = _ENGINE.count_countries(text.lower())
 
     country_scores = {}
     authority_countries = set()
-    for country, patterns in COUNTRY_PATTERNS.items():
-        score = 0
-        for p in patterns:
-            score += len(re.findall(p, text_combined, re.IGNORECASE))
+    for country, score in country_hits.items():
         if score > 0:
             normalized_country = normalize_jurisdiction(country)
-            authority_pattern = _JURISDICTION_AUTHORITY_PATTERNS.get(normalized_country)
-            if authority_pattern and re.search(authority_pattern, text, re.IGNORECASE):
+            authority_re = _JURISDICTION_AUTHORITY_RES.get(normalized_country)
+            if authority_re and authority_re.search(text):
                 score += 5
                 authority_countries.add(normalized_country)
             country_scores[normalized_country] = (
@@ -1034,9 +1322,9 @@ def _detect_geography(
 
     # 官方来源名只作为标题/摘要无明确证据时的次级提示。
     if source_name:
-        for country, patterns in COUNTRY_PATTERNS.items():
-            if any(re.search(p, source_name, re.IGNORECASE) for p in patterns):
-                jurisdiction = normalize_jurisdiction(country)
+        for group in _ENGINE.countries:
+            if group.search(source_name):
+                jurisdiction = normalize_jurisdiction(group.tag)
                 scope = "supranational" if jurisdiction == "欧盟" else "single"
                 return jurisdiction, scope, "official_source"
 
@@ -1056,66 +1344,53 @@ def _detect_geography(
     return "", "unknown", "unknown"
 
 
+_OVERSEAS_CONTEXT = _TaggedPatterns("overseas_context", OVERSEAS_REGULATORY_CONTEXT)
+_OVERSEAS_ACTION = _TaggedPatterns("overseas_action", OVERSEAS_ENFORCEMENT_ACTIONS)
+_CHINA_MAINLAND = _TaggedPatterns("china_mainland", CHINA_MAINLAND_PATTERNS)
+
+
 def is_china_mainland(text: str) -> bool:
     """检测是否为中国大陆相关内容"""
-    has_overseas_context = any(
-        re.search(pattern, text, re.IGNORECASE)
-        for pattern in OVERSEAS_REGULATORY_CONTEXT
-    )
-    has_overseas_action = any(
-        re.search(pattern, text, re.IGNORECASE)
-        for pattern in OVERSEAS_ENFORCEMENT_ACTIONS
-    )
-    if has_overseas_context and has_overseas_action:
+    haystack = _haystack(text)
+    if _OVERSEAS_CONTEXT.search(text, haystack) and _OVERSEAS_ACTION.search(text, haystack):
         return False
-    for p in CHINA_MAINLAND_PATTERNS:
-        if re.search(p, text, re.IGNORECASE):
-            return True
-    return False
+    return _CHINA_MAINLAND.search(text, haystack)
 
 
-def _detect_category(text: str) -> Tuple[str, str]:
+def _detect_category(text: str, scan: Optional[RuleScan] = None) -> Tuple[str, str]:
     """检测一级/二级分类"""
-    text_lower = text.lower()
+    if scan is not None:
+        l1_counts, l2_counts = scan.categories, scan.subcategories
+    else:
+        l1_counts, l2_counts = _ENGINE.count_categories(text.lower())
     best_l1 = "经营合规"  # 默认兜底：通用监管动态归入经营合规，避免"内容监管"成垃圾桶
     best_l1_score = 0
-    best_l2 = ""
-
-    for l1, sub_patterns in CATEGORY_PATTERNS.items():
-        l1_score = 0
-        l1_patterns = sub_patterns.get("_l1", [])
-        for p in l1_patterns:
-            l1_score += len(re.findall(p, text_lower, re.IGNORECASE))
 
+    for l1, l1_score in l1_counts.items():
         if l1_score > best_l1_score:
             best_l1_score = l1_score
             best_l1 = l1
 
-            best_l2_score = 0
-            best_l2 = ""
-            for l2_name, l2_patterns in sub_patterns.items():
-                if l2_name == "_l1":
-                    continue
-                l2_score = 0
-                for p in l2_patterns:
-                    l2_score += len(re.findall(p, text_lower, re.IGNORECASE))
-                if l2_score > best_l2_score:
-                    best_l2_score = l2_score
-                    best_l2 = l2_name
+    best_l2 = ""
+    best_l2_score = 0
+    for l2_name, l2_score in l2_counts.get(best_l1, {}).items():
+        if l2_score > best_l2_score:
+            best_l2_score = l2_score
+            best_l2 = l2_name
 
     return best_l1, best_l2
 
 
-def _detect_status(text: str) -> str:
+def _detect_status(text: str, scan: Optional[RuleScan] = None) -> str:
     """检测状态"""
-    text_lower = text.lower()
+    if scan is not None:
+        status_counts = scan.statuses
+    else:
+        status_counts = _ENGINE.count_statuses(text.lower())
     best_status = "立法动态"
     best_score = 0
 
-    for status, patterns in STATUS_PATTERNS.items():
-        score = 0
-        for p in patterns:
-            score += len(re.findall(p, text_lower, re.IGNORECASE))
+    for status, score in status_counts.items():
         if score > best_score:
             best_score = score
             best_status = status
@@ -14,6 +14,23 @@ from config.sources import SOURCE_TIER_MAP, SOURCE_TIER_PATTERNS
 from config.settings import (
     OUTPUT_DIR, DATABASE_PATH, MAX_ARTICLE_AGE_DAYS,
     FETCH_TIMEOUT, MAX_CONCURRENT_REQUESTS, PERIOD_DAYS,
+    SQLITE_JOURNAL_MODE, SQLITE_SYNCHRONOUS, SQLITE_MMAP_SIZE,
+    SQLITE_CACHE_SIZE_KB, SQLITE_BUSY_TIMEOUT_MS,
+    HTTP_CACHE_PATH, HTTP_CACHE_MAX_AGE_DAYS,
+    LLM_CACHE_PATH, LLM_CACHE_TTL_DAYS, LLM_CACHE_MAX_ENTRIES,
+    LLM_TELEMETRY_PATH, LLM_TELEMETRY_RETENTION_DAYS,
+    LLM_PRICE_INPUT_PER_MTOK, LLM_PRICE_OUTPUT_PER_MTOK,
+    TRANSLATION_CACHE_PATH, TRANSLATION_CACHE_TTL_DAYS, TRANSLATION_CACHE_MAX_ENTRIES,
+    LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE, LLM_MAX_IN_FLIGHT,
+    LLM_BREAKER_WINDOW, LLM_BREAKER_MIN_CALLS, LLM_BREAKER_ERROR_RATE,
+    LLM_BREAKER_SLOW_SECONDS, LLM_BREAKER_COOLDOWN, LLM_BREAKER_MAX_COOLDOWN,
+    LLM_BATCH_TOKEN_BUDGET, LLM_BATCH_INITIAL_SIZE, LLM_BATCH_MAX_SIZE,
+    LLM_CLUSTER_SIMILARITY, LLM_CLUSTER_MIN_BIGRAMS, RETRANSLATE_CHUNK_SIZE,
+    RELEVANCE_MODEL_PATH, RELEVANCE_PREFILTER_MODE, RELEVANCE_MIN_RECALL,
+    RELEVANCE_MIN_TRAIN_SAMPLES,
+    HOST_RATE_LIMITS, DEFAULT_HOST_RATE_LIMIT, FETCH_FAMILY_TIMEOUTS,
+    HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE,
+    PAGE_CACHE_DIR, PAGE_CACHE_TTL_DAYS, PAGE_CACHE_NEGATIVE_TTL_HOURS,
 )
 from config.queries import (
     INDUSTRY_QUERY_NOISE_SUFFIX, OFFICIAL_SITE_QUERIES, DAILY_LANGUAGE_PROFILES,
@@ -18,3 +18,120 @@ PERIOD_DAYS = {
     "month": 30,
     "all":   90,
 }
+
+# ─── SQLite 连接参数 ─────────────────────────────────────────────────
+# sqlite_conn.connect() 统一应用于 monitor.db 与各缓存库。WAL 让 daily_check 等只读
+# 进程与 monitor.py run 的写入互不阻塞；WAL 下 synchronous=NORMAL 仅在检查点时 fsync，
+# 断电最多丢失最后几个事务，不会损坏库文件。
+SQLITE_JOURNAL_MODE = "WAL"
+SQLITE_SYNCHRONOUS = "NORMAL"
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024   # 字节；读多的报表/去重查询直接走内存映射
+SQLITE_CACHE_SIZE_KB = 32 * 1024       # 每个连接的页缓存上限
+SQLITE_BUSY_TIMEOUT_MS = 15000         # 遇到写锁时等待，而不是立即报 database is locked
+
+# ─── HTTP 条件请求缓存 ────────────────────────────────────────────────
+# 与 monitor.db 同目录：记录每个 feed URL 的 ETag / Last-Modified 及上次解析结果，
+# 源站返回 304 时直接复用，不再下载与解析。
+HTTP_CACHE_PATH = str(PROJECT_ROOT / "data" / "http_cache.db")
+HTTP_CACHE_MAX_AGE_DAYS = 30   # 超过该天数未被刷新的缓存条目在打开时清理
+
+# ─── LLM 响应缓存 ─────────────────────────────────────────────────────
+# 键为（模型, 系统提示词摘要, 规范化输入），重跑 / retranslate / 周报回读时
+# 相同输入直接复用上次的返回。环境变量 LLM_CACHE_BYPASS=1 或 --no-llm-cache 跳过缓存。
+LLM_CACHE_PATH = str(PROJECT_ROOT / "data" / "llm_cache.db")
+LLM_CACHE_TTL_DAYS = 30         # 写入超过该天数的条目失效（提示词/模型更新也会自然换键）
+LLM_CACHE_MAX_ENTRIES = 20000   # 超出后按最近使用时间淘汰
+
+# ─── LLM 调用遥测 ─────────────────────────────────────────────────────
+# 每次 LLM 调用的用途、token、延迟、重试与解析结果，monitor.py llm-stats 汇总。
+# 单价（元 / 百万 token）只用于报表估算费用；硅基流动 Qwen3-8B 免费，默认 0。
+LLM_TELEMETRY_PATH = str(PROJECT_ROOT / "data" / "llm_telemetry.db")
+LLM_TELEMETRY_RETENTION_DAYS = 90
+LLM_PRICE_INPUT_PER_MTOK = 0.0
+LLM_PRICE_OUTPUT_PER_MTOK = 0.0
+
+# ─── Google Translate 翻译缓存 ────────────────────────────────────────
+# LLM 不可用时的回退翻译结果，键为（源语言, 全文 SHA-256）。
+TRANSLATION_CACHE_PATH = str(PROJECT_ROOT / "data" / "translation_cache.db")
+TRANSLATION_CACHE_TTL_DAYS = 90         # 写入超过该天数的译文失效
+TRANSLATION_CACHE_MAX_ENTRIES = 50000   # 超出后按最近使用时间淘汰
+
+# ─── LLM 请求调度 ─────────────────────────────────────────────────────
+# 替代原先每批/每条固定 sleep(4)：按每分钟请求数与 token 预算放行，最多 N 个请求同时在途；
+# 429 / "try again in Xs" 时所有工作线程共同退避。默认值对应硅基流动免费层的保守配额。
+LLM_REQUESTS_PER_MINUTE = 30
+LLM_TOKENS_PER_MINUTE = 40000
+LLM_MAX_IN_FLIGHT = 4
+
+# LLM 端点熔断：最近 WINDOW 次请求（至少 MIN_CALLS 次）失败率 ≥ ERROR_RATE 或平均耗时
+# ≥ SLOW_SECONDS 时断开，断开期间直接回退 Google Translate；COOLDOWN 秒后放行一个试探请求，
+# 试探失败则冷却时间翻倍（不超过 MAX_COOLDOWN）。
+LLM_BREAKER_WINDOW = 20
+LLM_BREAKER_MIN_CALLS = 4
+LLM_BREAKER_ERROR_RATE = 0.5
+LLM_BREAKER_SLOW_SECONDS = 20.0
+LLM_BREAKER_COOLDOWN = 30.0
+LLM_BREAKER_MAX_COOLDOWN = 300.0
+
+# ─── LLM 批量翻译批大小 ───────────────────────────────────────────────
+# 每次调用按估算的输入 + 输出 token（含系统提示词）装入文章，不超过 TOKEN_BUDGET；
+# 条数上限从 INITIAL_SIZE 起，连续完整解析时逐步增大到 MAX_SIZE，返回截断/缺条时减半。
+LLM_BATCH_TOKEN_BUDGET = 10000
+LLM_BATCH_INITIAL_SIZE = 3
+LLM_BATCH_MAX_SIZE = 10
+
+# ─── LLM 前聚类 ───────────────────────────────────────────────────────
+# 规范化 URL 相同或归一化标题 bigram Jaccard 达到阈值的条目只送一条代表进 LLM。
+# 阈值远高于语义去重（0.55），只合并转载/聚合造成的近乎相同标题。
+LLM_CLUSTER_SIMILARITY = 0.85
+LLM_CLUSTER_MIN_BIGRAMS = 12   # 标题 bigram 少于该数时不按相似度聚类（只看 URL）
+
+# ─── 历史重译（retranslate）──────────────────────────────────────────
+# 每轮从检查点取 CHUNK_SIZE 条交给批量翻译，译完在一个事务内写库并推进检查点；
+# 中断后重跑从剩余条目继续。--budget 在两轮之间检查。
+RETRANSLATE_CHUNK_SIZE = 20
+
+# ─── 本地相关性预筛模型（可选，依赖 NumPy）──────────────────────────
+# 用 monitor.db 中的历史判定训练（python monitor.py train-prefilter），对 LLM 前的条目打分，
+# 高置信"无价值"条目直接入池（decision_source="model"），不再调用 LLM。
+# 模式：off / shadow（只打分并与 LLM 结果比对）/ active；环境变量 RELEVANCE_PREFILTER_MODE 覆盖。
+# 模型文件只在本地训练与使用（不提交、CI 不缓存），CI 运行时没有模型文件，预筛不生效。
+RELEVANCE_MODEL_PATH = str(PROJECT_ROOT / "data" / "relevance_model.npz")
+RELEVANCE_PREFILTER_MODE = "shadow"
+RELEVANCE_MIN_RECALL = 0.98          # 召回护栏：校准集有价值条目的保留比例不低于该值，据此选跳过阈值
+RELEVANCE_MIN_TRAIN_SAMPLES = 300    # 有标签样本少于该数时拒绝训练
+
+# ─── 按域名限速（令牌桶）─────────────────────────────────────────────
+# rate: 初始速率（请求/秒）；burst: 允许的突发请求数；
+# max_rate: 健康时可逐步提速到的上限；min_rate: 连续 429 时降速的下限。
+# 不同域名的请求可以并行，同一域名的请求由令牌桶排队。
+HOST_RATE_LIMITS = {
+    # Google News RSS：原固定 2s 间隔 ≈ 0.5 req/s，健康时最多提到 1 req/s
+    "news.google.com":      {"rate": 0.5,    "burst": 1, "max_rate": 1.0, "min_rate": 0.1},
+    # GDELT 免费接口：原固定 12s 间隔
+    "api.gdeltproject.org": {"rate": 1 / 12, "burst": 1, "max_rate": 0.2, "min_rate": 1 / 30},
+    # Google Translate 回退：原每条之后固定 0.15~0.2s
+    "translate.google.com": {"rate": 5.0,    "burst": 2, "max_rate": 6.0, "min_rate": 0.5},
+}
+DEFAULT_HOST_RATE_LIMIT = {"rate": 2.0, "burst": 4, "max_rate": 4.0, "min_rate": 0.2}
+
+# ─── 抓取编排 ─────────────────────────────────────────────────────────
+# RSS / Google News / GDELT 三类信源并行抓取，各自的最长等待时间（秒）。
+# 超时的信源本轮按 0 条处理，不阻塞其余信源进入过滤流水线。
+FETCH_FAMILY_TIMEOUTS = {
+    "rss":         300,
+    "google_news": 1800,   # 周报全量查询约 500 条，受 news.google.com 令牌桶限速
+    "gdelt":       180,
+}
+
+# ─── 共享 HTTP 连接池 ─────────────────────────────────────────────────
+# 所有外部请求复用同一个 requests.Session（keep-alive），避免每次重新握手。
+HTTP_POOL_CONNECTIONS = 50                    # 缓存连接池的域名数
+HTTP_POOL_MAXSIZE = MAX_CONCURRENT_REQUESTS   # 单个域名最多保持的连接数，与并发度一致
+
+# ─── 文章页面缓存 ─────────────────────────────────────────────────────
+# 日期校正与正文抓取共用一次下载 + 一次解析，结果按内容摘要落盘，
+# 重跑与 retranslate 在 TTL 内不再重复下载同一页面。
+PAGE_CACHE_DIR = str(PROJECT_ROOT / "data" / "page_cache")
+PAGE_CACHE_TTL_DAYS = 14
+PAGE_CACHE_NEGATIVE_TTL_HOURS = 6   # 抓取失败（4xx/5xx/超时）的短期缓存，避免反复重试
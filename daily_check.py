@@ -39,8 +39,10 @@ from utils import (
     geography_display,
 )
 from models import Database
+import sqlite_conn
 from feishu_client import send_card
-from classifier import get_source_tier, _is_hardware_noise, _is_google_apple_non_core
+from classifier import get_source_tier
+from features import features_for
 
 
 # ── 机器人推送去重（记录已推送的 source_url，避免跨天重复推送）────────────
@@ -106,7 +108,7 @@ def get_daily_items() -> list:
         print(f"⚠️  数据库不存在: {DB_PATH}")
         return []
 
-    # daily_check 可独立运行，先确保旧数据库已经补齐新增列。
+    # daily_check 可独立运行，先确保数据库 schema 已迁移到最新（已是最新时只读一次 user_version）。
     migration_db = Database(str(DB_PATH))
     migration_db.close()
 
@@ -122,7 +124,7 @@ def get_daily_items() -> list:
     print(f"📅 日报筛选：date IN [{date_range_label}]，created_at >= {cutoff_utc} (UTC)"
           + (" (周一含周末)" if is_monday else ""))
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite_conn.connect(DB_PATH, readonly=True)
     conn.row_factory = sqlite3.Row
 
     placeholders = ",".join("?" for _ in date_list)
@@ -143,7 +145,8 @@ def get_daily_items() -> list:
                COALESCE(push_decision, 'pool_only') AS push_decision,
                COALESCE(value_score, 0) AS value_score,
                COALESCE(noise_reason, '判定失败') AS noise_reason,
-               COALESCE(decision_source, 'fallback') AS decision_source
+               COALESCE(decision_source, 'fallback') AS decision_source,
+               COALESCE(features_json, '') AS features_json
         FROM legislation
         WHERE date IN ({placeholders})
           AND created_at >= ?
@@ -155,12 +158,11 @@ def get_daily_items() -> list:
 
     conn.close()
 
-    # 实时噪音门控（兜底旧 DB 评分）
+    # 实时噪音门控（兜底旧 DB 评分）：优先读取入库时持久化的 ArticleFeatures
     def _is_noise(d: dict) -> bool:
-        text = " ".join(filter(None, [d.get("title", ""), d.get("title_zh", ""), d.get("summary", "")]))
-        return _is_hardware_noise(text) or _is_google_apple_non_core(text)
+        return features_for(d).is_noise
 
-    items = [dict(r) for r in rows if not _is_noise(dict(r))]
+    items = [d for d in (dict(r) for r in rows) if not _is_noise(d)]
 
     # 按 source_tier DESC → impact_score DESC 排序
     for d in items:
@@ -528,6 +530,13 @@ def main():
             print("📝 日报客观摘要跳过（无 API Key 或调用失败）")
     except Exception as e:
         print(f"⚠️  日报客观摘要生成失败（将跳过）: {e}")
+    finally:
+        import llm_cache
+        import llm_dispatch
+        import translation_cache
+        llm_cache.log_summary()
+        llm_dispatch.log_summary()
+        translation_cache.log_summary()
 
     card = build_daily_card(
         push_items,
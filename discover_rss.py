@@ -10,7 +10,8 @@ import concurrent.futures
 from typing import Optional
 import warnings
 warnings.filterwarnings("ignore")
-import requests
+
+import http_session
 
 # ── 探测路径（从最常见到最少见）────────────────────────────────────────
 PROBE_PATHS = [
@@ -121,7 +122,7 @@ def is_valid_feed(content: bytes) -> bool:
 def probe_url(url: str) -> Optional[str]:
     """探测单个 URL，有效返回 URL，否则返回 None。"""
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=6,
+        resp = http_session.get(url, headers=HEADERS, timeout=6,
                             allow_redirects=True, stream=False)
         if resp.status_code == 200:
             ct = resp.headers.get("content-type", "")
@@ -184,8 +185,10 @@ def main():
         time.sleep(0.5)
 
     # ── 汇总报告 ──────────────────────────────────────────────────────
+    pool = http_session.stats()
     print("\n" + "=" * 64)
     print(f"扫描完成。共发现 {len(all_found)} 个未收录的有效 feed：")
+    print(f"（请求 {pool['requests']} 次，新建连接 {pool['new_connections']} 个，复用率 {pool['reuse_rate']:.0%}）")
     print("=" * 64)
 
     if not all_found:
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import hashlib
 import re
-from dataclasses import asdict, is_dataclass
 
-from utils import _bigram_sim, normalize_jurisdiction
+from features import features_for, item_field
+from utils import BigramIndex, _bigram_jaccard, bigram_rank_order, normalize_jurisdiction
 
 
 _ENTITY_PATTERNS = [
@@ -63,6 +63,9 @@ _STAGE_EVIDENCE = re.compile(
     re.I,
 )
 
+# same_event 在无强 key 时对同管辖区、同大类标题的相似度要求
+_SAME_CATEGORY_SIMILARITY = 0.62
+
 _STATUS_RANK = {
     "已废止": 1,
     "立法动态": 2,
@@ -76,42 +79,26 @@ _STATUS_RANK = {
 }
 
 
-def _item_dict(item) -> dict:
-    if isinstance(item, dict):
-        return item
-    if is_dataclass(item):
-        return asdict(item)
-    return vars(item)
+def match_entities(text: str) -> tuple:
+    """Entity keys found in the event text, in _ENTITY_PATTERNS order."""
+    return tuple(name for name, pattern in _ENTITY_PATTERNS if pattern.search(text))
 
 
-def _event_text(item) -> str:
-    data = _item_dict(item)
-    return " ".join(filter(None, (
-        data.get("title", ""),
-        data.get("title_zh", ""),
-        data.get("summary", ""),
-        data.get("summary_zh", ""),
-    )))
+def match_topics(text: str) -> tuple:
+    """Topic keys found in the event text, in _TOPIC_PATTERNS order."""
+    return tuple(name for name, pattern in _TOPIC_PATTERNS if pattern.search(text))
 
 
-def _normalized_title(item) -> str:
-    data = _item_dict(item)
-    title = data.get("title_zh") or data.get("title") or ""
-    title = re.sub(r"^\s*[\[【][^\]】]{1,16}[\]】]\s*", "", title)
+def normalize_title(title: str) -> str:
+    title = re.sub(r"^\s*[\[【][^\]】]{1,16}[\]】]\s*", "", title or "")
     return re.sub(r"[^\w\u3400-\u9fff]+", "", title.lower())
 
 
-def _matched_entity_keys(item) -> set[str]:
-    text = _event_text(item)
-    return {name for name, pattern in _ENTITY_PATTERNS if pattern.search(text)}
-
-
 def build_event_key(item) -> str:
     """Build a stable internal key without exposing it to Bitable."""
-    data = _item_dict(item)
-    text = _event_text(data)
-    entities = [name for name, pattern in _ENTITY_PATTERNS if pattern.search(text)]
-    topics = [name for name, pattern in _TOPIC_PATTERNS if pattern.search(text)]
+    features = features_for(item)
+    entities = features.entities
+    topics = features.topics
 
     specific = next((name for name in entities if name in _SPECIFIC_LAW_KEYS), "")
     if specific:
@@ -121,30 +108,36 @@ def build_event_key(item) -> str:
         core = ":".join(sorted(set(entities)) + sorted(set(topics)))
         return f"strong:{core}"
 
-    jurisdiction = normalize_jurisdiction(data.get("jurisdiction", ""))
-    title = _normalized_title(data)
+    jurisdiction = normalize_jurisdiction(item_field(item, "jurisdiction"))
+    title = features.normalized_title
     fallback = f"{jurisdiction}|{title}"
     digest = hashlib.sha1(fallback.encode("utf-8")).hexdigest()[:20]
     return f"title:{digest}"
 
 
+def event_geo(item) -> str:
+    """Jurisdiction when known, otherwise the region group."""
+    return normalize_jurisdiction(item_field(item, "jurisdiction")) or item_field(item, "region")
+
+
 def same_event(left, right) -> bool:
     """Conservative event match for records no more than 30 days apart."""
-    left_data, right_data = _item_dict(left), _item_dict(right)
-    left_key = left_data.get("event_key") or build_event_key(left_data)
-    right_key = right_data.get("event_key") or build_event_key(right_data)
-    left_geo = normalize_jurisdiction(left_data.get("jurisdiction", "")) or left_data.get("region", "")
-    right_geo = normalize_jurisdiction(right_data.get("jurisdiction", "")) or right_data.get("region", "")
+    left_features, right_features = features_for(left), features_for(right)
+    left_key = item_field(left, "event_key") or build_event_key(left)
+    right_key = item_field(right, "event_key") or build_event_key(right)
+    left_geo, right_geo = event_geo(left), event_geo(right)
     if left_geo and right_geo and left_geo != right_geo:
         return False
 
-    left_companies = _matched_entity_keys(left_data) & _COMPANY_KEYS
-    right_companies = _matched_entity_keys(right_data) & _COMPANY_KEYS
+    left_companies = set(left_features.entities) & _COMPANY_KEYS
+    right_companies = set(right_features.entities) & _COMPANY_KEYS
     if left_companies and right_companies and left_companies.isdisjoint(right_companies):
         return False
 
-    left_title, right_title = _normalized_title(left_data), _normalized_title(right_data)
-    title_similarity = _bigram_sim(left_title, right_title)
+    left_title, right_title = left_features.normalized_title, right_features.normalized_title
+    title_similarity = _bigram_jaccard(
+        left_features.normalized_title_bigrams, right_features.normalized_title_bigrams,
+    )
     if left_key.startswith("strong:") and left_key == right_key:
         if left_key.removeprefix("strong:") in _SPECIFIC_LAW_KEYS:
             return True
@@ -154,29 +147,83 @@ def same_event(left, right) -> bool:
     if left_title and left_title == right_title:
         return True
 
-    left_category = left_data.get("category_l1")
-    same_category = bool(left_category) and left_category == right_data.get("category_l1")
+    left_category = item_field(left, "category_l1")
+    same_category = bool(left_category) and left_category == item_field(right, "category_l1")
     return bool(
         left_geo
         and left_geo == right_geo
         and same_category
-        and title_similarity >= 0.62
+        and title_similarity >= _SAME_CATEGORY_SIMILARITY
     )
 
 
+class EventIndex:
+    """
+    In-memory candidate index for same_event lookups.
+
+    same_event(candidate, item) can only hold when the two records share an
+    event key, share a non-empty normalized title, or sit in the same
+    (geo, category_l1) block with title similarity >= _SAME_CATEGORY_SIMILARITY.
+    candidates() returns exactly the records meeting one of those preconditions,
+    in insertion order, so callers scanning them get the same first match as a
+    scan over every record.
+    """
+
+    def __init__(self, records=()):
+        records = list(records)
+        self._records: list = []
+        self._by_key: dict = {}
+        self._by_title: dict = {}
+        self._similar = BigramIndex(
+            _SAME_CATEGORY_SIMILARITY,
+            bigram_rank_order(features_for(r).normalized_title_bigrams for r in records),
+        )
+        for record in records:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @staticmethod
+    def _block(item):
+        geo, category = event_geo(item), item_field(item, "category_l1")
+        return (geo, category) if geo and category else None
+
+    def add(self, record) -> None:
+        """Index a record; its event_key must already be set."""
+        seq = len(self._records)
+        self._records.append(record)
+        features = features_for(record)
+        self._by_key.setdefault(item_field(record, "event_key"), []).append(seq)
+        if features.normalized_title:
+            self._by_title.setdefault(features.normalized_title, []).append(seq)
+        block = self._block(record)
+        if block is not None:
+            self._similar.add(seq, features.normalized_title_bigrams, block)
+
+    def candidates(self, item) -> list:
+        features = features_for(item)
+        found = set(self._by_key.get(item_field(item, "event_key") or build_event_key(item), ()))
+        if features.normalized_title:
+            found.update(self._by_title.get(features.normalized_title, ()))
+        block = self._block(item)
+        if block is not None:
+            found |= self._similar.candidates(features.normalized_title_bigrams, [block])
+        return [self._records[seq] for seq in sorted(found)]
+
+
 def is_meaningful_progress(existing, incoming) -> bool:
     """Allow a later legal stage only when the incoming raw text supports it."""
-    existing_data, incoming_data = _item_dict(existing), _item_dict(incoming)
-    old_rank = _STATUS_RANK.get(existing_data.get("status", ""), 0)
-    new_rank = _STATUS_RANK.get(incoming_data.get("status", ""), 0)
+    old_rank = _STATUS_RANK.get(item_field(existing, "status"), 0)
+    new_rank = _STATUS_RANK.get(item_field(incoming, "status"), 0)
     raw_text = " ".join(filter(None, (
-        incoming_data.get("title", ""), incoming_data.get("summary", ""),
+        item_field(incoming, "title"), item_field(incoming, "summary"),
     )))
     if not _STAGE_EVIDENCE.search(raw_text):
         return False
 
-    old_status = existing_data.get("status", "")
-    new_status = incoming_data.get("status", "")
+    old_status = item_field(existing, "status")
+    new_status = item_field(incoming, "status")
     if new_status == old_status:
         return False
     if new_status in {"修订变更", "执法动态", "已废止"}:
@@ -0,0 +1,292 @@
+"""
+逐条文章文本特征（ArticleFeatures）
+
+同一条目的标题/摘要会被多个阶段反复 lower() 和正则扫描：相关性过滤、分类评分、
+事件去重（event_dedup / reporter 指纹 / monitor 语义去重）、跨日去重和日报噪音门控。
+ArticleFeatures 把这些派生结果挂在条目上（dict 条目记在旁表里），按需计算、逐项缓存：
+
+  视图     依赖字段                                 特征
+  raw      title, summary                           中国大陆 / 硬噪音 / 信号组 / 规则扫描
+  noise    title, title_zh, summary                 硬件噪音 / Google-Apple 非核心
+  event    title, title_zh, summary, summary_zh     事件实体 / 议题 / 指纹
+  title    title, title_zh                          归一化标题 / bigram 集合
+
+字段被改写（翻译回填、摘要截断、时间轴追加）后，依赖该字段的视图自动失效，其余
+视图继续复用。写库时序列化为 legislation.features_json（附各视图的字段摘要），
+daily_check / reporter 等其他进程读取时只采用摘要仍与当前字段一致的部分。
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+_FEATURES_VERSION = 1
+_TEXT_FIELDS = ("title", "summary", "title_zh", "summary_zh")
+
+_VIEWS = {
+    "raw":   ("title", "summary"),
+    "noise": ("title", "title_zh", "summary"),
+    "event": ("title", "title_zh", "summary", "summary_zh"),
+    "title": ("title", "title_zh"),
+}
+
+# 特征名 → 所属视图
+_FEATURE_VIEW = {
+    "china_mainland": "raw",
+    "hard_noise": "raw",
+    "signals": "raw",
+    "rule_scan": "raw",
+    "hardware_noise": "noise",
+    "google_apple_non_core": "noise",
+    "entities": "event",
+    "topics": "event",
+    "fingerprint_terms": "event",
+    "normalized_title": "title",
+    "title_bigrams": "title",
+    "normalized_title_bigrams": "title",
+}
+
+# 写库时保证计算并持久化的特征（跨进程读取方需要的部分）
+_PERSISTED = (
+    "hardware_noise", "google_apple_non_core",
+    "entities", "topics", "fingerprint_terms", "normalized_title",
+)
+
+
+def item_field(item, name: str, default=""):
+    """兼容 dict 与 LegislationItem 的字段读取。"""
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
+
+
+def _view_digest(fields: Dict[str, str], view: str) -> str:
+    joined = "\x1f".join(fields[name] for name in _VIEWS[view])
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()[:16]
+
+
+class ArticleFeatures:
+    """单条文章的文本特征：属性首次访问时计算，之后直接返回缓存值。"""
+
+    __slots__ = ("fields", "_values")
+
+    def __init__(self, title: str = "", summary: str = "",
+                 title_zh: str = "", summary_zh: str = ""):
+        self.fields = {
+            "title": title or "",
+            "summary": summary or "",
+            "title_zh": title_zh or "",
+            "summary_zh": summary_zh or "",
+        }
+        self._values: dict = {}
+
+    # ── 文本视图 ──────────────────────────────────────────────────────
+
+    @property
+    def raw_text(self) -> str:
+        """抓取阶段的原文：相关性过滤与分类使用。"""
+        return f"{self.fields['title']} {self.fields['summary']}"
+
+    @property
+    def noise_text(self) -> str:
+        f = self.fields
+        return " ".join(filter(None, (f["title"], f["title_zh"], f["summary"])))
+
+    @property
+    def event_text(self) -> str:
+        f = self.fields
+        return " ".join(filter(None, (f["title"], f["title_zh"], f["summary"], f["summary_zh"])))
+
+    @property
+    def display_title(self) -> str:
+        """去重比较用标题：优先中文译名。"""
+        return self.fields["title_zh"] or self.fields["title"]
+
+    def _get(self, name: str, compute):
+        try:
+            return self._values[name]
+        except KeyError:
+            value = self._values[name] = compute()
+            return value
+
+    # ── raw 视图 ──────────────────────────────────────────────────────
+
+    @property
+    def china_mainland(self) -> bool:
+        from classifier import is_china_mainland
+        return self._get("china_mainland", lambda: is_china_mainland(self.raw_text))
+
+    @property
+    def hard_noise(self) -> bool:
+        from fetcher import _is_multilingual_hard_noise
+        return self._get("hard_noise", lambda: _is_multilingual_hard_noise(self.raw_text))
+
+    def has_signal(self, group: str) -> bool:
+        """fetcher.SIGNALS 信号组是否命中原文（小写）；各组独立缓存，保持过滤的短路顺序。"""
+        from fetcher import SIGNALS
+        signals = self._get("signals", dict)
+        if group not in signals:
+            signals[group] = SIGNALS.has(group, self.raw_text.lower())
+        return signals[group]
+
+    @property
+    def rule_scan(self):
+        """classifier 规则表扫描结果（RuleScan），与 classify_article 的输入文本一致。"""
+        from classifier import scan_rules
+        return self._get("rule_scan", lambda: scan_rules(self.raw_text.strip()))
+
+    @property
+    def country_hits(self) -> Dict[str, int]:
+        return self.rule_scan.countries
+
+    # ── noise 视图 ────────────────────────────────────────────────────
+
+    @property
+    def hardware_noise(self) -> bool:
+        from classifier import _is_hardware_noise
+        return self._get("hardware_noise", lambda: _is_hardware_noise(self.noise_text))
+
+    @property
+    def google_apple_non_core(self) -> bool:
+        from classifier import _is_google_apple_non_core
+        return self._get(
+            "google_apple_non_core", lambda: _is_google_apple_non_core(self.noise_text)
+        )
+
+    @property
+    def is_noise(self) -> bool:
+        return self.hardware_noise or self.google_apple_non_core
+
+    # ── event 视图 ────────────────────────────────────────────────────
+
+    @property
+    def entities(self) -> tuple:
+        from event_dedup import match_entities
+        return self._get("entities", lambda: match_entities(self.event_text))
+
+    @property
+    def topics(self) -> tuple:
+        from event_dedup import match_topics
+        return self._get("topics", lambda: match_topics(self.event_text))
+
+    @property
+    def fingerprint_terms(self) -> frozenset:
+        """reporter 事件指纹中的实体/议题部分（E:/T:），区域部分由调用方按当前 region 补上。"""
+        from reporter import _fingerprint_terms
+        return self._get("fingerprint_terms", lambda: _fingerprint_terms(self.event_text))
+
+    # ── title 视图 ────────────────────────────────────────────────────
+
+    @property
+    def normalized_title(self) -> str:
+        from event_dedup import normalize_title
+        return self._get("normalized_title", lambda: normalize_title(self.display_title))
+
+    @property
+    def title_bigrams(self) -> frozenset:
+        from utils import _bigram_set
+        return self._get("title_bigrams", lambda: _bigram_set(self.display_title))
+
+    @property
+    def normalized_title_bigrams(self) -> frozenset:
+        from utils import _bigram_set
+        return self._get(
+            "normalized_title_bigrams", lambda: _bigram_set(self.normalized_title)
+        )
+
+    # ── 失效 / 持久化 ─────────────────────────────────────────────────
+
+    def _inherit(self, other: "ArticleFeatures") -> None:
+        """从旧特征中复用依赖字段未变化的视图。"""
+        unchanged = {
+            view for view, names in _VIEWS.items()
+            if all(self.fields[n] == other.fields[n] for n in names)
+        }
+        for name, value in other._values.items():
+            if _FEATURE_VIEW[name] in unchanged:
+                self._values.setdefault(name, value)
+
+    def to_json(self) -> str:
+        """序列化持久化特征（缺失的先计算），附各视图的字段摘要用于读取时校验。"""
+        for name in _PERSISTED:
+            getattr(self, name)
+        values = {}
+        for name in _PERSISTED:
+            value = self._values[name]
+            values[name] = sorted(value) if isinstance(value, frozenset) else value
+        views = sorted({_FEATURE_VIEW[name] for name in _PERSISTED})
+        return json.dumps({
+            "v": _FEATURES_VERSION,
+            "views": {view: _view_digest(self.fields, view) for view in views},
+            "values": values,
+        }, ensure_ascii=False, separators=(",", ":"))
+
+    def load_json(self, payload: str) -> None:
+        """载入持久化特征；版本不符、解析失败或字段摘要不一致的视图一律忽略。"""
+        try:
+            data = json.loads(payload)
+        except (TypeError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("v") != _FEATURES_VERSION:
+            return
+        fresh = {
+            view for view, digest in (data.get("views") or {}).items()
+            if view in _VIEWS and digest == _view_digest(self.fields, view)
+        }
+        for name, value in (data.get("values") or {}).items():
+            if name not in _PERSISTED or _FEATURE_VIEW[name] not in fresh:
+                continue
+            if name in ("entities", "topics"):
+                value = tuple(value)
+            elif name == "fingerprint_terms":
+                value = frozenset(value)
+            self._values.setdefault(name, value)
+
+
+# dict 条目不能挂属性、也不能弱引用，特征放在按 id() 索引的旁表里，不写进 dict 本身
+# （否则 JSON 序列化 / 写库时会带上不可序列化的对象）。id 被新对象复用时旧记录
+# 只会在字段完全一致（或视图依赖字段一致）时被采用，而特征是字段的纯函数，结果不受影响。
+_DICT_FEATURES_MAX = 50000
+_dict_features: "OrderedDict[int, ArticleFeatures]" = OrderedDict()
+_dict_features_lock = threading.Lock()
+
+
+def _cached_features(item) -> Optional[ArticleFeatures]:
+    if not isinstance(item, dict):
+        return getattr(item, "_features", None)
+    with _dict_features_lock:
+        return _dict_features.get(id(item))
+
+
+def _attach_features(item, features: ArticleFeatures) -> None:
+    if not isinstance(item, dict):
+        item._features = features
+        return
+    with _dict_features_lock:
+        _dict_features[id(item)] = features
+        _dict_features.move_to_end(id(item))
+        while len(_dict_features) > _DICT_FEATURES_MAX:
+            _dict_features.popitem(last=False)
+
+
+def features_for(item) -> ArticleFeatures:
+    """返回条目（dict 或 LegislationItem）当前文本对应的特征，并缓存以便复用。
+
+    条目已挂特征且字段未变 → 原样返回；字段有变 → 新建并继承未受影响的视图；
+    数据库行带 features_json → 先载入其中仍然有效的部分。
+    """
+    fields = {name: item_field(item, name) or "" for name in _TEXT_FIELDS}
+    current = _cached_features(item)
+    if current is not None and current.fields == fields:
+        return current
+
+    features = ArticleFeatures(**fields)
+    if current is not None:
+        features._inherit(current)
+    payload = item_field(item, "features_json", "")
+    if payload:
+        features.load_json(payload)
+    _attach_features(item, features)
+    return features
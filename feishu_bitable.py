@@ -32,9 +32,9 @@ import os
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-import requests
+import http_session
 
 from utils import (
     APPLICABILITY_SCOPE_LABELS, _get_region_group,
@@ -101,7 +101,7 @@ def resolve_wiki_app_token(wiki_token: str, access_token: str) -> str:
     将知识库（Wiki）页面 token 解析为多维表格的实际 app_token。
     知识库中的多维表格 URL：/wiki/JkHXXX → 需调用 Wiki API 获取 obj_token。
     """
-    resp = requests.get(
+    resp = http_session.get(
         _WIKI_NODE_URL,
         params={"token": wiki_token},
         headers={"Authorization": f"Bearer {access_token}"},
@@ -242,7 +242,7 @@ def write_to_bitable(
         batch   = items[i : i + _BATCH_SIZE]
         records = [_build_record(item, available_fields=available_fields) for item in batch]
 
-        resp = requests.post(
+        resp = http_session.post(
             url,
             headers=headers,
             json={"records": records},
@@ -275,7 +275,7 @@ def get_bitable_field_names(
     url = _FIELDS_URL.format(app_token=app_token, table_id=table_id)
     headers = {"Authorization": f"Bearer {access_token}"}
     try:
-        resp = requests.get(url, headers=headers, params={"page_size": 500}, timeout=20)
+        resp = http_session.get(url, headers=headers, params={"page_size": 500}, timeout=20)
         resp.raise_for_status()
         data = resp.json()
         if data.get("code") != 0:
@@ -559,7 +559,7 @@ def fetch_valid_records_from_bitable(
             if page_token:
                 params["page_token"] = page_token
 
-            resp = requests.get(list_url, headers=headers, params=params, timeout=30)
+            resp = http_session.get(list_url, headers=headers, params=params, timeout=30)
             resp.raise_for_status()
             data = resp.json()
 
@@ -649,46 +649,59 @@ def fetch_valid_records_from_bitable(
         return []
 
 
+def _has_table_credentials() -> bool:
+    return bool(
+        os.environ.get("FEISHU_APP_ID") and os.environ.get("FEISHU_APP_SECRET")
+        and os.environ.get("FEISHU_BITABLE_TABLE_ID")
+        and (os.environ.get("FEISHU_BITABLE_WIKI_TOKEN") or os.environ.get("FEISHU_BITABLE_APP_TOKEN"))
+    )
+
+
+def _fetch_all_records() -> list:
+    """按环境变量中的凭证分页拉取整张表的记录（page_size=500）；失败时抛异常。"""
+    app_token = os.environ.get("FEISHU_BITABLE_APP_TOKEN", "")
+    wiki_token = os.environ.get("FEISHU_BITABLE_WIKI_TOKEN", "")
+    table_id = os.environ.get("FEISHU_BITABLE_TABLE_ID", "")
+    token = get_tenant_access_token(
+        os.environ.get("FEISHU_APP_ID", ""), os.environ.get("FEISHU_APP_SECRET", "")
+    )
+    if wiki_token:
+        app_token = resolve_wiki_app_token(wiki_token, token)
+
+    list_url = _LIST_URL.format(app_token=app_token, table_id=table_id)
+    headers  = {"Authorization": f"Bearer {token}"}
+
+    all_records: list = []
+    page_token: Optional[str] = None
+    while True:
+        params: dict = {"page_size": 500}
+        if page_token:
+            params["page_token"] = page_token
+        resp = http_session.get(list_url, headers=headers, params=params, timeout=30)
+        resp.raise_for_status()
+        data = resp.json()
+        if data.get("code") != 0:
+            raise RuntimeError(f"拉取记录失败: {data.get('msg')}")
+        batch = data.get("data", {}).get("items", [])
+        all_records.extend(batch)
+        has_more   = data.get("data", {}).get("has_more", False)
+        page_token = data.get("data", {}).get("page_token")
+        if not has_more or not page_token:
+            break
+    return all_records
+
+
 def fetch_noise_feedback_stats(days: int = 30) -> dict:
     """
     读取最近一段时间的人工状态，按信源统计总样本、噪音数、比率和原因。
     若凭证未配置或 API 失败，返回空字典。
     """
-    app_id     = os.environ.get("FEISHU_APP_ID", "")
-    app_secret = os.environ.get("FEISHU_APP_SECRET", "")
-    wiki_token = os.environ.get("FEISHU_BITABLE_WIKI_TOKEN", "")
-    app_token  = os.environ.get("FEISHU_BITABLE_APP_TOKEN", "")
-    table_id   = os.environ.get("FEISHU_BITABLE_TABLE_ID", "")
-
-    if not all([app_id, app_secret, table_id]) or not (wiki_token or app_token):
+    if not _has_table_credentials():
         print("⏭️  未配置飞书多维表格凭证，跳过噪音统计")
         return {}
 
     try:
-        token = get_tenant_access_token(app_id, app_secret)
-        if wiki_token:
-            app_token = resolve_wiki_app_token(wiki_token, token)
-
-        list_url = _LIST_URL.format(app_token=app_token, table_id=table_id)
-        headers  = {"Authorization": f"Bearer {token}"}
-
-        all_records: list = []
-        page_token: Optional[str] = None
-        while True:
-            params: dict = {"page_size": 500}
-            if page_token:
-                params["page_token"] = page_token
-            resp = requests.get(list_url, headers=headers, params=params, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-            if data.get("code") != 0:
-                raise RuntimeError(f"拉取记录失败: {data.get('msg')}")
-            batch = data.get("data", {}).get("items", [])
-            all_records.extend(batch)
-            has_more   = data.get("data", {}).get("has_more", False)
-            page_token = data.get("data", {}).get("page_token")
-            if not has_more or not page_token:
-                break
+        all_records = _fetch_all_records()
 
         cutoff = (datetime.now(tz=timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
         stats: dict = {}
@@ -731,6 +744,36 @@ def fetch_noise_feedback_stats(days: int = 30) -> dict:
         return {}
 
 
+def fetch_triage_labels() -> Dict[str, int]:
+    """
+    读取人工初筛结果作为相关性预筛的训练标签：原始链接 → 1（保留）/ 0（噪音/不推送）。
+    待初筛记录不计入。凭证未配置或 API 失败时返回空字典。
+    """
+    if not _has_table_credentials():
+        print("⏭️  未配置飞书多维表格凭证，跳过人工标签")
+        return {}
+    try:
+        records = _fetch_all_records()
+    except Exception as exc:
+        print(f"❌ 获取人工初筛标签失败: {exc}")
+        return {}
+
+    labels: Dict[str, int] = {}
+    for rec in records:
+        fields = rec.get("fields", {})
+        status_val = str(fields.get("处理状态", "")).strip()
+        if not status_val or "待初筛" in status_val:
+            continue
+        link_raw = fields.get("原始链接", "")
+        if isinstance(link_raw, dict):
+            url = link_raw.get("link") or link_raw.get("url") or ""
+        else:
+            url = str(link_raw or "")
+        if url:
+            labels[url.strip()] = 0 if ("噪音" in status_val or "不推送" in status_val) else 1
+    return labels
+
+
 def fetch_noise_source_stats() -> dict:
     """Backward-compatible noise counts used by older callers."""
     stats = fetch_noise_feedback_stats()
@@ -744,12 +787,14 @@ if __name__ == "__main__":
     import sqlite3
     from pathlib import Path as _P
 
+    import sqlite_conn
+
     db = _P(__file__).parent / "data" / "monitor.db"
     if not db.exists():
         print("❌ 数据库不存在，请先运行 monitor.py 抓取数据")
         sys.exit(1)
 
-    conn = sqlite3.connect(db)
+    conn = sqlite_conn.connect(db, readonly=True)
     conn.row_factory = sqlite3.Row
     rows = conn.execute(
         """SELECT title, title_zh, summary_zh, summary, region, status, category_l1,
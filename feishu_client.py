@@ -15,7 +15,7 @@ import json
 import os
 import time
 
-import requests
+import http_session
 
 # ── 飞书 API 端点 ────────────────────────────────────────────────────────
 _TOKEN_URL = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
@@ -28,7 +28,7 @@ def get_tenant_access_token(app_id: str = "", app_secret: str = "") -> str:
     """获取 tenant_access_token（有效期 2 小时）。"""
     app_id = app_id or os.environ["FEISHU_APP_ID"]
     app_secret = app_secret or os.environ["FEISHU_APP_SECRET"]
-    resp = requests.post(
+    resp = http_session.post(
         _TOKEN_URL,
         json={"app_id": app_id, "app_secret": app_secret},
         timeout=10,
@@ -56,7 +56,7 @@ def send_card(chat_id: str, card: dict, max_retries: int = 3) -> bool:
     }
     for attempt in range(max_retries):
         try:
-            resp = requests.post(
+            resp = http_session.post(
                 f"{_MSG_URL}?receive_id_type=chat_id",
                 headers=headers,
                 json=payload,
@@ -7,6 +7,7 @@ import re
 import json
 import time
 import logging
+import threading
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from typing import List, Optional
@@ -19,6 +20,8 @@ from utils import MEDIA_SUFFIX_RE
 import requests
 from bs4 import BeautifulSoup
 
+import http_session
+
 from config import (
     RSS_FEEDS,
     KEYWORDS,
@@ -32,6 +35,7 @@ from config import (
     FETCH_TIMEOUT,
     MAX_CONCURRENT_REQUESTS,
     MAX_ARTICLE_AGE_DAYS,
+    FETCH_FAMILY_TIMEOUTS,
     DAILY_GOOGLE_NEWS_EN,
     DAILY_GOOGLE_NEWS_JA,
     DAILY_GOOGLE_NEWS_KO,
@@ -47,6 +51,12 @@ from config import (
 )
 from models import LegislationItem
 from classifier import classify_article, is_china_mainland
+from features import features_for
+from http_cache import FeedCache, get_feed_cache
+from rate_limit import get_limiter, parse_retry_after
+from article_page import (  # noqa: F401  _parse_*_date 保留旧导入路径
+    fetch_article_page, get_page_cache, _parse_iso_date, _parse_human_date,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,15 +72,29 @@ HEADERS = {
 }
 
 
-def safe_get(url: str, timeout: int = FETCH_TIMEOUT, max_retries: int = 3) -> Optional[requests.Response]:
+def safe_get(
+    url: str,
+    timeout: int = FETCH_TIMEOUT,
+    max_retries: int = 3,
+    extra_headers: Optional[dict] = None,
+) -> Optional[requests.Response]:
+    """
+    GET 并重试；extra_headers 用于条件请求（304 原样返回给调用方）。
+    每次请求前经按域名令牌桶排队，429 时按 Retry-After 暂停该域名并降速。
+    """
+    headers = {**HEADERS, **extra_headers} if extra_headers else HEADERS
+    limiter = get_limiter()
     for attempt in range(max_retries):
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=timeout, allow_redirects=True)
+            limiter.acquire(url)
+            resp = http_session.get(url, headers=headers, timeout=timeout, allow_redirects=True)
             if resp.status_code == 429:
-                wait = min(2 ** attempt * 5, 60)
-                logger.warning(f"请求限速(429) {url}，等待 {wait}s 后重试 ({attempt+1}/{max_retries})")
-                time.sleep(wait)
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                wait = min(retry_after if retry_after is not None else 2 ** attempt * 5, 60)
+                logger.warning(f"请求限速(429) {url}，该域名暂停 {wait:g}s 后重试 ({attempt+1}/{max_retries})")
+                limiter.penalize(url, wait)
                 continue
+            limiter.feedback(url, resp.status_code)
             resp.raise_for_status()
             return resp
         except requests.RequestException as e:
@@ -83,6 +107,37 @@ def safe_get(url: str, timeout: int = FETCH_TIMEOUT, max_retries: int = 3) -> Op
     return None
 
 
+def conditional_fetch(url: str, source: str, parse) -> Optional[List[dict]]:
+    """
+    带 ETag / Last-Modified 的条件请求：
+    - 源站返回 304 → 直接返回上次缓存的解析结果，不做任何解析
+    - 返回 200 → 调用 parse(resp) 解析，并连同新的校验字段写回缓存
+    请求失败返回 None。命中情况按 source 计入 FeedCache 统计。
+    """
+    cache = get_feed_cache()
+    entry = cache.lookup(url) if cache else None
+    resp = safe_get(url, extra_headers=FeedCache.conditional_headers(entry))
+    if not resp:
+        return None
+    if resp.status_code == 304:
+        if not entry:
+            return []
+        cache.record(source, hit=True)
+        cache.touch(url)
+        return FeedCache.cached_items(entry)
+
+    items = parse(resp)
+    if cache:
+        cache.record(source, hit=False)
+        cache.store(
+            url,
+            resp.headers.get("ETag", ""),
+            resp.headers.get("Last-Modified", ""),
+            items,
+        )
+    return items
+
+
 # ─── RSS 解析 ─────────────────────────────────────────────────────────
 
 def parse_rss_date(date_str: str) -> str:
@@ -143,11 +198,19 @@ def _oaic_title_to_url(title: str) -> str:
 
 
 def fetch_rss_feed(feed_config: dict) -> List[dict]:
-    url = feed_config["url"]
-    resp = safe_get(url)
-    if not resp:
+    items = conditional_fetch(
+        feed_config["url"],
+        feed_config["name"],
+        lambda resp: _parse_rss_response(resp, feed_config),
+    )
+    if items is None:
         return []
+    logger.info(f"[RSS] {feed_config['name']}: 获取 {len(items)} 条")
+    return items
+
 
+def _parse_rss_response(resp: requests.Response, feed_config: dict) -> List[dict]:
+    url = feed_config["url"]
     items = []
     try:
         # 部分 RSS（如日本総務省）使用 Shift_JIS 等非 UTF-8 编码，
@@ -240,7 +303,6 @@ def fetch_rss_feed(feed_config: dict) -> List[dict]:
             if not it.get("url"):
                 it["url"] = _oaic_title_to_url(it["title"])
 
-    logger.info(f"[RSS] {feed_config['name']}: 获取 {len(items)} 条")
     return items
 
 
@@ -259,10 +321,22 @@ def fetch_google_news(query: str, region_key: str = "en_US", max_results: int =
         ceid=region["ceid"],
     )
 
-    resp = safe_get(url)
-    if not resp:
+    items = conditional_fetch(
+        url,
+        f"Google News/{region_key}",
+        lambda resp: _parse_google_news_response(resp, region),
+    )
+    if items is None:
         return []
+    if max_results:
+        items = items[:max_results]
 
+    logger.info(f"[Google News] '{query}' ({region_key}): 获取 {len(items)} 条")
+    return items
+
+
+def _parse_google_news_response(resp: requests.Response, region: dict) -> List[dict]:
+    """解析 Google News RSS 全部条目（截断由调用方按 max_results 处理，便于缓存复用）。"""
     items = []
     try:
         root = ET.fromstring(resp.content)
@@ -288,12 +362,8 @@ def fetch_google_news(query: str, region_key: str = "en_US", max_results: int =
                 "region": region.get("region", ""),
                 "lang": region["hl"].split("-")[0],
             })
-            if max_results and len(items) >= max_results:
-                break
     except ET.ParseError as e:
         logger.warning(f"Google News RSS 解析失败: {e}")
-
-    logger.info(f"[Google News] '{query}' ({region_key}): 获取 {len(items)} 条")
     return items
 
 
@@ -717,20 +787,67 @@ def _is_multilingual_hard_noise(text: str) -> bool:
     return False
 
 
-def _is_traditional_consumer_goods_noise(text_lower: str) -> bool:
-    """排除传统消费品监管噪音，但保留游戏内 cosmetics/skins/IAP 等合规动态。"""
-    has_traditional_signal = any(
-        re.search(pattern, text_lower, re.IGNORECASE)
-        for pattern in TRADITIONAL_CONSUMER_GOODS_SIGNALS
-    )
-    if not has_traditional_signal:
-        return False
+# ─── 预编译组合匹配器 ─────────────────────────────────────────────────
+#
+# 上面的关键词列表逐条 re.search 时，每篇文章要跑数百次正则。这里在导入时
+# 把每个信号组合并为一个交替式正则：任一子式能在文本中匹配 ⇔ 组合式能匹配
+# （回溯会尝试每个分支），因此过滤结论与逐条匹配完全一致，每组只需扫描一次。
+
+_NEVER_MATCH = re.compile(r"(?!)")
 
-    has_game_signal = any(
-        re.search(pattern, text_lower, re.IGNORECASE)
-        for pattern in GAME_STRONG_SIGNALS
+
+def _combine_patterns(patterns: List[str], flags: int = re.IGNORECASE) -> "re.Pattern":
+    """合并正则列表为单个交替式；空列表返回永不匹配的正则。"""
+    if not patterns:
+        return _NEVER_MATCH
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+def _combine_literal_signals(signals: List[str]) -> tuple:
+    """
+    DIGITAL_INDUSTRY_SIGNALS 拆为两组：
+    - ASCII 词：\b(?:词1|词2|…)\b，与逐词 \b+escape+\b 等价（避免 "ai" 误中 "oaic"）
+    - 非 ASCII（CJK 等）：字面量子串交替，与 `signal in text_lower` 等价（区分大小写）
+    长词优先排列只影响匹配位置，不影响"是否命中"。
+    """
+    ascii_terms = sorted({s for s in signals if s.isascii()}, key=len, reverse=True)
+    other_terms = sorted({s for s in signals if not s.isascii()}, key=len, reverse=True)
+    ascii_re = (
+        re.compile(r"\b(?:" + "|".join(re.escape(s) for s in ascii_terms) + r")\b", re.IGNORECASE)
+        if ascii_terms else _NEVER_MATCH
+    )
+    other_re = (
+        re.compile("|".join(re.escape(s) for s in other_terms))
+        if other_terms else _NEVER_MATCH
     )
-    return not has_game_signal
+    return ascii_re, other_re
+
+
+class SignalMatcher:
+    """信号组名 → 预编译组合正则。has() 判断单组是否命中，scan() 返回命中的组名集合。"""
+
+    def __init__(self, groups: dict):
+        self.groups = groups
+
+    def has(self, group: str, text: str) -> bool:
+        return self.groups[group].search(text) is not None
+
+    def scan(self, text: str, groups: Optional[List[str]] = None) -> set:
+        names = groups if groups is not None else list(self.groups)
+        return {name for name in names if self.groups[name].search(text)}
+
+
+_DIGITAL_ASCII_RE, _DIGITAL_OTHER_RE = _combine_literal_signals(DIGITAL_INDUSTRY_SIGNALS)
+
+SIGNALS = SignalMatcher({
+    "exclusion":         _combine_patterns(EXCLUSION_PATTERNS),
+    "regulatory":        _combine_patterns(REGULATORY_SIGNALS),
+    "game":              _combine_patterns(GAME_SIGNALS),
+    "consumer_goods":    _combine_patterns(TRADITIONAL_CONSUMER_GOODS_SIGNALS),
+    "game_strong":       _combine_patterns(GAME_STRONG_SIGNALS),
+    "digital_ascii":     _DIGITAL_ASCII_RE,
+    "digital_non_ascii": _DIGITAL_OTHER_RE,
+})
 
 
 def is_legislation_relevant(article: dict) -> bool:
@@ -741,33 +858,25 @@ def is_legislation_relevant(article: dict) -> bool:
     3. 不匹配排除词模式
     4. 非中国大陆内容
     """
-    title = article.get("title", "")
-    summary = article.get("summary", "")
-    text = f"{title} {summary}"
-    text_lower = text.lower()
+    features = features_for(article)
 
     # 排除中国大陆
-    if is_china_mainland(text):
+    if features.china_mainland:
         return False
 
-    if _is_multilingual_hard_noise(text):
+    if features.hard_noise:
         return False
 
-    if _is_traditional_consumer_goods_noise(text_lower):
+    # 传统消费品监管噪音（游戏内 cosmetics/skins/IAP 等强游戏信号除外）
+    if features.has_signal("consumer_goods") and not features.has_signal("game_strong"):
         return False
 
     # 检查排除词（在标题和摘要中）
-    for p in EXCLUSION_PATTERNS:
-        if re.search(p, text_lower, re.IGNORECASE):
-            return False
+    if features.has_signal("exclusion"):
+        return False
 
     # 必须有法规信号
-    has_regulatory = False
-    for p in REGULATORY_SIGNALS:
-        if re.search(p, text_lower, re.IGNORECASE):
-            has_regulatory = True
-            break
-    if not has_regulatory:
+    if not features.has_signal("regulatory"):
         return False
 
     # 官方/法律信源：放宽但不取消数字行业关键词检查
@@ -775,27 +884,15 @@ def is_legislation_relevant(article: dict) -> bool:
     # 信号词列表维护在 config/keywords.py → DIGITAL_INDUSTRY_SIGNALS
     source_tier = article.get("tier", "")
     if source_tier in ("official", "legal"):
-        for signal in DIGITAL_INDUSTRY_SIGNALS:
-            if signal.isascii():
-                # ASCII 词用词边界匹配，避免 "ai" 误中 "oaic"、"complaint" 等
-                if re.search(r"\b" + re.escape(signal) + r"\b", text_lower, re.IGNORECASE):
-                    return True
-            else:
-                # CJK 等非 ASCII 直接子串匹配（每个字本身就是词边界）
-                if signal in text_lower:
-                    return True
-        return False
+        # ASCII 词用词边界匹配，避免 "ai" 误中 "oaic"、"complaint" 等；
+        # CJK 等非 ASCII 直接子串匹配（每个字本身就是词边界）
+        return (
+            features.has_signal("digital_ascii")
+            or features.has_signal("digital_non_ascii")
+        )
 
     # 其他信源：必须有游戏信号
-    has_game = False
-    for p in GAME_SIGNALS:
-        if re.search(p, text_lower, re.IGNORECASE):
-            has_game = True
-            break
-    if not has_game:
-        return False
-
-    return True
+    return features.has_signal("game")
 
 
 def is_recent(article: dict, max_days: int = MAX_ARTICLE_AGE_DAYS) -> bool:
@@ -818,174 +915,15 @@ RECYCLED_DATE_SOURCES = {
 
 def try_fetch_article_date(url: str, timeout: int = 8) -> Optional[str]:
     """
-    从原始文章页面抓取更精确的发布时间。
-    优先级: article:published_time > datePublished JSON-LD > <time> 标签
-    返回 YYYY-MM-DD 格式，失败返回 None。
+    从原始文章页面抓取更精确的发布时间（返回 YYYY-MM-DD，失败返回 None）。
+    页面经 article_page 单次下载 + 单次解析并落盘缓存，正文片段随之保存供 LLM 复用。
     """
-    if not url or not url.startswith("http"):
-        return None
     try:
-        resp = requests.get(
-            url,
-            headers={**HEADERS, "Accept": "text/html"},
-            timeout=timeout,
-            allow_redirects=True,
-        )
-        if not resp.ok:
-            return None
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        # 1. Open Graph / article meta 标签
-        for prop in [
-            "article:published_time", "og:article:published_time",
-            "datePublished", "date", "pubdate", "article:modified_time",
-        ]:
-            tag = soup.find("meta", {"property": prop}) or soup.find("meta", {"name": prop})
-            if tag and tag.get("content"):
-                d = _parse_iso_date(tag["content"])
-                if d:
-                    return d
-
-        # 2. JSON-LD
-        for script in soup.find_all("script", {"type": "application/ld+json"}):
-            try:
-                data = json.loads(script.string or "")
-                # data 可能是 dict 或 list
-                entries = data if isinstance(data, list) else [data]
-                for entry in entries:
-                    if not isinstance(entry, dict):
-                        continue
-                    for key in ("datePublished", "dateCreated"):
-                        val = entry.get(key, "")
-                        d = _parse_iso_date(str(val))
-                        if d:
-                            return d
-            except (json.JSONDecodeError, TypeError, AttributeError):
-                continue
-
-        # 3. <time> 标签 - 先检查属性，再检查文本内容
-        for time_tag in soup.find_all("time"):
-            for attr in ("datetime", "pubdate", "content"):
-                val = time_tag.get(attr, "")
-                d = _parse_iso_date(str(val))
-                if d:
-                    return d
-            # 检查 <time> 标签的可见文字（如 "February 26, 2026"）
-            d = _parse_human_date(time_tag.get_text(" ", strip=True))
-            if d:
-                return d
-
-        # 4. 在常见的日期容器元素中搜索（class 含 date / time / published / meta 等）
-        DATE_CLASSES = re.compile(
-            r"\b(?:date|time|published|updated|posted|created|pubdate|timestamp|byline|article-meta)\b",
-            re.IGNORECASE,
-        )
-        for el in soup.find_all(class_=DATE_CLASSES):
-            text = el.get_text(" ", strip=True)
-            d = _parse_iso_date(text) or _parse_human_date(text)
-            if d:
-                return d
-
-        # 5. 在 <header> / <article> 头部搜索可见日期文字（最多扫描前 2000 字符正文）
-        for container in (soup.find("header"), soup.find("article"), soup.find("main")):
-            if container is None:
-                continue
-            snippet = container.get_text(" ", strip=True)[:2000]
-            d = _parse_human_date(snippet)
-            if d:
-                return d
-
+        page = fetch_article_page(url, timeout=timeout)
     except Exception as e:
         logger.debug(f"[日期抓取] {url}: {e}")
-    return None
-
-
-def _parse_iso_date(s: str) -> Optional[str]:
-    """从 ISO 8601 字符串提取 YYYY-MM-DD，超出今天则忽略"""
-    if not s:
         return None
-    s = s.strip()
-    # 常见格式: 2026-02-15T10:30:00Z / 2026-02-15 / 20260215
-    for fmt in ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%dT%H:%M:%S%z", "%Y%m%d"):
-        try:
-            dt = datetime.strptime(s[:len(fmt.replace('%Y','0000').replace('%m','00')
-                                        .replace('%d','00').replace('%H','00')
-                                        .replace('%M','00').replace('%S','00')
-                                        .replace('%z',''))], fmt)
-            result = dt.strftime("%Y-%m-%d")
-            # 合理性校验：2020-01-01 ~ 今天
-            if "2020-01-01" <= result <= datetime.now().strftime("%Y-%m-%d"):
-                return result
-        except ValueError:
-            continue
-    # 简单提取 YYYY-MM-DD
-    m = re.search(r"(202[0-9]-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01]))", s)
-    if m:
-        candidate = m.group(1)
-        if candidate <= datetime.now().strftime("%Y-%m-%d"):
-            return candidate
-    return None
-
-
-# 月份名称映射（英文全称和缩写）
-_MONTH_MAP = {
-    "january": 1, "february": 2, "march": 3, "april": 4,
-    "may": 5, "june": 6, "july": 7, "august": 8,
-    "september": 9, "october": 10, "november": 11, "december": 12,
-    "jan": 1, "feb": 2, "mar": 3, "apr": 4,
-    "jun": 6, "jul": 7, "aug": 8,
-    "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-}
-
-
-def _parse_human_date(text: str) -> Optional[str]:
-    """
-    从自然语言文本中提取英文日期，如 'February 26, 2026' 或 '26 Feb 2026'。
-    返回 YYYY-MM-DD，失败返回 None。
-    """
-    if not text:
-        return None
-    today = datetime.now().strftime("%Y-%m-%d")
-    tl = text.lower()
-
-    # 格式1: "Month DD, YYYY" 或 "Month DD YYYY"
-    m = re.search(
-        r'\b(january|february|march|april|may|june|july|august|september|october|november|december'
-        r'|jan|feb|mar|apr|jun|jul|aug|sep|oct|nov|dec)'
-        r'\s+(\d{1,2}),?\s+(20[2-9]\d)\b',
-        tl,
-    )
-    if m:
-        month = _MONTH_MAP.get(m.group(1))
-        day, year = int(m.group(2)), int(m.group(3))
-        if month:
-            try:
-                result = datetime(year, month, day).strftime("%Y-%m-%d")
-                if "2020-01-01" <= result <= today:
-                    return result
-            except ValueError:
-                pass
-
-    # 格式2: "DD Month YYYY" (英国/欧洲格式)
-    m = re.search(
-        r'\b(\d{1,2})\s+(january|february|march|april|may|june|july|august|september|october|november|december'
-        r'|jan|feb|mar|apr|jun|jul|aug|sep|oct|nov|dec)'
-        r'\s+(20[2-9]\d)\b',
-        tl,
-    )
-    if m:
-        day, month_name, year = int(m.group(1)), m.group(2), int(m.group(3))
-        month = _MONTH_MAP.get(month_name)
-        if month:
-            try:
-                result = datetime(year, month, day).strftime("%Y-%m-%d")
-                if "2020-01-01" <= result <= today:
-                    return result
-            except ValueError:
-                pass
-
-    return None
+    return page.published_date if page else None
 
 
 def enrich_article_dates(articles: List[dict]) -> List[dict]:
@@ -1006,6 +944,8 @@ def enrich_article_dates(articles: List[dict]) -> List[dict]:
         return articles
 
     logger.info(f"[日期校正] 对 {len(to_enrich)} 条文章抓取精确发布时间...")
+    page_cache = get_page_cache()
+    page_cache.reset_stats()
 
     url_to_date: dict = {}
 
@@ -1027,18 +967,27 @@ def enrich_article_dates(articles: List[dict]) -> List[dict]:
             a["date"] = url_to_date[url]
             enriched += 1
 
-    logger.info(f"[日期校正] 完成, 更新 {enriched} 条")
+    logger.info(
+        f"[日期校正] 完成, 更新 {enriched} 条"
+        f"（页面缓存命中 {page_cache.hits}/{page_cache.hits + page_cache.misses}）"
+    )
     return articles
 
 
 # ─── 聚合抓取入口 ─────────────────────────────────────────────────────
 
-def fetch_all_rss() -> List[dict]:
+def fetch_all_rss(stop: Optional[threading.Event] = None) -> List[dict]:
+    """抓取全部 RSS 源；stop 被置位后尚未开始的源直接跳过。"""
     all_items = []
     rss_sources = [f for f in RSS_FEEDS if f.get("type") == "rss"]
 
+    def run_feed(feed):
+        if stop is not None and stop.is_set():
+            return []
+        return fetch_rss_feed(feed)
+
     with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
-        futures = {executor.submit(fetch_rss_feed, feed): feed for feed in rss_sources}
+        futures = {executor.submit(run_feed, feed): feed for feed in rss_sources}
         for future in concurrent.futures.as_completed(futures):
             feed = futures[future]
             try:
@@ -1050,11 +999,13 @@ def fetch_all_rss() -> List[dict]:
     return all_items
 
 
-def fetch_google_news_all(max_days: int = MAX_ARTICLE_AGE_DAYS, daily_mode: bool = False) -> List[dict]:
+def fetch_google_news_all(max_days: int = MAX_ARTICLE_AGE_DAYS, daily_mode: bool = False,
+                          stop: Optional[threading.Event] = None) -> List[dict]:
     """
     聚合所有语言/地区的 Google News 查询。
     daily_mode=True：使用精选小查询集，控制请求量避免 IP 限速，每查询取前 20 条。
     weekly 模式：使用全量 KEYWORDS，以获得最大覆盖。
+    stop 被置位后尚未发出的查询直接跳过。
     """
     all_items = []
     when = f" when:{1 if daily_mode else max_days}d"
@@ -1118,21 +1069,24 @@ def fetch_google_news_all(max_days: int = MAX_ARTICLE_AGE_DAYS, daily_mode: bool
             ),
         ]
 
-    # Google News 所有请求均指向同一域名，并发只会加剧限速。
-    # 改为严格顺序执行：同一时刻最多 1 个请求在途，组间额外冷却。
-    _GROUP_COOLDOWN = 5.0   # 秒，locale 组间冷却
-    _TASK_INTERVAL  = 2.0   # 秒，每次请求后等待（顺序模式）
+    # Google News 所有请求指向同一域名：节奏由 rate_limit 的 news.google.com
+    # 令牌桶控制（429 自动降速），线程池只用于重叠网络往返，不会突破限速。
+    tasks = [task for group in locale_groups for task in group]
 
-    for g_idx, group in enumerate(locale_groups):
-        if g_idx > 0:
-            time.sleep(_GROUP_COOLDOWN)
-        for query, region in group:
-            try:
-                items = fetch_google_news(query, region, max_results_per_query)
-                all_items.extend(items)
-            except Exception as e:
-                logger.error(f"Google News 搜索失败 '{query}': {e}")
-            time.sleep(_TASK_INTERVAL)
+    def run_query(task):
+        query, region = task
+        if stop is not None and stop.is_set():
+            return []
+        try:
+            return fetch_google_news(query, region, max_results_per_query)
+        except Exception as e:
+            logger.error(f"Google News 搜索失败 '{query}': {e}")
+            return []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        # map 保持查询顺序，结果与顺序执行一致
+        for items in executor.map(run_query, tasks):
+            all_items.extend(items)
 
     return all_items
 
@@ -1185,10 +1139,11 @@ def _parse_gdelt_date(seendate: str) -> str:
         return datetime.now().strftime("%Y-%m-%d")
 
 
-def fetch_gdelt_all(daily_mode: bool = False) -> List[dict]:
+def fetch_gdelt_all(daily_mode: bool = False, stop: Optional[threading.Event] = None) -> List[dict]:
     """
     通过 GDELT DOC API 补充抓取合规监管文章。
     返回格式与 fetch_rss_feed / fetch_google_news 一致，直接进入下游过滤流水线。
+    stop 被置位时中断令牌桶等待（每 12 秒 1 次）并停止后续查询。
     """
     timespan = "1d" if daily_mode else "7d"
     all_items: List[dict] = []
@@ -1198,13 +1153,16 @@ def fetch_gdelt_all(daily_mode: bool = False) -> List[dict]:
     rate_limits = 0
     stopped_for_rate_limit = False
 
-    for query_index, (query, label) in enumerate(_GDELT_QUERIES):
-        if query_index:
-            time.sleep(12)
+    limiter = get_limiter()   # api.gdeltproject.org 令牌桶：默认每 12 秒 1 次
+
+    for query, label in _GDELT_QUERIES:
         for attempt in range(2):   # 429 时最多重试一次
             try:
+                limiter.acquire(_GDELT_API, stop=stop)
+                if stop is not None and stop.is_set():
+                    break
                 requests_made += 1
-                resp = requests.get(
+                resp = http_session.get(
                     _GDELT_API,
                     params={
                         "query":      query,
@@ -1218,6 +1176,9 @@ def fetch_gdelt_all(daily_mode: bool = False) -> List[dict]:
                 )
                 if resp.status_code == 429:
                     rate_limits += 1
+                    retry_after = parse_retry_after(resp.headers.get("Retry-After", "5"))
+                    wait_seconds = min(15.0, max(1.0, retry_after if retry_after is not None else 5.0))
+                    limiter.penalize(_GDELT_API, wait_seconds)
                     if daily_mode:
                         logger.warning(
                             f"[GDELT] {label} 触发限速，日报模式立即停止补充抓取"
@@ -1225,19 +1186,14 @@ def fetch_gdelt_all(daily_mode: bool = False) -> List[dict]:
                         stopped_for_rate_limit = True
                         break
                     if attempt == 0:
-                        retry_after = resp.headers.get("Retry-After", "5")
-                        try:
-                            wait_seconds = min(15.0, max(1.0, float(retry_after)))
-                        except (TypeError, ValueError):
-                            wait_seconds = 5.0
                         logger.warning(
                             f"[GDELT] {label} 触发限速，等待 {wait_seconds:g} 秒后重试…"
                         )
-                        time.sleep(wait_seconds)
                         continue
                     logger.warning("[GDELT] 持续限速，本轮停止 GDELT 补充抓取")
                     stopped_for_rate_limit = True
                     break
+                limiter.feedback(_GDELT_API, resp.status_code)
                 resp.raise_for_status()
                 articles = resp.json().get("articles") or []
                 count = 0
@@ -1261,7 +1217,7 @@ def fetch_gdelt_all(daily_mode: bool = False) -> List[dict]:
             except Exception as e:
                 logger.warning(f"[GDELT] {label} 请求失败: {e}")
                 break
-        if stopped_for_rate_limit:
+        if stopped_for_rate_limit or (stop is not None and stop.is_set()):
             break
 
     logger.info(
@@ -1276,6 +1232,80 @@ def fetch_gdelt_all(daily_mode: bool = False) -> List[dict]:
     return all_items
 
 
+# ─── 并行抓取编排 ─────────────────────────────────────────────────────
+
+def fetch_all_sources(max_days: int = MAX_ARTICLE_AGE_DAYS, daily_mode: bool = False) -> List[dict]:
+    """
+    并行抓取 RSS / Google News / GDELT 三类信源并合并为一个结果列表。
+    三类信源指向互不重叠的域名（同域名节奏由 rate_limit 控制），总耗时取决于最慢的一类。
+    每类有独立超时（FETCH_FAMILY_TIMEOUTS），超时或异常的一类按 0 条处理；超时时置位
+    该类的 stop 事件，抓取函数在查询间隙/令牌桶等待中看到后即返回，不再继续发请求。
+    合并顺序固定为 RSS → Google News → GDELT，与原顺序执行一致，保证下游按标题去重结果稳定。
+    """
+    families = [
+        ("rss",         "RSS",         lambda stop: fetch_all_rss(stop=stop)),
+        ("google_news", "Google News", lambda stop: fetch_google_news_all(max_days, daily_mode=daily_mode, stop=stop)),
+        ("gdelt",       "GDELT",       lambda stop: fetch_gdelt_all(daily_mode=daily_mode, stop=stop)),
+    ]
+    labels = {key: label for key, label, _ in families}
+
+    def timed(fn, stop):
+        t0 = time.monotonic()
+        items = fn(stop)
+        return items, time.monotonic() - t0
+
+    started = time.monotonic()
+    stops = {key: threading.Event() for key, _, _ in families}
+    deadlines = {
+        key: started + FETCH_FAMILY_TIMEOUTS[key] if key in FETCH_FAMILY_TIMEOUTS else None
+        for key, _, _ in families
+    }
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(families))
+    pending = {executor.submit(timed, fn, stops[key]): key for key, _, fn in families}
+
+    results: dict = {key: [] for key, _, _ in families}
+    durations: dict = {}
+    while pending:
+        now = time.monotonic()
+        for future, key in list(pending.items()):
+            if deadlines[key] is not None and deadlines[key] <= now:
+                stops[key].set()
+                del pending[future]
+                logger.warning(
+                    f"{labels[key]} 抓取超过 {FETCH_FAMILY_TIMEOUTS[key]}s 未完成，本轮按 0 条处理"
+                )
+        if not pending:
+            break
+        next_deadline = min((deadlines[k] for k in pending.values() if deadlines[k] is not None), default=None)
+        done, _ = concurrent.futures.wait(
+            pending,
+            timeout=None if next_deadline is None else max(0.0, next_deadline - now),
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        for future in done:
+            key = pending.pop(future)
+            try:
+                items, durations[key] = future.result()
+                results[key] = items or []
+            except Exception as e:
+                logger.error(f"{labels[key]} 抓取失败: {e}")
+            logger.info(f"{labels[key]} 抓取完成: {len(results[key])} 条原始数据")
+    # 超时的一类已置位 stop，线程发完手上的请求即退出；不等待它（结果已丢弃）
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    wall = time.monotonic() - started
+    detail = " ".join(
+        f"{key}={durations[key]:.1f}s/{len(results[key])}条" if key in durations
+        else f"{key}={'超时' if stops[key].is_set() else '失败'}/0条"
+        for key, _, _ in families
+    )
+    logger.info(
+        f"[抓取编排] {detail} 总耗时={wall:.1f}s "
+        f"(顺序执行约 {sum(durations.values()):.1f}s)"
+    )
+    return [item for key, _, _ in families for item in results[key]]
+
+
 def _is_foreign_commentary(lang: str, region: str) -> bool:
     """兼容旧调用：文章语言不再作为删除事件的依据。"""
     return False
@@ -1294,7 +1324,7 @@ def _log_language_funnel(stage: str, items: List[dict]) -> None:
 def fetch_and_process(max_days: int = MAX_ARTICLE_AGE_DAYS, daily_mode: bool = False) -> List[LegislationItem]:
     """
     完整抓取 & 处理流水线:
-    1. 抓取 RSS + Google News
+    1. 并行抓取 RSS + Google News + GDELT
     2. 严格过滤 (法规 + 游戏 + 排除中国大陆 + 排除噪音)
     3. 分类为 LegislationItem
     4. 按事件实际司法辖区分类（语言仅作为输入信息，不用于删除）
@@ -1305,16 +1335,22 @@ def fetch_and_process(max_days: int = MAX_ARTICLE_AGE_DAYS, daily_mode: bool = F
     logger.info(f"开始抓取数据 ({'日报模式 when:1d' if daily_mode else f'when:{max_days}d'})...")
 
     # 1. 抓取
-    rss_items = fetch_all_rss()
-    logger.info(f"RSS 抓取完成: {len(rss_items)} 条原始数据")
-
-    news_items = fetch_google_news_all(max_days, daily_mode=daily_mode)
-    logger.info(f"Google News 抓取完成: {len(news_items)} 条原始数据")
-
-    gdelt_items = fetch_gdelt_all(daily_mode=daily_mode)
-    logger.info(f"GDELT 抓取完成: {len(gdelt_items)} 条原始数据")
+    feed_cache = get_feed_cache()
+    if feed_cache:
+        feed_cache.reset_stats()
+    http_session.reset_stats()
+    try:
+        pruned = get_page_cache().prune()
+        if pruned:
+            logger.info(f"[页面缓存] 清理过期文件 {pruned} 个")
+    except OSError as e:
+        logger.debug(f"[页面缓存] 清理失败: {e}")
+    all_raw = fetch_all_sources(max_days, daily_mode=daily_mode)
+    if feed_cache:
+        feed_cache.log_summary()
+    get_limiter().log_summary()
+    http_session.log_stats()
 
-    all_raw = rss_items + news_items + gdelt_items
     logger.info(f"合计原始数据: {len(all_raw)} 条")
     _log_language_funnel("raw", all_raw)
 
@@ -0,0 +1,159 @@
+"""
+HTTP 条件请求缓存（ETag / Last-Modified）
+
+为 RSS 与 Google News 抓取保存每个 URL 的校验字段和上次解析出的条目：
+  - 请求时附带 If-None-Match / If-Modified-Since
+  - 源站返回 304 时直接复用缓存条目，跳过下载与 XML 解析
+  - 按信源统计命中率，运行结束时输出汇总
+
+缓存存放在 data/http_cache.db（与 monitor.db 同目录），多线程抓取共享一个连接。
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from config import HTTP_CACHE_PATH, HTTP_CACHE_MAX_AGE_DAYS
+import sqlite_conn
+
+logger = logging.getLogger(__name__)
+
+
+class FeedCache:
+    """feed URL → (ETag, Last-Modified, 解析结果) 的持久化缓存。"""
+
+    def __init__(self, db_path: str = HTTP_CACHE_PATH,
+                 max_age_days: int = HTTP_CACHE_MAX_AGE_DAYS):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite_conn.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS feed_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT DEFAULT '',
+                last_modified TEXT DEFAULT '',
+                items_json TEXT DEFAULT '[]',
+                updated_at TEXT DEFAULT (datetime('now'))
+            )
+        """)
+        # updated_at 由 SQLite 以 UTC 写入，截止时间同样在 SQL 中计算
+        self.conn.execute(
+            "DELETE FROM feed_cache WHERE updated_at < datetime('now', ?)",
+            (f"-{max_age_days} days",),
+        )
+        self.conn.commit()
+        # source → {"hit": n, "miss": n}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    # ── 查询 / 写入 ──────────────────────────────────────────────────
+
+    def lookup(self, url: str) -> Optional[dict]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, items_json FROM feed_cache WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if not row or not (row["etag"] or row["last_modified"]):
+            return None
+        return {
+            "etag": row["etag"],
+            "last_modified": row["last_modified"],
+            "items_json": row["items_json"],
+        }
+
+    @staticmethod
+    def conditional_headers(entry: Optional[dict]) -> dict:
+        """由缓存条目生成条件请求头；无缓存时返回空 dict。"""
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def cached_items(entry: dict) -> List[dict]:
+        """反序列化缓存条目（每次返回新对象，调用方可自由修改）。"""
+        try:
+            return json.loads(entry.get("items_json") or "[]")
+        except ValueError:
+            return []
+
+    def store(self, url: str, etag: str, last_modified: str, items: List[dict]) -> None:
+        """保存校验字段与解析结果。源站两者都不提供时不缓存（无法发条件请求）。"""
+        if not (etag or last_modified):
+            return
+        with self._lock:
+            self.conn.execute("""
+                INSERT INTO feed_cache (url, etag, last_modified, items_json, updated_at)
+                VALUES (?, ?, ?, ?, datetime('now'))
+                ON CONFLICT(url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    items_json = excluded.items_json,
+                    updated_at = excluded.updated_at
+            """, (url, etag or "", last_modified or "", json.dumps(items, ensure_ascii=False)))
+            self.conn.commit()
+
+    def touch(self, url: str) -> None:
+        """304 命中时刷新 updated_at，避免仍有效的条目被过期清理。"""
+        with self._lock:
+            self.conn.execute(
+                "UPDATE feed_cache SET updated_at = datetime('now') WHERE url = ?", (url,)
+            )
+            self.conn.commit()
+
+    # ── 命中率统计 ────────────────────────────────────────────────────
+
+    def record(self, source: str, hit: bool) -> None:
+        with self._lock:
+            bucket = self._stats.setdefault(source, {"hit": 0, "miss": 0})
+            bucket["hit" if hit else "miss"] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {k: dict(v) for k, v in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def log_summary(self) -> None:
+        """输出本次运行的条件请求命中汇总（总计 + 各信源）。"""
+        stats = self.stats()
+        if not stats:
+            return
+        hits = sum(v["hit"] for v in stats.values())
+        total = hits + sum(v["miss"] for v in stats.values())
+        logger.info(f"[HTTP缓存] 条件请求命中 {hits}/{total} ({hits / total:.0%})")
+        for source, v in sorted(stats.items()):
+            n = v["hit"] + v["miss"]
+            logger.info(f"[HTTP缓存]   {source}: {v['hit']}/{n} ({v['hit'] / n:.0%})")
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+_feed_cache: Optional[FeedCache] = None
+_feed_cache_lock = threading.Lock()
+
+
+def get_feed_cache() -> Optional[FeedCache]:
+    """进程内共享的 FeedCache；打开失败（只读目录等）时返回 None，抓取退回无缓存模式。"""
+    global _feed_cache
+    with _feed_cache_lock:
+        if _feed_cache is None:
+            try:
+                _feed_cache = FeedCache(HTTP_CACHE_PATH)
+            except sqlite3.Error as e:
+                logger.warning(f"[HTTP缓存] 打开失败，本次不使用条件请求: {e}")
+                return None
+        return _feed_cache
@@ -0,0 +1,115 @@
+"""
+共享 HTTP 会话：连接池 + keep-alive
+
+抓取（RSS / Google News / GDELT / 日期校正 / 正文）、飞书 API 与 discover_rss
+统一通过本模块的 get() / post() 发请求，复用同一个 requests.Session：
+  - 每个域名一个连接池，池大小与 MAX_CONCURRENT_REQUESTS 一致
+  - 同一出版商域名的日期校正、正文抓取复用已建立的 TCP+TLS 连接
+  - 统计请求数与新建连接数，输出连接复用率
+"""
+
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+from config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+
+logger = logging.getLogger(__name__)
+
+_stats_lock = threading.Lock()
+_stats = {"requests": 0, "new_connections": 0}
+
+
+def _count(key: str) -> None:
+    with _stats_lock:
+        _stats[key] += 1
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _count("new_connections")
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _count("new_connections")
+        return super()._new_conn()
+
+
+class _PooledAdapter(HTTPAdapter):
+    """统计新建连接数的 HTTPAdapter（复用的连接不会触发 _new_conn）。"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """进程内共享的 Session（首次调用时创建）。重试由调用方自行控制，适配器不重试。"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = _PooledAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=0,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    _count("requests")
+    return get_session().get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    _count("requests")
+    return get_session().post(url, **kwargs)
+
+
+def stats() -> dict:
+    with _stats_lock:
+        result = dict(_stats)
+    reused = max(0, result["requests"] - result["new_connections"])
+    result["reuse_rate"] = reused / result["requests"] if result["requests"] else 0.0
+    return result
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
+
+
+def log_stats() -> None:
+    s = stats()
+    if not s["requests"]:
+        return
+    logger.info(
+        f"[HTTP连接池] 请求={s['requests']} 新建连接={s['new_connections']} "
+        f"复用率={s['reuse_rate']:.0%}"
+    )
+
+
+def close() -> None:
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
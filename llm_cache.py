@@ -0,0 +1,187 @@
+"""
+LLM 响应缓存（按模型 + 系统提示词摘要 + 规范化输入）
+
+translator 的批量翻译、单条翻译、重复验证、摘要融合和各类综述在重跑、
+retranslate、周报回读 Bitable 时会反复收到完全相同的输入。本模块把
+（模型, 系统提示词 SHA-256, 空白规范化后的用户输入）映射到 LLM 原始返回文本：
+  - 命中时直接返回，不发请求，也不再等待限速 sleep
+  - 写入时间超过 TTL 的条目视为失效；条目数超过上限时按最近使用时间淘汰
+  - 按用途统计命中/未命中，运行结束时输出汇总
+  - 环境变量 LLM_CACHE_BYPASS=1 或 CLI --no-llm-cache 时跳过缓存读写
+
+缓存存放在 data/llm_cache.db（与 monitor.db 同目录）。
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+from config import LLM_CACHE_PATH, LLM_CACHE_TTL_DAYS, LLM_CACHE_MAX_ENTRIES
+import sqlite_conn
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def cache_key(model: str, system_prompt: str, user_msg: str) -> str:
+    """（模型, 系统提示词摘要, 规范化输入）→ 缓存键。"""
+    system_hash = hashlib.sha256((system_prompt or "").encode("utf-8")).hexdigest()
+    normalized = _WHITESPACE.sub(" ", user_msg or "").strip()
+    joined = "\x1f".join((model or "", system_hash, normalized))
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """缓存键 → LLM 返回文本 的持久化缓存。"""
+
+    def __init__(self, db_path: str = LLM_CACHE_PATH,
+                 ttl_days: float = LLM_CACHE_TTL_DAYS,
+                 max_entries: int = LLM_CACHE_MAX_ENTRIES):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self.ttl_days = ttl_days
+        self.max_entries = max_entries
+        self.bypass = os.environ.get("LLM_CACHE_BYPASS", "").strip().lower() in {"1", "true", "yes"}
+        self._lock = threading.Lock()
+        self.conn = sqlite_conn.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                model TEXT DEFAULT '',
+                purpose TEXT DEFAULT '',
+                response TEXT NOT NULL,
+                created_at TEXT DEFAULT (datetime('now')),
+                last_used_at TEXT DEFAULT (datetime('now'))
+            )
+        """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache(last_used_at)"
+        )
+        self.evict()
+        # purpose → {"hit": n, "miss": n}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _ttl_modifier(self) -> str:
+        """datetime('now', ?) 的修饰符；时间戳均由 SQLite 以 UTC 写入，截止时间也在 SQL 中计算。"""
+        return f"-{self.ttl_days} days"
+
+    # ── 查询 / 写入 ──────────────────────────────────────────────────
+
+    def get(self, key: str, purpose: str = "") -> Optional[str]:
+        """返回未过期的缓存文本并刷新最近使用时间；bypass 时恒为 None（不计入统计）。"""
+        if self.bypass:
+            return None
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT response FROM llm_cache WHERE key = ? AND created_at >= datetime('now', ?)",
+                (key, self._ttl_modifier()),
+            ).fetchone()
+            if row:
+                self.conn.execute(
+                    "UPDATE llm_cache SET last_used_at = datetime('now') WHERE key = ?", (key,)
+                )
+                self.conn.commit()
+            bucket = self._stats.setdefault(purpose, {"hit": 0, "miss": 0})
+            bucket["hit" if row else "miss"] += 1
+        return row[0] if row else None
+
+    def put(self, key: str, response: str, model: str = "", purpose: str = "") -> None:
+        if self.bypass or not response:
+            return
+        with self._lock:
+            self.conn.execute("""
+                INSERT INTO llm_cache (key, model, purpose, response, created_at, last_used_at)
+                VALUES (?, ?, ?, ?, datetime('now'), datetime('now'))
+                ON CONFLICT(key) DO UPDATE SET
+                    response = excluded.response,
+                    created_at = excluded.created_at,
+                    last_used_at = excluded.last_used_at
+            """, (key, model, purpose, response))
+            self.conn.commit()
+
+    def evict(self) -> int:
+        """删除过期条目，并按最近使用时间裁剪到 max_entries 条；返回删除条数。"""
+        with self._lock:
+            removed = self.conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < datetime('now', ?)",
+                (self._ttl_modifier(),),
+            ).rowcount
+            removed += self.conn.execute("""
+                DELETE FROM llm_cache WHERE key IN (
+                    SELECT key FROM llm_cache ORDER BY last_used_at DESC, rowid DESC
+                    LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,)).rowcount
+            self.conn.commit()
+        if removed:
+            logger.info(f"[LLM缓存] 清理过期/超额条目 {removed} 条")
+        return removed
+
+    # ── 命中率统计 ────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {k: dict(v) for k, v in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def log_summary(self) -> None:
+        """输出本次运行的 LLM 缓存命中汇总（总计 + 各用途）。"""
+        if self.bypass:
+            logger.info("[LLM缓存] 本次运行已跳过缓存")
+            return
+        stats = self.stats()
+        if not stats:
+            return
+        hits = sum(v["hit"] for v in stats.values())
+        total = hits + sum(v["miss"] for v in stats.values())
+        logger.info(f"[LLM缓存] 命中 {hits}/{total} ({hits / total:.0%})，省去 {hits} 次 LLM 调用")
+        for purpose, v in sorted(stats.items()):
+            n = v["hit"] + v["miss"]
+            logger.info(f"[LLM缓存]   {purpose or '其他'}: {v['hit']}/{n} ({v['hit'] / n:.0%})")
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+_llm_cache: Optional[LLMCache] = None
+_llm_cache_lock = threading.Lock()
+_bypass_requested = False
+
+
+def set_bypass(bypass: bool = True) -> None:
+    """CLI --no-llm-cache：本进程内跳过缓存读写（已打开的缓存同步生效）。"""
+    global _bypass_requested
+    _bypass_requested = bypass
+    with _llm_cache_lock:
+        if _llm_cache is not None:
+            _llm_cache.bypass = bypass
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """进程内共享的 LLMCache；打开失败（只读目录等）时返回 None，调用退回无缓存模式。"""
+    global _llm_cache
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            try:
+                _llm_cache = LLMCache(LLM_CACHE_PATH)
+            except sqlite3.Error as e:
+                logger.warning(f"[LLM缓存] 打开失败，本次不使用缓存: {e}")
+                return None
+            if _bypass_requested:
+                _llm_cache.bypass = True
+        return _llm_cache
+
+
+def log_summary() -> None:
+    """运行结束时输出命中汇总；本进程未用到缓存时不输出。"""
+    if _llm_cache is not None:
+        _llm_cache.log_summary()
@@ -0,0 +1,327 @@
+"""
+LLM 请求调度：每分钟请求数 / token 预算 + 并发上限 + 共享退避
+
+translator 的所有 LLM 请求经 LLMDispatcher.call() 发出：
+  - 请求数与 token 数各用一个令牌桶（速率 = 每分钟预算 / 60），采用与 rate_limit
+    相同的"预约"扣减：预算不足时记为欠账，调用方只睡眠一次，并发排队自动错开
+  - 同时在途的请求数不超过 max_in_flight
+  - 429 / Retry-After / "try again in Xs" → 所有工作线程一起暂停到建议时间后再重试；
+    500 类瞬时故障固定暂停后重试
+  - map() 用最多 max_in_flight 个线程并行处理一组输入，结果按输入顺序返回
+  - 熔断器（CircuitBreaker）统计最近请求的失败率与耗时：端点异常时断开，
+    断开期间请求立即失败（调用方回退 Google Translate），冷却后放行试探请求，
+    试探成功即恢复
+
+取代原先每批 / 每条之后固定 time.sleep(4) 的串行节流，以及每进程只做一次的连通性预检。
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from config import (
+    LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE, LLM_MAX_IN_FLIGHT,
+    LLM_BREAKER_WINDOW, LLM_BREAKER_MIN_CALLS, LLM_BREAKER_ERROR_RATE,
+    LLM_BREAKER_SLOW_SECONDS, LLM_BREAKER_COOLDOWN, LLM_BREAKER_MAX_COOLDOWN,
+)
+
+logger = logging.getLogger(__name__)
+
+_RETRY_IN = re.compile(r"(?:try again|retry after|retry-after)\D{0,10}?(\d+(?:\.\d+)?)\s*s", re.IGNORECASE)
+_MAX_PAUSE = 35.0            # 单次退避上限（秒），与原 translator 重试等待一致
+_SERVER_ERROR_PAUSE = 6.0    # 500 类故障的固定等待
+_MAX_RETRIES = 2
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """从异常的 Retry-After 响应头或 "try again in Xs" 文本中提取建议等待秒数。"""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+    except AttributeError:
+        value = None
+    if value:
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+    m = _RETRY_IN.search(str(exc))
+    return float(m.group(1)) if m else None
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    """异常携带的 HTTP 状态码（SDK 的 status_code 或 requests 的 response.status_code）。"""
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """有状态码时只看状态码；没有时才按错误文本判断（避免请求 ID 等字段里的 "429" 误判）。"""
+    status = _status_code(exc)
+    if status is not None:
+        return status == 429
+    text = str(exc)
+    return "429" in text or "rate_limit" in text.lower() or bool(_RETRY_IN.search(text))
+
+
+def is_server_error(exc: BaseException) -> bool:
+    """有状态码时只看状态码；没有时才按错误文本判断。"""
+    status = _status_code(exc)
+    if status is not None:
+        return status >= 500
+    text = str(exc)
+    return ("500" in text or "50507" in text or "InternalServerError" in text
+            or "unknown error" in text.lower())
+
+
+# ── 熔断器 ────────────────────────────────────────────────────────────
+
+class CircuitOpenError(RuntimeError):
+    """熔断器断开期间发出的请求直接失败，不等待客户端超时。"""
+
+
+class CircuitBreaker:
+    """
+    LLM 端点健康模型：closed（正常）/ open（断开，快速失败）/ half_open（试探）。
+
+    closed 状态下保留最近 window 次请求的成败与耗时，样本数达到 min_calls 后
+    失败率 ≥ error_rate 或平均耗时 ≥ slow_seconds 即断开。断开 cooldown 秒后进入
+    half_open，只放行一个试探请求：成功则恢复 closed，失败则再次断开且冷却时间翻倍
+    （不超过 max_cooldown）。限速（429）说明端点可达，不计为失败。
+    before_call() 返回的 trial 标记需原样传给 record()：half_open 期间只有试探请求的
+    结果决定状态，closed 时放行、断开期间才返回的请求结果一律忽略。
+    """
+
+    def __init__(self, window: int = LLM_BREAKER_WINDOW,
+                 min_calls: int = LLM_BREAKER_MIN_CALLS,
+                 error_rate: float = LLM_BREAKER_ERROR_RATE,
+                 slow_seconds: float = LLM_BREAKER_SLOW_SECONDS,
+                 cooldown: float = LLM_BREAKER_COOLDOWN,
+                 max_cooldown: float = LLM_BREAKER_MAX_COOLDOWN):
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_seconds = slow_seconds
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.state = "closed"
+        self._outcomes: deque = deque(maxlen=window)   # (成功?, 耗时秒)
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self.transitions = 0
+        self.rejected = 0
+
+    def _set_state(self, state: str, reason: str = "") -> None:
+        if state == self.state:
+            return
+        logger.warning(f"[LLM熔断] {self.state} → {state}" + (f"（{reason}）" if reason else ""))
+        self.state = state
+        self.transitions += 1
+
+    def _refresh(self, now: float) -> None:
+        if self.state == "open" and now - self._opened_at >= self.cooldown:
+            self._set_state("half_open", f"冷却 {self.cooldown:g}s 结束，放行试探请求")
+
+    def available(self) -> bool:
+        """当前是否值得尝试 LLM（open 且未到冷却期时为 False）。"""
+        with self._lock:
+            self._refresh(time.monotonic())
+            return self.state != "open"
+
+    def before_call(self) -> bool:
+        """
+        请求前检查：open 时抛 CircuitOpenError；half_open 时只放行一个试探请求。
+        返回本次请求是否为试探请求。
+        """
+        with self._lock:
+            self._refresh(time.monotonic())
+            if self.state == "closed":
+                return False
+            if self.state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self.rejected += 1
+        raise CircuitOpenError(f"LLM 熔断器 {self.state}，跳过请求")
+
+    def record(self, ok: bool, latency: float, trial: bool = False) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if trial:
+                self._trial_in_flight = False
+            if self.state == "half_open":
+                if not trial:
+                    return
+                if ok and latency < self.slow_seconds:
+                    self._outcomes.clear()
+                    self.cooldown = self.base_cooldown
+                    self._set_state("closed", f"试探请求成功，耗时 {latency:.1f}s")
+                else:
+                    self._open(now, "试探请求失败" if not ok else f"试探请求耗时 {latency:.1f}s")
+                    self.cooldown = min(self.max_cooldown, self.cooldown * 2)
+                return
+            if self.state != "closed":
+                return
+            self._outcomes.append((ok, latency))
+            if len(self._outcomes) < self.min_calls:
+                return
+            n = len(self._outcomes)
+            failures = sum(1 for success, _ in self._outcomes if not success)
+            avg_latency = sum(t for _, t in self._outcomes) / n
+            if failures / n >= self.error_rate:
+                self._open(now, f"最近 {n} 次请求失败 {failures} 次")
+            elif avg_latency >= self.slow_seconds:
+                self._open(now, f"最近 {n} 次请求平均耗时 {avg_latency:.1f}s")
+
+    def _open(self, now: float, reason: str) -> None:
+        self._opened_at = now
+        self._set_state("open", reason)
+
+    def summary(self) -> str:
+        with self._lock:
+            self._refresh(time.monotonic())
+            n = len(self._outcomes)
+            failures = sum(1 for success, _ in self._outcomes if not success)
+            return (
+                f"状态={self.state} 最近失败={failures}/{n} "
+                f"状态切换={self.transitions} 快速失败={self.rejected}"
+            )
+
+
+class LLMDispatcher:
+    """线程安全的 LLM 请求调度器（RPM / TPM 令牌桶 + 在途上限 + 共享退避）。"""
+
+    def __init__(self, requests_per_minute: float = LLM_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: float = LLM_TOKENS_PER_MINUTE,
+                 max_in_flight: int = LLM_MAX_IN_FLIGHT):
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._request_rate = requests_per_minute / 60.0
+        self._token_rate = tokens_per_minute / 60.0
+        # 突发上限：请求数 = 在途上限；token = 15 秒预算
+        self._request_burst = float(self.max_in_flight)
+        self._token_burst = tokens_per_minute / 4.0
+        self._requests = self._request_burst
+        self._tokens = self._token_burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self.breaker = CircuitBreaker()
+        self._local = threading.local()   # 当前线程最近一次 call() 的尝试次数 / 排队秒数
+        # 统计
+        self.calls = 0
+        self.throttled = 0
+        self.retried = 0
+        self.waited = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._requests = min(self._request_burst, self._requests + elapsed * self._request_rate)
+        self._tokens = min(self._token_burst, self._tokens + elapsed * self._token_rate)
+        self._updated = now
+
+    def acquire(self, tokens: int) -> float:
+        """预约一次请求及 tokens 个 token 的预算，必要时阻塞。返回实际等待秒数。"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._requests -= 1
+            self._tokens -= tokens
+            wait = max(
+                -self._requests / self._request_rate if self._requests < 0 else 0.0,
+                -self._tokens / self._token_rate if self._tokens < 0 else 0.0,
+                self._paused_until - now,
+            )
+            self.waited += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """所有工作线程在 seconds 秒内不再发出新请求（共享退避）。"""
+        seconds = min(max(seconds, 0.0), _MAX_PAUSE)
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self.throttled += 1
+        logger.warning(f"[LLM调度] 触发限速/故障，全部请求暂停 {seconds:.1f}s")
+
+    def call(self, fn: Callable, tokens: int = 0):
+        """按预算发出 fn()；限速与 500 类故障按建议时间共享退避后重试，最终失败原样抛出。
+        熔断器断开时直接抛 CircuitOpenError。"""
+        self._local.attempts, self._local.queued = 0, 0.0
+        for attempt in range(_MAX_RETRIES + 1):
+            trial = self.breaker.before_call()
+            self._local.queued += self.acquire(tokens)
+            with self._slots:
+                if not trial:
+                    # 排队（共享退避最长 _MAX_PAUSE 秒）期间熔断器可能已断开或进入试探
+                    trial = self.breaker.before_call()
+                self._local.attempts = attempt + 1
+                with self._lock:
+                    self.calls += 1
+                started = time.monotonic()
+                try:
+                    result = fn()
+                except Exception as e:
+                    # 429 说明端点可达，只退避不计失败
+                    self.breaker.record(is_rate_limited(e), time.monotonic() - started, trial)
+                    if attempt >= _MAX_RETRIES or not self.breaker.available():
+                        raise
+                    if is_rate_limited(e):
+                        wait = retry_after_seconds(e)
+                        self.pause((wait + 1.5) if wait is not None else _SERVER_ERROR_PAUSE)
+                    elif is_server_error(e):
+                        self.pause(_SERVER_ERROR_PAUSE)
+                    else:
+                        raise
+                    with self._lock:
+                        self.retried += 1
+                    continue
+                self.breaker.record(True, time.monotonic() - started, trial)
+                return result
+
+    def last_call_info(self) -> Tuple[int, float]:
+        """当前线程最近一次 call() 的 (实际发出次数, 预算排队秒数)，供调用遥测记录。"""
+        return getattr(self._local, "attempts", 0), getattr(self._local, "queued", 0.0)
+
+    def map(self, fn: Callable, items: list) -> List:
+        """并行处理 items（最多 max_in_flight 个线程），结果按输入顺序返回。"""
+        items = list(items)
+        if len(items) <= 1 or self.max_in_flight == 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_in_flight, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    def log_summary(self) -> None:
+        if not self.calls and not self.breaker.rejected:
+            return
+        logger.info(
+            f"[LLM调度] 请求={self.calls} 限速/故障退避={self.throttled} "
+            f"重试={self.retried} 排队={self.waited:.1f}s"
+        )
+        logger.info(f"[LLM熔断] {self.breaker.summary()}")
+
+
+_dispatcher: Optional[LLMDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher() -> LLMDispatcher:
+    """进程内共享的 LLM 调度器。"""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = LLMDispatcher()
+        return _dispatcher
+
+
+def log_summary() -> None:
+    if _dispatcher is not None:
+        _dispatcher.log_summary()
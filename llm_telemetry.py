@@ -0,0 +1,172 @@
+"""
+LLM 调用遥测
+
+translator._complete() 每次调用（含缓存命中与失败）写入一行 llm_calls：
+  - call_type：调用用途（batch / single / verify_dup / merge / executive_summary /
+    weekly_card / daily_summary …，与 llm_cache 的 purpose 一致）
+  - items：本次调用覆盖的条目数（批量翻译 = 批大小，重复核验 = 对数），用于折算每条 token
+  - prompt / completion tokens：取自响应的 usage 字段，接口未返回时留空
+  - latency_ms（请求耗时，含重试）、queue_ms（RPM/TPM 预算与共享退避的排队时间）、attempts
+  - outcome：ok / rejected（未通过解析校验）/ error / circuit_open
+  - cache_hit：命中 llm_cache 时为 1，不发请求
+
+monitor.py llm-stats 按用途与日期汇总 p50/p95 延迟、每条 token、重试与估算费用。
+数据存放在 data/llm_telemetry.db，超过 LLM_TELEMETRY_RETENTION_DAYS 的记录在打开时清理。
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from config import (
+    LLM_TELEMETRY_PATH, LLM_TELEMETRY_RETENTION_DAYS,
+    LLM_PRICE_INPUT_PER_MTOK, LLM_PRICE_OUTPUT_PER_MTOK,
+)
+import sqlite_conn
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """最近秩百分位（q 取 0~100）；空列表返回 None。"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))   # ceil(n * q / 100)
+    return ordered[int(rank) - 1]
+
+
+class LLMTelemetry:
+    """llm_calls 表的写入与汇总（线程安全）。"""
+
+    def __init__(self, db_path: str = LLM_TELEMETRY_PATH,
+                 retention_days: float = LLM_TELEMETRY_RETENTION_DAYS):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self.conn = sqlite_conn.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_calls (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TEXT DEFAULT (datetime('now')),
+                call_type TEXT NOT NULL,
+                model TEXT DEFAULT '',
+                items INTEGER DEFAULT 1,
+                prompt_tokens INTEGER,
+                completion_tokens INTEGER,
+                latency_ms INTEGER DEFAULT 0,
+                queue_ms INTEGER DEFAULT 0,
+                attempts INTEGER DEFAULT 0,
+                outcome TEXT DEFAULT 'ok',
+                cache_hit INTEGER DEFAULT 0
+            )
+        """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_calls_created ON llm_calls(created_at)"
+        )
+        self.conn.commit()
+        self.purge()
+
+    def record(self, call_type: str, *, model: str = "", items: int = 1,
+               prompt_tokens: Optional[int] = None, completion_tokens: Optional[int] = None,
+               latency: float = 0.0, queued: float = 0.0, attempts: int = 0,
+               outcome: str = "ok", cache_hit: bool = False) -> None:
+        with self._lock:
+            self.conn.execute("""
+                INSERT INTO llm_calls (call_type, model, items, prompt_tokens, completion_tokens,
+                                       latency_ms, queue_ms, attempts, outcome, cache_hit)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (call_type, model, max(1, int(items)), prompt_tokens, completion_tokens,
+                  int(latency * 1000), int(queued * 1000), attempts, outcome, int(cache_hit)))
+            self.conn.commit()
+
+    def purge(self) -> int:
+        with self._lock:
+            removed = self.conn.execute(
+                "DELETE FROM llm_calls WHERE created_at < datetime('now', ?)",
+                (f"-{self.retention_days} days",),
+            ).rowcount
+            self.conn.commit()
+        return removed
+
+    def _rows(self, days: int) -> List[sqlite3.Row]:
+        with self._lock:
+            return self.conn.execute(
+                "SELECT * FROM llm_calls WHERE created_at >= datetime('now', ?) ORDER BY created_at",
+                (f"-{days} days",),
+            ).fetchall()
+
+    def summarize(self, days: int = 14, by: str = "call_type") -> List[Dict]:
+        """
+        按 call_type 或日期（by="day"）汇总最近 days 天：调用数、缓存命中、错误、重试、
+        请求延迟 p50/p95（不含缓存命中）、每条 prompt/completion token 与估算费用。
+        """
+        groups: Dict[str, list] = {}
+        for row in self._rows(days):
+            key = row["created_at"][:10] if by == "day" else row["call_type"]
+            groups.setdefault(key, []).append(row)
+
+        summary = []
+        for key in sorted(groups):
+            rows = groups[key]
+            sent = [r for r in rows if not r["cache_hit"] and r["outcome"] != "circuit_open"]
+            latencies = [r["latency_ms"] / 1000 for r in sent]
+            metered = [r for r in sent if r["prompt_tokens"] is not None]
+            prompt = sum(r["prompt_tokens"] for r in metered)
+            completion = sum(r["completion_tokens"] or 0 for r in metered)
+            metered_items = sum(r["items"] for r in metered)
+            summary.append({
+                "key": key,
+                "calls": len(rows),
+                "cache_hits": sum(r["cache_hit"] for r in rows),
+                "errors": sum(r["outcome"] in ("error", "circuit_open") for r in rows),
+                "rejected": sum(r["outcome"] == "rejected" for r in rows),
+                "retries": sum(max(0, r["attempts"] - 1) for r in sent),
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "queue_s": sum(r["queue_ms"] for r in sent) / 1000,
+                "prompt_per_item": prompt / metered_items if metered_items else None,
+                "completion_per_item": completion / metered_items if metered_items else None,
+                "prompt_tokens": prompt,
+                "completion_tokens": completion,
+                "cost": (prompt * LLM_PRICE_INPUT_PER_MTOK
+                         + completion * LLM_PRICE_OUTPUT_PER_MTOK) / 1_000_000,
+            })
+        return summary
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+_telemetry: Optional[LLMTelemetry] = None
+_telemetry_failed = False
+_telemetry_lock = threading.Lock()
+
+
+def get_telemetry() -> Optional[LLMTelemetry]:
+    """进程内共享的 LLMTelemetry；打开失败时返回 None，调用照常进行只是不记录。"""
+    global _telemetry, _telemetry_failed
+    with _telemetry_lock:
+        if _telemetry is None and not _telemetry_failed:
+            try:
+                _telemetry = LLMTelemetry(LLM_TELEMETRY_PATH)
+            except sqlite3.Error as e:
+                _telemetry_failed = True
+                logger.warning(f"[LLM遥测] 打开失败，本次不记录: {e}")
+        return _telemetry
+
+
+def record(call_type: str, **fields) -> None:
+    """记录一次调用；遥测故障只记日志，不影响调用方。"""
+    telemetry = get_telemetry()
+    if telemetry is None:
+        return
+    try:
+        telemetry.record(call_type, **fields)
+    except sqlite3.Error as e:
+        logger.debug(f"[LLM遥测] 写入失败: {e}")
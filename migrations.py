@@ -0,0 +1,257 @@
+"""
+monitor.db 版本化迁移
+
+库的 schema 版本记录在 PRAGMA user_version。Database() 打开时只读一次该值，
+等于 SCHEMA_VERSION 即直接返回；落后时在一个 BEGIN IMMEDIATE 事务内按顺序执行
+缺失的迁移并逐步写入版本号（多个进程同时打开时只有一个会真正执行）。
+
+新增表、列或索引：在 MIGRATIONS 末尾追加一个函数，不要修改已发布的迁移。
+v1–v4 对应引入版本号之前已存在的建表/补列逻辑，必须对任意旧库幂等
+（旧库 user_version 均为 0，可能已经有其中部分表和列）。
+"""
+
+import logging
+import sqlite3
+from typing import Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 全文检索列：trigram 分词对中英混排文本都按 3 字符子串建索引
+FTS_COLUMNS = ("title", "summary", "title_zh", "summary_zh")
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> set:
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _add_missing_columns(conn: sqlite3.Connection, table: str, columns: list) -> None:
+    existing = _columns(conn, table)
+    for col, definition in columns:
+        if col not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {col} {definition}")
+
+
+def create_fts(conn: sqlite3.Connection, table: str) -> bool:
+    """
+    为 table 建 FTS5 外部内容索引（{table}_fts）与同步触发器，并 rebuild 回填已有行。
+    SQLite 未编译 FTS5/trigram 时返回 False，关键词检索退回 LIKE。
+    """
+    fts = f"{table}_fts"
+    columns = ", ".join(FTS_COLUMNS)
+    new_values = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+    old_values = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+    try:
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                {columns}, content='{table}', content_rowid='id', tokenize='trigram'
+            )
+        """)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"[迁移] 当前 SQLite 不支持 FTS5 trigram，{table} 关键词检索使用 LIKE: {e}")
+        return False
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {columns} ON {table} BEGIN
+            INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+    return True
+
+
+# ─── 迁移 ────────────────────────────────────────────────────────────
+
+def _v1_base_tables(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS legislation (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            region TEXT NOT NULL,
+            category_l1 TEXT NOT NULL,
+            category_l2 TEXT DEFAULT '',
+            title TEXT NOT NULL,
+            date TEXT NOT NULL,
+            status TEXT DEFAULT '政策信号',
+            summary TEXT DEFAULT '',
+            source_name TEXT DEFAULT '',
+            source_url TEXT DEFAULT '',
+            lang TEXT DEFAULT 'en',
+            title_zh TEXT DEFAULT '',
+            summary_zh TEXT DEFAULT '',
+            impact_score REAL DEFAULT 1.0,
+            jurisdiction TEXT DEFAULT '',
+            applicability_scope TEXT DEFAULT 'unknown',
+            jurisdiction_source TEXT DEFAULT 'unknown',
+            push_decision TEXT DEFAULT 'pool_only',
+            value_score INTEGER DEFAULT 0,
+            noise_reason TEXT DEFAULT '判定失败',
+            decision_source TEXT DEFAULT 'fallback',
+            event_key TEXT DEFAULT '',
+            features_json TEXT DEFAULT '',
+            created_at TEXT DEFAULT (datetime('now')),
+            UNIQUE(title, source_url)
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_region ON legislation(region)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_category ON legislation(category_l1)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_date ON legislation(date)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS fetch_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_name TEXT NOT NULL,
+            fetched_at TEXT DEFAULT (datetime('now')),
+            item_count INTEGER DEFAULT 0,
+            status TEXT DEFAULT 'ok',
+            error_msg TEXT DEFAULT ''
+        )
+    """)
+    # retranslate 检查点：本轮待重译条目的队列，中断后重跑从剩余条目继续
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS retranslate_queue (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            item_id INTEGER NOT NULL UNIQUE,
+            status TEXT DEFAULT 'pending',
+            updated_at TEXT DEFAULT (datetime('now'))
+        )
+    """)
+
+
+def _v2_legislation_columns(conn: sqlite3.Connection) -> None:
+    """旧表补列；idx_impact 依赖 impact_score 列，必须在补列之后再建。"""
+    _add_missing_columns(conn, "legislation", [
+        ("title_zh",     "TEXT DEFAULT ''"),
+        ("summary_zh",   "TEXT DEFAULT ''"),
+        ("impact_score", "REAL DEFAULT 1.0"),
+        ("risk_revenue", "INTEGER DEFAULT 0"),
+        ("risk_product", "INTEGER DEFAULT 0"),
+        ("risk_urgency", "INTEGER DEFAULT 0"),
+        ("risk_scope",   "INTEGER DEFAULT 0"),
+        ("risk_source",  "TEXT DEFAULT 'regex'"),
+        ("jurisdiction", "TEXT DEFAULT ''"),
+        ("applicability_scope", "TEXT DEFAULT 'unknown'"),
+        ("jurisdiction_source", "TEXT DEFAULT 'unknown'"),
+        ("push_decision", "TEXT DEFAULT 'pool_only'"),
+        ("value_score", "INTEGER DEFAULT 0"),
+        ("noise_reason", "TEXT DEFAULT '判定失败'"),
+        ("decision_source", "TEXT DEFAULT 'fallback'"),
+        ("event_key", "TEXT DEFAULT ''"),
+        ("features_json", "TEXT DEFAULT ''"),
+    ])
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_impact ON legislation(impact_score)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_event_key ON legislation(event_key)")
+
+
+def _v3_archive_table(conn: sqlite3.Connection) -> None:
+    """归档表（原先在首次 archive 时才创建并逐列探测）。"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS legislation_archive (
+            id INTEGER,
+            region TEXT,
+            category_l1 TEXT,
+            category_l2 TEXT,
+            title TEXT,
+            date TEXT,
+            status TEXT,
+            summary TEXT,
+            source_name TEXT,
+            source_url TEXT,
+            lang TEXT,
+            title_zh TEXT,
+            summary_zh TEXT,
+            impact_score REAL,
+            risk_revenue INTEGER DEFAULT 0,
+            risk_product INTEGER DEFAULT 0,
+            risk_urgency INTEGER DEFAULT 0,
+            risk_scope INTEGER DEFAULT 0,
+            risk_source TEXT DEFAULT 'regex',
+            jurisdiction TEXT DEFAULT '',
+            applicability_scope TEXT DEFAULT 'unknown',
+            jurisdiction_source TEXT DEFAULT 'unknown',
+            created_at TEXT,
+            archived_at TEXT DEFAULT (datetime('now')),
+            PRIMARY KEY (id)
+        )
+    """)
+    _add_missing_columns(conn, "legislation_archive", [
+        ("jurisdiction", "TEXT DEFAULT ''"),
+        ("applicability_scope", "TEXT DEFAULT 'unknown'"),
+        ("jurisdiction_source", "TEXT DEFAULT 'unknown'"),
+    ])
+
+
+def _v4_full_text(conn: sqlite3.Connection) -> None:
+    """主表与归档表的 FTS5 全文索引，回填已有行。"""
+    if create_fts(conn, "legislation"):
+        create_fts(conn, "legislation_archive")
+
+
+def _v5_hot_query_indexes(conn: sqlite3.Connection) -> None:
+    """
+    热点查询的复合/部分索引（query_audit.HOT_QUERIES 登记了对应查询形状）：
+      - (date, impact_score)：query_items / filter_new_events 的日期范围；倒序扫描即满足
+        filter_new_events 的 ORDER BY date DESC, impact_score DESC。取代单列 idx_date。
+        同时去掉单列 idx_impact：有它时规划器会让 query_items 按 impact 顺序遍历全表，
+        日期窗口内不足 LIMIT 行时走完整个索引；改为按日期窗口定位、窗口内的行临时排序。
+        stats 的 GROUP BY impact_score 不在热点路径上，不需要它
+      - (date, created_at)：daily_check 的 date IN (...) AND created_at >= ?
+      - 未翻译条目的部分索引，按 impact_score 顺序直接取前 N 条
+      - source_url：upsert_many 预查已有键（UNIQUE(title, source_url) 不能只按 source_url 查）
+      - retranslate 检查点待处理行的部分索引
+    """
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_date_impact ON legislation(date, impact_score)")
+    conn.execute("DROP INDEX IF EXISTS idx_date")
+    conn.execute("DROP INDEX IF EXISTS idx_impact")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_date_created ON legislation(date, created_at)")
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_untranslated ON legislation(impact_score DESC, date DESC)
+        WHERE title_zh = '' OR title_zh IS NULL
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_source_url ON legislation(source_url)")
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_retranslate_pending ON retranslate_queue(seq)
+        WHERE status = 'pending'
+    """)
+
+
+MIGRATIONS: List[Tuple[str, Callable[[sqlite3.Connection], None]]] = [
+    ("基础表 legislation / fetch_log / retranslate_queue", _v1_base_tables),
+    ("legislation 补列与 impact / event_key 索引", _v2_legislation_columns),
+    ("归档表 legislation_archive", _v3_archive_table),
+    ("FTS5 全文索引", _v4_full_text),
+    ("热点查询复合/部分索引", _v5_hot_query_indexes),
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """把 conn 升级到 SCHEMA_VERSION，返回本次执行的迁移数；已是最新时只读一次 pragma。"""
+    if schema_version(conn) >= SCHEMA_VERSION:
+        return 0
+    applied = 0
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # 拿到写锁后重读：另一个进程可能已经完成迁移
+        for version in range(schema_version(conn) + 1, SCHEMA_VERSION + 1):
+            description, apply = MIGRATIONS[version - 1]
+            apply(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+            logger.info(f"[迁移] schema v{version}: {description}")
+            applied += 1
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return applied
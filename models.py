@@ -7,9 +7,11 @@ import os
 import re
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Dict, Iterable, List, Optional
 
 from config import DATABASE_PATH
+import migrations
+import sqlite_conn
 
 
 @dataclass
@@ -39,7 +41,7 @@ class LegislationItem:
     push_decision: str = "pool_only"  # push / pool_only
     value_score: int = 0              # 信息价值 0-3
     noise_reason: str = "判定失败"     # 固定枚举，便于人工反馈分析
-    decision_source: str = "fallback" # llm / rule / fallback
+    decision_source: str = "fallback" # llm / rule / fallback / model
     event_key: str = ""               # 仅用于本地跨日事件去重，不写入 Bitable
     id: Optional[int] = None
 
@@ -47,151 +49,151 @@ class LegislationItem:
         return asdict(self)
 
 
+# 单条与批量写入共用的 UPSERT；UNIQUE(title, source_url) 冲突时只覆盖非空/更可信的字段
+_UPSERT_SQL = """
+    INSERT INTO legislation
+        (region, category_l1, category_l2, title, date, status, summary,
+         source_name, source_url, lang, title_zh, summary_zh, impact_score,
+         risk_revenue, risk_product, risk_urgency, risk_scope, risk_source,
+         jurisdiction, applicability_scope, jurisdiction_source,
+         push_decision, value_score, noise_reason, decision_source, event_key,
+         features_json)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(title, source_url) DO UPDATE SET
+        region     = excluded.region,
+        category_l1 = CASE WHEN excluded.category_l1 != '' THEN excluded.category_l1 ELSE legislation.category_l1 END,
+        status     = CASE WHEN excluded.status     != '' THEN excluded.status     ELSE legislation.status     END,
+        impact_score = CASE WHEN excluded.impact_score > 0 THEN excluded.impact_score ELSE legislation.impact_score END,
+        title_zh   = CASE WHEN excluded.title_zh   != '' THEN excluded.title_zh   ELSE legislation.title_zh   END,
+        summary_zh = CASE WHEN excluded.summary_zh != '' THEN excluded.summary_zh ELSE legislation.summary_zh END,
+        risk_revenue = CASE WHEN excluded.risk_source = 'llm' THEN excluded.risk_revenue ELSE legislation.risk_revenue END,
+        risk_product = CASE WHEN excluded.risk_source = 'llm' THEN excluded.risk_product ELSE legislation.risk_product END,
+        risk_urgency = CASE WHEN excluded.risk_source = 'llm' THEN excluded.risk_urgency ELSE legislation.risk_urgency END,
+        risk_scope   = CASE WHEN excluded.risk_source = 'llm' THEN excluded.risk_scope   ELSE legislation.risk_scope   END,
+        risk_source  = CASE WHEN excluded.risk_source = 'llm' THEN excluded.risk_source  ELSE legislation.risk_source  END,
+        jurisdiction = CASE
+            WHEN excluded.applicability_scope IN ('global', 'multi') AND excluded.jurisdiction = '' THEN ''
+            WHEN excluded.jurisdiction != '' THEN excluded.jurisdiction
+            ELSE legislation.jurisdiction
+        END,
+        applicability_scope = CASE WHEN excluded.applicability_scope != 'unknown' THEN excluded.applicability_scope ELSE legislation.applicability_scope END,
+        jurisdiction_source = CASE WHEN excluded.jurisdiction_source != 'unknown' THEN excluded.jurisdiction_source ELSE legislation.jurisdiction_source END,
+        push_decision = excluded.push_decision,
+        value_score = excluded.value_score,
+        noise_reason = excluded.noise_reason,
+        decision_source = excluded.decision_source,
+        event_key = CASE WHEN excluded.event_key != '' THEN excluded.event_key ELSE legislation.event_key END,
+        features_json = excluded.features_json
+"""
+
+
+def _upsert_params(item: LegislationItem) -> tuple:
+    """_UPSERT_SQL 的参数；缺少事件键时就地补算（跨日去重依赖该键）。"""
+    from event_dedup import build_event_key
+    from features import features_for
+    if not item.event_key:
+        item.event_key = build_event_key(item)
+    return (
+        item.region, item.category_l1, item.category_l2,
+        item.title, item.date, item.status, item.summary,
+        item.source_name, item.source_url, item.lang,
+        item.title_zh, item.summary_zh, item.impact_score,
+        item.risk_revenue, item.risk_product, item.risk_urgency,
+        item.risk_scope, item.risk_source,
+        item.jurisdiction, item.applicability_scope,
+        item.jurisdiction_source,
+        item.push_decision, item.value_score,
+        item.noise_reason, item.decision_source,
+        item.event_key,
+        features_for(item).to_json(),
+    )
+
+
+# 全文检索（索引见 migrations.create_fts）：trigram 短语查询即子串匹配，与原
+# LIKE '%kw%' 语义一致。不足 3 个字符的关键词（如「开箱」）无法走索引，退回 LIKE。
+_FTS_MIN_KEYWORD_LEN = 3
+# snippet() 高亮标记；终端输出由 reporter.print_table 换成颜色
+SNIPPET_OPEN = "\x02"
+SNIPPET_CLOSE = "\x03"
+
+
+def _fts_phrase(keyword: str) -> str:
+    """关键词转为 FTS5 短语查询（双引号转义），避免 AND/OR/* 等被当作语法。"""
+    return '"' + keyword.replace('"', '""') + '"'
+
+
 class Database:
     """SQLite 数据库操作"""
 
     def __init__(self, db_path: str = DATABASE_PATH):
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        self.conn = sqlite_conn.connect(db_path)
         self.conn.row_factory = sqlite3.Row
-        self._init_tables()
-
-    def _init_tables(self):
-        self.conn.executescript("""
-            CREATE TABLE IF NOT EXISTS legislation (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                region TEXT NOT NULL,
-                category_l1 TEXT NOT NULL,
-                category_l2 TEXT DEFAULT '',
-                title TEXT NOT NULL,
-                date TEXT NOT NULL,
-                status TEXT DEFAULT '政策信号',
-                summary TEXT DEFAULT '',
-                source_name TEXT DEFAULT '',
-                source_url TEXT DEFAULT '',
-                lang TEXT DEFAULT 'en',
-                title_zh TEXT DEFAULT '',
-                summary_zh TEXT DEFAULT '',
-                impact_score REAL DEFAULT 1.0,
-                jurisdiction TEXT DEFAULT '',
-                applicability_scope TEXT DEFAULT 'unknown',
-                jurisdiction_source TEXT DEFAULT 'unknown',
-                push_decision TEXT DEFAULT 'pool_only',
-                value_score INTEGER DEFAULT 0,
-                noise_reason TEXT DEFAULT '判定失败',
-                decision_source TEXT DEFAULT 'fallback',
-                event_key TEXT DEFAULT '',
-                created_at TEXT DEFAULT (datetime('now')),
-                UNIQUE(title, source_url)
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_region ON legislation(region);
-            CREATE INDEX IF NOT EXISTS idx_category ON legislation(category_l1);
-            CREATE INDEX IF NOT EXISTS idx_date ON legislation(date);
-
-            CREATE TABLE IF NOT EXISTS fetch_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                source_name TEXT NOT NULL,
-                fetched_at TEXT DEFAULT (datetime('now')),
-                item_count INTEGER DEFAULT 0,
-                status TEXT DEFAULT 'ok',
-                error_msg TEXT DEFAULT ''
-            );
-        """)
-        # ── 迁移: 旧表补列 ────────────────────────────────────────────
-        for col, definition in [
-            ("title_zh",     "TEXT DEFAULT ''"),
-            ("summary_zh",   "TEXT DEFAULT ''"),
-            ("impact_score", "REAL DEFAULT 1.0"),
-            ("risk_revenue", "INTEGER DEFAULT 0"),
-            ("risk_product", "INTEGER DEFAULT 0"),
-            ("risk_urgency", "INTEGER DEFAULT 0"),
-            ("risk_scope",   "INTEGER DEFAULT 0"),
-            ("risk_source",  "TEXT DEFAULT 'regex'"),
-            ("jurisdiction", "TEXT DEFAULT ''"),
-            ("applicability_scope", "TEXT DEFAULT 'unknown'"),
-            ("jurisdiction_source", "TEXT DEFAULT 'unknown'"),
-            ("push_decision", "TEXT DEFAULT 'pool_only'"),
-            ("value_score", "INTEGER DEFAULT 0"),
-            ("noise_reason", "TEXT DEFAULT '判定失败'"),
-            ("decision_source", "TEXT DEFAULT 'fallback'"),
-            ("event_key", "TEXT DEFAULT ''"),
-        ]:
-            try:
-                self.conn.execute(f"SELECT {col} FROM legislation LIMIT 1")
-            except sqlite3.OperationalError:
-                self.conn.execute(
-                    f"ALTER TABLE legislation ADD COLUMN {col} {definition}"
-                )
-        # idx_impact 依赖 impact_score 列，必须在迁移之后再建
-        self.conn.executescript(
-            "CREATE INDEX IF NOT EXISTS idx_impact ON legislation(impact_score);"
-            "CREATE INDEX IF NOT EXISTS idx_event_key ON legislation(event_key);"
-        )
-        self.conn.commit()
+        self._fts_enabled: Optional[bool] = None
+        migrations.migrate(self.conn)
+
+    @property
+    def fts_enabled(self) -> bool:
+        """FTS5 全文索引是否可用（迁移时 SQLite 不支持 trigram 则不会建表）。"""
+        if self._fts_enabled is None:
+            self._fts_enabled = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'legislation_fts'"
+            ).fetchone() is not None
+        return self._fts_enabled
 
     def upsert_item(self, item: LegislationItem) -> bool:
-        if not item.event_key:
-            from event_dedup import build_event_key
-            item.event_key = build_event_key(item)
         try:
-            self.conn.execute("""
-                INSERT INTO legislation
-                    (region, category_l1, category_l2, title, date, status, summary,
-                     source_name, source_url, lang, title_zh, summary_zh, impact_score,
-                     risk_revenue, risk_product, risk_urgency, risk_scope, risk_source,
-                     jurisdiction, applicability_scope, jurisdiction_source,
-                     push_decision, value_score, noise_reason, decision_source, event_key)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(title, source_url) DO UPDATE SET
-                    region     = excluded.region,
-                    category_l1 = CASE WHEN excluded.category_l1 != '' THEN excluded.category_l1 ELSE legislation.category_l1 END,
-                    status     = CASE WHEN excluded.status     != '' THEN excluded.status     ELSE legislation.status     END,
-                    impact_score = CASE WHEN excluded.impact_score > 0 THEN excluded.impact_score ELSE legislation.impact_score END,
-                    title_zh   = CASE WHEN excluded.title_zh   != '' THEN excluded.title_zh   ELSE legislation.title_zh   END,
-                    summary_zh = CASE WHEN excluded.summary_zh != '' THEN excluded.summary_zh ELSE legislation.summary_zh END,
-                    risk_revenue = CASE WHEN excluded.risk_source = 'llm' THEN excluded.risk_revenue ELSE legislation.risk_revenue END,
-                    risk_product = CASE WHEN excluded.risk_source = 'llm' THEN excluded.risk_product ELSE legislation.risk_product END,
-                    risk_urgency = CASE WHEN excluded.risk_source = 'llm' THEN excluded.risk_urgency ELSE legislation.risk_urgency END,
-                    risk_scope   = CASE WHEN excluded.risk_source = 'llm' THEN excluded.risk_scope   ELSE legislation.risk_scope   END,
-                    risk_source  = CASE WHEN excluded.risk_source = 'llm' THEN excluded.risk_source  ELSE legislation.risk_source  END,
-                    jurisdiction = CASE
-                        WHEN excluded.applicability_scope IN ('global', 'multi') AND excluded.jurisdiction = '' THEN ''
-                        WHEN excluded.jurisdiction != '' THEN excluded.jurisdiction
-                        ELSE legislation.jurisdiction
-                    END,
-                    applicability_scope = CASE WHEN excluded.applicability_scope != 'unknown' THEN excluded.applicability_scope ELSE legislation.applicability_scope END,
-                    jurisdiction_source = CASE WHEN excluded.jurisdiction_source != 'unknown' THEN excluded.jurisdiction_source ELSE legislation.jurisdiction_source END,
-                    push_decision = excluded.push_decision,
-                    value_score = excluded.value_score,
-                    noise_reason = excluded.noise_reason,
-                    decision_source = excluded.decision_source,
-                    event_key = CASE WHEN excluded.event_key != '' THEN excluded.event_key ELSE legislation.event_key END
-            """, (
-                item.region, item.category_l1, item.category_l2,
-                item.title, item.date, item.status, item.summary,
-                item.source_name, item.source_url, item.lang,
-                item.title_zh, item.summary_zh, item.impact_score,
-                item.risk_revenue, item.risk_product, item.risk_urgency,
-                item.risk_scope, item.risk_source,
-                item.jurisdiction, item.applicability_scope,
-                item.jurisdiction_source,
-                item.push_decision, item.value_score,
-                item.noise_reason, item.decision_source,
-                item.event_key,
-            ))
+            cursor = self.conn.execute(_UPSERT_SQL, _upsert_params(item))
             self.conn.commit()
-            return self.conn.total_changes > 0
+            return cursor.rowcount > 0
         except sqlite3.Error:
             return False
 
+    def upsert_many(self, items: List[LegislationItem]) -> Dict[str, int]:
+        """
+        批量写入：事件键与特征先整批算好，再在单个事务内 executemany 同一条 UPSERT。
+        新增/更新条数按写入前已存在的 (title, source_url) 精确区分，同批重复键从第二次
+        起记为更新。整批事务失败时回滚并退回逐条写入，跳过出错的行（与逐条写入一致）。
+        """
+        if not items:
+            return {"inserted": 0, "updated": 0}
+        keys = {(item.title, item.source_url) for item in items}
+        params = [_upsert_params(item) for item in items]
+        try:
+            with self.conn:
+                existing = self._existing_upsert_keys(keys)
+                self.conn.executemany(_UPSERT_SQL, params)
+            written = items
+        except sqlite3.Error:
+            existing = self._existing_upsert_keys(keys)
+            written = [item for item in items if self.upsert_item(item)]
+
+        inserted = 0
+        for item in written:
+            key = (item.title, item.source_url)
+            if key not in existing:
+                existing.add(key)
+                inserted += 1
+        return {"inserted": inserted, "updated": len(written) - inserted}
+
     def bulk_upsert(self, items: List[LegislationItem]) -> int:
-        count = 0
-        for item in items:
-            if self.upsert_item(item):
-                count += 1
-        return count
+        counts = self.upsert_many(items)
+        return counts["inserted"] + counts["updated"]
+
+    def _existing_upsert_keys(self, keys: set) -> set:
+        """库内已存在的 (title, source_url)；按 source_url 分块查询避免超出变量上限。"""
+        urls = sorted({url for _, url in keys})
+        existing = set()
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT title, source_url FROM legislation WHERE source_url IN ({placeholders})",
+                chunk,
+            )
+            existing.update((title, url) for title, url in rows if (title, url) in keys)
+        return existing
 
     def filter_new_events(
         self,
@@ -202,28 +204,40 @@ class Database:
         if not items:
             return [], []
 
-        from event_dedup import build_event_key, is_meaningful_progress, same_event
+        from event_dedup import EventIndex, build_event_key, is_meaningful_progress, same_event
+        from features import item_field
 
+        # 只取 same_event / is_meaningful_progress 用到的列；features_json 让实体、
+        # 归一化标题等直接从入库时的持久化结果恢复
+        columns = """id, title, summary, title_zh, summary_zh, date, status, region,
+                     jurisdiction, category_l1, impact_score, event_key,
+                     COALESCE(features_json, '') AS features_json"""
         valid_dates = sorted(item.date for item in items if re.fullmatch(r"\d{4}-\d{2}-\d{2}", item.date or ""))
         if valid_dates:
             start = (datetime.strptime(valid_dates[0], "%Y-%m-%d") - timedelta(days=window_days)).strftime("%Y-%m-%d")
             end = valid_dates[-1]
             rows = self.conn.execute(
-                """SELECT * FROM legislation WHERE date >= ? AND date <= ?
+                f"""SELECT {columns} FROM legislation WHERE date >= ? AND date <= ?
                    ORDER BY date DESC, impact_score DESC""",
                 (start, end),
             ).fetchall()
         else:
             rows = self.conn.execute(
-                """SELECT * FROM legislation WHERE date >= date('now', ?)
+                f"""SELECT {columns} FROM legislation WHERE date >= date('now', ?)
                    ORDER BY date DESC, impact_score DESC""",
                 (f"-{window_days} days",),
             ).fetchall()
 
         existing = [dict(row) for row in rows]
+        backfilled = []
         for row in existing:
             if not row.get("event_key"):
                 row["event_key"] = build_event_key(row)
+                backfilled.append((row["event_key"], row["id"]))
+        if backfilled:
+            # 回写旧记录的 event_key，后续按 idx_event_key 检索不再需要现算
+            self.conn.executemany("UPDATE legislation SET event_key = ? WHERE id = ?", backfilled)
+            self.conn.commit()
 
         ordered = sorted(
             items,
@@ -234,13 +248,16 @@ class Database:
             ),
             reverse=True,
         )
+        # 候选索引：库内记录在前、已接受条目按接受顺序增量追加，
+        # 与逐条扫描 existing + accepted 的先后顺序一致
+        index = EventIndex(existing)
         accepted: List[LegislationItem] = []
         dropped: list[tuple[LegislationItem, str]] = []
 
         for item in ordered:
             item.event_key = item.event_key or build_event_key(item)
             duplicate = None
-            for candidate in existing + [accepted_item.to_dict() for accepted_item in accepted]:
+            for candidate in index.candidates(item):
                 if not same_event(candidate, item):
                     continue
                 if is_meaningful_progress(candidate, item):
@@ -250,8 +267,11 @@ class Database:
 
             if duplicate is None:
                 accepted.append(item)
+                index.add(item)
             else:
-                duplicate_title = duplicate.get("title_zh") or duplicate.get("title") or "同一事件"
+                duplicate_title = (
+                    item_field(duplicate, "title_zh") or item_field(duplicate, "title") or "同一事件"
+                )
                 dropped.append((item, duplicate_title))
 
         return accepted, dropped
@@ -273,7 +293,13 @@ class Database:
         limit: int = 500,
         date_start: Optional[str] = None,
         date_end: Optional[str] = None,
+        include_archive: bool = False,
     ) -> List[dict]:
+        """
+        按条件查询。keyword 走 FTS5 全文索引时按 bm25（标题权重更高）结合 impact_score
+        排序，并在 _snippet 中返回命中片段（SNIPPET_OPEN/SNIPPET_CLOSE 包围命中词）；
+        include_archive=True 时同时检索 legislation_archive。
+        """
         conditions = []
         params = []
 
@@ -286,9 +312,6 @@ class Database:
         if status:
             conditions.append("status = ?")
             params.append(status)
-        if keyword:
-            conditions.append("(title LIKE ? OR summary LIKE ? OR title_zh LIKE ? OR summary_zh LIKE ?)")
-            params.extend([f"%{keyword}%"] * 4)
         if date_start and date_end:
             conditions.append("date >= ?")
             params.append(date_start)
@@ -298,16 +321,50 @@ class Database:
             conditions.append("date >= date('now', ?)")
             params.append(f"-{days} days")
 
-        where = " AND ".join(conditions) if conditions else "1=1"
-        query = f"""
-            SELECT * FROM legislation
+        tables = ["legislation", "legislation_archive"] if include_archive else ["legislation"]
+
+        keyword = (keyword or "").strip()
+        use_fts = bool(keyword) and self.fts_enabled and len(keyword) >= _FTS_MIN_KEYWORD_LEN
+        if keyword and not use_fts:
+            conditions.append("(title LIKE ? OR summary LIKE ? OR title_zh LIKE ? OR summary_zh LIKE ?)")
+            params.extend([f"%{keyword}%"] * 4)
+
+        items = []
+        for table in tables:
+            if use_fts:
+                items.extend(self._search_fts(table, keyword, conditions, params, limit))
+            else:
+                where = " AND ".join(conditions) if conditions else "1=1"
+                rows = self.conn.execute(f"""
+                    SELECT * FROM {table}
+                    WHERE {where}
+                    ORDER BY impact_score DESC, date DESC
+                    LIMIT ?
+                """, [*params, limit]).fetchall()
+                items.extend(dict(row) for row in rows)
+
+        if len(tables) > 1:
+            if use_fts:
+                items.sort(key=lambda d: d["_rank"])
+            else:
+                items.sort(key=lambda d: (d.get("impact_score") or 0, d.get("date") or ""), reverse=True)
+            items = items[:limit]
+        return items
+
+    def _search_fts(self, table: str, keyword: str, conditions: list,
+                    params: list, limit: int) -> List[dict]:
+        """{table}_fts 短语检索；bm25 为负数，乘以 (1 + impact/10) 使高影响条目靠前。"""
+        fts = f"{table}_fts"
+        where = " AND ".join([f"{fts} MATCH ?", *conditions])
+        rows = self.conn.execute(f"""
+            SELECT t.*,
+                   snippet({fts}, -1, ?, ?, '…', 40) AS _snippet,
+                   bm25({fts}, 3.0, 1.0, 3.0, 1.0) * (1 + COALESCE(t.impact_score, 0) / 10.0) AS _rank
+            FROM {fts} JOIN {table} AS t ON t.id = {fts}.rowid
             WHERE {where}
-            ORDER BY impact_score DESC, date DESC
+            ORDER BY _rank, t.date DESC
             LIMIT ?
-        """
-        params.append(limit)
-
-        rows = self.conn.execute(query, params).fetchall()
+        """, [SNIPPET_OPEN, SNIPPET_CLOSE, _fts_phrase(keyword), *params, limit]).fetchall()
         return [dict(row) for row in rows]
 
     def get_stats(self) -> dict:
@@ -371,8 +428,10 @@ class Database:
                            applicability_scope: str = "",
                            jurisdiction_source: str = "",
                            push_decision: str = "", value_score: Optional[int] = None,
-                           noise_reason: str = "", decision_source: str = ""):
-        """直接按 id 更新翻译字段，可选更新分类/地区/风险评估。"""
+                           noise_reason: str = "", decision_source: str = "",
+                           commit: bool = True):
+        """直接按 id 更新翻译字段，可选更新分类/地区/风险评估。
+        commit=False 时由调用方在同一事务内批量提交（见 update_translations）。"""
         sql = "UPDATE legislation SET title_zh = ?, summary_zh = ?"
         params: list = [title_zh, summary_zh]
         if region:
@@ -414,8 +473,71 @@ class Database:
         sql += " WHERE id = ?"
         params.append(item_id)
         self.conn.execute(sql, params)
+        if commit:
+            self.conn.commit()
+
+    def update_translations(self, updates: List[dict],
+                            done_ids: Iterable[int] = (),
+                            failed_ids: Iterable[int] = ()) -> int:
+        """
+        在一个事务内写入一组翻译结果（每项为 update_translation 的关键字参数，含 item_id），
+        并同步推进 retranslate 检查点；任一写入失败则整组回滚。返回更新条数。
+        """
+        with self.conn:
+            for update in updates:
+                self.update_translation(**update, commit=False)
+            self._mark_retranslate(done_ids, "done")
+            self._mark_retranslate(failed_ids, "failed")
+        return len(updates)
+
+    # ── retranslate 检查点 ──────────────────────────────────────────────
+
+    def start_retranslate_queue(self, item_ids: List[int]) -> int:
+        """丢弃旧检查点，按给定顺序建立新的待重译队列。返回入队条数。"""
+        with self.conn:
+            self.conn.execute("DELETE FROM retranslate_queue")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO retranslate_queue (item_id) VALUES (?)",
+                [(item_id,) for item_id in item_ids],
+            )
+        return self.retranslate_progress()["pending"]
+
+    def pending_retranslate_items(self, limit: Optional[int] = None) -> List[dict]:
+        """按入队顺序返回检查点中尚未处理的条目（已被删除的条目自动跳过）。"""
+        sql = """
+            SELECT l.* FROM retranslate_queue q
+            JOIN legislation l ON l.id = q.item_id
+            WHERE q.status = 'pending'
+            ORDER BY q.seq
+        """
+        params: tuple = ()
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (limit,)
+        return [dict(row) for row in self.conn.execute(sql, params).fetchall()]
+
+    def retranslate_progress(self) -> dict:
+        """检查点中各状态的条数：{"pending": n, "done": n, "failed": n}。"""
+        counts = {"pending": 0, "done": 0, "failed": 0}
+        for row in self.conn.execute("""
+            SELECT q.status, COUNT(*) AS cnt FROM retranslate_queue q
+            JOIN legislation l ON l.id = q.item_id
+            GROUP BY q.status
+        """):
+            counts[row["status"]] = row["cnt"]
+        return counts
+
+    def clear_retranslate_queue(self) -> None:
+        self.conn.execute("DELETE FROM retranslate_queue")
         self.conn.commit()
 
+    def _mark_retranslate(self, item_ids: Iterable[int], status: str) -> None:
+        self.conn.executemany(
+            "UPDATE retranslate_queue SET status = ?, updated_at = datetime('now') "
+            "WHERE item_id = ?",
+            [(status, item_id) for item_id in item_ids],
+        )
+
     def backfill_geography(self) -> int:
         """只用与现有一级区域一致的强证据回填历史地理字段。"""
         from classifier import _detect_geography
@@ -473,49 +595,6 @@ class Database:
         将超过 keep_days 天以前的记录移入 legislation_archive 表并从主表删除。
         返回实际归档条数。
         """
-        # 建归档表（首次调用时自动创建）
-        self.conn.executescript("""
-            CREATE TABLE IF NOT EXISTS legislation_archive (
-                id INTEGER,
-                region TEXT,
-                category_l1 TEXT,
-                category_l2 TEXT,
-                title TEXT,
-                date TEXT,
-                status TEXT,
-                summary TEXT,
-                source_name TEXT,
-                source_url TEXT,
-                lang TEXT,
-                title_zh TEXT,
-                summary_zh TEXT,
-                impact_score REAL,
-                risk_revenue INTEGER DEFAULT 0,
-                risk_product INTEGER DEFAULT 0,
-                risk_urgency INTEGER DEFAULT 0,
-                risk_scope INTEGER DEFAULT 0,
-                risk_source TEXT DEFAULT 'regex',
-                jurisdiction TEXT DEFAULT '',
-                applicability_scope TEXT DEFAULT 'unknown',
-                jurisdiction_source TEXT DEFAULT 'unknown',
-                created_at TEXT,
-                archived_at TEXT DEFAULT (datetime('now')),
-                PRIMARY KEY (id)
-            );
-        """)
-        for col, definition in [
-            ("jurisdiction", "TEXT DEFAULT ''"),
-            ("applicability_scope", "TEXT DEFAULT 'unknown'"),
-            ("jurisdiction_source", "TEXT DEFAULT 'unknown'"),
-        ]:
-            try:
-                self.conn.execute(f"SELECT {col} FROM legislation_archive LIMIT 1")
-            except sqlite3.OperationalError:
-                self.conn.execute(
-                    f"ALTER TABLE legislation_archive ADD COLUMN {col} {definition}"
-                )
-        self.conn.commit()
-
         cutoff = (datetime.now() - timedelta(days=keep_days)).strftime("%Y-%m-%d")
 
         # 复制到归档表（已存在则跳过）
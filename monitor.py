@@ -11,7 +11,7 @@
     python monitor.py report --period week   # 周报
     python monitor.py report --period month  # 月报
     python monitor.py report --format html   # 生成 HTML 报告
-    python monitor.py query --keyword "loot box"  # 关键词搜索
+    python monitor.py query --keyword "loot box"  # 关键词搜索（FTS5 全文索引，按相关度排序）
     python monitor.py stats                  # 查看数据库统计
     python monitor.py schedule --interval 24 # 每24小时自动执行
 """
@@ -21,9 +21,13 @@ import logging
 import os
 import sys
 import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
+import llm_cache
+import llm_dispatch
+import relevance_model
+import translation_cache
 from models import Database
 from fetcher import fetch_and_process
 from translator import translate_items_batch
@@ -31,11 +35,13 @@ from reporter import (
     print_table, save_markdown, save_html,
     _calculate_event_fingerprint, _fp_same_event,
 )
+from features import features_for
 from utils import (
-    _get_region_group, _bigram_sim, previous_full_week_range, _TIER_SORT,
+    BigramIndex, _get_region_group, _bigram_jaccard, bigram_rank_order,
+    previous_full_week_range, _TIER_SORT,
     normalize_geography, normalize_jurisdiction, region_for_jurisdiction,
 )
-from config import PERIOD_DAYS
+from config import PERIOD_DAYS, RELEVANCE_MIN_RECALL
 
 # ─── 日志配置 ─────────────────────────────────────────────────────────
 
@@ -96,6 +102,50 @@ def _log_item_language_counts(stage: str, items: list) -> None:
     logger.info(f"[语种漏斗] {stage}: total={len(items)} {detail}".rstrip())
 
 
+def _date_ordinal(value):
+    """ISO 日期 → 序数；无法解析时返回 None（该条不参与按日期窗口的去重）。"""
+    try:
+        return date.fromisoformat(value).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+def _dedup_candidates(blocks, ordinals, title_bigrams, rank_order, threshold,
+                      bucket_days, extra_keys):
+    """
+    去重候选生成：对每个条目 i 返回可能与之合并的 j > i（升序）。
+
+    分桶：block（区域或区域 × 大类）× 日期段（bucket_days 天一段，检索相邻三段，
+    覆盖 ≤bucket_days 天的日期差）。桶内用 BigramIndex 前缀过滤找出标题 Jaccard
+    可能 ≥ threshold 的条目，再并上共享 extra_keys（规范化 URL、指纹实体）的条目。
+    不在候选中的对不可能满足任何合并条件，调用方只需精确比较候选。
+    """
+    from collections import defaultdict
+
+    index = BigramIndex(threshold, rank_order)
+    postings: dict = defaultdict(list)
+    pairs: list = [set() for _ in title_bigrams]
+    # 按标题长度升序先检索、后登记：每对只在较长一方检索时发现一次
+    for i in sorted(range(len(title_bigrams)), key=lambda k: len(title_bigrams[k])):
+        ordinal = ordinals[i]
+        if ordinal is None:
+            continue
+        segment = ordinal // bucket_days
+        neighbours = [(blocks[i], segment - 1), (blocks[i], segment), (blocks[i], segment + 1)]
+        found = index.candidates(title_bigrams[i], neighbours)
+        for key in extra_keys[i]:
+            for bucket in neighbours:
+                found.update(postings.get((bucket, key), ()))
+        for j in found:
+            pairs[min(i, j)].add(max(i, j))
+
+        bucket = (blocks[i], segment)
+        index.add(i, title_bigrams[i], bucket, ascending=True)
+        for key in extra_keys[i]:
+            postings[(bucket, key)].append(i)
+    return [sorted(js) for js in pairs]
+
+
 def _deduplicate_items(items, enable_fingerprint: bool = False):
     """
     三阶段去重 + 事件级时间轴合并：
@@ -117,15 +167,24 @@ def _deduplicate_items(items, enable_fingerprint: bool = False):
       → 确认后：保留状态权重最高项，并在其 summary_zh 末尾追加时间轴进展注释
 
     禁止跨 region 合并（如美国 vs 英国同主题法案仍独立显示）。
+    阶段 1/2 只精确比较 _dedup_candidates 给出的候选对，结果与两两比较一致。
     """
-    from models import LegislationItem
-    from datetime import date as _date
     from collections import defaultdict
     dropped: set[int] = set()
+    # 标题 bigram 集合、日期序数与事件指纹取自条目，每条只计算一次
+    title_bigrams = [features_for(item).title_bigrams for item in items]
+    ordinals = [_date_ordinal(item.date) for item in items]
+    rank_order = bigram_rank_order(title_bigrams)
     fingerprints = (
-        [_calculate_event_fingerprint(item.to_dict()) for item in items]
+        [_calculate_event_fingerprint(item) for item in items]
         if enable_fingerprint else []
     )
+    # 指纹合并要求共享实体，按实体（E:）建倒排即可覆盖全部指纹候选
+    entity_keys = [
+        [term for term in fingerprints[i] if term.startswith("E:")]
+        if enable_fingerprint else []
+        for i in range(len(items))
+    ]
 
     _SOURCE_CAP = 3  # 同源 + 同区域每日最多保留条数
 
@@ -149,33 +208,32 @@ def _deduplicate_items(items, enable_fingerprint: bool = False):
         )
 
     # ── 阶段 1：2 天窗口，标题去重 ────────────────────────────────────
+    # 候选：同 region × 相邻 3 天段内，标题可能 >0.55、同 URL 或共享指纹实体
+    urls = [
+        item.source_url.split("?", 1)[0].rstrip("/") if item.source_url else None
+        for item in items
+    ]
+    stage1_candidates = _dedup_candidates(
+        [item.region for item in items], ordinals, title_bigrams, rank_order,
+        threshold=0.55, bucket_days=3,
+        extra_keys=[
+            ([("U", url)] if url is not None else []) + entity_keys[i]
+            for i, url in enumerate(urls)
+        ],
+    )
     fingerprint_candidates = []
     for i, item_i in enumerate(items):
         if i in dropped:
             continue
         duplicates = []
-        for j, item_j in enumerate(items):
-            if j <= i or j in dropped:
+        for j in stage1_candidates[i]:
+            if j in dropped:
                 continue
-            if item_i.region != item_j.region:
-                continue
-            try:
-                d_i = _date.fromisoformat(item_i.date)
-                d_j = _date.fromisoformat(item_j.date)
-                diff = abs((d_i - d_j).days)
-                if diff > 2:
-                    continue
-            except ValueError:
+            item_j = items[j]
+            if abs(ordinals[i] - ordinals[j]) > 2:
                 continue
-            title_i = item_i.title_zh or item_i.title
-            title_j = item_j.title_zh or item_j.title
-            same_url = bool(
-                item_i.source_url
-                and item_j.source_url
-                and item_i.source_url.split("?", 1)[0].rstrip("/")
-                == item_j.source_url.split("?", 1)[0].rstrip("/")
-            )
-            sim = _bigram_sim(title_i, title_j)
+            same_url = urls[i] is not None and urls[i] == urls[j]
+            sim = _bigram_jaccard(title_bigrams[i], title_bigrams[j])
             # 高相似标题直接合并（>0.8）；同分类则放宽到 0.55
             if same_url or sim > 0.8:
                 duplicates.append((j, sim))
@@ -239,31 +297,22 @@ def _deduplicate_items(items, enable_fingerprint: bool = False):
         "草案/征求意见": 5, "立法进行中": 4, "已提案": 3, "立法动态": 2, "已废止": 1,
     }
 
-    # 收集候选跨阶段对：(i, j)
+    # 收集候选跨阶段对：(i, j)；检索限定同 region + 同大类 × 相邻 30 天段
+    stage2_candidates = _dedup_candidates(
+        [(item.region, item.category_l1) for item in items], ordinals, title_bigrams,
+        rank_order, threshold=0.5, bucket_days=30, extra_keys=entity_keys,
+    )
     candidates = []
-    for i, item_i in enumerate(items):
+    for i in range(len(items)):
         if i in dropped:
             continue
-        for j, item_j in enumerate(items):
-            if j <= i or j in dropped:
-                continue
-            # 同 region + 同大类
-            if item_i.region != item_j.region:
+        for j in stage2_candidates[i]:
+            if j in dropped:
                 continue
-            if item_i.category_l1 != item_j.category_l1:
+            diff = abs(ordinals[i] - ordinals[j])
+            if diff <= 2 or diff > 30:   # 2 天内已处理，>30 天不合并
                 continue
-            try:
-                d_i = _date.fromisoformat(item_i.date)
-                d_j = _date.fromisoformat(item_j.date)
-                diff = abs((d_i - d_j).days)
-                if diff <= 2 or diff > 30:   # 2 天内已处理，>30 天不合并
-                    continue
-            except ValueError:
-                continue
-            sim = _bigram_sim(
-                item_i.title_zh or item_i.title,
-                item_j.title_zh or item_j.title,
-            )
+            sim = _bigram_jaccard(title_bigrams[i], title_bigrams[j])
             # 移除上限：sim ≥ 0.5 均为候选（高相似跨阶段对在 LLM 验证后合并）
             if sim >= 0.5 or (
                 enable_fingerprint
@@ -419,11 +468,19 @@ def _log_shadow_comparison(stats: dict, title: str, v1: tuple, v2: tuple) -> Non
 
 # ─── 命令: run ───────────────────────────────────────────────────────
 
+def _apply_llm_cache_flag(args) -> None:
+    """--no-llm-cache：本次运行不读写 LLM 响应缓存（prompt 调试、强制刷新时使用）。"""
+    if getattr(args, "no_llm_cache", False):
+        llm_cache.set_bypass()
+        logger.info("已跳过 LLM 响应缓存 (--no-llm-cache)")
+
+
 def cmd_run(args):
     """执行一次完整的抓取-处理-存储流程"""
     days = _period_to_days(args.period)
     label = _period_label(args.period)
     logger.info(f"开始执行抓取 [{label}]...")
+    _apply_llm_cache_flag(args)
     shadow_mode = _push_shadow_mode_enabled()
     shadow_stats = {
         "total": 0,
@@ -464,13 +521,13 @@ def cmd_run(args):
                 logger.info("已跳过翻译 (--no-translate)")
             else:
                 from classifier import compute_composite_score, score_impact
-                logger.info(f"正在批量翻译并分类 ({len(items)} 条，每批 3 篇)...")
+                logger.info(f"正在批量翻译并分类 ({len(items)} 条，自适应批大小)...")
                 kept_items = []
                 llm_filtered = 0
 
-                # ── 批量翻译：3 条/LLM 请求，速度 3× ─────────────────
+                # ── 批量翻译：近似重复只送代表，按 token 预算自适应打包 ──
                 items_dicts = [item.to_dict() for item in items]
-                translated_list = translate_items_batch(items_dicts, batch_size=3)
+                translated_list = translate_items_batch(items_dicts)
 
                 for item, translated in zip(items, translated_list):
                     # 不相关文章仍保留到候选池，只禁止进入日报。
@@ -608,8 +665,12 @@ def cmd_run(args):
                     len(persistent_duplicates),
                 )
 
-            written_count = db.bulk_upsert(items)
-            logger.info(f"写入/更新 {written_count} 条记录 (共处理 {len(items)} 条)")
+            counts = db.upsert_many(items)
+            written_count = counts["inserted"] + counts["updated"]
+            logger.info(
+                f"写入/更新 {written_count} 条记录 (新增 {counts['inserted']}，"
+                f"更新 {counts['updated']}，共处理 {len(items)} 条)"
+            )
             db.log_fetch("full_run", written_count, "ok")
 
         else:
@@ -638,6 +699,10 @@ def cmd_run(args):
         raise
     finally:
         db.close()
+        llm_cache.log_summary()
+        llm_dispatch.log_summary()
+        translation_cache.log_summary()
+        relevance_model.log_summary()
 
 
 # ─── 命令: report ────────────────────────────────────────────────────
@@ -721,6 +786,7 @@ def cmd_query(args):
             region=args.region,
             keyword=args.keyword,
             days=days,
+            include_archive=getattr(args, "archive", False),
         )
         if items:
             print_table(items)
@@ -765,119 +831,183 @@ def cmd_stats(args):
 
 # ─── 命令: retranslate ───────────────────────────────────────────────
 
+def _parse_budget(text: str):
+    """--budget 取值：纯数字或 "200calls" 表示 LLM 请求数，"30m" / "30min" 表示分钟数。"""
+    import re
+    m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*(calls?|m|min|minutes?)?\s*", text or "", re.IGNORECASE)
+    if not m or float(m.group(1)) <= 0:
+        raise argparse.ArgumentTypeError(f"无效的预算: {text!r}（示例: 200 / 200calls / 30m）")
+    unit = "minutes" if (m.group(2) or "").lower().startswith("m") else "calls"
+    return unit, float(m.group(1))
+
+
+def _retranslate_update(item_dict: dict, translated: dict):
+    """把一条重译结果整理为 Database.update_translation 的参数；没有译文时返回 None。"""
+    from classifier import compute_composite_score, score_impact
+
+    if not translated.get("title_zh"):
+        return None
+    # 提取 LLM 分类结果
+    llm_region   = translated.get("_llm_region", "")
+    jurisdiction = normalize_jurisdiction(
+        translated.get("_llm_jurisdiction", "") or llm_region
+    )
+    applicability_scope = translated.get(
+        "_llm_applicability_scope", "unknown"
+    )
+    jurisdiction, applicability_scope = normalize_geography(
+        jurisdiction, applicability_scope
+    )
+    llm_category = translated.get("_llm_category_l1", "")
+    llm_status   = translated.get("_llm_status", "")
+    if jurisdiction:
+        region = region_for_jurisdiction(jurisdiction)
+    elif applicability_scope in {"global", "multi"}:
+        region = "其他"
+    else:
+        region = _get_region_group(item_dict.get("region", ""))
+
+    # 提取 LLM 风险评估
+    r_rev = translated.get("_llm_risk_revenue", 0)
+    r_pro = translated.get("_llm_risk_product", 0)
+    r_urg = translated.get("_llm_risk_urgency", 0)
+    r_sco = translated.get("_llm_risk_scope", 0)
+    risk_source = "llm" if r_rev + r_pro + r_urg + r_sco > 0 else ""
+
+    # 计算影响评分
+    text = f"{item_dict.get('title', '')} {translated.get('summary_zh', '')}"
+    if risk_source:
+        impact = compute_composite_score(r_rev, r_pro, r_urg, r_sco,
+                                         region=region, source_name=item_dict.get("source_name", ""), text=text)
+    else:
+        status = llm_status or item_dict.get("status", "立法动态")
+        impact = score_impact(status, item_dict.get("source_name", ""), region=region, text=text)
+
+    assessment, _, _ = _resolve_push_assessment(
+        shadow_mode=_push_shadow_mode_enabled(),
+        raw_title=item_dict.get("title", ""),
+        raw_summary=item_dict.get("summary", ""),
+        generated_title=translated.get("title_zh", ""),
+        generated_summary=translated.get("summary_zh", ""),
+        source_name=item_dict.get("source_name", ""),
+        is_relevant=translated.get("_llm_is_relevant"),
+        value_score=translated.get("_llm_value_score", 0),
+        push_decision=translated.get("_llm_push_decision", "pool_only"),
+        noise_reason=translated.get("_llm_noise_reason", "判定失败"),
+        decision_source=translated.get("_llm_decision_source", "fallback"),
+        risk_revenue=r_rev, risk_product=r_pro,
+        risk_urgency=r_urg, risk_scope=r_sco,
+        jurisdiction=jurisdiction,
+        applicability_scope=applicability_scope,
+    )
+    push_decision, value_score, noise_reason, decision_source = assessment
+
+    return dict(
+        item_id=item_dict["id"],
+        title_zh=translated["title_zh"],
+        summary_zh=translated.get("summary_zh", ""),
+        region=region,
+        category_l1=llm_category,
+        status=llm_status,
+        impact_score=impact,
+        risk_revenue=r_rev, risk_product=r_pro,
+        risk_urgency=r_urg, risk_scope=r_sco,
+        risk_source=risk_source,
+        jurisdiction=jurisdiction,
+        applicability_scope=applicability_scope,
+        jurisdiction_source="llm" if (
+            jurisdiction or applicability_scope != "unknown"
+        ) else "",
+        push_decision=push_decision,
+        value_score=value_score,
+        noise_reason=noise_reason,
+        decision_source=decision_source,
+    )
+
+
 def cmd_retranslate(args):
     """
     清空含脏词/格式问题的历史翻译字段，然后立即重新翻译。
     用途：当 translator.py 中的 _TERM_CORRECTIONS 或 prompt 更新后，
     让旧数据库条目也能享受最新翻译质量。
+
+    待重译条目先写入 SQLite 检查点（retranslate_queue），再按 RETRANSLATE_CHUNK_SIZE
+    一轮交给批量翻译（并发 + RPM/TPM 限速），每轮结果在一个事务内写库并推进检查点。
+    中断或 --budget 用尽后重跑会从剩余条目继续；--restart 丢弃检查点重新建队列。
     """
-    from translator import _TERM_CORRECTIONS, translate_item_fields
-    from classifier import compute_composite_score, score_impact
+    from translator import _TERM_CORRECTIONS
+    from config import RETRANSLATE_CHUNK_SIZE
 
+    _apply_llm_cache_flag(args)
+    budget = getattr(args, "budget", None)
+    dispatcher = llm_dispatch.get_dispatcher()
+    start_calls, start_time = dispatcher.calls, time.monotonic()
     db = Database()
     try:
-        # ── 阶段 1：清空含脏词的翻译字段 ──────────────────────────────
-        dirty_terms = list(_TERM_CORRECTIONS.keys())
-        # 同时清理常见格式问题：【xxx】栏目前缀、问句标题（以"？"结尾）
-        extra_patterns = ["【"]
-        cleared = db.clear_stale_translations(dirty_terms + extra_patterns)
-        logger.info(f"[重译] 已清空 {cleared} 条含脏词翻译的条目")
-
-        # ── 阶段 2：查询所有 title_zh 为空的条目并重译 ─────────────────
-        # 注意：即使 cleared==0（无脏词），--no-translate 抓取的新条目也需要在这里翻译，
-        # 因此不提前返回，让下方的 items_dicts 为空判断处理"真正无事可做"的情形。
-        limit = getattr(args, "limit", 100)
-        items_dicts = db.query_items_untranslated(limit=limit)
-        if not items_dicts:
-            logger.info("[重译] 没有待翻译条目，完成。")
-            return
-
-        logger.info(f"[重译] 开始重译 {len(items_dicts)} 条条目（限额 {limit}）…")
+        progress = db.retranslate_progress()
+        if progress["pending"] and not getattr(args, "restart", False):
+            logger.info(
+                f"[重译] 从检查点继续：剩余 {progress['pending']} 条"
+                f"（已完成 {progress['done']}，失败 {progress['failed']}）"
+            )
+        else:
+            # ── 阶段 1：清空含脏词的翻译字段 ──────────────────────────────
+            dirty_terms = list(_TERM_CORRECTIONS.keys())
+            # 同时清理常见格式问题：【xxx】栏目前缀、问句标题（以"？"结尾）
+            extra_patterns = ["【"]
+            cleared = db.clear_stale_translations(dirty_terms + extra_patterns)
+            logger.info(f"[重译] 已清空 {cleared} 条含脏词翻译的条目")
+
+            # ── 阶段 2：所有 title_zh 为空的条目写入检查点队列 ────────────────
+            # 注意：即使 cleared==0（无脏词），--no-translate 抓取的新条目也需要在这里翻译，
+            # 因此不提前返回，让下方的队列为空判断处理"真正无事可做"的情形。
+            limit = getattr(args, "limit", 100)
+            queued = db.start_retranslate_queue(
+                [d["id"] for d in db.query_items_untranslated(limit=limit)]
+            )
+            if not queued:
+                logger.info("[重译] 没有待翻译条目，完成。")
+                return
+            logger.info(f"[重译] 开始重译 {queued} 条条目（限额 {limit}）…")
+
+        # ── 阶段 3：分轮批量翻译，每轮一个事务写库 + 推进检查点 ────────────
         updated = 0
-        for item_dict in items_dicts:
-            translated = translate_item_fields(item_dict)
-            if translated.get("title_zh"):
-                # 提取 LLM 分类结果
-                llm_region   = translated.get("_llm_region", "")
-                jurisdiction = normalize_jurisdiction(
-                    translated.get("_llm_jurisdiction", "") or llm_region
-                )
-                applicability_scope = translated.get(
-                    "_llm_applicability_scope", "unknown"
-                )
-                jurisdiction, applicability_scope = normalize_geography(
-                    jurisdiction, applicability_scope
-                )
-                llm_category = translated.get("_llm_category_l1", "")
-                llm_status   = translated.get("_llm_status", "")
-                if jurisdiction:
-                    region = region_for_jurisdiction(jurisdiction)
-                elif applicability_scope in {"global", "multi"}:
-                    region = "其他"
-                else:
-                    region = _get_region_group(item_dict.get("region", ""))
-
-                # 提取 LLM 风险评估
-                r_rev = translated.get("_llm_risk_revenue", 0)
-                r_pro = translated.get("_llm_risk_product", 0)
-                r_urg = translated.get("_llm_risk_urgency", 0)
-                r_sco = translated.get("_llm_risk_scope", 0)
-                risk_source = "llm" if r_rev + r_pro + r_urg + r_sco > 0 else ""
-
-                # 计算影响评分
-                text = f"{item_dict.get('title', '')} {translated.get('summary_zh', '')}"
-                if risk_source:
-                    impact = compute_composite_score(r_rev, r_pro, r_urg, r_sco,
-                                                     region=region, source_name=item_dict.get("source_name", ""), text=text)
-                else:
-                    status = llm_status or item_dict.get("status", "立法动态")
-                    impact = score_impact(status, item_dict.get("source_name", ""), region=region, text=text)
-
-                assessment, _, _ = _resolve_push_assessment(
-                    shadow_mode=_push_shadow_mode_enabled(),
-                    raw_title=item_dict.get("title", ""),
-                    raw_summary=item_dict.get("summary", ""),
-                    generated_title=translated.get("title_zh", ""),
-                    generated_summary=translated.get("summary_zh", ""),
-                    source_name=item_dict.get("source_name", ""),
-                    is_relevant=translated.get("_llm_is_relevant"),
-                    value_score=translated.get("_llm_value_score", 0),
-                    push_decision=translated.get("_llm_push_decision", "pool_only"),
-                    noise_reason=translated.get("_llm_noise_reason", "判定失败"),
-                    decision_source=translated.get("_llm_decision_source", "fallback"),
-                    risk_revenue=r_rev, risk_product=r_pro,
-                    risk_urgency=r_urg, risk_scope=r_sco,
-                    jurisdiction=jurisdiction,
-                    applicability_scope=applicability_scope,
-                )
-                push_decision, value_score, noise_reason, decision_source = assessment
-
-                db.update_translation(
-                    item_dict["id"],
-                    translated["title_zh"],
-                    translated.get("summary_zh", ""),
-                    region=region,
-                    category_l1=llm_category,
-                    status=llm_status,
-                    impact_score=impact,
-                    risk_revenue=r_rev, risk_product=r_pro,
-                    risk_urgency=r_urg, risk_scope=r_sco,
-                    risk_source=risk_source,
-                    jurisdiction=jurisdiction,
-                    applicability_scope=applicability_scope,
-                    jurisdiction_source="llm" if (
-                        jurisdiction or applicability_scope != "unknown"
-                    ) else "",
-                    push_decision=push_decision,
-                    value_score=value_score,
-                    noise_reason=noise_reason,
-                    decision_source=decision_source,
-                )
-                updated += 1
-                logger.info(f"  ✓ [{region}] {translated['title_zh'][:40]}")
+        while True:
+            if budget and _budget_exhausted(budget, dispatcher.calls - start_calls,
+                                            time.monotonic() - start_time):
+                remaining = db.retranslate_progress()["pending"]
+                logger.info(f"[重译] 预算已用尽，剩余 {remaining} 条留待下次继续")
+                break
+            chunk = db.pending_retranslate_items(limit=RETRANSLATE_CHUNK_SIZE)
+            if not chunk:
+                db.clear_retranslate_queue()
+                break
+            results = translate_items_batch(chunk)
+            updates, failed = [], []
+            for item_dict, translated in zip(chunk, results):
+                update = _retranslate_update(item_dict, translated)
+                if update is None:
+                    failed.append(item_dict["id"])
+                    continue
+                updates.append(update)
+                logger.info(f"  ✓ [{update['region']}] {update['title_zh'][:40]}")
+            updated += db.update_translations(
+                updates, done_ids=[u["item_id"] for u in updates], failed_ids=failed,
+            )
         logger.info(f"[重译] 完成，共更新 {updated} 条。")
     finally:
         db.close()
+        llm_cache.log_summary()
+        llm_dispatch.log_summary()
+        translation_cache.log_summary()
+        relevance_model.log_summary()
+
+
+def _budget_exhausted(budget, calls: int, elapsed_seconds: float) -> bool:
+    unit, amount = budget
+    if unit == "minutes":
+        return elapsed_seconds >= amount * 60
+    return calls >= amount
 
 
 # ─── 命令: noise-sync ────────────────────────────────────────────────
@@ -936,6 +1066,155 @@ def cmd_noise_sync(args):
     _reload_noise_sources()
 
 
+# ─── 命令: train-prefilter / evaluate-prefilter ──────────────────────
+
+def _prefilter_examples(db, with_bitable: bool):
+    human_labels = {}
+    if with_bitable:
+        from feishu_bitable import fetch_triage_labels
+        human_labels = fetch_triage_labels()
+        logger.info(f"[相关性预筛] Bitable 人工标签 {len(human_labels)} 条")
+    return relevance_model.load_examples(db.conn, human_labels)
+
+
+def _log_prefilter_report(title: str, report: dict) -> None:
+    logger.info(
+        f"[相关性预筛] {title}：样本 {report['samples']}（有价值 {report['positives']}），"
+        f"阈值 {report['threshold']:.3f} → 跳过 {report['skipped']} 条（{report['skip_rate']:.0%}），"
+        f"无价值条目拦截 {report['negatives_skipped']:.0%}，"
+        f"有价值召回 {report['recall']:.1%}（误跳过 {report['missed_positives']} 条）"
+    )
+
+
+def cmd_train_prefilter(args):
+    """
+    用 monitor.db 的历史判定（可选叠加 Bitable 人工初筛）训练本地相关性预筛模型，
+    按召回护栏在校准集上选定跳过阈值、在最近 20% 的测试集上报告召回，写入 RELEVANCE_MODEL_PATH。
+    """
+    from config import RELEVANCE_MODEL_PATH
+
+    db = Database()
+    try:
+        items, labels = _prefilter_examples(db, args.with_bitable)
+    finally:
+        db.close()
+    logger.info(f"[相关性预筛] 有标签样本 {len(items)} 条（有价值 {sum(labels)}）")
+    try:
+        model, report = relevance_model.train(items, labels, min_recall=args.min_recall)
+    except (ValueError, RuntimeError) as e:
+        logger.error(f"[相关性预筛] 未训练: {e}")
+        sys.exit(1)
+    _log_prefilter_report("校准集", model.meta["calibration"])
+    _log_prefilter_report("测试集", report)
+    model.save(RELEVANCE_MODEL_PATH)
+    logger.info(
+        f"[相关性预筛] 模型已保存: {RELEVANCE_MODEL_PATH}"
+        f"（当前模式 {relevance_model.prefilter_mode()}，确认影子结果后再设为 active）"
+    )
+
+
+def cmd_evaluate_prefilter(args):
+    """
+    在最近 --days 天的有标签样本上评估已保存的预筛模型（默认阈值或 --threshold）。
+    训练与选阈值用过的样本（日期 ≤ 模型的 calibrated_through）不参与评估。
+    """
+    from config import RELEVANCE_MODEL_PATH
+
+    if not relevance_model._HAS_NUMPY:
+        logger.error("[相关性预筛] 需要 NumPy：pip install numpy")
+        sys.exit(1)
+    try:
+        model = relevance_model.RelevanceModel.load(RELEVANCE_MODEL_PATH)
+    except OSError as e:
+        logger.error(f"[相关性预筛] 无法读取模型（先运行 train-prefilter）: {e}")
+        sys.exit(1)
+    db = Database()
+    try:
+        items, labels = _prefilter_examples(db, args.with_bitable)
+    finally:
+        db.close()
+    cutoff = (date.today() - timedelta(days=args.days)).isoformat()
+    seen_through = model.meta.get("calibrated_through") or ""
+    recent = [
+        (d, y) for d, y in zip(items, labels)
+        if (d.get("date") or "") >= cutoff and (d.get("date") or "") > seen_through
+    ]
+    if not recent:
+        logger.warning(
+            f"[相关性预筛] 最近 {args.days} 天没有训练/校准（截至 {seen_through or '?'}）之后的有标签样本"
+        )
+        return
+    logger.info(f"[相关性预筛] 模型训练于 {model.meta.get('trained_at', '?')}")
+    report = relevance_model.evaluate(
+        model, [d for d, _ in recent], [y for _, y in recent], threshold=args.threshold,
+    )
+    _log_prefilter_report(f"最近 {args.days} 天", report)
+
+
+# ─── 命令: llm-stats ─────────────────────────────────────────────────
+
+def cmd_llm_stats(args):
+    """按调用用途与日期汇总 LLM 遥测：p50/p95 延迟、每条 token、重试、缓存命中与估算费用。"""
+    from llm_telemetry import get_telemetry
+
+    telemetry = get_telemetry()
+    if telemetry is None:
+        logger.error("[LLM遥测] 无法打开遥测库")
+        sys.exit(1)
+
+    def fmt(value, spec):
+        return "-" if value is None else format(value, spec)
+
+    for by, title in (("call_type", "按调用用途"), ("day", "按日期（UTC）")):
+        rows = telemetry.summarize(days=args.days, by=by)
+        print()
+        print(f"  LLM 调用统计 · {title} · 最近 {args.days} 天")
+        print(f"  {'-' * 104}")
+        print(
+            f"  {'':<18} {'调用':>5} {'缓存':>5} {'错误':>4} {'拒收':>4} {'重试':>4} "
+            f"{'p50(s)':>7} {'p95(s)':>7} {'排队(s)':>8} {'输入/条':>8} {'输出/条':>8} {'费用':>8}"
+        )
+        if not rows:
+            print("  （无记录）")
+            continue
+        for r in rows:
+            print(
+                f"  {r['key']:<18} {r['calls']:>5} {r['cache_hits']:>5} {r['errors']:>4} "
+                f"{r['rejected']:>4} {r['retries']:>4} {fmt(r['p50'], '7.2f')} "
+                f"{fmt(r['p95'], '7.2f')} {r['queue_s']:>8.1f} "
+                f"{fmt(r['prompt_per_item'], '8.0f')} {fmt(r['completion_per_item'], '8.0f')} "
+                f"{r['cost']:>8.3f}"
+            )
+    print()
+
+
+# ─── 命令: audit-queries ─────────────────────────────────────────────
+
+def cmd_audit_queries(args):
+    """对登记的热点查询执行 EXPLAIN QUERY PLAN，存在整表扫描时退出码为 1。"""
+    import query_audit
+
+    db = Database(args.db) if args.db else Database()
+    try:
+        results = query_audit.audit(db.conn)
+    finally:
+        db.close()
+
+    print()
+    for r in results:
+        mark = "✗ 扫描" if r["full_scans"] else ("△ 排序" if r["temp_sort"] else "✓ 正常")
+        print(f"  {mark:<8} {r['name']:<22} {r['caller']}")
+        for step in r["plan"]:
+            print(f"  {'':<8}   {step}")
+    scans = [r["name"] for r in results if r["full_scans"]]
+    print()
+    print(f"  共 {len(results)} 条查询，整表扫描 {len(scans)} 条"
+          + (f"：{', '.join(scans)}" if scans else ""))
+    print()
+    if scans:
+        sys.exit(1)
+
+
 # ─── 命令: archive ────────────────────────────────────────────────────
 
 def cmd_archive(args):
@@ -1001,6 +1280,8 @@ def main():
     _add_period_arg(p_run)
     p_run.add_argument("--output", "-o", help="输出文件名 (支持 .md / .html)")
     p_run.add_argument("--no-translate", action="store_true", help="跳过翻译(加快速度)")
+    p_run.add_argument("--no-llm-cache", action="store_true",
+                       help="不读写 LLM 响应缓存（强制重新调用 LLM）")
     p_run.set_defaults(func=cmd_run)
 
     # report
@@ -1020,6 +1301,8 @@ def main():
     p_query = subparsers.add_parser("query", help="关键词查询")
     p_query.add_argument("--keyword", "-k", required=True, help="搜索关键词")
     p_query.add_argument("--region", "-r", help="按地区筛选")
+    p_query.add_argument("--archive", action="store_true",
+                         help="同时检索 legislation_archive 中的归档记录")
     _add_period_arg(p_query)
     p_query.set_defaults(func=cmd_query)
 
@@ -1040,6 +1323,18 @@ def main():
         "--limit", type=int, default=100,
         help="单次最多重译条数（默认 100，避免超 Groq 配额）",
     )
+    p_retrans.add_argument(
+        "--no-llm-cache", action="store_true",
+        help="不读写 LLM 响应缓存（prompt 更新后强制重新调用 LLM）",
+    )
+    p_retrans.add_argument(
+        "--budget", type=_parse_budget, default=None,
+        help="本次最多消耗的 LLM 请求数（如 200）或分钟数（如 30m），用尽后保存检查点退出",
+    )
+    p_retrans.add_argument(
+        "--restart", action="store_true",
+        help="丢弃上次未完成的检查点，重新清理脏词并建立待重译队列",
+    )
     p_retrans.set_defaults(func=cmd_retranslate)
 
     # noise-sync
@@ -1053,6 +1348,52 @@ def main():
     )
     p_noise.set_defaults(func=cmd_noise_sync)
 
+    # llm-stats
+    p_llm_stats = subparsers.add_parser(
+        "llm-stats",
+        help="LLM 调用遥测：各用途 p50/p95 延迟、每条 token、重试与费用趋势",
+    )
+    p_llm_stats.add_argument("--days", type=int, default=14, help="统计最近 N 天（默认 14）")
+    p_llm_stats.set_defaults(func=cmd_llm_stats)
+
+    # audit-queries
+    p_audit = subparsers.add_parser(
+        "audit-queries",
+        help="EXPLAIN QUERY PLAN 审计热点查询，标出整表扫描与临时排序",
+    )
+    p_audit.add_argument("--db", help="数据库路径（默认 data/monitor.db）")
+    p_audit.set_defaults(func=cmd_audit_queries)
+
+    # train-prefilter / evaluate-prefilter
+    p_train = subparsers.add_parser(
+        "train-prefilter",
+        help="用历史 LLM 判定训练本地相关性预筛模型（需要 NumPy）",
+    )
+    p_train.add_argument(
+        "--min-recall", type=float, default=RELEVANCE_MIN_RECALL,
+        help=f"召回护栏：校准集有价值条目至少保留的比例（默认 {RELEVANCE_MIN_RECALL}）",
+    )
+    p_train.add_argument(
+        "--with-bitable", action="store_true",
+        help="叠加 Bitable 人工初筛结果作为标签（需配置飞书凭证）",
+    )
+    p_train.set_defaults(func=cmd_train_prefilter)
+
+    p_eval = subparsers.add_parser(
+        "evaluate-prefilter",
+        help="评估已保存的相关性预筛模型：跳过率与有价值条目召回",
+    )
+    p_eval.add_argument("--days", type=int, default=30, help="评估最近 N 天的样本（默认 30）")
+    p_eval.add_argument(
+        "--threshold", type=float, default=None,
+        help="用指定阈值代替模型保存的阈值（对比不同取值）",
+    )
+    p_eval.add_argument(
+        "--with-bitable", action="store_true",
+        help="叠加 Bitable 人工初筛结果作为标签（需配置飞书凭证）",
+    )
+    p_eval.set_defaults(func=cmd_evaluate_prefilter)
+
     # archive
     p_archive = subparsers.add_parser(
         "archive",
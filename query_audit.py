@@ -0,0 +1,128 @@
+"""
+热点查询的 EXPLAIN QUERY PLAN 审计
+
+HOT_QUERIES 登记 reporter / daily_check / retranslate / 去重 / 入库路径上的查询形状
+（与 models.py、daily_check.py 中的 SQL 保持一致，改动查询时同步更新）。audit()
+对每条查询执行 EXPLAIN QUERY PLAN，标出整表/整索引扫描（SCAN）与需要临时 B 树
+排序的步骤。monitor.py audit-queries 打印结果，存在整表扫描时退出码为 1。
+新增热点查询时登记到这里，并把所需索引作为新迁移追加到 migrations.MIGRATIONS。
+"""
+
+import re
+import sqlite3
+from typing import Dict, List, Set, Tuple
+
+# (名称, 调用位置, SQL, 参数)
+HOT_QUERIES: List[Tuple[str, str, str, tuple]] = [
+    (
+        "query_items", "models.Database.query_items（report / query 默认按天数）",
+        """SELECT * FROM legislation WHERE date >= date('now', ?)
+           ORDER BY impact_score DESC, date DESC LIMIT ?""",
+        ("-7 days", 500),
+    ),
+    (
+        "query_items_range", "models.Database.query_items（周报显式日期范围）",
+        """SELECT * FROM legislation WHERE date >= ? AND date <= ?
+           ORDER BY impact_score DESC, date DESC LIMIT ?""",
+        ("2026-01-05", "2026-01-11", 500),
+    ),
+    (
+        "query_items_region", "models.Database.query_items（--region）",
+        """SELECT * FROM legislation WHERE region = ? AND date >= date('now', ?)
+           ORDER BY impact_score DESC, date DESC LIMIT ?""",
+        ("北美", "-90 days", 500),
+    ),
+    (
+        "query_items_keyword", "models.Database._search_fts（query --keyword）",
+        """SELECT t.*, bm25(legislation_fts) AS _rank
+           FROM legislation_fts JOIN legislation AS t ON t.id = legislation_fts.rowid
+           WHERE legislation_fts MATCH ? AND date >= date('now', ?)
+           ORDER BY _rank LIMIT ?""",
+        ('"loot box"', "-90 days", 500),
+    ),
+    (
+        "daily_items", "daily_check.get_daily_items",
+        """SELECT * FROM legislation
+           WHERE date IN (?, ?) AND created_at >= ?
+             AND COALESCE(impact_score, 1.0) > 0
+             AND title_zh IS NOT NULL AND TRIM(title_zh) != ''""",
+        ("2026-01-05", "2026-01-06", "2026-01-05 00:00:00"),
+    ),
+    (
+        "untranslated", "models.Database.query_items_untranslated",
+        """SELECT * FROM legislation WHERE title_zh = '' OR title_zh IS NULL
+           ORDER BY impact_score DESC, date DESC LIMIT ?""",
+        (200,),
+    ),
+    (
+        "filter_new_events", "models.Database.filter_new_events",
+        """SELECT * FROM legislation WHERE date >= ? AND date <= ?
+           ORDER BY date DESC, impact_score DESC""",
+        ("2025-12-06", "2026-01-05"),
+    ),
+    (
+        "upsert_existing_keys", "models.Database._existing_upsert_keys",
+        "SELECT title, source_url FROM legislation WHERE source_url IN (?, ?)",
+        ("https://example.com/1", "https://example.com/2"),
+    ),
+    (
+        "retranslate_pending", "models.Database.pending_retranslate_items",
+        """SELECT l.* FROM retranslate_queue q JOIN legislation l ON l.id = q.item_id
+           WHERE q.status = 'pending' ORDER BY q.seq LIMIT ?""",
+        (20,),
+    ),
+    (
+        "archive_old_records", "models.Database.archive_old_records",
+        "SELECT * FROM legislation WHERE date < ?",
+        ("2025-07-01",),
+    ),
+]
+
+# SCAN 即逐行遍历整张表或整个索引（SEARCH 才是按键定位）；虚表（FTS）不在此列
+_SCAN_RE = re.compile(r"^SCAN (\w+)(?: USING (?:COVERING )?INDEX (\w+))?$")
+
+
+def explain(conn: sqlite3.Connection, sql: str, params: tuple = ()) -> List[str]:
+    """EXPLAIN QUERY PLAN 的 detail 列（按输出顺序）。"""
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def partial_indexes(conn: sqlite3.Connection) -> Set[str]:
+    return {
+        row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND sql LIKE '%WHERE%'"
+        )
+    }
+
+
+def full_scans(plan: List[str], partial: Set[str] = frozenset()) -> List[str]:
+    """
+    计划中整表扫描的表名（别名）。按非部分索引顺序的 SCAN 同样计入：带 LIMIT 时
+    窗口内不足 LIMIT 行也会走完整个索引；只有部分索引（只遍历满足条件的行）不算。
+    """
+    scans = []
+    for step in plan:
+        m = _SCAN_RE.match(step.strip())
+        if not m:
+            continue
+        table, index = m.groups()
+        if index and index in partial:
+            continue
+        scans.append(table)
+    return scans
+
+
+def audit(conn: sqlite3.Connection) -> List[Dict]:
+    """逐条审计 HOT_QUERIES：{name, caller, plan, full_scans, temp_sort}。"""
+    partial = partial_indexes(conn)
+    results = []
+    for name, caller, sql, params in HOT_QUERIES:
+        plan = explain(conn, sql, params)
+        results.append({
+            "name": name,
+            "caller": caller,
+            "plan": plan,
+            "full_scans": full_scans(plan, partial),
+            "temp_sort": any("TEMP B-TREE" in step for step in plan),
+        })
+    return results
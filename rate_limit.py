@@ -0,0 +1,174 @@
+"""
+按域名的令牌桶限速调度
+
+所有外部抓取（RSS / Google News / GDELT / 日期校正 / 正文抓取）在发请求前
+调用 acquire(url)，拿到令牌后再发出，请求结束后用 feedback() 回报状态码：
+  - 429 / Retry-After → 该域名降速，并在 Retry-After 内不再放行
+  - 连续成功 → 逐步提速，直到配置的 max_rate
+不同域名各自独立计数，因此指向不同域名的请求可以重叠执行。
+
+令牌采用"预约"方式扣减：令牌不足时记为欠账，调用方只需睡眠一次即可，
+多个线程同时排队时会自动按速率错开。
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from config import HOST_RATE_LIMITS, DEFAULT_HOST_RATE_LIMIT
+
+logger = logging.getLogger(__name__)
+
+# 连续成功多少次后提速一档；每档提速幅度（相对初始速率）
+_SPEEDUP_AFTER = 10
+_SPEEDUP_STEP = 0.25
+# 429 时的降速系数
+_SLOWDOWN_FACTOR = 0.5
+
+
+def host_of(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+class _HostBucket:
+    """单个域名的令牌桶状态（由 HostRateLimiter 的锁保护）。"""
+
+    def __init__(self, rate: float, burst: int, max_rate: float, min_rate: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_rate = max(rate, max_rate)
+        self.min_rate = min(rate, min_rate)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.streak = 0
+        # 统计
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class HostRateLimiter:
+    """线程安全的按域名令牌桶调度器。"""
+
+    def __init__(self, limits: Optional[Dict[str, dict]] = None,
+                 default: Optional[dict] = None):
+        self._limits = HOST_RATE_LIMITS if limits is None else limits
+        self._default = DEFAULT_HOST_RATE_LIMIT if default is None else default
+        self._buckets: Dict[str, _HostBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str) -> _HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            cfg = self._limits.get(host)
+            if cfg is None:
+                # 子域名回退到已配置的父域名（如 www.ftc.gov → ftc.gov）
+                cfg = next(
+                    (v for k, v in self._limits.items() if host.endswith("." + k)),
+                    self._default,
+                )
+            bucket = _HostBucket(
+                cfg.get("rate", 1.0), cfg.get("burst", 1),
+                cfg.get("max_rate", cfg.get("rate", 1.0)),
+                cfg.get("min_rate", cfg.get("rate", 1.0)),
+            )
+            self._buckets[host] = bucket
+        return bucket
+
+    def acquire(self, url: str, stop: Optional[threading.Event] = None) -> float:
+        """
+        为 url 所在域名预约一个令牌，必要时阻塞等待。返回需等待的秒数。
+        传入 stop 时改为 stop.wait()，stop 被置位即提前返回（调用方自行检查 stop）。
+        """
+        host = host_of(url)
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.refill(time.monotonic())
+            bucket.tokens -= 1
+            bucket.requests += 1
+            wait = -bucket.tokens / bucket.rate if bucket.tokens < 0 else 0.0
+            bucket.waited += wait
+        if wait > 0:
+            if stop is not None:
+                stop.wait(wait)
+            else:
+                time.sleep(wait)
+        return wait
+
+    def feedback(self, url: str, status_code: int, retry_after: Optional[str] = None) -> None:
+        """请求完成后回报状态码：429/503 降速，成功累计后提速。"""
+        host = host_of(url)
+        if status_code in (429, 503):
+            self.penalize(url, parse_retry_after(retry_after))
+            return
+        if status_code >= 400:
+            return
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.streak += 1
+            if bucket.streak >= _SPEEDUP_AFTER and bucket.rate < bucket.max_rate:
+                bucket.streak = 0
+                old = bucket.rate
+                bucket.rate = min(bucket.max_rate, bucket.rate + bucket.base_rate * _SPEEDUP_STEP)
+                logger.debug(f"[限速] {host} 提速 {old:.3g} → {bucket.rate:.3g} req/s")
+
+    def penalize(self, url: str, retry_after: Optional[float] = None) -> None:
+        """限速：降低速率；有 Retry-After 时在该时长内不再放行该域名。"""
+        host = host_of(url)
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.refill(time.monotonic())
+            bucket.streak = 0
+            bucket.throttled += 1
+            old = bucket.rate
+            bucket.rate = max(bucket.min_rate, bucket.rate * _SLOWDOWN_FACTOR)
+            pause = retry_after if retry_after is not None else 1.0 / bucket.rate
+            # 以欠账表示暂停期：下一次 acquire 需等待 pause 秒，后续请求按新速率错开
+            bucket.tokens = min(bucket.tokens, 0.0) + 1.0 - pause * bucket.rate
+        logger.warning(
+            f"[限速] {host} 触发限速，速率 {old:.3g} → {bucket.rate:.3g} req/s，暂停 {pause:g}s"
+        )
+
+    def stats(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                host: {
+                    "requests": b.requests,
+                    "throttled": b.throttled,
+                    "waited": round(b.waited, 1),
+                    "rate": round(b.rate, 3),
+                }
+                for host, b in self._buckets.items()
+            }
+
+    def log_summary(self) -> None:
+        for host, s in sorted(self.stats().items(), key=lambda kv: -kv[1]["requests"]):
+            logger.info(
+                f"[限速统计] {host}: 请求={s['requests']} 429={s['throttled']} "
+                f"排队={s['waited']:.1f}s 当前速率={s['rate']:g} req/s"
+            )
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """解析 Retry-After 秒数；HTTP-date 等无法解析的格式返回 None。"""
+    if value is None or value == "":
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+_limiter = HostRateLimiter()
+
+
+def get_limiter() -> HostRateLimiter:
+    """进程内共享的限速器。"""
+    return _limiter
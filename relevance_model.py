@@ -0,0 +1,400 @@
+"""
+本地相关性预筛模型（可选依赖 NumPy）
+
+通过 is_legislation_relevant 的条目全部送 LLM，其中相当一部分返回 is_relevant=false /
+value_score=0 仅入池。本模块用 monitor.db 里已有的判定结果训练一个 CPU 上即可运行的
+逻辑回归：
+  - 特征：原文标题+摘要的哈希 n-gram（拉丁文字取词与相邻词对，中日韩泰取字符 bigram），
+    外加信源与语言标记；2^18 维二值特征，按条 L2 归一化
+  - 标签：decision_source 为 llm / rule 的历史条目，push 或 value_score ≥ 1 为正样本，
+    其余为负样本；Bitable 人工初筛结果（可选）覆盖同 URL 的标签。fallback / model 来源的
+    条目不参与训练，模型不会学习自己的输出
+  - 召回护栏：按时间顺序切成训练 60% / 校准 20% / 测试 20%。在校准集上选取使正样本
+    保留比例 ≥ RELEVANCE_MIN_RECALL 的最大跳过阈值，再在未参与训练与选阈值的测试集上
+    报告召回；校准集或测试集正样本过少时拒绝训练。运行时 official / legal 信源的条目
+    永不跳过
+
+运行时 RelevancePrefilter 的三种模式：off / shadow（只打分，LLM 返回后统计"本会跳过但
+LLM 判定有价值"的条目数）/ active（低于阈值的条目不调用 LLM，直接入池，
+decision_source="model"）。未安装 NumPy 或模型文件不存在时预筛不生效，流程与原来一致。
+模型文件只在本地训练与使用（data/relevance_model.npz 不提交、CI 也不缓存），shadow
+统计只来自本地运行；NumPy 不在 requirements.txt 中，需要时单独安装。
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import zlib
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    np = None
+    _HAS_NUMPY = False
+
+from config import (
+    RELEVANCE_MODEL_PATH, RELEVANCE_PREFILTER_MODE, RELEVANCE_MIN_RECALL,
+    RELEVANCE_MIN_TRAIN_SAMPLES,
+)
+
+logger = logging.getLogger(__name__)
+
+_HASH_BITS = 18
+_DIM = 1 << _HASH_BITS
+_CALIBRATION = 0.2              # 按时间切出的校准集（选阈值）比例
+_TEST = 0.2                     # 最近的测试集（报告召回）比例
+_MIN_HELDOUT_POSITIVES = 20     # 校准集 / 测试集正样本少于该数时无法可靠估计召回
+_EPOCHS = 150
+_LEARNING_RATE = 0.5
+_L2 = 1e-4
+_NEVER_SKIP_TIERS = {"official", "legal"}
+_PREFILTER_MODES = {"off", "shadow", "active"}
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+_DENSE_SCRIPT = re.compile(r"[\u0e00-\u0e7f\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af]")
+
+
+# ── 特征 ──────────────────────────────────────────────────────────────
+
+def feature_terms(item: dict) -> List[str]:
+    """条目的 n-gram 特征名（未哈希），只使用抓取阶段即可得到的原文字段。"""
+    text = f"{item.get('title') or ''} {item.get('summary') or ''}".lower()
+    terms = []
+    previous = None
+    for token in _TOKEN.findall(text):
+        if _DENSE_SCRIPT.search(token):
+            terms.extend(f"c:{token[i:i + 2]}" for i in range(max(1, len(token) - 1)))
+            previous = None
+            continue
+        if token.isdigit():
+            previous = None
+            continue
+        terms.append(f"w:{token}")
+        if previous:
+            terms.append(f"b:{previous} {token}")
+        previous = token
+    terms.append(f"src:{(item.get('source_name') or '').strip().lower()}")
+    terms.append(f"lang:{(item.get('lang') or '').strip().lower()}")
+    return terms
+
+
+def _hash(term: str) -> int:
+    # 不用内置 hash()：其随进程随机加盐，训练与推理会映射到不同的维度
+    return zlib.crc32(term.encode("utf-8")) & (_DIM - 1)
+
+
+def _matrix(items: List[dict]):
+    """稀疏矩阵（CSR 三元组）：每行去重后的特征下标与 1/sqrt(n) 权重。"""
+    rows = [np.unique(np.fromiter((_hash(t) for t in feature_terms(d)), dtype=np.int64))
+            for d in items]
+    lengths = np.array([len(r) for r in rows], dtype=np.int64)
+    indices = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+    data = np.repeat(1.0 / np.sqrt(np.maximum(lengths, 1)), lengths)
+    indptr = np.concatenate(([0], np.cumsum(lengths)))
+    return indices, data, indptr
+
+
+def _margins(weights, bias: float, matrix) -> "np.ndarray":
+    indices, data, indptr = matrix
+    cumulative = np.concatenate(([0.0], np.cumsum(weights[indices] * data)))
+    return cumulative[indptr[1:]] - cumulative[indptr[:-1]] + bias
+
+
+def _sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-np.clip(x, -30, 30)))
+
+
+# ── 标签 ──────────────────────────────────────────────────────────────
+
+def label_for(row: dict) -> Optional[int]:
+    """历史条目的训练标签：1 = 值得送 LLM，0 = 无价值；无可靠判定时返回 None。"""
+    if row.get("decision_source") not in ("llm", "rule"):
+        return None
+    if row.get("push_decision") == "push" or int(row.get("value_score") or 0) >= 1:
+        return 1
+    return 0
+
+
+def load_examples(conn, human_labels: Optional[Dict[str, int]] = None) -> Tuple[List[dict], List[int]]:
+    """
+    从 legislation 表读取有标签的条目，按日期升序返回 (条目, 标签)。
+    human_labels（source_url → 标签）来自 Bitable 人工初筛，优先于库内判定。
+    """
+    human_labels = human_labels or {}
+    rows = conn.execute("""
+        SELECT title, summary, source_name, source_url, lang, date,
+               push_decision, value_score, decision_source
+        FROM legislation
+        ORDER BY date, id
+    """).fetchall()
+    items, labels = [], []
+    for row in rows:
+        item = dict(row)
+        label = human_labels.get(item.get("source_url") or "")
+        if label is None:
+            label = label_for(item)
+        if label is None:
+            continue
+        items.append(item)
+        labels.append(int(label))
+    return items, labels
+
+
+# ── 模型 ──────────────────────────────────────────────────────────────
+
+class RelevanceModel:
+    """哈希 n-gram 逻辑回归：predict() 返回条目"值得送 LLM"的概率。"""
+
+    def __init__(self, weights, bias: float = 0.0, threshold: float = 0.0,
+                 meta: Optional[dict] = None):
+        self.weights = weights
+        self.bias = float(bias)
+        self.threshold = float(threshold)
+        self.meta = meta or {}
+
+    @classmethod
+    def fit(cls, items: List[dict], labels: List[int],
+            epochs: int = _EPOCHS, learning_rate: float = _LEARNING_RATE,
+            l2: float = _L2) -> "RelevanceModel":
+        """全量 AdaGrad 训练；正负样本按类别频率加权，避免多数类淹没少数类。"""
+        matrix = _matrix(items)
+        indices, data, indptr = matrix
+        y = np.asarray(labels, dtype=np.float64)
+        n = len(y)
+        n_pos = max(1.0, y.sum())
+        n_neg = max(1.0, n - y.sum())
+        sample_weight = np.where(y > 0, n / (2 * n_pos), n / (2 * n_neg))
+        lengths = np.diff(indptr)
+
+        weights = np.zeros(_DIM)
+        bias = 0.0
+        grad_sq = np.full(_DIM, 1e-8)
+        bias_sq = 1e-8
+        for _ in range(epochs):
+            error = (_sigmoid(_margins(weights, bias, matrix)) - y) * sample_weight
+            grad = np.bincount(indices, weights=data * np.repeat(error, lengths), minlength=_DIM) / n
+            grad += l2 * weights
+            grad_sq += grad ** 2
+            weights -= learning_rate * grad / np.sqrt(grad_sq)
+            bias_grad = error.mean()
+            bias_sq += bias_grad ** 2
+            bias -= learning_rate * bias_grad / np.sqrt(bias_sq)
+        return cls(weights, bias)
+
+    def predict(self, items: List[dict]) -> "np.ndarray":
+        if not items:
+            return np.zeros(0)
+        return _sigmoid(_margins(self.weights, self.bias, _matrix(items)))
+
+    def save(self, path: str = RELEVANCE_MODEL_PATH) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        nonzero = np.flatnonzero(self.weights)
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                indices=nonzero,
+                values=self.weights[nonzero],
+                bias=np.array(self.bias),
+                threshold=np.array(self.threshold),
+                meta=np.array(json.dumps(self.meta, ensure_ascii=False)),
+            )
+
+    @classmethod
+    def load(cls, path: str = RELEVANCE_MODEL_PATH) -> "RelevanceModel":
+        with np.load(path) as archive:
+            weights = np.zeros(_DIM)
+            weights[archive["indices"]] = archive["values"]
+            return cls(
+                weights,
+                bias=float(archive["bias"]),
+                threshold=float(archive["threshold"]),
+                meta=json.loads(str(archive["meta"])),
+            )
+
+
+def recall_threshold(positive_probs, min_recall: float) -> float:
+    """最大的跳过阈值 t（概率 < t 的条目跳过 LLM），使正样本被跳过的比例 ≤ 1 - min_recall。"""
+    probs = np.sort(np.asarray(positive_probs, dtype=np.float64))
+    allowed_misses = int(np.floor((1.0 - min_recall) * len(probs) + 1e-9))
+    return float(probs[allowed_misses]) if allowed_misses < len(probs) else 1.0
+
+
+def evaluate(model: RelevanceModel, items: List[dict], labels: List[int],
+             threshold: Optional[float] = None) -> dict:
+    """在给定样本上统计：跳过率、正样本召回、误跳过（有价值却被跳过）条数等。"""
+    threshold = model.threshold if threshold is None else threshold
+    y = np.asarray(labels, dtype=np.int64)
+    skipped = model.predict(items) < threshold
+    positives = int(y.sum())
+    missed = int((skipped & (y == 1)).sum())
+    negatives = len(y) - positives
+    caught = int((skipped & (y == 0)).sum())
+    return {
+        "samples": len(y),
+        "positives": positives,
+        "negatives": negatives,
+        "skipped": int(skipped.sum()),
+        "skip_rate": float(skipped.mean()) if len(y) else 0.0,
+        "missed_positives": missed,
+        "recall": (positives - missed) / positives if positives else 1.0,
+        "negatives_skipped": caught / negatives if negatives else 0.0,
+        "threshold": threshold,
+    }
+
+
+def train(items: List[dict], labels: List[int],
+          min_recall: float = RELEVANCE_MIN_RECALL,
+          min_samples: int = RELEVANCE_MIN_TRAIN_SAMPLES) -> Tuple[RelevanceModel, dict]:
+    """
+    按时间顺序切分训练/校准/测试集（items 需按日期升序）：训练集拟合，校准集按召回护栏
+    选阈值，测试集只用于报告。样本或校准/测试集正样本不足时抛 ValueError。
+    返回 (模型, 测试集评估结果)。
+    """
+    if not _HAS_NUMPY:
+        raise RuntimeError("本地预筛模型需要 NumPy：pip install numpy")
+    if len(items) < min_samples:
+        raise ValueError(f"有标签样本 {len(items)} 条，少于下限 {min_samples}")
+    cal_start = int(len(items) * (1 - _CALIBRATION - _TEST))
+    test_start = int(len(items) * (1 - _TEST))
+    train_items, train_labels = items[:cal_start], labels[:cal_start]
+    cal_items, cal_labels = items[cal_start:test_start], labels[cal_start:test_start]
+    test_items, test_labels = items[test_start:], labels[test_start:]
+    for name, part in (("校准集", cal_labels), ("测试集", test_labels)):
+        if sum(part) < _MIN_HELDOUT_POSITIVES:
+            raise ValueError(
+                f"{name}正样本仅 {sum(part)} 条（需 ≥ {_MIN_HELDOUT_POSITIVES}），无法校验召回护栏"
+            )
+    if not 0 < sum(train_labels) < len(train_labels):
+        raise ValueError("训练集只有单一类别")
+
+    model = RelevanceModel.fit(train_items, train_labels)
+    cal_probs = model.predict(cal_items)
+    y = np.asarray(cal_labels)
+    model.threshold = recall_threshold(cal_probs[y == 1], min_recall)
+    report = evaluate(model, test_items, test_labels)
+    model.meta = {
+        "trained_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "train_samples": len(train_items),
+        "train_positives": int(sum(train_labels)),
+        "min_recall": min_recall,
+        # 训练与选阈值用到的最新日期；evaluate-prefilter 只评估此后的样本
+        "calibrated_through": cal_items[-1].get("date") or "",
+        "calibration": evaluate(model, cal_items, cal_labels),
+        "test": report,
+    }
+    return model, report
+
+
+# ── 运行时预筛 ────────────────────────────────────────────────────────
+
+class RelevancePrefilter:
+    """
+    LLM 前的预筛。route() 返回每条是否"高置信无价值"；shadow 模式下调用方仍把全部
+    条目送 LLM，observe() 再按 LLM 结果统计预筛本会误跳过的条目。
+    """
+
+    def __init__(self, model: RelevanceModel, mode: str = "shadow"):
+        self.model = model
+        self.mode = mode
+        self._lock = threading.Lock()
+        self.stats = {"scored": 0, "flagged": 0, "skipped": 0,
+                      "exempt": 0, "shadow_checked": 0, "shadow_missed": 0}
+
+    @property
+    def active(self) -> bool:
+        return self.mode == "active"
+
+    def route(self, items_dicts: List[dict]) -> List[bool]:
+        from classifier import get_source_tier
+
+        probs = self.model.predict(items_dicts)
+        flagged = []
+        exempt = 0
+        for item, prob in zip(items_dicts, probs):
+            low = bool(prob < self.model.threshold)
+            if low and get_source_tier(item.get("source_name") or "") in _NEVER_SKIP_TIERS:
+                low = False
+                exempt += 1
+            flagged.append(low)
+        with self._lock:
+            self.stats["scored"] += len(items_dicts)
+            self.stats["flagged"] += sum(flagged)
+            self.stats["exempt"] += exempt
+            if self.active:
+                self.stats["skipped"] += sum(flagged)
+        return flagged
+
+    def observe(self, flagged: List[bool], results: List[dict]) -> None:
+        """shadow 模式：对照 LLM 结果，记录被标记为无价值但 LLM 给出价值分/推送的条目。"""
+        checked = missed = 0
+        for low, result in zip(flagged, results):
+            if not low or result.get("_llm_decision_source") != "llm":
+                continue
+            checked += 1
+            if result.get("_llm_push_decision") == "push" or int(result.get("_llm_value_score") or 0) >= 1:
+                missed += 1
+                logger.info(f"[相关性预筛·影子] 本会跳过但 LLM 判定有价值: {(result.get('title') or '')[:60]}")
+        with self._lock:
+            self.stats["shadow_checked"] += checked
+            self.stats["shadow_missed"] += missed
+
+    def log_summary(self) -> None:
+        s = self.stats
+        if not s["scored"]:
+            return
+        msg = (
+            f"[相关性预筛] 模式={self.mode} 打分={s['scored']} 判定无价值={s['flagged']} "
+            f"实际跳过 LLM={s['skipped']} 权威信源豁免={s['exempt']}"
+        )
+        if s["shadow_checked"]:
+            msg += f" 影子比对={s['shadow_checked']} 误判={s['shadow_missed']}"
+        logger.info(msg)
+
+
+_prefilter: Optional[RelevancePrefilter] = None
+_prefilter_loaded = False
+_prefilter_lock = threading.Lock()
+
+
+def prefilter_mode() -> str:
+    mode = (os.environ.get("RELEVANCE_PREFILTER_MODE") or RELEVANCE_PREFILTER_MODE).strip().lower()
+    return mode if mode in _PREFILTER_MODES else "off"
+
+
+def get_prefilter() -> Optional[RelevancePrefilter]:
+    """进程内共享的预筛；关闭、未安装 NumPy、模型文件不存在或损坏时返回 None。"""
+    global _prefilter, _prefilter_loaded
+    with _prefilter_lock:
+        if _prefilter_loaded:
+            return _prefilter
+        _prefilter_loaded = True
+        mode = prefilter_mode()
+        if mode == "off":
+            return None
+        if not _HAS_NUMPY:
+            logger.info("[相关性预筛] 未安装 NumPy，跳过本地预筛")
+            return None
+        if not os.path.exists(RELEVANCE_MODEL_PATH):
+            logger.info("[相关性预筛] 模型文件不存在（python monitor.py train-prefilter），跳过本地预筛")
+            return None
+        try:
+            model = RelevanceModel.load(RELEVANCE_MODEL_PATH)
+        except Exception as e:
+            logger.warning(f"[相关性预筛] 模型加载失败，跳过本地预筛: {e}")
+            return None
+        _prefilter = RelevancePrefilter(model, mode)
+        logger.info(
+            f"[相关性预筛] 已加载模型（{model.meta.get('trained_at', '?')} 训练，"
+            f"阈值 {model.threshold:.3f}），模式 {mode}"
+        )
+        return _prefilter
+
+
+def log_summary() -> None:
+    if _prefilter is not None:
+        _prefilter.log_summary()
@@ -27,9 +27,11 @@ def _load_template_file(name: str) -> str:
 
 from config import OUTPUT_DIR, REGION_DISPLAY_ORDER
 from classifier import get_source_tier
+from features import features_for, item_field
+from models import SNIPPET_OPEN, SNIPPET_CLOSE
 from utils import (
     _REGION_GROUP_MAP, _GROUP_ORDER, _GROUP_EMOJI, _get_region_group, normalize_status,
-    _bigram_sim, _TIER_SORT, MEDIA_SUFFIX_RE, geography_display,
+    _bigram_jaccard, _TIER_SORT, MEDIA_SUFFIX_RE, geography_display,
 )
 
 
@@ -117,22 +119,9 @@ _FP_TOPICS = [
 ]
 
 
-def _calculate_event_fingerprint(item: dict) -> frozenset:
-    """
-    计算事件指纹：{R:区域, E:实体, T:议题}
-    用于在 LLM 语义检查前识别"候选合并池"。
-    两条新闻共享同一实体 + 同一议题，视为同一事件候选对。
-    """
-    text = " ".join(filter(None, [
-        item.get("title", ""),
-        item.get("title_zh", ""),
-        item.get("summary", ""),
-        item.get("summary_zh", ""),
-    ]))
+def _fingerprint_terms(text: str) -> frozenset:
+    """事件指纹中与区域无关的部分：{E:实体, T:议题}。"""
     parts: set = set()
-    group = _get_region_group(item.get("region", "其他"))
-    if group != "其他":
-        parts.add(f"R:{group}")
     for m in _FP_ENTITIES.findall(text):
         parts.add(f"E:{m.lower()}")
     for pattern, topic in _FP_TOPICS:
@@ -141,6 +130,20 @@ def _calculate_event_fingerprint(item: dict) -> frozenset:
     return frozenset(parts)
 
 
+def _calculate_event_fingerprint(item) -> frozenset:
+    """
+    计算事件指纹：{R:区域, E:实体, T:议题}
+    用于在 LLM 语义检查前识别"候选合并池"。
+    两条新闻共享同一实体 + 同一议题，视为同一事件候选对。
+    实体/议题取自条目的 ArticleFeatures（入库时已持久化），区域按当前 region 计算。
+    """
+    terms = features_for(item).fingerprint_terms
+    group = _get_region_group(item_field(item, "region", "其他"))
+    if group != "其他":
+        return terms | {f"R:{group}"}
+    return terms
+
+
 def _fp_same_event(fp_a: frozenset, fp_b: frozenset) -> bool:
     """指纹重叠：共享至少 1 个实体 AND 至少 1 个议题 → 视为同一事件候选。"""
     shared = fp_a & fp_b
@@ -277,11 +280,11 @@ def _dedup_for_display(items: List[dict]) -> List[dict]:
 
     # 预计算事件指纹（用于跨区域/跨来源候选匹配）
     fps: dict = {i: _calculate_event_fingerprint(items[i]) for i in range(len(items))}
+    bigrams: dict = {i: features_for(items[i]).title_bigrams for i in range(len(items))}
 
     for idx in sorted_idx:
         item    = items[idx]
         group   = _resolve_group(item)
-        t_item  = (item.get("title_zh") or item.get("title") or "")
         url_item = (item.get("source_url") or "").strip()
         is_dup  = False
 
@@ -300,8 +303,7 @@ def _dedup_for_display(items: List[dict]) -> List[dict]:
                 # 跨区域：只在指纹重叠时才进一步比较，避免误合并
                 if not _fp_same_event(fps[idx], fps[kidx]):
                     continue
-                t_kept = (kitem.get("title_zh") or kitem.get("title") or "")
-                sim = _bigram_sim(t_item, t_kept)
+                sim = _bigram_jaccard(bigrams[idx], bigrams[kidx])
                 tier_kept = TIER_PRIORITY.get(get_source_tier(kitem.get("source_name", "")), 1)
                 tier_curr = TIER_PRIORITY.get(get_source_tier(item.get("source_name", "")), 1)
                 # ② 权威源覆盖：任一方为 official（tier=4）时，bigram > 0.20 即合并
@@ -319,8 +321,7 @@ def _dedup_for_display(items: List[dict]) -> List[dict]:
                 continue  # 指纹匹配但 bigram 不足，不合并
 
             # ④ 同区域 Bigram 相似度（原有逻辑）
-            t_kept = (kitem.get("title_zh") or kitem.get("title") or "")
-            sim = _bigram_sim(t_item, t_kept)
+            sim = _bigram_jaccard(bigrams[idx], bigrams[kidx])
             if sim > 0.45:          # 确定重复
                 extra_items.setdefault(kidx, []).append(dict(items[idx]))
                 is_dup = True
@@ -513,6 +514,11 @@ def print_table(items: List[dict], max_summary_len: int = 50):
             f"{_truncate(summary_zh, max_summary_len)}"
         )
         print(row)
+        snippet = " ".join((item.get("_snippet") or "").split())
+        if snippet:
+            # 关键词检索命中片段（FTS5 snippet），命中词高亮
+            snippet = snippet.replace(SNIPPET_OPEN, C.YELLOW + C.BOLD).replace(SNIPPET_CLOSE, C.RESET)
+            print(f"{C.DIM}{'':<16} ↳{C.RESET} {snippet}")
 
     print(f"{'-'*140}")
     print(f"{C.DIM}共 {len(items)} 条记录{C.RESET}\n")
@@ -0,0 +1,46 @@
+"""
+SQLite 连接工厂
+
+monitor.db 与各缓存库（http_cache / llm_cache / llm_telemetry / translation_cache）
+统一经 connect() 打开并应用 config 中的 PRAGMA：
+  - journal_mode=WAL：读者不阻塞写者，daily_check 读库时 monitor.py run 可照常写入
+  - synchronous=NORMAL：WAL 下每次提交不再 fsync，只在检查点时落盘
+  - mmap_size / cache_size / temp_store=MEMORY：报表与去重的大范围读取少走系统调用
+  - busy_timeout：遇到写锁时等待而不是立即抛出 database is locked
+
+readonly=True 以 URI mode=ro 打开并设置 query_only，供日报、测试入口等只读路径使用；
+只读连接不改 journal_mode（需要写权限）。
+"""
+
+import os
+import sqlite3
+from urllib.parse import quote
+
+from config import (
+    SQLITE_JOURNAL_MODE, SQLITE_SYNCHRONOUS, SQLITE_MMAP_SIZE,
+    SQLITE_CACHE_SIZE_KB, SQLITE_BUSY_TIMEOUT_MS,
+)
+
+
+def connect(db_path, *, readonly: bool = False,
+            check_same_thread: bool = True) -> sqlite3.Connection:
+    """打开 db_path 并应用统一 PRAGMA（row_factory 由调用方自行设置）。"""
+    db_path = str(db_path)
+    timeout = SQLITE_BUSY_TIMEOUT_MS / 1000
+    if readonly:
+        conn = sqlite3.connect(
+            f"file:{quote(os.path.abspath(db_path))}?mode=ro", uri=True,
+            timeout=timeout, check_same_thread=check_same_thread,
+        )
+    else:
+        conn = sqlite3.connect(db_path, timeout=timeout, check_same_thread=check_same_thread)
+    conn.execute(f"PRAGMA busy_timeout = {int(SQLITE_BUSY_TIMEOUT_MS)}")
+    if readonly:
+        conn.execute("PRAGMA query_only = ON")
+    else:
+        conn.execute(f"PRAGMA journal_mode = {SQLITE_JOURNAL_MODE}")
+        conn.execute(f"PRAGMA synchronous = {SQLITE_SYNCHRONOUS}")
+    conn.execute(f"PRAGMA mmap_size = {int(SQLITE_MMAP_SIZE)}")
+    conn.execute(f"PRAGMA cache_size = -{int(SQLITE_CACHE_SIZE_KB)}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
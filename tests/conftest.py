@@ -8,3 +8,95 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_http_cache(tmp_path, monkeypatch):
+    """每个用例使用独立的 HTTP 条件请求缓存，避免读写 data/http_cache.db。"""
+    import http_cache
+    monkeypatch.setattr(http_cache, "HTTP_CACHE_PATH", str(tmp_path / "http_cache.db"))
+    monkeypatch.setattr(http_cache, "_feed_cache", None)
+    yield
+    if http_cache._feed_cache is not None:
+        http_cache._feed_cache.close()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_rate_limiter(monkeypatch):
+    """每个用例使用全新的按域名限速器，避免上一个用例的 429 欠账拖慢后续用例。"""
+    import rate_limit
+    limiter = rate_limit.HostRateLimiter()
+    monkeypatch.setattr(rate_limit, "_limiter", limiter)
+    return limiter
+
+
+@pytest.fixture(autouse=True)
+def _isolated_page_cache(tmp_path, monkeypatch):
+    """文章页面缓存指向临时目录，避免读写 data/page_cache/。"""
+    import article_page
+    monkeypatch.setattr(article_page, "_page_cache", article_page.PageCache(str(tmp_path / "page_cache")))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_llm_cache(tmp_path, monkeypatch):
+    """LLM 响应缓存指向临时库，避免用例之间（及与 data/llm_cache.db）共享返回。"""
+    import llm_cache
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_PATH", str(tmp_path / "llm_cache.db"))
+    monkeypatch.setattr(llm_cache, "_llm_cache", None)
+    monkeypatch.setattr(llm_cache, "_bypass_requested", False)
+    monkeypatch.delenv("LLM_CACHE_BYPASS", raising=False)
+    yield
+    if llm_cache._llm_cache is not None:
+        llm_cache._llm_cache.close()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_translation_cache(tmp_path, monkeypatch):
+    """Google 翻译缓存指向临时库，避免用例读到 data/translation_cache.db 里的译文。"""
+    import translation_cache
+    monkeypatch.setattr(translation_cache, "TRANSLATION_CACHE_PATH", str(tmp_path / "translation_cache.db"))
+    monkeypatch.setattr(translation_cache, "_translation_cache", None)
+    monkeypatch.setattr(translation_cache, "_translation_cache_failed", False)
+    yield
+    if translation_cache._translation_cache is not None:
+        translation_cache._translation_cache.close()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_llm_telemetry(tmp_path, monkeypatch):
+    """LLM 遥测写入临时库，避免用例产生的调用记录进入 data/llm_telemetry.db。"""
+    import llm_telemetry
+    monkeypatch.setattr(llm_telemetry, "LLM_TELEMETRY_PATH", str(tmp_path / "llm_telemetry.db"))
+    monkeypatch.setattr(llm_telemetry, "_telemetry", None)
+    monkeypatch.setattr(llm_telemetry, "_telemetry_failed", False)
+    yield
+    if llm_telemetry._telemetry is not None:
+        llm_telemetry._telemetry.close()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_relevance_prefilter(tmp_path, monkeypatch):
+    """预筛模型指向临时路径（默认不存在 → 不生效），避免读到 data/relevance_model.npz。"""
+    import relevance_model
+    monkeypatch.setattr(relevance_model, "RELEVANCE_MODEL_PATH", str(tmp_path / "relevance_model.npz"))
+    monkeypatch.setattr(relevance_model, "_prefilter", None)
+    monkeypatch.setattr(relevance_model, "_prefilter_loaded", False)
+    monkeypatch.delenv("RELEVANCE_PREFILTER_MODE", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_llm_dispatcher(monkeypatch):
+    """每个用例使用全新的 LLM 调度器，避免上一个用例的退避暂停或预算欠账拖慢后续用例。"""
+    import llm_dispatch
+    dispatcher = llm_dispatch.LLMDispatcher()
+    monkeypatch.setattr(llm_dispatch, "_dispatcher", dispatcher)
+    return dispatcher
+
+
+@pytest.fixture(autouse=True)
+def _isolated_batch_sizer(monkeypatch):
+    """每个用例从初始批大小开始，避免上一个用例的解析结果改变批次划分。"""
+    import translator
+    monkeypatch.setattr(translator, "_batch_sizer", translator._BatchSizer())
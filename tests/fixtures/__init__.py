@@ -0,0 +1,3 @@
+"""
+测试夹具：冻结的语料快照与各项优化上线前的参考实现（一致性测试与 benchmarks/ 共用）。
+"""
@@ -0,0 +1,129 @@
+"""
+冻结的语料快照与合成条目
+
+corpus_2026_10_17.json 是 2026-10-17 时 data/monitor.db 中 legislation 与
+legislation_archive 的原文/译文标题、摘要、信源与区域。一致性测试只读这份快照，
+不依赖每日任务改写并提交的线上库；benchmarks/ 可用 load_rows(db_path) 改读任意库。
+"""
+
+import json
+import random
+import re
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+import sqlite_conn
+
+FROZEN_CORPUS = Path(__file__).resolve().parent / "corpus_2026_10_17.json"
+_FIELDS = ("title", "summary", "title_zh", "summary_zh", "source_name", "region")
+
+_REGIONS = ["北美", "欧洲", "日韩", "港澳台", "东南亚", "中东", "南美", "大洋洲", "其他"]
+_CATEGORIES = ["数据隐私", "玩法合规", "未成年人保护", "内容监管", "消费者保护", "经营合规"]
+_STATUSES = ["已生效", "即将生效", "执法动态", "修订变更", "草案/征求意见", "立法进行中", "已提案", "立法动态"]
+_JURISDICTIONS = {
+    "北美": ["美国", "加拿大"], "欧洲": ["英国", "法国", "德国", "欧盟"],
+    "日韩": ["日本", "韩国"], "港澳台": ["台湾地区"], "东南亚": ["越南", "印度尼西亚"],
+    "中东": ["土耳其"], "南美": ["巴西"], "大洋洲": ["澳大利亚"], "其他": [""],
+}
+
+
+def load_rows(db_path: Optional[str] = None) -> List[dict]:
+    """语料行（_FIELDS 各字段，空值为空串）：默认读冻结快照，传入 db_path 时只读打开该库。"""
+    if db_path is None:
+        return json.loads(FROZEN_CORPUS.read_text(encoding="utf-8"))
+    conn = sqlite_conn.connect(db_path, readonly=True)
+    try:
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        rows = []
+        for table in ("legislation", "legislation_archive"):
+            if table in tables:
+                rows += conn.execute(f"SELECT {', '.join(_FIELDS)} FROM {table}").fetchall()
+    finally:
+        conn.close()
+    return [{field: value or "" for field, value in zip(_FIELDS, row)} for row in rows]
+
+
+def relevance_articles(rows: List[dict]) -> List[dict]:
+    """每条原文分别以普通信源（tier=""）和官方信源（tier="official"）各判定一次。"""
+    return [
+        {"title": row["title"], "summary": row["summary"], "tier": tier}
+        for row in rows
+        for tier in ("", "official")
+    ]
+
+
+def classifier_articles(rows: List[dict]) -> List[dict]:
+    """原文与中文译文（有译文时）各一篇，信源名与区域按库内记录传入。"""
+    corpus = []
+    for row in rows:
+        corpus.append({"title": row["title"], "summary": row["summary"],
+                       "source": row["source_name"], "region": row["region"]})
+        if row["title_zh"] or row["summary_zh"]:
+            corpus.append({"title": row["title_zh"], "summary": row["summary_zh"],
+                           "source": row["source_name"], "region": row["region"]})
+    return corpus
+
+
+def seed_titles(rows: List[dict]) -> List[str]:
+    """全部非空标题（原文与中文译文），作为合成条目的种子词表。"""
+    return [t for row in rows for t in (row["title"], row["title_zh"]) if t]
+
+
+def _mutate(title: str, rng: random.Random) -> str:
+    """轻微改写：删去/替换少量字符，或追加来源后缀。"""
+    chars = list(title)
+    for _ in range(rng.randint(0, max(1, len(chars) // 15))):
+        if len(chars) > 4:
+            pos = rng.randrange(len(chars))
+            if rng.random() < 0.5:
+                del chars[pos]
+            else:
+                chars[pos] = rng.choice("aeiou的了和")
+    if rng.random() < 0.3:
+        chars += list(rng.choice([" - Reuters", " | GamesIndustry.biz", "（更新）"]))
+    return "".join(chars)
+
+
+def make_items(titles: list, n: int, seed: int = 7) -> list:
+    """合成 n 条条目的字段 dict（每次计时前据此新建 LegislationItem）。"""
+    rng = random.Random(seed)
+    vocabulary = [word for title in titles for word in re.findall(r"\w+", title)]
+    start = date(2026, 9, 1)
+    rows, days = [], []
+    for k in range(n):
+        if rows and rng.random() < 0.4:
+            b = rng.randrange(len(rows))
+            base = rows[b]
+            title = _mutate(base["title"], rng)
+            region = base["region"] if rng.random() < 0.8 else rng.choice(_REGIONS)
+            category = base["category_l1"] if rng.random() < 0.7 else rng.choice(_CATEGORIES)
+            day = days[b] + timedelta(days=rng.randint(-5, 20))
+        else:
+            # 从种子词表随机组句：大规模语料里若直接复用种子标题，会人为制造大量重复
+            title = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(5, 12)))
+            region, category = rng.choice(_REGIONS), rng.choice(_CATEGORIES)
+            day = start + timedelta(days=rng.randrange(30))
+        url = f"https://news{rng.randrange(n // 3 + 1)}.example/{k}"
+        if rng.random() < 0.05:
+            url = f"https://shared.example/{rng.randrange(50)}?utm=x"
+        days.append(day)
+        rows.append({
+            "region": region, "category_l1": category, "category_l2": "",
+            "title": title, "title_zh": title if rng.random() < 0.5 else "",
+            "date": day.isoformat() if rng.random() < 0.99 else "unknown",
+            "status": rng.choice(_STATUSES), "summary": "",
+            "source_name": f"Source {rng.randrange(max(1, n // 5))}", "source_url": url,
+            "impact_score": round(rng.uniform(1, 10), 1),
+        })
+    return rows
+
+
+def make_event_rows(titles: list, n: int, seed: int = 7) -> list:
+    """make_items 之上补与区域对应的管辖区与 value_score（跨日事件去重用）。"""
+    rng = random.Random(seed)
+    rows = make_items(titles, n, seed)
+    for row in rows:
+        row["jurisdiction"] = rng.choice(_JURISDICTIONS[row["region"]])
+        row["value_score"] = rng.randint(0, 3)
+    return rows
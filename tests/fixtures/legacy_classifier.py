@@ -0,0 +1,184 @@
+"""
+classify_article 的参考实现：预编译规则扫描引擎上线前的逐条 re.findall
+"""
+
+import re
+
+import classifier
+from utils import (
+    _get_region_group, normalize_applicability_scope, normalize_jurisdiction,
+    region_for_jurisdiction,
+)
+
+
+def legacy_is_hardware_noise(text: str) -> bool:
+    for p in classifier._HARDWARE_NOISE_PATTERNS:
+        if re.search(p, text, re.IGNORECASE):
+            return True
+    return False
+
+
+def legacy_high_risk_bonus(text: str) -> float:
+    text_lower = text.lower()
+    bonus = 0.0
+    for add, patterns in classifier._HIGH_RISK_PATTERNS:
+        for p in patterns:
+            if re.search(p, text_lower, re.IGNORECASE):
+                bonus += add
+                break
+    return bonus
+
+
+def legacy_score_impact(status: str, source_name: str, region: str = "", text: str = "") -> float:
+    if text and (legacy_is_hardware_noise(text) or classifier._is_google_apple_non_core(text)):
+        return 0.0
+    base = classifier._IMPACT_STATUS_BASE.get(status, 2.0)
+    tier = classifier.get_source_tier(source_name)
+    tier_bonus = {"official": 2.0, "legal": 1.0, "industry": 0.5}.get(tier, 0.0)
+    market_bonus = 2.0 if region in classifier._CORE_MARKETS else 0.0
+    risk_bonus = legacy_high_risk_bonus(text) if text else 0.0
+    total = base + tier_bonus + market_bonus + risk_bonus
+    if source_name and source_name in classifier._HIGH_NOISE_SOURCES:
+        total = max(1.0, total * 0.5)
+    return round(min(10.0, max(1.0, total)), 1)
+
+
+def legacy_detect_geography(text: str, fallback: str = "", source_name: str = "",
+                            allow_locale_fallback: bool = True) -> tuple:
+    text_combined = text.lower()
+    country_scores = {}
+    authority_countries = set()
+    for country, patterns in classifier.COUNTRY_PATTERNS.items():
+        score = 0
+        for p in patterns:
+            score += len(re.findall(p, text_combined, re.IGNORECASE))
+        if score > 0:
+            normalized_country = normalize_jurisdiction(country)
+            authority_pattern = classifier._JURISDICTION_AUTHORITY_PATTERNS.get(normalized_country)
+            if authority_pattern and re.search(authority_pattern, text, re.IGNORECASE):
+                score += 5
+                authority_countries.add(normalized_country)
+            country_scores[normalized_country] = (
+                country_scores.get(normalized_country, 0) + score
+            )
+
+    if country_scores:
+        best_country = max(country_scores, key=country_scores.get)
+        jurisdiction = best_country
+        material_countries = set(country_scores)
+        if best_country != "欧盟" and best_country in authority_countries:
+            material_countries.discard("欧盟")
+        is_multi = len(material_countries) > 1 or bool(classifier._MULTI_SCOPE_PATTERN.search(text))
+        if len(material_countries) > 1 and best_country not in authority_countries:
+            ranked = sorted(
+                (country_scores[country] for country in material_countries),
+                reverse=True,
+            )
+            if len(ranked) > 1 and ranked[0] == ranked[1]:
+                return "", "multi", "rule"
+        scope = "multi" if is_multi else "single"
+        if jurisdiction == "欧盟" and scope == "single":
+            scope = "supranational"
+        return jurisdiction, scope, "rule"
+
+    if source_name:
+        for country, patterns in classifier.COUNTRY_PATTERNS.items():
+            if any(re.search(p, source_name, re.IGNORECASE) for p in patterns):
+                jurisdiction = normalize_jurisdiction(country)
+                scope = "supranational" if jurisdiction == "欧盟" else "single"
+                return jurisdiction, scope, "official_source"
+
+    if classifier._GLOBAL_SCOPE_PATTERN.search(text):
+        return "", "global", "rule"
+    if classifier._MULTI_SCOPE_PATTERN.search(text):
+        return "", "multi", "rule"
+
+    if allow_locale_fallback:
+        jurisdiction = normalize_jurisdiction(fallback)
+        if jurisdiction:
+            return (
+                jurisdiction,
+                normalize_applicability_scope("", jurisdiction),
+                "locale",
+            )
+    return "", "unknown", "unknown"
+
+
+def legacy_detect_category(text: str) -> tuple:
+    text_lower = text.lower()
+    best_l1 = "经营合规"
+    best_l1_score = 0
+    best_l2 = ""
+    for l1, sub_patterns in classifier.CATEGORY_PATTERNS.items():
+        l1_score = 0
+        for p in sub_patterns.get("_l1", []):
+            l1_score += len(re.findall(p, text_lower, re.IGNORECASE))
+        if l1_score > best_l1_score:
+            best_l1_score = l1_score
+            best_l1 = l1
+            best_l2_score = 0
+            best_l2 = ""
+            for l2_name, l2_patterns in sub_patterns.items():
+                if l2_name == "_l1":
+                    continue
+                l2_score = 0
+                for p in l2_patterns:
+                    l2_score += len(re.findall(p, text_lower, re.IGNORECASE))
+                if l2_score > best_l2_score:
+                    best_l2_score = l2_score
+                    best_l2 = l2_name
+    return best_l1, best_l2
+
+
+def legacy_detect_status(text: str) -> str:
+    text_lower = text.lower()
+    best_status = "立法动态"
+    best_score = 0
+    for status, patterns in classifier.STATUS_PATTERNS.items():
+        score = 0
+        for p in patterns:
+            score += len(re.findall(p, text_lower, re.IGNORECASE))
+        if score > best_score:
+            best_score = score
+            best_status = status
+    return best_status
+
+
+def legacy_is_china_mainland(text: str) -> bool:
+    has_overseas_context = any(
+        re.search(p, text, re.IGNORECASE) for p in classifier.OVERSEAS_REGULATORY_CONTEXT
+    )
+    has_overseas_action = any(
+        re.search(p, text, re.IGNORECASE) for p in classifier.OVERSEAS_ENFORCEMENT_ACTIONS
+    )
+    if has_overseas_context and has_overseas_action:
+        return False
+    return any(re.search(p, text, re.IGNORECASE) for p in classifier.CHINA_MAINLAND_PATTERNS)
+
+
+def legacy_classify(article: dict) -> tuple:
+    """返回与 classification_key() 同结构的元组。"""
+    text = f"{article.get('title', '')} {article.get('summary', '')}".strip()
+    jurisdiction, scope, source = legacy_detect_geography(
+        text, fallback=article.get("region", ""), source_name=article.get("source", ""),
+    )
+    region = (
+        region_for_jurisdiction(jurisdiction)
+        if jurisdiction
+        else _get_region_group(article.get("region", "其他"))
+    )
+    if scope in {"global", "multi", "unknown"} and not jurisdiction:
+        region = "其他"
+    l1, l2 = legacy_detect_category(text)
+    status = legacy_detect_status(text)
+    impact = legacy_score_impact(status, article.get("source", ""), region=region, text=text)
+    return (region, jurisdiction, scope, source, l1, l2, status, impact,
+            legacy_is_china_mainland(text))
+
+
+def classification_key(article: dict) -> tuple:
+    item = classifier.classify_article(article)
+    text = f"{article.get('title', '')} {article.get('summary', '')}".strip()
+    return (item.region, item.jurisdiction, item.applicability_scope, item.jurisdiction_source,
+            item.category_l1, item.category_l2, item.status, item.impact_score,
+            classifier.is_china_mainland(text))
@@ -0,0 +1,246 @@
+"""
+monitor._deduplicate_items 的参考实现（分桶候选索引上线前的两两比较）与对比用的运行器
+"""
+
+import time
+from unittest import mock
+
+from features import features_for
+from models import LegislationItem
+from monitor import (
+    _TIER_SORT, _bigram_jaccard, _calculate_event_fingerprint, _fp_same_event,
+    _make_timeline_note, logger,
+)
+
+
+def legacy_deduplicate_items(items, enable_fingerprint: bool = False):
+    """分桶索引上线前的两两比较实现（逐字保留），仅作为一致性与性能基线。"""
+    from datetime import date as _date
+    from collections import defaultdict
+    dropped: set[int] = set()
+    # 标题 bigram 集合与事件指纹取自条目的 ArticleFeatures，每条只计算一次
+    title_bigrams = [features_for(item).title_bigrams for item in items]
+    fingerprints = (
+        [_calculate_event_fingerprint(item) for item in items]
+        if enable_fingerprint else []
+    )
+
+    _SOURCE_CAP = 3  # 同源 + 同区域每日最多保留条数
+
+    # ── 阶段 0：同源限流 ─────────────────────────────────────────────────
+    # 按 (source_name, region) 分桶，桶内按 impact_score 降序，超过 cap 的丢弃
+    buckets: dict = defaultdict(list)
+    for i, item in enumerate(items):
+        key = (item.source_name or "", item.region or "")
+        buckets[key].append(i)
+
+    for key, indices in buckets.items():
+        if len(indices) <= _SOURCE_CAP:
+            continue
+        # 按 impact_score 降序排序，保留前 _SOURCE_CAP 条
+        indices.sort(key=lambda idx: -items[idx].impact_score)
+        for idx in indices[_SOURCE_CAP:]:
+            dropped.add(idx)
+        src, rgn = key
+        logger.info(
+            f"[同源限流] {src} × {rgn}：{len(indices)} 条 → 保留 {_SOURCE_CAP} 条"
+        )
+
+    # ── 阶段 1：2 天窗口，标题去重 ────────────────────────────────────
+    fingerprint_candidates = []
+    for i, item_i in enumerate(items):
+        if i in dropped:
+            continue
+        duplicates = []
+        for j, item_j in enumerate(items):
+            if j <= i or j in dropped:
+                continue
+            if item_i.region != item_j.region:
+                continue
+            try:
+                d_i = _date.fromisoformat(item_i.date)
+                d_j = _date.fromisoformat(item_j.date)
+                diff = abs((d_i - d_j).days)
+                if diff > 2:
+                    continue
+            except ValueError:
+                continue
+            same_url = bool(
+                item_i.source_url
+                and item_j.source_url
+                and item_i.source_url.split("?", 1)[0].rstrip("/")
+                == item_j.source_url.split("?", 1)[0].rstrip("/")
+            )
+            sim = _bigram_jaccard(title_bigrams[i], title_bigrams[j])
+            # 高相似标题直接合并（>0.8）；同分类则放宽到 0.55
+            if same_url or sim > 0.8:
+                duplicates.append((j, sim))
+            elif sim > 0.55 and item_i.category_l1 == item_j.category_l1:
+                duplicates.append((j, sim))
+            elif enable_fingerprint and _fp_same_event(fingerprints[i], fingerprints[j]):
+                fingerprint_candidates.append((i, j))
+        if duplicates:
+            group = [(i, 0.0)] + duplicates
+            group.sort(key=lambda x: (-items[x[0]].impact_score, x[0]))
+            winner_idx = group[0][0]
+            for idx, _ in group[1:]:
+                dropped.add(idx)
+
+    # 低标题相似度但事件指纹一致：只作为 LLM 候选，不直接自动合并。
+    if fingerprint_candidates:
+        from classifier import get_source_tier
+        from translator import verify_duplicate_pairs
+
+        valid_pairs = [
+            (i, j) for i, j in fingerprint_candidates
+            if i not in dropped and j not in dropped
+        ]
+        titles = [
+            (
+                items[i].title_zh or items[i].title,
+                items[j].title_zh or items[j].title,
+            )
+            for i, j in valid_pairs
+        ]
+        try:
+            verified = verify_duplicate_pairs(titles)
+        except Exception as exc:
+            logger.warning(f"[事件指纹] LLM 验证失败，保守保留: {exc}")
+            verified = [False] * len(valid_pairs)
+
+        for (i, j), is_same_event in zip(valid_pairs, verified):
+            if not is_same_event or i in dropped or j in dropped:
+                continue
+
+            def same_day_priority(index: int) -> tuple:
+                item = items[index]
+                tier = _TIER_SORT.get(get_source_tier(item.source_name), 1)
+                return (tier, item.impact_score, item.date)
+
+            winner, loser = (
+                (i, j) if same_day_priority(i) >= same_day_priority(j) else (j, i)
+            )
+            dropped.add(loser)
+            logger.info(
+                f"[事件指纹] LLM 确认跨语言重复，保留: "
+                f"{(items[winner].title_zh or items[winner].title)[:60]}"
+            )
+
+    # ── 阶段 2：30 天窗口，事件级聚类（硬性合并同一法案不同阶段）────────
+    # 同一法案在不同阶段（如印尼年龄禁令草案→已生效）严禁拆分展示，必须合并。
+    # 窗口扩展至 30 天；移除相似度上限（sim > 0.8 的高相似跨阶段对同样捕获）。
+    # 状态优先级（高 → 低）
+    _STATUS_RANK = {
+        "已生效": 9, "即将生效": 8, "执法动态": 7, "修订变更": 6,
+        "草案/征求意见": 5, "立法进行中": 4, "已提案": 3, "立法动态": 2, "已废止": 1,
+    }
+
+    # 收集候选跨阶段对：(i, j)
+    candidates = []
+    for i, item_i in enumerate(items):
+        if i in dropped:
+            continue
+        for j, item_j in enumerate(items):
+            if j <= i or j in dropped:
+                continue
+            # 同 region + 同大类
+            if item_i.region != item_j.region:
+                continue
+            if item_i.category_l1 != item_j.category_l1:
+                continue
+            try:
+                d_i = _date.fromisoformat(item_i.date)
+                d_j = _date.fromisoformat(item_j.date)
+                diff = abs((d_i - d_j).days)
+                if diff <= 2 or diff > 30:   # 2 天内已处理，>30 天不合并
+                    continue
+            except ValueError:
+                continue
+            sim = _bigram_jaccard(title_bigrams[i], title_bigrams[j])
+            # 移除上限：sim ≥ 0.5 均为候选（高相似跨阶段对在 LLM 验证后合并）
+            if sim >= 0.5 or (
+                enable_fingerprint
+                and _fp_same_event(fingerprints[i], fingerprints[j])
+            ):
+                candidates.append((i, j, sim))
+
+    if candidates:
+        # 尝试用 LLM 批量验证
+        pairs_to_verify = []
+        for i, j, _ in candidates:
+            t_i = (items[i].title_zh or items[i].title or "")
+            t_j = (items[j].title_zh or items[j].title or "")
+            pairs_to_verify.append((t_i, t_j))
+
+        llm_results = None
+        try:
+            from translator import verify_duplicate_pairs
+            import time as _time
+            _time.sleep(2)
+            llm_results = verify_duplicate_pairs(pairs_to_verify)
+        except Exception as e:
+            logger.warning(f"[事件聚类] LLM 验证失败，使用启发式判断: {e}")
+
+        for idx_pair, (i, j, sim) in enumerate(candidates):
+            if i in dropped or j in dropped:
+                continue
+            is_same_event = (
+                llm_results[idx_pair]
+                if llm_results and idx_pair < len(llm_results)
+                else sim >= 0.65  # 无 LLM 时：高相似度 + 同地区同类 → 视为同一事件
+            )
+            if not is_same_event:
+                continue
+
+            item_i, item_j = items[i], items[j]
+            # 保留状态优先级更高的项（草案→生效 保留"生效"条目）
+            rank_i = _STATUS_RANK.get(item_i.status, 0)
+            rank_j = _STATUS_RANK.get(item_j.status, 0)
+            if rank_i >= rank_j:
+                winner, loser_idx = i, j
+            else:
+                winner, loser_idx = j, i
+
+            dropped.add(loser_idx)
+            timeline = _make_timeline_note([item_i, item_j])
+            if timeline:
+                winner_item = items[winner]
+                if winner_item.summary_zh:
+                    winner_item.summary_zh = winner_item.summary_zh.rstrip("。") + f"。{timeline}"
+                else:
+                    winner_item.summary_zh = timeline
+                logger.info(
+                    f"[事件聚类] 合并跨阶段条目 → {timeline[:60]}"
+                )
+
+    result = [item for i, item in enumerate(items) if i not in dropped]
+    merged = len(items) - len(result)
+    if merged:
+        logger.info(
+            f"[去重] 三阶段去重：{len(items)} 条 → {len(result)} 条（合并 {merged} 条）"
+        )
+    return result
+
+
+def _fresh(rows: list) -> list:
+    items = [LegislationItem(**row) for row in rows]
+    for item in items:
+        features_for(item).title_bigrams
+        _calculate_event_fingerprint(item)
+    return items
+
+
+def _verify_stub(pairs: list) -> list:
+    return [(len(a) + len(b)) % 3 == 0 for a, b in pairs]
+
+
+def run(fn, rows: list) -> tuple:
+    """返回（耗时秒，保留条目的 (原始下标, summary_zh) 列表）。"""
+    items = _fresh(rows)
+    position = {id(item): k for k, item in enumerate(items)}
+    with mock.patch("translator.verify_duplicate_pairs", _verify_stub), \
+            mock.patch("time.sleep", lambda _s: None):
+        t0 = time.perf_counter()
+        kept = fn(items, enable_fingerprint=True)
+        elapsed = time.perf_counter() - t0
+    return elapsed, [(position[id(item)], item.summary_zh) for item in kept]
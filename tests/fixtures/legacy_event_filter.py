@@ -0,0 +1,99 @@
+"""
+Database.filter_new_events 的参考实现（EventIndex 上线前逐条扫描 existing + accepted）与对比用的运行器
+"""
+
+import re
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from models import Database, LegislationItem
+
+
+def legacy_filter_new_events(
+    self,
+    items: List[LegislationItem],
+    window_days: int = 30,
+) -> tuple[List[LegislationItem], list[tuple[LegislationItem, str]]]:
+    """索引上线前的逐条扫描实现（逐字保留），self 为 Database；仅作为一致性与性能基线。"""
+    if not items:
+        return [], []
+
+    from event_dedup import build_event_key, is_meaningful_progress, same_event
+    from features import item_field
+
+    valid_dates = sorted(item.date for item in items if re.fullmatch(r"\d{4}-\d{2}-\d{2}", item.date or ""))
+    if valid_dates:
+        start = (datetime.strptime(valid_dates[0], "%Y-%m-%d") - timedelta(days=window_days)).strftime("%Y-%m-%d")
+        end = valid_dates[-1]
+        rows = self.conn.execute(
+            """SELECT * FROM legislation WHERE date >= ? AND date <= ?
+               ORDER BY date DESC, impact_score DESC""",
+            (start, end),
+        ).fetchall()
+    else:
+        rows = self.conn.execute(
+            """SELECT * FROM legislation WHERE date >= date('now', ?)
+               ORDER BY date DESC, impact_score DESC""",
+            (f"-{window_days} days",),
+        ).fetchall()
+
+    existing = [dict(row) for row in rows]
+    for row in existing:
+        if not row.get("event_key"):
+            row["event_key"] = build_event_key(row)
+
+    ordered = sorted(
+        items,
+        key=lambda item: (
+            int(item.value_score or 0),
+            float(item.impact_score or 0),
+            item.date or "",
+        ),
+        reverse=True,
+    )
+    accepted: List[LegislationItem] = []
+    dropped: list[tuple[LegislationItem, str]] = []
+
+    for item in ordered:
+        item.event_key = item.event_key or build_event_key(item)
+        duplicate = None
+        # accepted 直接传对象：挂在条目上的 ArticleFeatures 得以复用
+        for candidate in existing + accepted:
+            if not same_event(candidate, item):
+                continue
+            if is_meaningful_progress(candidate, item):
+                continue
+            duplicate = candidate
+            break
+
+        if duplicate is None:
+            accepted.append(item)
+        else:
+            duplicate_title = (
+                item_field(duplicate, "title_zh") or item_field(duplicate, "title") or "同一事件"
+            )
+            dropped.append((item, duplicate_title))
+
+    return accepted, dropped
+
+
+def build_database(path: str, rows: list) -> Database:
+    db = Database(path)
+    for row in rows:
+        db.upsert_item(LegislationItem(**row))
+    return db
+
+
+def run(fn, db: Database, rows: list) -> tuple:
+    """返回（耗时秒，接受条目下标，(丢弃条目下标, 重复标题) 列表）。"""
+    items = [LegislationItem(**row) for row in rows]
+    position = {id(item): k for k, item in enumerate(items)}
+    t0 = time.perf_counter()
+    accepted, dropped = fn(db, items)
+    elapsed = time.perf_counter() - t0
+    return (
+        elapsed,
+        [position[id(item)] for item in accepted],
+        [(position[id(item)], title) for item, title in dropped],
+    )
@@ -0,0 +1,43 @@
+"""
+is_legislation_relevant 的参考实现：组合匹配器上线前的逐条 re.search
+"""
+
+import re
+
+import fetcher
+from config import DIGITAL_INDUSTRY_SIGNALS
+
+
+def legacy_is_legislation_relevant(article: dict) -> bool:
+    """组合匹配器上线前的逐条匹配实现，仅作为一致性与性能基线。"""
+    title = article.get("title", "")
+    summary = article.get("summary", "")
+    text = f"{title} {summary}"
+    text_lower = text.lower()
+
+    if fetcher.is_china_mainland(text):
+        return False
+    if fetcher._is_multilingual_hard_noise(text):
+        return False
+    has_traditional = any(
+        re.search(p, text_lower, re.IGNORECASE)
+        for p in fetcher.TRADITIONAL_CONSUMER_GOODS_SIGNALS
+    )
+    if has_traditional and not any(
+        re.search(p, text_lower, re.IGNORECASE) for p in fetcher.GAME_STRONG_SIGNALS
+    ):
+        return False
+    for p in fetcher.EXCLUSION_PATTERNS:
+        if re.search(p, text_lower, re.IGNORECASE):
+            return False
+    if not any(re.search(p, text_lower, re.IGNORECASE) for p in fetcher.REGULATORY_SIGNALS):
+        return False
+    if article.get("tier", "") in ("official", "legal"):
+        for signal in DIGITAL_INDUSTRY_SIGNALS:
+            if signal.isascii():
+                if re.search(r"\b" + re.escape(signal) + r"\b", text_lower, re.IGNORECASE):
+                    return True
+            elif signal in text_lower:
+                return True
+        return False
+    return any(re.search(p, text_lower, re.IGNORECASE) for p in fetcher.GAME_SIGNALS)
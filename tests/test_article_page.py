@@ -0,0 +1,97 @@
+"""
+article_page.py 单元测试 — 单次抓取 + 内容寻址缓存
+"""
+
+import time
+
+import pytest
+
+import article_page
+from article_page import ArticlePage, PageCache, fetch_article_page, parse_article_html
+
+
+_HTML = """
+<html><head>
+  <link rel="canonical" href="https://www.example.com/news/game-law">
+  <meta property="article:published_time" content="2026-10-12T08:00:00Z">
+  <script>var x = 1;</script>
+</head><body>
+  <header>Site header</header>
+  <article>The regulator published final rules requiring game publishers to disclose
+  loot box probabilities and to verify the age of players before any paid draw.</article>
+</body></html>
+"""
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text=_HTML, url="https://example.com/a"):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.url = url
+        self.headers = {}
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+
+@pytest.fixture
+def fake_get(monkeypatch):
+    calls = []
+
+    def _get(url, **kwargs):
+        calls.append(url)
+        return FakeResponse(url=url)
+
+    monkeypatch.setattr(article_page.http_session, "get", _get)
+    return calls
+
+
+def test_single_parse_extracts_date_canonical_and_body():
+    page = parse_article_html("https://example.com/a", _HTML)
+    assert page.published_date == "2026-10-12"
+    assert page.canonical_url == "https://www.example.com/news/game-law"
+    assert page.body_snippet.startswith("The regulator published final rules")
+    assert "Site header" not in page.body_snippet
+
+
+def test_page_is_downloaded_once_and_shared(fake_get):
+    import fetcher
+    import translator
+
+    url = "https://example.com/a"
+    assert fetcher.try_fetch_article_date(url) == "2026-10-12"
+    assert translator._fetch_article_body(url).startswith("The regulator")
+    assert fake_get == [url]
+
+
+def test_identical_content_is_stored_once(tmp_path, fake_get):
+    cache = PageCache(str(tmp_path / "pc"))
+    article_page._page_cache = cache
+    fetch_article_page("https://example.com/a")
+    fetch_article_page("https://example.com/a?utm_source=x")
+    assert len(list((tmp_path / "pc" / "urls").glob("*/*.json"))) == 2
+    assert len(list((tmp_path / "pc" / "pages").glob("*/*.json"))) == 1
+
+
+def test_cached_only_never_hits_network(fake_get):
+    assert fetch_article_page("https://example.com/new", cached_only=True) is None
+    assert fake_get == []
+
+
+def test_failures_use_short_negative_ttl(tmp_path):
+    cache = PageCache(str(tmp_path / "pc"), ttl_days=14, negative_ttl_hours=1)
+    stale = time.time() - 2 * 3600
+    cache.put(ArticlePage(url="https://a/fail", status=404, fetched_at=stale))
+    cache.put(ArticlePage(url="https://a/ok", status=200, fetched_at=stale), "d" * 64)
+    assert cache.get("https://a/fail") is None
+    assert cache.get("https://a/ok") is not None
+    assert cache.prune() == 1
+
+
+def test_expired_entries_and_orphaned_pages_are_pruned(tmp_path):
+    cache = PageCache(str(tmp_path / "pc"), ttl_days=1)
+    cache.put(ArticlePage(url="https://a/old", status=200, fetched_at=time.time() - 3 * 86400), "e" * 64)
+    assert cache.prune() == 2
+    assert cache.get("https://a/old") is None
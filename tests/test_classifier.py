@@ -158,6 +158,9 @@ from classifier import (
     _is_hardware_noise,
     _is_google_apple_non_core,
     _high_risk_bonus,
+    _anchors,
+    _required_literal,
+    scan_rules,
     COUNTRY_PATTERNS,
     COUNTRY_TO_REGION,
 )
@@ -677,6 +680,56 @@ class TestClassifyArticle:
         assert result.impact_score == 0.0
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# 规则扫描引擎
+# ═══════════════════════════════════════════════════════════════════════
+
+class TestScoringEngine:
+
+    def test_parity_with_per_pattern_findall_over_database(self):
+        """引擎与逐条 re.findall 实现对库内全部文章给出相同的分类与评分"""
+        from tests.fixtures.corpus import classifier_articles, load_rows
+        from tests.fixtures.legacy_classifier import classification_key, legacy_classify
+
+        corpus = classifier_articles(load_rows())
+        corpus += [
+            {"title": "Türkiye kılavuz: oyun yasası ΣΟΣ", "summary": "İstanbul FTC fine", "source": ""},
+            {"title": "FTC fines game company for COPPA violation", "summary": "", "source": "FTC News"},
+            {"title": "游戏新规", "summary": "", "source": "European Commission"},
+        ]
+        mismatches = [a["title"] for a in corpus if legacy_classify(a) != classification_key(a)]
+        assert mismatches == []
+
+    def test_counts_overlapping_patterns_independently(self):
+        """不同模式的重叠命中各自计数，与逐条 findall 一致"""
+        scan = scan_rules("loot box loot boxes gacha")
+        assert scan.categories["玩法合规"] >= 3
+
+    def test_scan_is_reused_by_detectors(self):
+        text = "FTC fines game company for COPPA violation"
+        scan = scan_rules(text)
+        assert _detect_status(text, scan) == _detect_status(text)
+        assert _detect_category(text, scan) == _detect_category(text)
+        assert _detect_geography(text, scan=scan) == _detect_geography(text)
+        assert score_impact("执法动态", "FTC News", text=text, scan=scan) == \
+            score_impact("执法动态", "FTC News", text=text)
+
+    def test_required_literal_skips_optional_characters(self):
+        assert _required_literal("loot.?box") == "loot"
+        assert _required_literal(r"\bEU\b") == "eu"
+        assert _required_literal(r"colou?r") == "colo"
+        assert _required_literal(r"(?:a|b)") is None
+
+    def test_anchors_disabled_when_any_branch_has_no_literal(self):
+        assert _anchors(r"gacha|\d+") is None
+        assert _anchors(r"gacha|loot.?box") == ("gacha", "loot")
+
+    def test_casefold_special_characters_skip_prefilter(self):
+        """ſ 在 IGNORECASE 下等价于 s，但小写文本中不含预筛字面量 wireless，必须跑正则"""
+        assert _is_hardware_noise("new wireleſſ ſtandard")
+        assert _is_hardware_noise("new wireless standard")
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # 数据完整性
 # ═══════════════════════════════════════════════════════════════════════
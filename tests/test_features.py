@@ -0,0 +1,135 @@
+"""
+features.py 单元测试
+覆盖：按需计算与缓存、字段改写后的视图失效、features_json 持久化与跨进程复用
+"""
+import json
+
+import pytest
+
+import classifier
+from event_dedup import build_event_key
+from features import ArticleFeatures, features_for
+from models import Database, LegislationItem
+from reporter import _calculate_event_fingerprint
+
+
+def _item(**overrides) -> LegislationItem:
+    values = {
+        "region": "北美",
+        "category_l1": "消费者保护",
+        "category_l2": "",
+        "title": "FTC fines Roblox over loot box refunds",
+        "date": "2026-10-16",
+        "status": "执法动态",
+        "summary": "The FTC ordered refunds for children.",
+        "source_name": "FTC News",
+        "source_url": "https://ftc.gov/news/1",
+        "title_zh": "美国FTC就开箱退款处罚Roblox",
+        "summary_zh": "FTC 要求向儿童退款。",
+    }
+    values.update(overrides)
+    return LegislationItem(**values)
+
+
+def _count_calls(monkeypatch, module, name):
+    calls = []
+    original = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, wrapper)
+    return calls
+
+
+class TestArticleFeatures:
+
+    def test_features_are_attached_and_reused(self, monkeypatch):
+        calls = _count_calls(monkeypatch, classifier, "_is_hardware_noise")
+        item = _item()
+        assert features_for(item) is features_for(item)
+        features_for(item).hardware_noise
+        features_for(item).hardware_noise
+        assert len(calls) == 1
+
+    def test_dict_features_are_reused_without_touching_the_dict(self, monkeypatch):
+        calls = _count_calls(monkeypatch, classifier, "_is_hardware_noise")
+        row = _item().to_dict()
+        keys = set(row)
+        assert features_for(row) is features_for(row)
+        features_for(row).hardware_noise
+        features_for(row).hardware_noise
+        assert len(calls) == 1
+        assert set(row) == keys
+        json.dumps(row)
+
+        row["title_zh"] = "另一个标题"
+        assert features_for(row).display_title == "另一个标题"
+
+    def test_dict_and_dataclass_give_same_event_key(self):
+        item = _item()
+        assert build_event_key(item) == build_event_key(item.to_dict())
+
+    def test_translation_invalidates_only_dependent_views(self, monkeypatch):
+        item = _item(title_zh="", summary_zh="")
+        features = features_for(item)
+        assert features.china_mainland is False
+        assert features.display_title == item.title
+
+        mainland_calls = _count_calls(monkeypatch, classifier, "is_china_mainland")
+        item.title_zh = "美国FTC就开箱退款处罚Roblox"
+        refreshed = features_for(item)
+        assert refreshed is not features
+        assert refreshed.display_title == item.title_zh
+        assert refreshed.china_mainland is False
+        assert mainland_calls == []  # raw 视图只依赖 title/summary，继续复用
+
+    def test_fingerprint_matches_region_and_terms(self):
+        fp = _calculate_event_fingerprint(_item())
+        assert {"R:北美", "E:roblox", "E:ftc", "T:gacha", "T:refund"} <= fp
+
+
+class TestPersistence:
+
+    def test_round_trip_restores_persisted_values(self, monkeypatch):
+        item = _item()
+        payload = features_for(item).to_json()
+
+        def fail(*_):
+            raise AssertionError("persisted feature recomputed")
+
+        monkeypatch.setattr(classifier, "_is_hardware_noise", fail)
+        monkeypatch.setattr(classifier, "_is_google_apple_non_core", fail)
+        row = dict(item.to_dict(), features_json=payload)
+        features = features_for(row)
+        assert features.is_noise is False
+        assert features.entities == features_for(item).entities
+        assert features.fingerprint_terms == features_for(item).fingerprint_terms
+
+    def test_stale_views_are_ignored(self):
+        item = _item()
+        payload = features_for(item).to_json()
+        row = dict(item.to_dict(), title_zh="完全不同的标题", features_json=payload)
+        features = features_for(row)
+        assert features.normalized_title == "完全不同的标题"
+
+    @pytest.mark.parametrize("payload", ["", "not json", '{"v": 0, "values": {}}', "[]"])
+    def test_invalid_payload_falls_back_to_compute(self, payload):
+        row = dict(_item().to_dict(), features_json=payload)
+        assert features_for(row).entities == features_for(_item()).entities
+
+    def test_upsert_persists_features_json(self, tmp_path):
+        db = Database(str(tmp_path / "test.db"))
+        try:
+            item = _item(title="iPhone 16 Pro review battery optimization")
+            db.upsert_item(item)
+            row = db.query_items(days=0)[0]
+            assert row["features_json"]
+            restored = ArticleFeatures(
+                row["title"], row["summary"], row["title_zh"], row["summary_zh"],
+            )
+            restored.load_json(row["features_json"])
+            assert restored._values["hardware_noise"] is True
+        finally:
+            db.close()
@@ -31,7 +31,7 @@ def test_write_to_bitable_returns_only_successful_urls(monkeypatch):
         return _FakeResponse({"code": 1250001, "msg": "batch failed"})
 
     monkeypatch.setattr(feishu_bitable, "_BATCH_SIZE", 2)
-    monkeypatch.setattr(feishu_bitable.requests, "post", fake_post)
+    monkeypatch.setattr(feishu_bitable.http_session, "post", fake_post)
 
     items = [
         {"title_zh": "A", "source_url": "https://example.com/a"},
@@ -86,7 +86,7 @@ def test_date_enrichment_reapplies_recency_filter(monkeypatch):
         "region": "全球",
         "lang": "en",
     }
-    monkeypatch.setattr(fetcher, "fetch_all_rss", lambda: [old_article])
+    monkeypatch.setattr(fetcher, "fetch_all_rss", lambda **kwargs: [old_article])
     monkeypatch.setattr(fetcher, "fetch_google_news_all", lambda *args, **kwargs: [])
     monkeypatch.setattr(fetcher, "fetch_gdelt_all", lambda **kwargs: [])
     monkeypatch.setattr(fetcher, "is_legislation_relevant", lambda article: True)
@@ -104,6 +104,85 @@ def test_date_enrichment_reapplies_recency_filter(monkeypatch):
     assert fetcher.fetch_and_process(max_days=1, daily_mode=True) == []
 
 
+class TestFetchAllSources:
+
+    def test_families_run_concurrently_and_merge_in_fixed_order(self, monkeypatch):
+        import time as _time
+
+        def slow(items):
+            def run(*args, **kwargs):
+                _time.sleep(0.3)
+                return items
+            return run
+
+        monkeypatch.setattr(fetcher, "fetch_all_rss", slow([{"title": "rss"}]))
+        monkeypatch.setattr(fetcher, "fetch_google_news_all", slow([{"title": "news"}]))
+        monkeypatch.setattr(fetcher, "fetch_gdelt_all", slow([{"title": "gdelt"}]))
+
+        started = _time.monotonic()
+        result = fetcher.fetch_all_sources(max_days=7)
+
+        assert [item["title"] for item in result] == ["rss", "news", "gdelt"]
+        assert _time.monotonic() - started < 0.8
+
+    def test_family_timeout_and_failure_do_not_drop_other_families(self, monkeypatch):
+        import threading
+        import time as _time
+        exited = threading.Event()
+
+        def hung(*args, stop=None, **kwargs):
+            stop.wait(5)
+            exited.set()
+            return [{"title": "late"}]
+
+        def broken(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(fetcher, "FETCH_FAMILY_TIMEOUTS", {"rss": 5, "google_news": 0.2, "gdelt": 5})
+        monkeypatch.setattr(fetcher, "fetch_all_rss", lambda **kwargs: [{"title": "rss"}])
+        monkeypatch.setattr(fetcher, "fetch_google_news_all", hung)
+        monkeypatch.setattr(fetcher, "fetch_gdelt_all", broken)
+
+        started = _time.monotonic()
+        assert fetcher.fetch_all_sources(max_days=1, daily_mode=True) == [{"title": "rss"}]
+        assert _time.monotonic() - started < 1.0
+        # 超时的一类收到 stop 后自行退出，不会在后续阶段继续发请求
+        assert exited.wait(1.0)
+
+    def test_timeout_is_enforced_while_an_earlier_family_is_still_running(self, monkeypatch):
+        import threading
+        import time as _time
+        release = threading.Event()
+
+        def slow_rss(stop=None):
+            release.wait(5)
+            return [{"title": "rss"}]
+
+        def hung_gdelt(*args, stop=None, **kwargs):
+            stop.wait(5)
+            release.set()        # GDELT 超时被处理时 RSS 仍在运行
+            return []
+
+        monkeypatch.setattr(fetcher, "FETCH_FAMILY_TIMEOUTS", {"rss": 5, "google_news": 5, "gdelt": 0.2})
+        monkeypatch.setattr(fetcher, "fetch_all_rss", slow_rss)
+        monkeypatch.setattr(fetcher, "fetch_google_news_all", lambda *args, **kwargs: [])
+        monkeypatch.setattr(fetcher, "fetch_gdelt_all", hung_gdelt)
+
+        started = _time.monotonic()
+        assert fetcher.fetch_all_sources(max_days=1, daily_mode=True) == [{"title": "rss"}]
+        assert _time.monotonic() - started < 1.0
+
+    def test_gdelt_stop_interrupts_rate_limit_wait(self, monkeypatch):
+        import threading
+        calls = []
+        stop = threading.Event()
+        stop.set()
+        monkeypatch.setattr(fetcher.http_session, "get", lambda *args, **kwargs: calls.append(1))
+
+        assert fetcher.fetch_gdelt_all(daily_mode=True, stop=stop) == []
+        assert calls == []
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # 监管信号词 (REGULATORY_SIGNALS)
 # ═══════════════════════════════════════════════════════════════════════
@@ -483,7 +562,7 @@ class TestGdeltFallback:
         }
         monkeypatch.setattr(fetcher.time, "sleep", lambda _seconds: None)
         monkeypatch.setattr(
-            fetcher.requests,
+            fetcher.http_session,
             "get",
             lambda *args, **kwargs: self.FakeResponse(200, [article]),
         )
@@ -502,7 +581,7 @@ class TestGdeltFallback:
             return self.FakeResponse(429, headers={"Retry-After": "1"})
 
         monkeypatch.setattr(fetcher.time, "sleep", lambda _seconds: None)
-        monkeypatch.setattr(fetcher.requests, "get", fake_get)
+        monkeypatch.setattr(fetcher.http_session, "get", fake_get)
 
         assert fetcher.fetch_gdelt_all(daily_mode=True) == []
         assert len(calls) == 1
@@ -515,7 +594,41 @@ class TestGdeltFallback:
             return self.FakeResponse(429, headers={"Retry-After": "1"})
 
         monkeypatch.setattr(fetcher.time, "sleep", lambda _seconds: None)
-        monkeypatch.setattr(fetcher.requests, "get", fake_get)
+        monkeypatch.setattr(fetcher.http_session, "get", fake_get)
 
         assert fetcher.fetch_gdelt_all(daily_mode=False) == []
         assert len(calls) == 2
+
+
+class TestCompiledSignalMatchers:
+
+    def test_combined_matchers_keep_legacy_decisions_on_stored_corpus(self):
+        from tests.fixtures.corpus import load_rows, relevance_articles
+        from tests.fixtures.legacy_relevance import legacy_is_legislation_relevant
+        import json
+        from pathlib import Path
+
+        corpus = relevance_articles(load_rows())
+        fixture = Path(__file__).parent / "fixtures" / "daily_2026_07_14.json"
+        corpus += [
+            {"title": row["title"], "summary": "", "tier": tier}
+            for row in json.loads(fixture.read_text(encoding="utf-8"))
+            for tier in ("", "legal")
+        ]
+        mismatches = [
+            a["title"] for a in corpus
+            if legacy_is_legislation_relevant(a) != is_legislation_relevant(a)
+        ]
+        assert mismatches == []
+
+    def test_scan_reports_matched_groups(self):
+        groups = fetcher.SIGNALS.scan("ftc fines mobile game publisher over loot boxes")
+        assert {"regulatory", "game", "digital_ascii"} <= groups
+        assert "exclusion" not in groups
+
+    def test_digital_ascii_signals_keep_word_boundaries(self):
+        assert not fetcher.SIGNALS.has("digital_ascii", "oaic complaint")
+        assert fetcher.SIGNALS.has("digital_ascii", "new ai rules")
+
+    def test_empty_signal_list_never_matches(self):
+        assert fetcher._combine_patterns([]).search("anything") is None
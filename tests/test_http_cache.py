@@ -0,0 +1,124 @@
+"""
+http_cache.py / fetcher 条件请求单元测试
+"""
+
+import time
+
+import fetcher
+import http_cache
+from http_cache import FeedCache
+
+
+_RSS = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss><channel>
+  <item>
+    <title>FTC finalizes rule on game loot boxes</title>
+    <link>https://www.ftc.gov/news/1</link>
+    <pubDate>Mon, 12 Oct 2026 10:00:00 +0000</pubDate>
+    <description>The rule applies to video game publishers.</description>
+  </item>
+</channel></rss>"""
+
+_FEED = {"name": "FTC", "url": "https://www.ftc.gov/feed.xml", "region": "北美", "tier": "official"}
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class TestFeedCache:
+
+    def test_prune_age_is_measured_in_utc(self, tmp_path, monkeypatch):
+        # updated_at 由 SQLite 以 UTC 写入；本地时区为 UTC+8 时 23 小时前刷新的条目不应被清理
+        monkeypatch.setenv("TZ", "Asia/Shanghai")
+        time.tzset()
+        path = str(tmp_path / "c.db")
+        try:
+            cache = FeedCache(path, max_age_days=1)
+            cache.store("u", '"abc"', "", [{"title": "t"}])
+            cache.conn.execute("UPDATE feed_cache SET updated_at = datetime('now', '-23 hours')")
+            cache.conn.commit()
+            cache.close()
+
+            reopened = FeedCache(path, max_age_days=1)
+            assert reopened.lookup("u") is not None
+            reopened.close()
+        finally:
+            monkeypatch.delenv("TZ")
+            time.tzset()
+
+    def test_store_and_lookup_roundtrip(self, tmp_path):
+        cache = FeedCache(str(tmp_path / "c.db"))
+        cache.store("u", '"abc"', "Mon, 12 Oct 2026 10:00:00 GMT", [{"title": "t"}])
+        entry = cache.lookup("u")
+        assert FeedCache.conditional_headers(entry) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 12 Oct 2026 10:00:00 GMT",
+        }
+        assert FeedCache.cached_items(entry) == [{"title": "t"}]
+        cache.close()
+
+    def test_response_without_validators_is_not_cached(self, tmp_path):
+        cache = FeedCache(str(tmp_path / "c.db"))
+        cache.store("u", "", "", [{"title": "t"}])
+        assert cache.lookup("u") is None
+        assert FeedCache.conditional_headers(None) == {}
+        cache.close()
+
+    def test_stats_are_counted_per_source(self, tmp_path):
+        cache = FeedCache(str(tmp_path / "c.db"))
+        cache.record("FTC", hit=True)
+        cache.record("FTC", hit=False)
+        cache.record("OAIC", hit=True)
+        assert cache.stats() == {"FTC": {"hit": 1, "miss": 1}, "OAIC": {"hit": 1, "miss": 0}}
+        cache.reset_stats()
+        assert cache.stats() == {}
+        cache.close()
+
+
+class TestConditionalFetch:
+
+    def test_304_returns_cached_items_without_parsing(self, monkeypatch):
+        sent_headers = []
+
+        def fake_get(url, headers=None, **kwargs):
+            sent_headers.append(headers)
+            if len(sent_headers) == 1:
+                return FakeResponse(200, _RSS, {"ETag": '"v1"'})
+            return FakeResponse(304)
+
+        monkeypatch.setattr(fetcher.http_session, "get", fake_get)
+        first = fetcher.fetch_rss_feed(_FEED)
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("304 不应再解析")
+
+        monkeypatch.setattr(fetcher, "_parse_rss_response", fail_parse)
+        second = fetcher.fetch_rss_feed(_FEED)
+
+        assert len(first) == 1
+        assert second == first
+        assert "If-None-Match" not in sent_headers[0]
+        assert sent_headers[1]["If-None-Match"] == '"v1"'
+        assert http_cache.get_feed_cache().stats() == {"FTC": {"hit": 1, "miss": 1}}
+
+    def test_google_news_caches_full_feed_and_truncates_on_return(self, monkeypatch):
+        rss = b"<rss><channel>" + b"".join(
+            f"<item><title>Game law {i} - Outlet</title><link>https://n/{i}</link></item>".encode()
+            for i in range(5)
+        ) + b"</channel></rss>"
+        responses = [FakeResponse(200, rss, {"Last-Modified": "x"}), FakeResponse(304)]
+        monkeypatch.setattr(fetcher.time, "sleep", lambda _seconds: None)
+        monkeypatch.setattr(fetcher.http_session, "get", lambda *a, **k: responses.pop(0))
+
+        assert len(fetcher.fetch_google_news("game law", "en_US", max_results=2)) == 2
+        cached = fetcher.fetch_google_news("game law", "en_US", max_results=0)
+        assert len(cached) == 5
+        assert cached[0]["source"] == "Outlet"
@@ -0,0 +1,62 @@
+"""
+http_session.py 单元测试 — 共享连接池与复用统计
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import http_session
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # 支持 keep-alive
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    http_session.close()
+    http_session.reset_stats()
+    yield
+    http_session.close()
+
+
+def test_session_is_shared():
+    assert http_session.get_session() is http_session.get_session()
+
+
+def test_sequential_requests_reuse_one_connection(local_server):
+    for path in ("/a", "/b", "/c"):
+        assert http_session.get(local_server + path, timeout=5).text == "ok"
+
+    stats = http_session.stats()
+    assert stats["requests"] == 3
+    assert stats["new_connections"] == 1
+    assert stats["reuse_rate"] == pytest.approx(2 / 3)
+
+
+def test_adapter_pool_size_matches_config():
+    adapter = http_session.get_session().get_adapter("https://example.com")
+    assert adapter._pool_maxsize == http_session.HTTP_POOL_MAXSIZE
+    assert adapter.max_retries.total == 0
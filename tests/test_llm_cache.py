@@ -0,0 +1,140 @@
+"""
+llm_cache.py / translator LLM 响应缓存单元测试
+"""
+import time
+from types import SimpleNamespace
+
+import llm_cache
+import translator
+from llm_cache import LLMCache, cache_key
+
+
+class FakeCompletions:
+    def __init__(self, content):
+        self.content = content
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=self.content))]
+        )
+
+
+def _fake_client(monkeypatch, content):
+    completions = FakeCompletions(content)
+    monkeypatch.setattr(translator, "_HAS_AI", True)
+    monkeypatch.setattr(
+        translator, "_AI_CLIENT", SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    )
+    return completions
+
+
+_PAIRS = [("美国FTC处罚Roblox", "FTC就开箱退款处罚Roblox")]
+
+
+class TestCacheKey:
+
+    def test_whitespace_is_normalized(self):
+        assert cache_key("m", "sys", "a  b\n c ") == cache_key("m", "sys", "a b c")
+
+    def test_model_and_system_prompt_change_key(self):
+        base = cache_key("m", "sys", "msg")
+        assert cache_key("other", "sys", "msg") != base
+        assert cache_key("m", "sys v2", "msg") != base
+
+
+class TestLLMCache:
+
+    def test_put_get_and_stats(self, tmp_path):
+        cache = LLMCache(str(tmp_path / "c.db"))
+        try:
+            assert cache.get("k", "batch") is None
+            cache.put("k", "[1]", model="m", purpose="batch")
+            assert cache.get("k", "batch") == "[1]"
+            assert cache.stats() == {"batch": {"hit": 1, "miss": 1}}
+        finally:
+            cache.close()
+
+    def test_ttl_is_measured_in_utc(self, tmp_path, monkeypatch):
+        # created_at 由 SQLite 以 UTC 写入；本地时区为 UTC+8 时 23 小时前的条目仍在 1 天 TTL 内
+        monkeypatch.setenv("TZ", "Asia/Shanghai")
+        time.tzset()
+        cache = LLMCache(str(tmp_path / "c.db"), ttl_days=1)
+        try:
+            cache.put("k", "fresh")
+            cache.conn.execute("UPDATE llm_cache SET created_at = datetime('now', '-23 hours')")
+            cache.conn.commit()
+            assert cache.evict() == 0
+            assert cache.get("k") == "fresh"
+        finally:
+            cache.close()
+            monkeypatch.delenv("TZ")
+            time.tzset()
+
+    def test_expired_entries_are_ignored_and_purged(self, tmp_path):
+        path = str(tmp_path / "c.db")
+        cache = LLMCache(path, ttl_days=1)
+        cache.put("k", "old")
+        cache.conn.execute("UPDATE llm_cache SET created_at = datetime('now', '-2 days')")
+        cache.conn.commit()
+        assert cache.get("k") is None
+        cache.close()
+
+        reopened = LLMCache(path, ttl_days=1)
+        try:
+            assert reopened.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] == 0
+        finally:
+            reopened.close()
+
+    def test_size_limit_evicts_least_recently_used(self, tmp_path):
+        cache = LLMCache(str(tmp_path / "c.db"), max_entries=2)
+        try:
+            for key in ("a", "b", "c"):
+                cache.put(key, key)
+            cache.conn.execute("UPDATE llm_cache SET last_used_at = datetime('now', '-1 hour') WHERE key = 'a'")
+            cache.conn.execute("UPDATE llm_cache SET last_used_at = datetime('now', '+1 hour') WHERE key = 'b'")
+            cache.conn.commit()
+            assert cache.evict() == 1
+            keys = {r[0] for r in cache.conn.execute("SELECT key FROM llm_cache")}
+            assert keys == {"b", "c"}
+        finally:
+            cache.close()
+
+
+class TestTranslatorCaching:
+
+    def test_repeated_call_is_served_from_cache(self, monkeypatch):
+        completions = _fake_client(monkeypatch, "[true]")
+        assert translator.verify_duplicate_pairs(_PAIRS) == [True]
+        assert translator.verify_duplicate_pairs(_PAIRS) == [True]
+        assert completions.calls == 1
+        assert llm_cache.get_llm_cache().stats()["verify_dup"] == {"hit": 1, "miss": 1}
+
+    def test_rejected_output_is_not_cached(self, monkeypatch):
+        completions = _fake_client(monkeypatch, "上述变化提醒中资游戏公司应关注平台政策。")
+        items = [{"title_zh": "韩国调查 Google 强制 IAP", "impact_score": 6}]
+        assert translator.generate_daily_summary(items) == ""
+        assert translator.generate_daily_summary(items) == ""
+        assert completions.calls == 2
+
+    def test_unparseable_batch_is_not_cached(self, monkeypatch):
+        completions = _fake_client(monkeypatch, "抱歉，无法处理")
+        items = [{"title": "FTC fines Roblox"}, {"title": "EU DSA guidance"}]
+        assert translator._ai_process_batch(items) == [None, None]
+        assert translator._ai_process_batch(items) == [None, None]
+        assert completions.calls == 2
+
+    def test_bypass_skips_cache(self, monkeypatch):
+        completions = _fake_client(monkeypatch, "[true]")
+        llm_cache.set_bypass()
+        translator.verify_duplicate_pairs(_PAIRS)
+        translator.verify_duplicate_pairs(_PAIRS)
+        assert completions.calls == 2
+
+    def test_bypass_from_environment(self, monkeypatch):
+        monkeypatch.setenv("LLM_CACHE_BYPASS", "1")
+        completions = _fake_client(monkeypatch, "[true]")
+        translator.verify_duplicate_pairs(_PAIRS)
+        translator.verify_duplicate_pairs(_PAIRS)
+        assert completions.calls == 2
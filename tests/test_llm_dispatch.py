@@ -0,0 +1,267 @@
+"""
+llm_dispatch.py 单元测试 — RPM/TPM 预算、共享退避、按输入顺序返回
+"""
+import threading
+import time as _time
+from types import SimpleNamespace
+
+import pytest
+
+import llm_dispatch
+import translator
+from llm_dispatch import LLMDispatcher, is_rate_limited, is_server_error, retry_after_seconds
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(llm_dispatch.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(llm_dispatch.time, "sleep", fake.sleep)
+    return fake
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def test_request_budget_spaces_calls(clock):
+    dispatcher = LLMDispatcher(requests_per_minute=60, tokens_per_minute=10**6, max_in_flight=2)
+    waits = [dispatcher.acquire(0) for _ in range(4)]
+    # 突发 2 次，之后按 1 req/s 排队
+    assert waits == [0.0, 0.0, pytest.approx(1.0), pytest.approx(1.0)]
+
+
+def test_token_budget_limits_large_requests(clock):
+    dispatcher = LLMDispatcher(requests_per_minute=600, tokens_per_minute=6000, max_in_flight=4)
+    assert dispatcher.acquire(1500) == 0.0   # 突发预算 = 15 秒 = 1500 token
+    assert dispatcher.acquire(1000) == pytest.approx(10.0)
+
+
+def test_rate_limit_pauses_and_retries(clock):
+    dispatcher = LLMDispatcher(requests_per_minute=600, tokens_per_minute=10**6, max_in_flight=2)
+    attempts = []
+
+    def flaky():
+        attempts.append(clock.now)
+        if len(attempts) == 1:
+            raise RateLimitError("Rate limit reached. Please try again in 3.5s.")
+        return "ok"
+
+    assert dispatcher.call(flaky) == "ok"
+    assert attempts[1] - attempts[0] == pytest.approx(5.0)   # 3.5s + 1.5s 余量
+    assert dispatcher.throttled == 1 and dispatcher.retried == 1
+
+
+def test_non_retryable_error_is_raised(clock):
+    dispatcher = LLMDispatcher()
+    with pytest.raises(ValueError):
+        dispatcher.call(lambda: (_ for _ in ()).throw(ValueError("bad request")))
+    assert dispatcher.retried == 0
+
+
+def test_retry_after_header_and_text():
+    exc = Exception("boom")
+    exc.response = SimpleNamespace(headers={"retry-after": "7"})
+    assert retry_after_seconds(exc) == 7.0
+    assert retry_after_seconds(Exception("try again in 2.25s")) == 2.25
+    assert retry_after_seconds(Exception("nope")) is None
+    assert is_rate_limited(RateLimitError("slow down"))
+
+
+def test_status_code_decides_before_message_text():
+    class BadRequest(Exception):
+        status_code = 400
+
+    exc = BadRequest("max_tokens must be <= 5000 (request id req_429abc)")
+    assert not is_rate_limited(exc)
+    assert not is_server_error(exc)
+
+    http_error = Exception("upstream said 429")
+    http_error.response = SimpleNamespace(status_code=502, headers={})
+    assert is_server_error(http_error) and not is_rate_limited(http_error)
+
+    # 没有状态码时才退回文本判断
+    assert is_rate_limited(Exception("Error code: 429 rate_limit_exceeded"))
+    assert is_server_error(Exception("InternalServerError: unknown error"))
+
+
+def test_map_keeps_input_order_and_limits_in_flight():
+    dispatcher = LLMDispatcher(max_in_flight=3)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def work(x):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        _time.sleep(0.02 * (5 - x % 5))
+        with lock:
+            active[0] -= 1
+        return x * 10
+
+    assert dispatcher.map(work, range(10)) == [x * 10 for x in range(10)]
+    assert 1 < peak[0] <= 3
+
+
+def test_translate_items_batch_runs_batches_concurrently(monkeypatch):
+    monkeypatch.setattr(translator, "_HAS_AI", True)
+    monkeypatch.setattr(translator, "_check_ai_reachable", lambda: True)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_batch(batch):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        _time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return [
+            {
+                "is_relevant": True,
+                "title_zh": f"[美国] 标题{d['title']}",
+                "summary_zh": f"FTC 对第 {d['title']} 条案件处以罚款并要求退款整改。",
+                "region": "美国",
+            }
+            for d in batch
+        ]
+
+    monkeypatch.setattr(translator, "_ai_process_batch", fake_batch)
+    items = [{"title": str(i)} for i in range(12)]
+    results = translator.translate_items_batch(items, batch_size=3)
+
+    assert [r["title"] for r in results] == [str(i) for i in range(12)]
+    assert [r["title_zh"] for r in results] == [f"[美国] 标题{i}" for i in range(12)]
+    assert peak[0] > 1
+
+
+# ── 熔断器 ────────────────────────────────────────────────────────────
+
+def _breaker(**overrides):
+    params = dict(window=10, min_calls=4, error_rate=0.5, slow_seconds=20.0,
+                  cooldown=30.0, max_cooldown=100.0)
+    params.update(overrides)
+    return llm_dispatch.CircuitBreaker(**params)
+
+
+def test_breaker_opens_on_error_rate_and_fails_fast(clock):
+    breaker = _breaker()
+    for ok in (True, False, True, False):
+        breaker.before_call()
+        breaker.record(ok, 1.0)
+    assert breaker.state == "open"
+    assert breaker.available() is False
+    with pytest.raises(llm_dispatch.CircuitOpenError):
+        breaker.before_call()
+    assert breaker.rejected == 1
+
+
+def test_breaker_opens_on_latency(clock):
+    breaker = _breaker()
+    for _ in range(4):
+        breaker.record(True, 25.0)
+    assert breaker.state == "open"
+
+
+def test_half_open_allows_single_trial_then_closes(clock):
+    breaker = _breaker()
+    for _ in range(4):
+        breaker.record(False, 1.0)
+    clock.now += 30.0
+    assert breaker.available() is True
+    trial = breaker.before_call()               # 试探请求
+    assert trial is True and breaker.state == "half_open"
+    with pytest.raises(llm_dispatch.CircuitOpenError):
+        breaker.before_call()                   # 试探期间其余请求快速失败
+    breaker.record(True, 2.0, trial)
+    assert breaker.state == "closed"
+    assert breaker.before_call() is False
+
+
+def test_failed_trial_reopens_with_longer_cooldown(clock):
+    breaker = _breaker()
+    for _ in range(4):
+        breaker.record(False, 1.0)
+    clock.now += 30.0
+    breaker.record(False, 1.0, breaker.before_call())
+    assert breaker.state == "open" and breaker.cooldown == 60.0
+    clock.now += 30.0
+    assert breaker.available() is False
+    clock.now += 30.0
+    assert breaker.available() is True
+
+
+def test_straggler_result_does_not_decide_half_open(clock):
+    breaker = _breaker()
+    straggler = breaker.before_call()           # closed 时放行，随后在排队中等待
+    for _ in range(4):
+        breaker.record(False, 1.0)
+    clock.now += 30.0
+    trial = breaker.before_call()
+    breaker.record(True, 1.0, straggler)        # 断开前放行的请求此时才返回
+    assert breaker.state == "half_open"
+    with pytest.raises(llm_dispatch.CircuitOpenError):
+        breaker.before_call()                   # 试探仍在进行
+    breaker.record(False, 1.0, trial)
+    assert breaker.state == "open" and breaker.cooldown == 60.0
+
+
+def test_dispatcher_rechecks_breaker_after_queueing(clock, monkeypatch):
+    dispatcher = LLMDispatcher(requests_per_minute=6000, tokens_per_minute=10**7, max_in_flight=2)
+    dispatcher.breaker = _breaker()
+    original_acquire = dispatcher.acquire
+
+    def acquire_while_breaker_opens(tokens):
+        for _ in range(4):                      # 排队期间其他线程的失败让熔断器断开
+            dispatcher.breaker.record(False, 1.0)
+        return original_acquire(tokens)
+
+    monkeypatch.setattr(dispatcher, "acquire", acquire_while_breaker_opens)
+    calls = []
+    with pytest.raises(llm_dispatch.CircuitOpenError):
+        dispatcher.call(lambda: calls.append(1))
+    assert calls == []
+
+
+def test_rate_limits_do_not_trip_breaker(clock):
+    dispatcher = LLMDispatcher(requests_per_minute=6000, tokens_per_minute=10**7, max_in_flight=2)
+    dispatcher.breaker = _breaker()
+
+    def limited():
+        raise RateLimitError("try again in 1s")
+
+    for _ in range(3):
+        with pytest.raises(RateLimitError):
+            dispatcher.call(limited)
+    assert dispatcher.breaker.state == "closed"
+
+
+def test_dispatcher_stops_calling_endpoint_once_open(clock, monkeypatch):
+    dispatcher = LLMDispatcher(requests_per_minute=6000, tokens_per_minute=10**7, max_in_flight=2)
+    dispatcher.breaker = _breaker()
+    calls = []
+
+    def down():
+        calls.append(1)
+        raise ConnectionError("Connection refused")
+
+    for _ in range(6):
+        with pytest.raises((ConnectionError, llm_dispatch.CircuitOpenError)):
+            dispatcher.call(down)
+    assert len(calls) == 4
+    assert translator._check_ai_reachable() is True   # 共享调度器未受影响
+    monkeypatch.setattr(llm_dispatch, "_dispatcher", dispatcher)
+    assert translator._check_ai_reachable() is False
@@ -0,0 +1,114 @@
+"""
+llm_telemetry.py / translator 调用遥测单元测试
+"""
+from types import SimpleNamespace
+
+import pytest
+
+import llm_telemetry
+import translator
+from llm_telemetry import LLMTelemetry, percentile
+
+
+class FakeCompletions:
+    def __init__(self, content, usage=None, errors=()):
+        self.content = content
+        self.usage = usage
+        self.errors = list(errors)
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=self.content))],
+            usage=self.usage,
+        )
+
+
+def _fake_client(monkeypatch, completions):
+    monkeypatch.setattr(translator, "_HAS_AI", True)
+    monkeypatch.setattr(
+        translator, "_AI_CLIENT", SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    )
+
+
+def _rows():
+    return [dict(r) for r in llm_telemetry.get_telemetry().conn.execute(
+        "SELECT * FROM llm_calls ORDER BY id"
+    )]
+
+
+_PAIRS = [("美国FTC处罚Roblox", "FTC就开箱退款处罚Roblox"), ("欧盟DSA指南", "日本景品表示法修订")]
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 50) is None
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile(list(range(1, 101)), 95) == 95
+
+
+def test_summarize_groups_and_excludes_cache_hits_from_latency(tmp_path):
+    telemetry = LLMTelemetry(str(tmp_path / "t.db"))
+    try:
+        telemetry.record("batch", items=4, prompt_tokens=800, completion_tokens=1200,
+                         latency=2.0, attempts=1)
+        telemetry.record("batch", items=2, prompt_tokens=400, completion_tokens=600,
+                         latency=6.0, attempts=3, outcome="rejected")
+        telemetry.record("batch", items=3, cache_hit=True)
+        telemetry.record("merge", latency=1.0, attempts=1, outcome="error")
+
+        by_type = {r["key"]: r for r in telemetry.summarize(days=1)}
+        batch = by_type["batch"]
+        assert batch["calls"] == 3 and batch["cache_hits"] == 1
+        assert batch["p50"] == 2.0 and batch["p95"] == 6.0
+        assert batch["prompt_per_item"] == 200 and batch["completion_per_item"] == 300
+        assert batch["retries"] == 2 and batch["rejected"] == 1
+        assert by_type["merge"]["errors"] == 1
+        assert len(telemetry.summarize(days=1, by="day")) == 1
+    finally:
+        telemetry.close()
+
+
+def test_old_rows_are_purged_on_open(tmp_path):
+    path = str(tmp_path / "t.db")
+    telemetry = LLMTelemetry(path, retention_days=7)
+    telemetry.record("batch")
+    telemetry.conn.execute("UPDATE llm_calls SET created_at = datetime('now', '-8 days')")
+    telemetry.conn.commit()
+    telemetry.close()
+    reopened = LLMTelemetry(path, retention_days=7)
+    try:
+        assert reopened.conn.execute("SELECT COUNT(*) FROM llm_calls").fetchone()[0] == 0
+    finally:
+        reopened.close()
+
+
+def test_complete_records_usage_and_cache_hit(monkeypatch):
+    usage = SimpleNamespace(prompt_tokens=120, completion_tokens=8)
+    _fake_client(monkeypatch, FakeCompletions("[true, false]", usage=usage))
+    translator.verify_duplicate_pairs(_PAIRS)
+    translator.verify_duplicate_pairs(_PAIRS)
+
+    first, second = _rows()
+    assert first["call_type"] == "verify_dup" and first["items"] == 2
+    assert (first["prompt_tokens"], first["completion_tokens"]) == (120, 8)
+    assert first["outcome"] == "ok" and first["attempts"] == 1 and first["cache_hit"] == 0
+    assert second["cache_hit"] == 1 and second["prompt_tokens"] is None
+
+
+def test_complete_records_retries_and_failures(monkeypatch):
+    class ServerError(Exception):
+        status_code = 500
+
+    monkeypatch.setattr("llm_dispatch.time.sleep", lambda s: None)
+    completions = FakeCompletions("[true, false]", errors=[ServerError("boom")])
+    _fake_client(monkeypatch, completions)
+    translator.verify_duplicate_pairs(_PAIRS)
+    assert _rows()[-1]["attempts"] == 2
+
+    completions.errors = [ValueError("bad request")]
+    with pytest.raises(ValueError):
+        translator._complete("sys", "msg", 10, "merge")
+    assert _rows()[-1]["outcome"] == "error"
@@ -0,0 +1,84 @@
+"""
+migrations.py 单元测试 — user_version 版本化迁移、旧库升级与回填
+"""
+import sqlite3
+
+import pytest
+
+import migrations
+from models import Database
+
+
+def _legacy_db(path):
+    """引入版本号之前的旧库：缺少后来补的列，没有归档表和全文索引。"""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE legislation (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            region TEXT NOT NULL, category_l1 TEXT NOT NULL, category_l2 TEXT DEFAULT '',
+            title TEXT NOT NULL, date TEXT NOT NULL, status TEXT DEFAULT '政策信号',
+            summary TEXT DEFAULT '', source_name TEXT DEFAULT '', source_url TEXT DEFAULT '',
+            lang TEXT DEFAULT 'en', created_at TEXT DEFAULT (datetime('now')),
+            UNIQUE(title, source_url)
+        );
+        INSERT INTO legislation (region, category_l1, title, date, source_url)
+        VALUES ('北美', '数据隐私', 'Age rating overhaul', '2026-03-20', 'https://old.com');
+    """)
+    conn.close()
+
+
+def test_new_database_is_created_at_current_version(tmp_path):
+    db = Database(str(tmp_path / "new.db"))
+    try:
+        assert migrations.schema_version(db.conn) == migrations.SCHEMA_VERSION
+    finally:
+        db.close()
+
+
+def test_legacy_database_is_upgraded_and_backfilled(tmp_path):
+    path = str(tmp_path / "old.db")
+    _legacy_db(path)
+
+    db = Database(path)
+    try:
+        assert migrations.schema_version(db.conn) == migrations.SCHEMA_VERSION
+        columns = {row[1] for row in db.conn.execute("PRAGMA table_info(legislation)")}
+        assert {"title_zh", "impact_score", "event_key", "features_json"} <= columns
+        rows = db.query_items(keyword="rating overhaul", days=0)
+        assert [r["title"] for r in rows] == ["Age rating overhaul"]
+        assert rows[0]["impact_score"] == 1.0
+    finally:
+        db.close()
+
+
+def test_current_schema_runs_no_migrations(tmp_path):
+    path = str(tmp_path / "m.db")
+    Database(path).close()
+    conn = sqlite3.connect(path)
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        assert migrations.migrate(conn) == 0
+    finally:
+        conn.close()
+    assert statements == ["PRAGMA user_version"]
+
+
+def test_failed_migration_rolls_back_every_step(tmp_path, monkeypatch):
+    path = str(tmp_path / "m.db")
+
+    def broken(conn):
+        conn.execute("CREATE TABLE should_not_exist (id INTEGER)")
+        raise sqlite3.OperationalError("boom")
+
+    monkeypatch.setattr(migrations, "MIGRATIONS", migrations.MIGRATIONS + [("broken", broken)])
+    monkeypatch.setattr(migrations, "SCHEMA_VERSION", len(migrations.MIGRATIONS))
+    conn = sqlite3.connect(path)
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            migrations.migrate(conn)
+        assert migrations.schema_version(conn) == 0
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert "legislation" not in tables and "should_not_exist" not in tables
+    finally:
+        conn.close()
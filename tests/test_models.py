@@ -109,6 +109,34 @@ class TestDatabaseUpsert:
         count = db.bulk_upsert(items)
         assert count == 5
 
+    def test_upsert_many_counts_inserted_and_updated(self, db):
+        db.upsert_item(_make_item(title="Article 0", source_url="https://test.com/0"))
+        items = [_make_item(title=f"Article {i}", source_url=f"https://test.com/{i}")
+                 for i in range(3)]
+        items.append(_make_item(title="Article 2", source_url="https://test.com/2",
+                                title_zh="同批重复"))
+
+        assert db.upsert_many(items) == {"inserted": 2, "updated": 2}
+        rows = db.query_items(days=0)
+        assert len(rows) == 3
+        assert {r["title_zh"] for r in rows if r["title"] == "Article 2"} == {"同批重复"}
+        assert all(r["event_key"] for r in rows)
+
+    def test_upsert_item_reports_its_own_row(self, db):
+        db.upsert_item(_make_item())
+        db.conn.execute("CREATE TRIGGER no_insert BEFORE INSERT ON legislation "
+                        "BEGIN SELECT RAISE(ABORT, 'blocked'); END")
+        assert db.upsert_item(_make_item(title="Other", source_url="https://test.com/x")) is False
+
+    def test_upsert_many_falls_back_to_rows_on_error(self, db):
+        db.conn.execute("CREATE TRIGGER no_bad BEFORE INSERT ON legislation "
+                        "WHEN NEW.title = 'bad' BEGIN SELECT RAISE(ABORT, 'blocked'); END")
+        items = [_make_item(title=t, source_url=f"https://test.com/{t}")
+                 for t in ("ok1", "bad", "ok2")]
+
+        assert db.upsert_many(items) == {"inserted": 2, "updated": 0}
+        assert sorted(r["title"] for r in db.query_items(days=0)) == ["ok1", "ok2"]
+
     def test_geography_fields_round_trip(self, db):
         db.upsert_item(_make_item(
             jurisdiction="美国", applicability_scope="single",
@@ -341,6 +369,32 @@ class TestDatabaseUpsert:
         assert len(accepted) == 2
         assert dropped == []
 
+    def test_missing_event_keys_are_backfilled_to_database(self, db):
+        db.upsert_item(_make_item(title="Old record", date="2026-07-01"))
+        db.conn.execute("UPDATE legislation SET event_key = ''")
+        db.conn.commit()
+
+        db.filter_new_events([_make_item(title="New record", date="2026-07-20",
+                                         source_url="https://example.com/new")])
+
+        keys = [r[0] for r in db.conn.execute("SELECT event_key FROM legislation")]
+        assert keys and all(keys)
+
+    def test_indexed_lookup_matches_full_scan(self, db):
+        from tests.fixtures.corpus import load_rows, make_event_rows, seed_titles
+        from tests.fixtures.legacy_event_filter import legacy_filter_new_events, run
+
+        rows = make_event_rows(seed_titles(load_rows()), 160, seed=5)
+        for row in rows[:60]:
+            if row["date"] != "unknown":
+                db.upsert_item(LegislationItem(**row))
+
+        _, *expected = run(legacy_filter_new_events, db, rows[60:])
+        _, *result = run(Database.filter_new_events, db, rows[60:])
+
+        assert result == expected
+        assert expected[1]
+
     def test_old_database_schema_migrates_event_key(self, tmp_path):
         db_path = tmp_path / "legacy.db"
         conn = sqlite3.connect(db_path)
@@ -463,6 +517,83 @@ class TestDatabaseQuery:
         assert titles == {"Start", "End"}
 
 
+class TestDatabaseFullTextSearch:
+
+    def test_keyword_matches_substrings_in_all_text_columns(self, db):
+        db.upsert_item(_make_item(title="New loot-box rules", source_url="https://1.com"))
+        db.upsert_item(_make_item(title="Other", summary_zh="日本消费者厅要求概率公示", source_url="https://2.com"))
+        db.upsert_item(_make_item(title="Unrelated", source_url="https://3.com"))
+
+        assert [r["title"] for r in db.query_items(keyword="LOOT-BOX", days=0)] == ["New loot-box rules"]
+        assert [r["title"] for r in db.query_items(keyword="概率公示", days=0)] == ["Other"]
+
+    def test_ranking_combines_relevance_and_impact(self, db):
+        db.upsert_item(_make_item(title="COPPA update", impact_score=2.0, source_url="https://1.com"))
+        db.upsert_item(_make_item(title="COPPA update", impact_score=9.0, source_url="https://2.com"))
+        db.upsert_item(_make_item(title="Privacy news", summary="mentions COPPA once",
+                                  impact_score=9.0, source_url="https://3.com"))
+
+        rows = db.query_items(keyword="COPPA", days=0)
+        assert [r["source_url"] for r in rows] == ["https://2.com", "https://1.com", "https://3.com"]
+
+    def test_snippet_marks_matched_text(self, db):
+        from models import SNIPPET_CLOSE, SNIPPET_OPEN
+        db.upsert_item(_make_item(title="FTC COPPA enforcement"))
+        row = db.query_items(keyword="coppa", days=0)[0]
+        assert f"{SNIPPET_OPEN}COPPA{SNIPPET_CLOSE}" in row["_snippet"]
+
+    def test_short_keyword_falls_back_to_like(self, db):
+        db.upsert_item(_make_item(title="Gacha", title_zh="开箱新规"))
+        rows = db.query_items(keyword="开箱", days=0)
+        assert len(rows) == 1 and "_snippet" not in rows[0]
+
+    def test_index_follows_updates_and_deletes(self, db):
+        db.upsert_item(_make_item(title_zh="旧译文"))
+        item_id = db.query_items(days=0)[0]["id"]
+        db.update_translation(item_id, "新版概率规则", "")
+
+        assert db.query_items(keyword="旧译文", days=0) == []
+        assert len(db.query_items(keyword="新版概率", days=0)) == 1
+        db.delete_item(item_id)
+        assert db.query_items(keyword="新版概率", days=0) == []
+
+    def test_missing_index_on_current_schema_falls_back_to_like(self, tmp_path):
+        # 迁移只按 user_version 执行：已是最新版本但缺少 FTS 表的库不会重建索引，
+        # 关键词检索退回 LIKE，结果仍然正确
+        path = str(tmp_path / "old.db")
+        database = Database(path)
+        database.upsert_item(_make_item(title="Age rating overhaul"))
+        database.conn.executescript("""
+            DROP TRIGGER legislation_fts_ai;
+            DROP TRIGGER legislation_fts_ad;
+            DROP TRIGGER legislation_fts_au;
+            DROP TABLE legislation_fts;
+        """)
+        database.close()
+
+        reopened = Database(path)
+        try:
+            assert reopened.fts_enabled is False
+            rows = reopened.query_items(keyword="rating overhaul", days=0)
+            assert [r["title"] for r in rows] == ["Age rating overhaul"]
+            assert "_snippet" not in rows[0]
+        finally:
+            reopened.close()
+
+    def test_archive_search(self, db):
+        from datetime import datetime
+        db.upsert_item(_make_item(title="Archived loot box ruling", date="2020-01-01",
+                                  source_url="https://old.com"))
+        db.upsert_item(_make_item(title="Recent loot box ruling",
+                                  date=datetime.now().strftime("%Y-%m-%d"),
+                                  source_url="https://new.com"))
+        db.archive_old_records(keep_days=180)
+
+        assert len(db.query_items(keyword="loot box", days=0)) == 1
+        rows = db.query_items(keyword="loot box", days=0, include_archive=True)
+        assert {r["title"] for r in rows} == {"Archived loot box ruling", "Recent loot box ruling"}
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Database - Stats
 # ═══════════════════════════════════════════════════════════════════════
@@ -497,6 +628,36 @@ class TestDatabaseTranslation:
         assert rows[0]["title_zh"] == "新标题"
         assert rows[0]["summary_zh"] == "新摘要"
 
+    def test_update_translations_is_atomic(self, db):
+        db.upsert_item(_make_item(title="A", title_zh="", source_url="https://1.com"))
+        db.upsert_item(_make_item(title="B", title_zh="", source_url="https://2.com"))
+        ids = [r["id"] for r in db.query_items_untranslated()]
+        db.start_retranslate_queue(ids)
+
+        with pytest.raises(Exception):
+            db.update_translations(
+                [{"item_id": ids[0], "title_zh": "甲", "summary_zh": ""},
+                 {"item_id": ids[1], "title_zh": "乙", "summary_zh": "", "bogus": 1}],
+                done_ids=ids,
+            )
+        assert len(db.query_items_untranslated()) == 2
+        assert db.retranslate_progress()["pending"] == 2
+
+        assert db.update_translations(
+            [{"item_id": ids[0], "title_zh": "甲", "summary_zh": ""}],
+            done_ids=[ids[0]], failed_ids=[ids[1]],
+        ) == 1
+        assert db.retranslate_progress() == {"pending": 0, "done": 1, "failed": 1}
+
+    def test_retranslate_queue_keeps_order_and_skips_deleted(self, db):
+        for i in range(3):
+            db.upsert_item(_make_item(title=f"T{i}", title_zh="", source_url=f"https://{i}.com"))
+        ids = sorted(r["id"] for r in db.query_items_untranslated())
+        db.start_retranslate_queue([ids[2], ids[0], ids[1]])
+        db.delete_item(ids[0])
+        assert [d["id"] for d in db.pending_retranslate_items()] == [ids[2], ids[1]]
+        assert db.retranslate_progress()["pending"] == 2
+
     def test_query_untranslated(self, db):
         db.upsert_item(_make_item(title="Translated", title_zh="有翻译",
                                   source_url="https://1.com"))
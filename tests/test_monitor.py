@@ -1,7 +1,14 @@
-"""Push-rule activation and shadow-mode regression tests."""
+"""Push-rule activation, shadow-mode and retranslate checkpoint regression tests."""
 
+import argparse
 from datetime import date
 
+import pytest
+
+import config
+import llm_dispatch
+import monitor
+from models import Database, LegislationItem
 from monitor import _push_shadow_mode_enabled, _resolve_push_assessment
 
 
@@ -59,3 +66,80 @@ def test_shadow_mode_automatically_expires_after_cutoff(monkeypatch):
     monkeypatch.setenv("MONITOR_SHADOW_UNTIL", "2026-07-31")
     assert _push_shadow_mode_enabled(today=date(2026, 7, 31)) is True
     assert _push_shadow_mode_enabled(today=date(2026, 8, 1)) is False
+
+
+# ── retranslate：检查点续跑与预算 ──────────────────────────────────────
+
+
+def _seed_untranslated(db_path, n):
+    db = Database(db_path)
+    for i in range(n):
+        db.upsert_item(LegislationItem(
+            region="北美", category_l1="数据隐私", category_l2="", title=f"Item {i}",
+            date="2026-03-20", status="立法动态", summary="", source_name="FTC News",
+            source_url=f"https://example.com/{i}", impact_score=float(10 - i),
+        ))
+    db.close()
+
+
+def _fake_batch(seen, fail_on_call=None):
+    def translate(items):
+        seen.append([d["title"] for d in items])
+        llm_dispatch.get_dispatcher().calls += 1
+        if fail_on_call == len(seen):
+            raise KeyboardInterrupt
+        return [{**d, "title_zh": f"[美国] 标题{d['title']}", "summary_zh": "摘要。"} for d in items]
+    return translate
+
+
+@pytest.fixture
+def retranslate_db(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "monitor.db")
+    monkeypatch.setattr(monitor, "Database", lambda: Database(db_path))
+    monkeypatch.setattr(config, "RETRANSLATE_CHUNK_SIZE", 2)
+    _seed_untranslated(db_path, 5)
+    return db_path
+
+
+def _args(**overrides):
+    values = dict(limit=100, budget=None, restart=False, no_llm_cache=False)
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def test_retranslate_resumes_from_checkpoint(retranslate_db, monkeypatch):
+    seen = []
+    monkeypatch.setattr(monitor, "translate_items_batch", _fake_batch(seen, fail_on_call=2))
+    with pytest.raises(KeyboardInterrupt):
+        monitor.cmd_retranslate(_args())
+    db = Database(retranslate_db)
+    assert db.retranslate_progress() == {"pending": 3, "done": 2, "failed": 0}
+    db.close()
+
+    seen.clear()
+    monkeypatch.setattr(monitor, "translate_items_batch", _fake_batch(seen))
+    monitor.cmd_retranslate(_args())
+    assert seen == [["Item 2", "Item 3"], ["Item 4"]]
+    db = Database(retranslate_db)
+    assert db.query_items_untranslated() == []
+    assert db.retranslate_progress() == {"pending": 0, "done": 0, "failed": 0}
+    db.close()
+
+
+def test_retranslate_stops_when_call_budget_is_spent(retranslate_db, monkeypatch):
+    seen = []
+    monkeypatch.setattr(monitor, "translate_items_batch", _fake_batch(seen))
+    monitor.cmd_retranslate(_args(budget=("calls", 2)))
+    assert len(seen) == 2
+    db = Database(retranslate_db)
+    assert db.retranslate_progress()["pending"] == 1
+    assert len(db.query_items_untranslated()) == 1
+    db.close()
+
+
+def test_parse_budget():
+    assert monitor._parse_budget("200") == ("calls", 200.0)
+    assert monitor._parse_budget("50calls") == ("calls", 50.0)
+    assert monitor._parse_budget("30m") == ("minutes", 30.0)
+    with pytest.raises(argparse.ArgumentTypeError):
+        monitor._parse_budget("soon")
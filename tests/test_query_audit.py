@@ -0,0 +1,59 @@
+"""
+query_audit.py 单元测试 — 热点查询均走索引、整表扫描识别
+"""
+import pytest
+
+import query_audit
+from models import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "audit.db"))
+    yield database
+    database.close()
+
+
+def test_hot_queries_avoid_full_scans(db):
+    results = query_audit.audit(db.conn)
+    assert len(results) == len(query_audit.HOT_QUERIES)
+    assert {r["name"]: r["full_scans"] for r in results if r["full_scans"]} == {}
+
+
+def test_index_backed_orderings_need_no_temp_sort(db):
+    results = {r["name"]: r for r in query_audit.audit(db.conn)}
+    for name in ("untranslated", "filter_new_events", "daily_items"):
+        assert not results[name]["temp_sort"], results[name]["plan"]
+
+
+def test_query_items_searches_the_date_window(db):
+    results = {r["name"]: r for r in query_audit.audit(db.conn)}
+    for name in ("query_items", "query_items_range"):
+        plan = results[name]["plan"]
+        assert plan[0].startswith("SEARCH legislation USING INDEX idx_date_"), plan
+        assert "(date>" in plan[0], plan
+
+
+def test_dropped_index_is_reported_as_full_scan(db):
+    db.conn.execute("DROP INDEX idx_source_url")
+    results = {r["name"]: r for r in query_audit.audit(db.conn)}
+    assert results["upsert_existing_keys"]["full_scans"] == ["legislation"]
+
+
+def test_impact_ordered_index_walk_is_reported_as_full_scan(db):
+    db.conn.execute("CREATE INDEX idx_impact ON legislation(impact_score)")   # v5 之前的单列索引
+    results = {r["name"]: r for r in query_audit.audit(db.conn)}
+    assert results["query_items"]["full_scans"] == ["legislation"], results["query_items"]["plan"]
+
+
+def test_full_scans_allows_only_partial_index_walks():
+    plan = [
+        "SCAN legislation USING INDEX idx_untranslated",
+        "SCAN legislation_fts VIRTUAL TABLE INDEX 0:M4",
+        "SCAN q",
+    ]
+    assert query_audit.full_scans(plan, partial={"idx_untranslated"}) == ["q"]
+
+    walk = ["SCAN legislation USING COVERING INDEX sqlite_autoindex_legislation_1"]
+    assert query_audit.full_scans(walk) == ["legislation"]
+    assert query_audit.full_scans(["SCAN legislation USING INDEX idx_impact"]) == ["legislation"]
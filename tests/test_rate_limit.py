@@ -0,0 +1,97 @@
+"""
+rate_limit.py 单元测试 — 按域名令牌桶
+"""
+
+import pytest
+
+import rate_limit
+from rate_limit import HostRateLimiter, host_of, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limit.time, "sleep", fake.sleep)
+    return fake
+
+
+def _limiter():
+    return HostRateLimiter(
+        limits={"news.google.com": {"rate": 0.5, "burst": 1, "max_rate": 1.0, "min_rate": 0.1}},
+        default={"rate": 2.0, "burst": 2, "max_rate": 2.0, "min_rate": 0.5},
+    )
+
+
+def test_same_host_is_spaced_by_rate(clock):
+    limiter = _limiter()
+    waits = [limiter.acquire("https://news.google.com/rss?q=x") for _ in range(3)]
+    assert waits == [0.0, pytest.approx(2.0), pytest.approx(2.0)]
+
+
+def test_different_hosts_do_not_wait_for_each_other(clock):
+    limiter = _limiter()
+    limiter.acquire("https://news.google.com/rss?q=a")
+    assert limiter.acquire("https://www.ftc.gov/feed.xml") == 0.0
+    assert limiter.acquire("https://www.oaic.gov.au/rss") == 0.0
+
+
+def test_burst_allows_back_to_back_requests(clock):
+    limiter = _limiter()
+    assert limiter.acquire("https://a.example/1") == 0.0
+    assert limiter.acquire("https://a.example/2") == 0.0
+    assert limiter.acquire("https://a.example/3") == pytest.approx(0.5)
+
+
+def test_stop_event_interrupts_the_wait(clock):
+    import threading
+    limiter = _limiter()
+    stop = threading.Event()
+    stop.set()
+    limiter.acquire("https://news.google.com/rss?q=x")
+    assert limiter.acquire("https://news.google.com/rss?q=x", stop=stop) == pytest.approx(2.0)
+    assert clock.sleeps == []
+
+
+def test_retry_after_pauses_host_and_slows_rate(clock):
+    limiter = _limiter()
+    url = "https://news.google.com/rss?q=x"
+    limiter.acquire(url)
+    limiter.feedback(url, 429, "7")
+    assert limiter.stats()["news.google.com"]["rate"] == 0.25
+    assert limiter.acquire(url) == pytest.approx(7.0)
+    assert limiter.acquire(url) == pytest.approx(4.0)
+
+
+def test_healthy_host_speeds_up_to_max_rate(clock):
+    limiter = _limiter()
+    url = "https://news.google.com/rss?q=x"
+    for _ in range(40):
+        limiter.feedback(url, 200)
+    assert limiter.stats()["news.google.com"]["rate"] == 1.0
+
+
+def test_subdomain_inherits_parent_limit():
+    limiter = HostRateLimiter(limits={"gov.uk": {"rate": 0.2}}, default={"rate": 5.0})
+    limiter.acquire("https://www.gov.uk/search")
+    assert limiter.stats()["www.gov.uk"]["rate"] == 0.2
+
+
+def test_helpers():
+    assert host_of("https://News.Google.com/rss") == "news.google.com"
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("Wed, 21 Oct 2026 07:28:00 GMT") is None
+    assert parse_retry_after(None) is None
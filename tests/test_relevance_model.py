@@ -0,0 +1,197 @@
+"""
+relevance_model.py 单元测试 — 哈希特征、训练与召回护栏、运行时预筛路由
+"""
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import relevance_model
+import translator
+from classifier import normalize_push_assessment_v2
+from models import Database, LegislationItem
+from relevance_model import RelevanceModel, RelevancePrefilter, label_for, recall_threshold
+
+_VALUABLE = [
+    "FTC fines {0} over loot box disclosures",
+    "Regulator bans paid random items in {0} under new law",
+    "{0} settles child privacy lawsuit and must change age verification",
+    "Parliament passes bill requiring probability disclosure for {0}",
+]
+_NOISE = [
+    "{0} stock rises after quarterly earnings beat",
+    "Football club signs {0} sponsorship deal",
+    "{0} patch notes add new season skins",
+    "Best {0} builds for the weekend tournament",
+]
+_NAMES = ["Roblox", "Genshin", "Fortnite", "Valorant", "Minecraft", "Tarkov"]
+
+
+def _synthetic(n, seed=7):
+    rng = random.Random(seed)
+    items, labels = [], []
+    for i in range(n):
+        positive = rng.random() < 0.35
+        template = rng.choice(_VALUABLE if positive else _NOISE)
+        items.append({
+            "title": template.format(rng.choice(_NAMES)),
+            "summary": "",
+            "source_name": "Game News",
+            "lang": "en",
+            "date": f"2026-{1 + i * 12 // n:02d}-01",
+        })
+        labels.append(int(positive))
+    return items, labels
+
+
+@pytest.fixture(scope="module")
+def trained():
+    items, labels = _synthetic(400)
+    return relevance_model.train(items, labels, min_recall=0.98, min_samples=100)
+
+
+class TestFeaturesAndLabels:
+
+    def test_feature_terms_cover_words_pairs_and_cjk_bigrams(self):
+        terms = relevance_model.feature_terms(
+            {"title": "Loot box 规制法案", "source_name": "FTC", "lang": "ja"}
+        )
+        assert {"w:loot", "b:loot box", "c:规制", "c:法案", "src:ftc", "lang:ja"} <= set(terms)
+
+    def test_labels_ignore_fallback_and_model_decisions(self):
+        assert label_for({"decision_source": "llm", "value_score": 2}) == 1
+        assert label_for({"decision_source": "rule", "value_score": 0}) == 0
+        assert label_for({"decision_source": "fallback", "value_score": 0}) is None
+        assert label_for({"decision_source": "model", "value_score": 0}) is None
+
+    def test_load_examples_prefers_human_labels(self, tmp_path):
+        db = Database(str(tmp_path / "m.db"))
+        try:
+            for i, source in enumerate(("llm", "fallback")):
+                db.upsert_item(LegislationItem(
+                    region="北美", category_l1="数据隐私", category_l2="", title=f"T{i}",
+                    date="2026-03-20", status="立法动态", summary="", source_name="FTC",
+                    source_url=f"https://example.com/{i}", decision_source=source,
+                ))
+            items, labels = relevance_model.load_examples(db.conn, {"https://example.com/1": 1})
+        finally:
+            db.close()
+        assert [d["title"] for d in items] == ["T0", "T1"]
+        assert labels == [0, 1]
+
+
+class TestTraining:
+
+    def test_recall_threshold_allows_bounded_misses(self):
+        probs = np.linspace(0.05, 0.95, 100)
+        t = recall_threshold(probs, 0.98)
+        assert (probs < t).sum() == 2
+
+    def test_training_meets_recall_guardrail(self, trained):
+        model, report = trained
+        assert model.meta["calibration"]["recall"] >= 0.98      # 阈值在校准集上选定
+        assert report["recall"] >= 0.9                          # 测试集上如实测量，不保证达到护栏
+        assert report["negatives_skipped"] > 0.5
+        assert model.meta["test"] == report
+
+    def test_recall_is_reported_on_rows_unused_for_fit_and_threshold(self, trained):
+        model, report = trained
+        items, _ = _synthetic(400)
+        assert model.meta["train_samples"] == 240
+        assert model.meta["calibration"]["samples"] == 80
+        assert report["samples"] == 80
+        assert model.meta["calibrated_through"] == items[319]["date"]
+
+    def test_refuses_without_enough_test_positives(self, monkeypatch):
+        items, labels = _synthetic(400)
+        labels = labels[:320] + [0] * 80           # 测试集没有正样本
+        with pytest.raises(ValueError, match="测试集"):
+            relevance_model.train(items, labels, min_samples=100)
+
+    def test_save_and_load_round_trip(self, trained, tmp_path):
+        model, _ = trained
+        path = str(tmp_path / "m.npz")
+        model.save(path)
+        loaded = RelevanceModel.load(path)
+        items, _ = _synthetic(20, seed=3)
+        assert np.allclose(loaded.predict(items), model.predict(items))
+        assert loaded.threshold == model.threshold
+
+    def test_refuses_without_enough_samples(self):
+        items, labels = _synthetic(50)
+        with pytest.raises(ValueError):
+            relevance_model.train(items, labels, min_samples=100)
+
+
+def _install(monkeypatch, model, mode):
+    prefilter = RelevancePrefilter(model, mode)
+    monkeypatch.setattr(relevance_model, "_prefilter", prefilter)
+    monkeypatch.setattr(relevance_model, "_prefilter_loaded", True)
+    return prefilter
+
+
+def _fake_llm(monkeypatch, sent):
+    monkeypatch.setattr(translator, "_HAS_AI", True)
+    monkeypatch.setattr(translator, "_check_ai_reachable", lambda: True)
+    monkeypatch.setattr(translator, "_HAS_TRANSLATOR", False)
+
+    def fake_batch(batch):
+        sent.extend(d["title"] for d in batch)
+        return [{
+            "is_relevant": True, "title_zh": f"[美国] {d['title']}",
+            "summary_zh": "FTC 对该公司处以罚款并要求整改开箱概率公示。", "region": "美国",
+            "push_decision": "push", "value_score": 3, "noise_reason": "高价值监管动态",
+        } for d in batch]
+
+    monkeypatch.setattr(translator, "_ai_process_batch", fake_batch)
+
+
+_ITEMS = [
+    {"title": "Football club signs Roblox sponsorship deal", "source_name": "Game News"},
+    {"title": "FTC fines Roblox over loot box disclosures", "source_name": "Game News"},
+    {"title": "Roblox stock rises after quarterly earnings beat", "source_name": "FTC"},
+]
+
+
+class TestRuntimePrefilter:
+
+    def test_missing_model_disables_prefilter(self):
+        assert relevance_model.get_prefilter() is None
+
+    def test_active_mode_skips_llm_for_flagged_items(self, trained, monkeypatch):
+        model, _ = trained
+        prefilter = _install(monkeypatch, model, "active")
+        sent = []
+        _fake_llm(monkeypatch, sent)
+        monkeypatch.setattr(
+            "classifier.get_source_tier", lambda name: "official" if name == "FTC" else "news"
+        )
+
+        results = translator.translate_items_batch([dict(d) for d in _ITEMS], batch_size=5)
+
+        assert sent == [_ITEMS[1]["title"], _ITEMS[2]["title"]]   # official 信源豁免
+        assert results[0]["_llm_decision_source"] == "model"
+        assert results[0]["_llm_noise_reason"] == "模型预筛"
+        assert results[1]["_llm_decision_source"] == "llm"
+        assert prefilter.stats["skipped"] == 1 and prefilter.stats["exempt"] == 1
+
+    def test_shadow_mode_sends_everything_and_counts_misses(self, trained, monkeypatch):
+        model, _ = trained
+        prefilter = _install(monkeypatch, model, "shadow")
+        sent = []
+        _fake_llm(monkeypatch, sent)
+
+        translator.translate_items_batch([dict(d) for d in _ITEMS], batch_size=5)
+
+        assert len(sent) == 3
+        assert prefilter.stats["skipped"] == 0
+        assert prefilter.stats["exempt"] == 1          # FTC 为 official 信源
+        assert prefilter.stats["shadow_checked"] == 1
+        assert prefilter.stats["shadow_missed"] == 1   # 假 LLM 对所有条目都给出高价值
+
+    def test_model_decision_source_survives_push_gate(self):
+        assert normalize_push_assessment_v2(
+            decision_source="model", noise_reason="模型预筛",
+            raw_title="Roblox stock rises", is_relevant=None,
+        ) == ("pool_only", 0, "模型预筛", "model")
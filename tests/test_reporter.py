@@ -129,6 +129,18 @@ def test_event_fingerprint_keeps_different_company_lawsuits_when_llm_rejects(mon
     assert result == [first, second]
 
 
+def test_indexed_dedup_matches_pairwise_reference():
+    from tests.fixtures.corpus import load_rows, make_items, seed_titles
+    from tests.fixtures.legacy_dedup import legacy_deduplicate_items, run
+
+    rows = make_items(seed_titles(load_rows()), 600, seed=11)
+    _, kept = run(monitor._deduplicate_items, rows)
+    _, expected = run(legacy_deduplicate_items, rows)
+
+    assert kept == expected
+    assert len(kept) < len(rows)
+
+
 def test_cmd_run_propagates_fetch_failure(monkeypatch):
     state = {"logged": None, "closed": False}
 
@@ -0,0 +1,56 @@
+"""
+sqlite_conn.py 单元测试 — 统一 PRAGMA、只读连接与 WAL 下读写并发
+"""
+import sqlite3
+
+import pytest
+
+import sqlite_conn
+from config import SQLITE_BUSY_TIMEOUT_MS
+from models import Database
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "monitor.db"
+    Database(str(path)).close()
+    return path
+
+
+def test_writer_connection_applies_pragmas(db_path):
+    conn = sqlite_conn.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1          # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2           # MEMORY
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == SQLITE_BUSY_TIMEOUT_MS
+    finally:
+        conn.close()
+
+
+def test_readonly_connection_rejects_writes(db_path):
+    conn = sqlite_conn.connect(db_path, readonly=True)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM legislation").fetchone()[0] == 0
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM legislation")
+    finally:
+        conn.close()
+
+
+def test_reader_is_not_blocked_by_open_write_transaction(db_path):
+    writer = sqlite_conn.connect(db_path)
+    reader = sqlite_conn.connect(db_path, readonly=True)
+    try:
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute(
+            "INSERT INTO legislation (region, category_l1, title, date) "
+            "VALUES ('北美', '数据隐私', 'pending', '2026-03-20')"
+        )
+        # 写事务未提交时读者看到的是提交前的快照，而不是等待写锁
+        assert reader.execute("SELECT COUNT(*) FROM legislation").fetchone()[0] == 0
+        writer.commit()
+        assert reader.execute("SELECT COUNT(*) FROM legislation").fetchone()[0] == 1
+    finally:
+        reader.close()
+        writer.close()
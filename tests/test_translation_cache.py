@@ -0,0 +1,141 @@
+"""
+translation_cache.py / translator Google Translate 回退批量翻译单元测试
+"""
+import time
+
+import pytest
+
+import translation_cache
+import translator
+from translation_cache import TranslationCache, translation_key
+
+
+class FakeGoogle:
+    """替换 deep_translator.GoogleTranslator：逐行加前缀，记录每次请求的原文。"""
+    requests = []
+    drop_line = False
+
+    def __init__(self, source="auto", target="zh-CN"):
+        self.source = source
+
+    def translate(self, text):
+        FakeGoogle.requests.append(text)
+        lines = [f"译:{line}" for line in text.split("\n")]
+        if FakeGoogle.drop_line and len(lines) > 1:
+            lines = lines[:-1]
+        return "\n".join(lines)
+
+
+@pytest.fixture
+def google(monkeypatch):
+    FakeGoogle.requests = []
+    FakeGoogle.drop_line = False
+    monkeypatch.setattr(translator, "_HAS_TRANSLATOR", True)
+    monkeypatch.setattr(translator, "GoogleTranslator", FakeGoogle, raising=False)
+    return FakeGoogle
+
+
+class TestTranslationCache:
+
+    def test_key_uses_full_text_and_language(self):
+        prefix = "x" * 500
+        assert translation_key(prefix + "a") != translation_key(prefix + "b")
+        assert translation_key("hello", "en") != translation_key("hello", "auto")
+
+    def test_put_get_many_and_stats(self, tmp_path):
+        cache = TranslationCache(str(tmp_path / "t.db"))
+        try:
+            cache.put_many({"hello": "你好", "bye": "再见"})
+            assert cache.get_many(["hello", "bye", "other"]) == {"hello": "你好", "bye": "再见"}
+            assert cache.get("hello", "en") is None
+            assert cache.stats() == {"hit": 2, "miss": 2}
+        finally:
+            cache.close()
+
+    def test_expired_and_excess_entries_are_evicted(self, tmp_path):
+        cache = TranslationCache(str(tmp_path / "t.db"), ttl_days=1, max_entries=2)
+        try:
+            cache.put_many({"a": "甲", "b": "乙", "c": "丙", "old": "旧"})
+            cache.conn.execute(
+                "UPDATE translation_cache SET created_at = datetime('now', '-2 days') WHERE key = ?",
+                (translation_key("old"),),
+            )
+            cache.conn.execute(
+                "UPDATE translation_cache SET last_used_at = datetime('now', '-1 hour') WHERE key = ?",
+                (translation_key("a"),),
+            )
+            cache.conn.commit()
+            assert cache.evict() == 2
+            assert cache.get_many(["a", "b", "c"]) == {"b": "乙", "c": "丙"}
+        finally:
+            cache.close()
+
+
+    def test_ttl_is_measured_in_utc(self, tmp_path, monkeypatch):
+        # 时间戳由 SQLite 以 UTC 写入；本地时区为 UTC+8 时 23 小时前写入的条目仍在 1 天 TTL 内
+        monkeypatch.setenv("TZ", "Asia/Shanghai")
+        time.tzset()
+        cache = TranslationCache(str(tmp_path / "t.db"), ttl_days=1)
+        try:
+            cache.put("hello", "你好")
+            cache.conn.execute("UPDATE translation_cache SET created_at = datetime('now', '-23 hours')")
+            cache.conn.commit()
+            assert cache.evict() == 0
+            assert cache.get("hello") == "你好"
+        finally:
+            cache.close()
+            monkeypatch.delenv("TZ")
+            time.tzset()
+
+
+    def test_open_failure_is_attempted_once(self, monkeypatch):
+        attempts = []
+
+        def broken(path):
+            attempts.append(path)
+            raise translation_cache.sqlite3.OperationalError("unable to open database file")
+
+        monkeypatch.setattr(translation_cache, "TranslationCache", broken)
+        assert translation_cache.get_translation_cache() is None
+        assert translation_cache.get_translation_cache() is None
+        assert len(attempts) == 1
+
+
+class TestTranslateBatch:
+
+    def test_single_line_texts_share_one_request(self, google):
+        result = translator.translate_batch_to_zh(["Loot box ban", "已是中文标题内容", "", "FTC fine"])
+        assert result == ["译:Loot box ban", "已是中文标题内容", "", "译:FTC fine"]
+        assert google.requests == ["Loot box ban\nFTC fine"]
+
+    def test_line_count_mismatch_falls_back_to_single_requests(self, google):
+        google.drop_line = True
+        result = translator.translate_batch_to_zh(["Loot box ban", "FTC fine"])
+        assert result == ["译:Loot box ban", "译:FTC fine"]
+        assert google.requests[1:] == ["Loot box ban", "FTC fine"]
+
+    def test_multiline_text_is_translated_alone(self, google):
+        translator.translate_batch_to_zh(["line one\nline two", "title"])
+        assert sorted(google.requests) == ["line one\nline two", "title"]
+
+    def test_cache_hit_skips_request(self, google):
+        assert translator.translate_to_zh("Age rating update") == "译:Age rating update"
+        assert translator.translate_to_zh("Age rating update") == "译:Age rating update"
+        assert len(google.requests) == 1
+        assert translation_cache.get_translation_cache().stats() == {"hit": 1, "miss": 1}
+
+    def test_failures_return_original_and_are_not_cached(self, google, monkeypatch):
+        def boom(self, text):
+            raise ConnectionError("blocked")
+
+        monkeypatch.setattr(FakeGoogle, "translate", boom)
+        assert translator.translate_batch_to_zh(["A", "B"]) == ["A", "B"]
+        assert translation_cache.get_translation_cache().get_many(["A", "B"]) == {}
+
+    def test_fallback_path_prefetches_in_one_request(self, google, monkeypatch):
+        monkeypatch.setattr(translator, "_HAS_AI", False)
+        items = [{"title": "Loot box ban", "summary": "Regulator bans loot boxes."},
+                 {"title": "FTC fine", "summary": "FTC fines a publisher."}]
+        results = translator.translate_items_batch(items)
+        assert [r["title_zh"] for r in results] == ["译:Loot box ban", "译:FTC fine"]
+        assert len(google.requests) == 1
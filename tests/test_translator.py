@@ -348,3 +348,174 @@ class TestValidSets:
 
     def test_term_corrections_not_empty(self):
         assert len(_TERM_CORRECTIONS) > 10
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# 批量返回容错解析
+# ═══════════════════════════════════════════════════════════════════════
+
+def _batch_obj(index, title="标题"):
+    return (
+        f'{{"index": {index}, "is_relevant": true, "title_zh": "[美国] {title}{index}", '
+        f'"summary_zh": "FTC 对第 {index} 案处以罚款。"}}'
+    )
+
+
+class TestBatchSalvage:
+
+    def test_truncated_array_keeps_complete_objects(self):
+        text = f"[{_batch_obj(1)}, {_batch_obj(2)}, {{\"index\": 3, \"title_zh\": \"[美国] 截"
+        objects = translator._parse_batch_objects(text)
+        assert [o["index"] for o in objects] == [1, 2]
+
+    def test_braces_inside_strings_do_not_split_objects(self):
+        objects = translator._parse_batch_objects('[{"summary_zh": "条款 {a} 与 \\"}\\" 无关", "index": 1}]')
+        assert objects == [{"summary_zh": '条款 {a} 与 "}" 无关', "index": 1}]
+
+    def test_match_by_index_and_echoed_title(self):
+        items = [{"title": "A"}, {"title": "B"}, {"title": "C"}]
+        objects = [{"index": 3, "x": 3}, {"title": "a", "x": 1}]
+        assert translator._match_batch_objects(objects, items) == [{"title": "a", "x": 1}, None, {"index": 3, "x": 3}]
+
+    def test_positional_fallback_only_when_counts_match(self):
+        items = [{"title": "A"}, {"title": "B"}]
+        assert translator._match_batch_objects([{"x": 1}, {"x": 2}], items) == [{"x": 1}, {"x": 2}]
+        assert translator._match_batch_objects([{"x": 1}], items) == [None, None]
+
+    def test_missing_items_are_requeued_as_smaller_batch(self, monkeypatch):
+        requests = []
+        replies = iter([
+            f"[{_batch_obj(1)}, {_batch_obj(3)}]",   # 第 2 条缺失
+            f"[{_batch_obj(1, '补')}]",               # 重新请求只含 1 条
+        ])
+
+        class FakeCompletions:
+            def create(self, **kwargs):
+                requests.append(kwargs["messages"][1]["content"])
+                content = next(replies)
+                return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+        monkeypatch.setattr(translator, "_HAS_AI", True)
+        monkeypatch.setattr(
+            translator, "_AI_CLIENT", SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+        )
+        before = translator.batch_counters()
+        items = [{"title": "first"}, {"title": "second"}, {"title": "third"}]
+        results = translator._ai_process_batch(items)
+
+        assert [r["title_zh"] for r in results] == ["[美国] 标题1", "[美国] 补1", "[美国] 标题3"]
+        assert len(requests) == 2
+        assert "second" in requests[1] and "first" not in requests[1]
+        after = translator.batch_counters()
+        assert after["salvaged"] - before["salvaged"] == 2
+        assert after["requeued"] - before["requeued"] == 1
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# 自适应批大小
+# ═══════════════════════════════════════════════════════════════════════
+
+class TestBatchSizer:
+
+    def test_short_headlines_fill_up_to_limit(self):
+        sizer = translator._BatchSizer(initial=8, max_size=10, token_budget=10000)
+        items = [{"title": f"FTC fines studio {i}"} for i in range(20)]
+        assert len(sizer.take(items, 0)) == 8
+        assert sizer.take(items, 18) == items[18:]
+
+    def test_long_articles_are_capped_by_token_budget(self):
+        sizer = translator._BatchSizer(initial=10, max_size=10, token_budget=10000)
+        items = [{"title": "t", "summary": "x" * 2000} for _ in range(10)]
+        batch = sizer.take(items, 0)
+        assert 1 <= len(batch) < 10
+        available = 10000 - translator._estimate_tokens(translator._AI_SYSTEM)
+        assert sum(sizer.item_tokens(d) for d in batch) <= available
+
+    def test_oversized_single_item_still_forms_a_batch(self):
+        sizer = translator._BatchSizer(initial=3, token_budget=100)
+        assert len(sizer.take([{"summary": "x" * 5000}, {"title": "b"}], 0)) == 1
+
+    def test_grows_on_success_and_halves_on_truncation(self):
+        sizer = translator._BatchSizer(initial=4, max_size=6)
+        sizer.record(4, 4, 1000)
+        sizer.record(4, 4, 1000)
+        assert sizer.limit == 5
+        sizer.record(5, 2, 1000)
+        assert sizer.limit == 2
+        assert sizer.calls == 3 and sizer.items == 13
+
+    def test_adaptive_batches_follow_parse_feedback(self, monkeypatch):
+        monkeypatch.setattr(translator, "_HAS_AI", True)
+        monkeypatch.setattr(translator, "_check_ai_reachable", lambda: True)
+        monkeypatch.setattr(translator, "translate_item_fields", lambda item: item)
+        monkeypatch.setattr(translator, "_batch_sizer", translator._BatchSizer(initial=4, max_size=8))
+        sizes = []
+
+        def truncating_batch(batch):
+            sizes.append(len(batch))
+            translator._batch_sizer.record(len(batch), len(batch) // 2, 0)
+            return [None] * len(batch)
+
+        monkeypatch.setattr(translator, "_ai_process_batch", truncating_batch)
+        translator.translate_items_batch([{"title": str(i)} for i in range(40)])
+        assert sizes[0] == 4
+        assert sizes[-1] == 1
+        assert sum(sizes) == 40
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# LLM 前聚类
+# ═══════════════════════════════════════════════════════════════════════
+
+class TestLLMClusters:
+
+    def _items(self):
+        return [
+            {"title": "FTC fines Genshin Impact publisher over loot box disclosures",
+             "source_url": "https://www.ftc.gov/news/hoyoverse?utm_source=rss"},
+            {"title": "Press release", "source_url": "https://ftc.gov/news/hoyoverse/"},
+            {"title": "FTC fines Genshin Impact publisher over loot box disclosures - Reuters",
+             "source_url": "https://reuters.com/a"},
+            {"title": "EU adopts Digital Fairness Act guidance for in-game currencies",
+             "source_url": "https://ec.europa.eu/b"},
+            {"title": "Press release", "source_url": "https://ec.europa.eu/c"},
+        ]
+
+    def test_url_and_near_duplicate_titles_share_representative(self):
+        assert translator._llm_clusters(self._items()) == [0, 0, 0, 3, 4]
+
+    def test_only_representatives_reach_llm(self, monkeypatch):
+        monkeypatch.setattr(translator, "_HAS_AI", True)
+        monkeypatch.setattr(translator, "_check_ai_reachable", lambda: True)
+        monkeypatch.setattr(translator, "translate_to_zh", lambda text, source_lang="auto": f"译:{text}")
+        sent = []
+
+        def fake_batch(batch):
+            sent.extend(d["title"] for d in batch)
+            return [
+                {
+                    "is_relevant": True,
+                    "title_zh": f"[美国] 中文{len(sent)}",
+                    "summary_zh": "FTC 就开箱概率披露处罚米哈游并要求整改退款。",
+                    "region": "美国",
+                    "category_l1": "消费者保护",
+                    "push_decision": "push",
+                    "value_score": 3,
+                }
+                for d in batch
+            ]
+
+        monkeypatch.setattr(translator, "_ai_process_batch", fake_batch)
+        items = self._items()
+        items[2]["title"] = "FTC Fines Genshin Impact Publisher Over Loot Box Disclosures"
+        results = translator.translate_items_batch(items, batch_size=5)
+
+        assert len(sent) == 3
+        assert len(results) == 5
+        rep, same_url, reprint = results[0], results[1], results[2]
+        for member in (same_url, reprint):
+            assert member["_llm_category_l1"] == rep["_llm_category_l1"] == "消费者保护"
+            assert member["_llm_push_decision"] == "push"
+            assert member["summary_zh"] == rep["summary_zh"]
+        assert reprint["title_zh"] == rep["title_zh"]          # 归一化标题相同，直接复用
+        assert same_url["title_zh"] == "[美国] 译:Press release"  # 标题不同，单独翻译
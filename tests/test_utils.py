@@ -1,11 +1,12 @@
 """
 utils.py 单元测试
-覆盖：区域分组映射、bigram 相似度、状态标签归一化、去重选择
+覆盖：区域分组映射、bigram 相似度与候选索引、状态标签归一化、去重选择
 """
 import pytest
 from datetime import date
 
 from utils import (
+    canonical_url,
     _REGION_GROUP_MAP,
     _GROUP_ORDER,
     _GROUP_EMOJI,
@@ -13,6 +14,10 @@ from utils import (
     previous_full_week_range,
     normalize_status,
     _bigram_sim,
+    _bigram_set,
+    _bigram_jaccard,
+    BigramIndex,
+    bigram_rank_order,
     _impact_emoji,
     _pick_group_items,
     CAT_EMOJI,
@@ -186,6 +191,48 @@ class TestBigramSim:
         assert _bigram_sim(None, "test") == 0.0
 
 
+class TestBigramIndex:
+
+    @staticmethod
+    def _corpus():
+        import random
+        rng = random.Random(3)
+        words = ["ftc", "loot", "box", "fine", "游戏", "未成年", "法案", "生效", "eu", "dsa"]
+        titles = [" ".join(rng.choice(words) for _ in range(rng.randint(1, 6))) for _ in range(300)]
+        return [_bigram_set(t) for t in titles]
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.55, 0.8])
+    def test_candidates_cover_all_pairs_above_threshold(self, threshold):
+        sets = self._corpus()
+        index = BigramIndex(threshold, bigram_rank_order(sets))
+        for k, bg in enumerate(sets):
+            index.add(k, bg)
+        for i, bg in enumerate(sets):
+            found = index.candidates(bg)
+            expected = {j for j, other in enumerate(sets) if _bigram_jaccard(bg, other) >= threshold}
+            assert expected <= found
+
+    def test_ascending_self_join_finds_every_pair(self):
+        sets = self._corpus()
+        index = BigramIndex(0.5, bigram_rank_order(sets))
+        found = set()
+        for i in sorted(range(len(sets)), key=lambda k: len(sets[k])):
+            found |= {frozenset((i, j)) for j in index.candidates(sets[i])}
+            index.add(i, sets[i], ascending=True)
+        expected = {
+            frozenset((i, j)) for i in range(len(sets)) for j in range(i)
+            if _bigram_jaccard(sets[i], sets[j]) >= 0.5
+        }
+        assert expected <= found
+
+    def test_blocks_and_unseen_tokens(self):
+        index = BigramIndex(0.5)
+        index.add("us", _bigram_set("FTC fines publisher"), block="北美")
+        index.add("uk", _bigram_set("FTC fines publisher"), block="欧洲")
+        assert index.candidates(_bigram_set("FTC fines publisher!"), ["北美"]) == {"us"}
+        assert index.candidates(frozenset()) == set()
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Impact Emoji
 # ═══════════════════════════════════════════════════════════════════════
@@ -263,3 +310,25 @@ class TestConstants:
                     "消费者保护", "经营合规", "平台政策", "内容监管", "PC & 跨平台合规"]
         for cat in expected:
             assert cat in CAT_EMOJI, f"'{cat}' 缺少 emoji 映射"
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# URL 规范化
+# ═══════════════════════════════════════════════════════════════════════
+
+class TestCanonicalUrl:
+
+    def test_tracking_params_scheme_and_www_ignored(self):
+        a = "https://www.example.com/news/ftc-fine/?utm_source=rss&utm_medium=feed#top"
+        b = "http://example.com/news/ftc-fine"
+        assert canonical_url(a) == canonical_url(b) == "example.com/news/ftc-fine"
+
+    def test_amp_and_mobile_variants(self):
+        assert canonical_url("https://m.example.com/a/b/amp/") == "example.com/a/b"
+
+    def test_meaningful_query_kept_and_sorted(self):
+        assert canonical_url("https://x.org/view?id=2&lang=en&fbclid=abc") == "x.org/view?id=2&lang=en"
+        assert canonical_url("https://x.org/view?lang=en&id=2") == "x.org/view?id=2&lang=en"
+
+    def test_empty(self):
+        assert canonical_url("") == ""
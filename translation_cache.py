@@ -0,0 +1,169 @@
+"""
+Google Translate 回退路径的持久化翻译缓存
+
+LLM 不可用的日子里，所有条目都走 Google Translate，而同一批标题/摘要每次运行都会
+被重新翻译。本模块把（源语言, 全文 SHA-256）映射到译文：
+  - 键使用全文摘要，前缀相同而正文不同的文本不会串用译文
+  - 写入超过 TTL 的条目失效；条目数超过上限时按最近使用时间淘汰
+  - 进程内统计命中/未命中，运行结束时输出汇总
+
+缓存存放在 data/translation_cache.db（与 monitor.db 同目录）。
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Optional
+
+from config import (
+    TRANSLATION_CACHE_PATH, TRANSLATION_CACHE_TTL_DAYS, TRANSLATION_CACHE_MAX_ENTRIES,
+)
+import sqlite_conn
+
+logger = logging.getLogger(__name__)
+
+
+def translation_key(text: str, source_lang: str = "auto") -> str:
+    return hashlib.sha256(f"{source_lang}\x1f{text}".encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    """（源语言, 原文）→ 中文译文 的持久化 LRU 缓存。"""
+
+    def __init__(self, db_path: str = TRANSLATION_CACHE_PATH,
+                 ttl_days: float = TRANSLATION_CACHE_TTL_DAYS,
+                 max_entries: int = TRANSLATION_CACHE_MAX_ENTRIES):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self.ttl_days = ttl_days
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.conn = sqlite_conn.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS translation_cache (
+                key TEXT PRIMARY KEY,
+                source_lang TEXT DEFAULT 'auto',
+                translation TEXT NOT NULL,
+                created_at TEXT DEFAULT (datetime('now')),
+                last_used_at TEXT DEFAULT (datetime('now'))
+            )
+        """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_translation_cache_last_used "
+            "ON translation_cache(last_used_at)"
+        )
+        self.evict()
+        self._stats = {"hit": 0, "miss": 0}
+
+    def _ttl_modifier(self) -> str:
+        """datetime('now', ?) 的修饰符；时间戳均由 SQLite 以 UTC 写入，截止时间也在 SQL 中计算。"""
+        return f"-{self.ttl_days} days"
+
+    def get_many(self, texts: Iterable[str], source_lang: str = "auto") -> Dict[str, str]:
+        """批量查询，返回 原文 → 译文（只含命中的条目），并刷新命中条目的最近使用时间。"""
+        keys = {translation_key(t, source_lang): t for t in texts}
+        if not keys:
+            return {}
+        found: Dict[str, str] = {}
+        with self._lock:
+            key_list = list(keys)
+            for start in range(0, len(key_list), 500):
+                chunk = key_list[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT key, translation FROM translation_cache "
+                    f"WHERE key IN ({marks}) AND created_at >= datetime('now', ?)",
+                    (*chunk, self._ttl_modifier()),
+                ).fetchall()
+                for key, translation in rows:
+                    found[keys[key]] = translation
+                if rows:
+                    self.conn.executemany(
+                        "UPDATE translation_cache SET last_used_at = datetime('now') WHERE key = ?",
+                        [(key,) for key, _ in rows],
+                    )
+            self.conn.commit()
+            self._stats["hit"] += len(found)
+            self._stats["miss"] += len(keys) - len(found)
+        return found
+
+    def get(self, text: str, source_lang: str = "auto") -> Optional[str]:
+        return self.get_many([text], source_lang).get(text)
+
+    def put_many(self, translations: Dict[str, str], source_lang: str = "auto") -> None:
+        rows = [
+            (translation_key(text, source_lang), source_lang, translation)
+            for text, translation in translations.items() if translation
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self.conn.executemany("""
+                INSERT INTO translation_cache (key, source_lang, translation, created_at, last_used_at)
+                VALUES (?, ?, ?, datetime('now'), datetime('now'))
+                ON CONFLICT(key) DO UPDATE SET
+                    translation = excluded.translation,
+                    created_at = excluded.created_at,
+                    last_used_at = excluded.last_used_at
+            """, rows)
+            self.conn.commit()
+
+    def put(self, text: str, translation: str, source_lang: str = "auto") -> None:
+        self.put_many({text: translation}, source_lang)
+
+    def evict(self) -> int:
+        """删除过期条目，并按最近使用时间裁剪到 max_entries 条；返回删除条数。"""
+        with self._lock:
+            removed = self.conn.execute(
+                "DELETE FROM translation_cache WHERE created_at < datetime('now', ?)",
+                (self._ttl_modifier(),),
+            ).rowcount
+            removed += self.conn.execute("""
+                DELETE FROM translation_cache WHERE key IN (
+                    SELECT key FROM translation_cache ORDER BY last_used_at DESC, rowid DESC
+                    LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,)).rowcount
+            self.conn.commit()
+        if removed:
+            logger.info(f"[翻译缓存] 清理过期/超额条目 {removed} 条")
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def log_summary(self) -> None:
+        stats = self.stats()
+        total = stats["hit"] + stats["miss"]
+        if total:
+            logger.info(f"[翻译缓存] 命中 {stats['hit']}/{total} ({stats['hit'] / total:.0%})")
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+_translation_cache: Optional[TranslationCache] = None
+_translation_cache_failed = False
+_translation_cache_lock = threading.Lock()
+
+
+def get_translation_cache() -> Optional[TranslationCache]:
+    """进程内共享的 TranslationCache；打开失败时返回 None（每个进程只尝试一次），翻译退回无缓存模式。"""
+    global _translation_cache, _translation_cache_failed
+    with _translation_cache_lock:
+        if _translation_cache is None and not _translation_cache_failed:
+            try:
+                _translation_cache = TranslationCache(TRANSLATION_CACHE_PATH)
+            except sqlite3.Error as e:
+                _translation_cache_failed = True
+                logger.warning(f"[翻译缓存] 打开失败，本次不使用缓存: {e}")
+        return _translation_cache
+
+
+def log_summary() -> None:
+    if _translation_cache is not None:
+        _translation_cache.log_summary()
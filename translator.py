@@ -12,12 +12,19 @@ import json
 import logging
 import os
 import re
+import threading
 import time
 from pathlib import Path
 from typing import Optional
 
+from config import (
+    LLM_BATCH_TOKEN_BUDGET, LLM_BATCH_INITIAL_SIZE, LLM_BATCH_MAX_SIZE,
+    LLM_CLUSTER_SIMILARITY, LLM_CLUSTER_MIN_BIGRAMS,
+)
+from features import features_for
 from utils import (
     APPLICABILITY_SCOPES, VALID_JURISDICTIONS, _REGION_GROUP_MAP, _GROUP_ORDER,
+    BigramIndex, _bigram_jaccard, canonical_url,
     normalize_applicability_scope, normalize_geography, normalize_jurisdiction,
 )
 
@@ -53,6 +60,89 @@ except ImportError:
     _HAS_AI = False
     logger.warning("openai 未安装，将使用 Google Translate。运行: pip install openai")
 
+# ── LLM 调用与响应缓存 ────────────────────────────────────────────────
+# 所有业务调用（连通性预检除外）经 _complete() 发出：先查 llm_cache，命中则不发请求；
+# 未命中时由 llm_dispatch 按 RPM/TPM 预算放行，限速与 500 类故障在调度器内共享退避重试。
+# 只有通过 accept 校验（可解析、未被后处理拒绝）的返回才写入缓存，避免把坏结果固化。
+# 每次调用的用途、usage token、耗时、重试与校验结果写入 llm_telemetry（monitor.py llm-stats）。
+
+
+def _estimate_tokens(text: str) -> int:
+    """粗略 token 估计：中文约 1 字/token，英文约 4 字符/token，取折中 2 字符/token。"""
+    return len(text) // 2 + 1
+
+
+def _complete(system_prompt: str, user_msg: str, max_tokens: int,
+              purpose: str, accept=None, items: int = 1) -> str:
+    """发送一次 system + user 对话并返回去首尾空白的文本；重试耗尽后异常原样抛出。
+    每次调用（含缓存命中与失败）按 purpose 写入 llm_telemetry，items 为本次覆盖的条目数。"""
+    import llm_telemetry
+    from llm_cache import cache_key, get_llm_cache
+    from llm_dispatch import CircuitOpenError, get_dispatcher
+
+    cache = get_llm_cache()
+    key = cache_key(_LLM_MODEL, system_prompt, user_msg)
+    if cache is not None:
+        cached = cache.get(key, purpose)
+        if cached is not None:
+            logger.debug(f"[LLM缓存] 命中 {purpose}")
+            llm_telemetry.record(purpose, model=_LLM_MODEL, items=items, cache_hit=True)
+            return cached
+
+    dispatcher = get_dispatcher()
+    started = time.monotonic()
+    try:
+        resp = dispatcher.call(
+            lambda: _AI_CLIENT.chat.completions.create(
+                model=_LLM_MODEL,
+                max_tokens=max_tokens,
+                extra_body=_LLM_EXTRA_BODY,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user",   "content": user_msg},
+                ],
+            ),
+            tokens=_estimate_tokens(system_prompt + user_msg) + max_tokens,
+        )
+    except Exception as e:
+        attempts, queued = dispatcher.last_call_info()
+        llm_telemetry.record(
+            purpose, model=_LLM_MODEL, items=items, attempts=attempts, queued=queued,
+            latency=time.monotonic() - started - queued,
+            outcome="circuit_open" if isinstance(e, CircuitOpenError) else "error",
+        )
+        raise
+    attempts, queued = dispatcher.last_call_info()
+    text = resp.choices[0].message.content.strip()
+    accepted = bool(text) and (accept is None or accept(text))
+    usage = getattr(resp, "usage", None)
+    llm_telemetry.record(
+        purpose, model=_LLM_MODEL, items=items, attempts=attempts, queued=queued,
+        latency=time.monotonic() - started - queued,
+        prompt_tokens=getattr(usage, "prompt_tokens", None),
+        completion_tokens=getattr(usage, "completion_tokens", None),
+        outcome="ok" if accepted else "rejected",
+    )
+    if cache is not None and accepted:
+        cache.put(key, text, model=_LLM_MODEL, purpose=purpose)
+    return text
+
+
+def _has_json_object(text: str) -> bool:
+    return bool(re.search(r'"title_zh"|"is_relevant"', text))
+
+
+def _has_json_array(n: int):
+    def accept(text: str) -> bool:
+        arr_m = re.search(r'\[.*\]', text, re.DOTALL)
+        try:
+            arr = json.loads(arr_m.group()) if arr_m else None
+        except json.JSONDecodeError:
+            return False
+        return isinstance(arr, list) and len(arr) == n
+    return accept
+
+
 # ── Google Translate 回退 ─────────────────────────────────────────────
 
 try:
@@ -62,8 +152,6 @@ except ImportError:
     _HAS_TRANSLATOR = False
     logger.warning("deep-translator 未安装。运行: pip install deep-translator")
 
-_cache: dict = {}
-
 # ── 专有名词纠错表 ────────────────────────────────────────────────────
 # 修正 AI 生成中常见的音译/意译错误，将其替换回受保护的英文原文
 
@@ -210,42 +298,18 @@ _VALID_STATUSES = {
 
 # ── 文章正文抓取（最优先给 AI 提供上下文）────────────────────────────
 
-def _fetch_article_body(url: str) -> str:
-    """尝试获取文章正文前 500 字；超时或失败时静默返回空字符串。"""
-    if not url or not url.startswith("http"):
-        return ""
+def _fetch_article_body(url: str, cached_only: bool = False) -> str:
+    """
+    获取文章正文前 500 字；超时或失败时静默返回空字符串。
+    与日期校正共用 article_page 的页面缓存：已抓过的页面不再下载。
+    cached_only=True 时只读缓存，不发网络请求。
+    """
     try:
-        import requests
-        from bs4 import BeautifulSoup
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            ),
-            "Accept": "text/html",
-        }
-        resp = requests.get(url, headers=headers, timeout=5, allow_redirects=True)
-        if not resp.ok:
-            return ""
-        soup = BeautifulSoup(resp.text, "html.parser")
-        # 移除噪音标签
-        for tag in soup(["script", "style", "nav", "footer", "header", "aside", "noscript"]):
-            tag.decompose()
-        # 优先提取语义化正文区域
-        for selector in ("article", "main", "[class*='article-body']",
-                         "[class*='post-content']", "[class*='entry-content']"):
-            el = soup.select_one(selector)
-            if el:
-                text = re.sub(r"\s+", " ", el.get_text(" ", strip=True))
-                if len(text) > 80:
-                    return text[:500]
-        # 兜底：body 全文
-        body = soup.find("body")
-        if body:
-            return re.sub(r"\s+", " ", body.get_text(" ", strip=True))[:500]
+        from article_page import fetch_article_page
+        page = fetch_article_page(url, cached_only=cached_only)
     except Exception:
-        pass
-    return ""
+        return ""
+    return page.body_snippet if page else ""
 
 
 # ── Claude AI 处理 ────────────────────────────────────────────────────
@@ -292,16 +356,7 @@ def _ai_process(title: str, summary: str, body_snippet: str = "",
     )
 
     try:
-        resp = _AI_CLIENT.chat.completions.create(
-            model=_LLM_MODEL,
-            max_tokens=500,
-            extra_body=_LLM_EXTRA_BODY,
-            messages=[
-                {"role": "system", "content": _AI_SYSTEM},
-                {"role": "user",   "content": user_msg},
-            ],
-        )
-        text = resp.choices[0].message.content.strip()
+        text = _complete(_AI_SYSTEM, user_msg, 500, "single", accept=_has_json_object)
         logger.info(f"[AI raw] {text[:200]}")   # 打印返回内容，方便排查
 
         # 兼容多种输出格式，含截断修复
@@ -402,7 +457,6 @@ def _ai_process(title: str, summary: str, body_snippet: str = "",
                     logger.warning(
                         f"[AI] 摘要与标题 bigram 相似度 {sim:.0%}，触发重新生成"
                     )
-                    time.sleep(4)
                     dedup_msg = (
                         f"{user_msg}\n\n"
                         f"上一次生成的摘要【{summary_zh}】与标题【{title_zh}】"
@@ -411,16 +465,8 @@ def _ai_process(title: str, summary: str, body_snippet: str = "",
                         f"摘要必须包含标题中没有的具体信息，30-50 字。"
                     )
                     try:
-                        resp3 = _AI_CLIENT.chat.completions.create(
-                            model=_LLM_MODEL,
-                            max_tokens=300,
-                            extra_body=_LLM_EXTRA_BODY,
-                            messages=[
-                                {"role": "system", "content": _AI_SYSTEM},
-                                {"role": "user",   "content": dedup_msg},
-                            ],
-                        )
-                        t3 = resp3.choices[0].message.content.strip()
+                        t3 = _complete(_AI_SYSTEM, dedup_msg, 300, "single_retry",
+                                       accept=lambda t: '"summary_zh"' in t)
                         logger.info(f"[AI dedup retry] {t3[:200]}")
                         tm3 = re.search(r'"title_zh"\s*:\s*"([^"]{2,})"', t3)
                         sm3 = re.search(r'"summary_zh"\s*:\s*"([^"]{2,})"', t3)
@@ -453,41 +499,8 @@ def _ai_process(title: str, summary: str, body_snippet: str = "",
             logger.warning(f"[AI] 返回内容中未找到 JSON: {text[:200]}")
 
     except Exception as e:
-        err_msg = str(e)
-        # 429 速率限制：提取建议等待时间
-        retry_m = re.search(r'try again in (\d+\.?\d*)s', err_msg, re.IGNORECASE)
-        # 500 服务端瞬时故障（硅基流动 50507 等）：固定等待 6s 后重试
-        is_server_error = ('500' in err_msg or '50507' in err_msg or
-                           'InternalServerError' in err_msg or 'unknown error' in err_msg.lower())
-
-        if retry_m or is_server_error:
-            if retry_m:
-                wait_sec = min(float(retry_m.group(1)) + 1.5, 35.0)
-                logger.warning(f"[AI] 速率限制，等待 {wait_sec:.1f}s 后重试")
-            else:
-                wait_sec = 6.0
-                logger.warning(f"[AI] 服务端 500 错误，等待 {wait_sec:.1f}s 后重试一次")
-            time.sleep(wait_sec)
-            try:
-                resp2 = _AI_CLIENT.chat.completions.create(
-                    model=_LLM_MODEL,
-                    max_tokens=300,
-                    extra_body=_LLM_EXTRA_BODY,
-                    messages=[
-                        {"role": "system", "content": _AI_SYSTEM},
-                        {"role": "user",   "content": user_msg},
-                    ],
-                )
-                text2 = resp2.choices[0].message.content.strip()
-                logger.info(f"[AI raw retry] {text2[:200]}")
-                tm = re.search(r'"title_zh"\s*:\s*"([^"]{2,})"', text2)
-                sm = re.search(r'"summary_zh"\s*:\s*"([^"]{2,})"', text2)
-                if tm and sm:
-                    return {"title_zh": tm.group(1).strip(), "summary_zh": sm.group(1).strip()}
-            except Exception as e2:
-                logger.warning(f"[AI] 重试失败: {type(e2).__name__}: {e2}")
-        else:
-            logger.warning(f"[AI] 调用异常: {type(e).__name__}: {e}")
+        # 429 / 500 类故障已由 llm_dispatch 按建议时间退避重试，到这里说明重试已耗尽
+        logger.warning(f"[AI] 调用异常: {type(e).__name__}: {e}")
     return None
 
 
@@ -500,25 +513,93 @@ def _is_mostly_chinese(text: str) -> bool:
     return chinese_count > len(text) * 0.3
 
 
+_GOOGLE_TRANSLATE_URL = "https://translate.google.com/"
+_GOOGLE_MAX_CHARS = 500      # 单条原文截断长度（与原先一致）
+_GOOGLE_BATCH_CHARS = 4500   # 合并请求的字符上限（deep_translator 单次上限 5000）
+
+
 def translate_to_zh(text: str, source_lang: str = "auto") -> str:
     """将文本翻译为中文，失败时返回原文"""
     if not text or not text.strip():
         return text
+    return translate_batch_to_zh([text], source_lang)[0]
+
+
+def translate_batch_to_zh(texts: list, source_lang: str = "auto") -> list:
+    """
+    批量翻译为中文，返回与 texts 等长的列表（无需翻译或翻译失败的保留原文）。
+    先查 translation_cache；未命中的单行文本按换行拼接成一次请求（不超过
+    _GOOGLE_BATCH_CHARS 字符），返回行数与请求不符时该组退回逐条翻译。
+    """
+    from translation_cache import get_translation_cache
+
     if not _HAS_TRANSLATOR:
-        return text
-    if _is_mostly_chinese(text):
-        return text
-    cache_key = text[:200]
-    if cache_key in _cache:
-        return _cache[cache_key]
-    try:
-        result = GoogleTranslator(source=source_lang, target="zh-CN").translate(text[:500])
+        return list(texts)
+    todo = [
+        t for t in dict.fromkeys(texts)
+        if t and t.strip() and not _is_mostly_chinese(t)
+    ]
+    if not todo:
+        return list(texts)
+
+    cache = get_translation_cache()
+    found = cache.get_many(todo, source_lang) if cache is not None else {}
+    missing = [t for t in todo if t not in found]
+    translated: dict = {}
+    for group in _google_batches(missing):
+        translated.update(_google_translate_group(group, source_lang))
+    if cache is not None and translated:
+        cache.put_many(translated, source_lang)
+    found.update(translated)
+    return [found.get(t, t) for t in texts]
+
+
+def _google_batches(texts: list) -> list:
+    """按字符上限把单行文本分组；含换行的文本单独成组（合并后无法按行拆回）。"""
+    groups, current, size = [], [], 0
+    for text in texts:
+        clipped = text[:_GOOGLE_MAX_CHARS]
+        if "\n" in clipped:
+            groups.append([text])
+            continue
+        if current and size + len(clipped) + 1 > _GOOGLE_BATCH_CHARS:
+            groups.append(current)
+            current, size = [], 0
+        current.append(text)
+        size += len(clipped) + 1
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _google_translate(text: str, source_lang: str) -> str:
+    from rate_limit import get_limiter
+    get_limiter().acquire(_GOOGLE_TRANSLATE_URL)
+    return GoogleTranslator(source=source_lang, target="zh-CN").translate(text)
+
+
+def _google_translate_group(group: list, source_lang: str) -> dict:
+    """翻译一组文本，返回 原文 → 译文（失败的条目不在结果中）。"""
+    if len(group) > 1:
+        try:
+            joined = _google_translate("\n".join(t[:_GOOGLE_MAX_CHARS] for t in group), source_lang)
+            lines = [line.strip() for line in (joined or "").split("\n") if line.strip()]
+            if len(lines) == len(group):
+                return dict(zip(group, lines))
+            logger.debug(f"合并翻译行数 {len(lines)} ≠ {len(group)}，逐条翻译")
+        except Exception as e:
+            logger.debug(f"合并翻译失败，逐条翻译: {e}")
+
+    results = {}
+    for text in group:
+        try:
+            result = _google_translate(text[:_GOOGLE_MAX_CHARS], source_lang)
+        except Exception as e:
+            logger.debug(f"翻译失败: {e}")
+            continue
         if result:
-            _cache[cache_key] = result
-            return result
-    except Exception as e:
-        logger.debug(f"翻译失败: {e}")
-    return text
+            results[text] = result
+    return results
 
 
 def _build_source_text(item_dict: dict) -> str:
@@ -559,50 +640,24 @@ def _ensure_complete_sentence(text: str) -> str:
 
 # ── AI 连通性预检（模块级缓存，只检测一次）──────────────────────────
 
-_ai_reachable: Optional[bool] = None   # None=未检测, True=可用, False=不可用
-
-
 def _check_ai_reachable() -> bool:
     """
-    发送一个极小请求测试 LLM 代理是否可达。
-    超时 10 秒即判定不可达，后续所有文章直接走 Google Translate，
-    避免逐条等待 25 秒超时造成 CI 任务大幅延误。
+    LLM 端点当前是否可用：由 llm_dispatch 熔断器根据最近请求的失败率与耗时判定。
+    断开期间直接走 Google Translate，不再逐条等待客户端超时；冷却结束后熔断器放行
+    试探请求，端点恢复后自动回到 LLM 路径（取代原先每进程一次、结果永久缓存的预检）。
     """
-    global _ai_reachable
-    if _ai_reachable is not None:
-        return _ai_reachable
-    try:
-        _AI_CLIENT.chat.completions.create(
-            model=_LLM_MODEL,
-            max_tokens=5,
-            timeout=10.0,
-            extra_body=_LLM_EXTRA_BODY,
-            messages=[{"role": "user", "content": "hi"}],
-        )
-        logger.info("[AI] 连通性预检通过，将使用 LLM 处理")
-        _ai_reachable = True
-    except Exception as e:
-        err_str = str(e)
-        # 429 表示 API 可达但触发速率限制，仍视为可用
-        if "429" in err_str or "rate_limit" in err_str.lower():
-            logger.info("[AI] 连通性预检触发速率限制，但 API 可达，将使用 LLM 处理")
-            _ai_reachable = True
-        else:
-            logger.warning(
-                f"[AI] 连通性预检失败，本次批量翻译全部使用 Google Translate 回退。"
-                f"原因：{type(e).__name__}: {e}"
-            )
-            _ai_reachable = False
-    return _ai_reachable
+    from llm_dispatch import get_dispatcher
+    return get_dispatcher().breaker.available()
 
 
-# ── LLM 批量翻译（3 篇/次，3× 吞吐，4s sleep/批次而非/条）──────────
+# ── LLM 批量翻译（3 篇/次，各批次经 llm_dispatch 并发发出）──────────
 
-def _ai_process_batch(items_data: list) -> list:
+def _ai_process_batch(items_data: list, _requeue: bool = True) -> list:
     """
     将 2-3 篇文章打包进一次 LLM 调用，返回等长结果列表。
     items_data: list of dict，每个 dict 含 title/summary/region_hint/category_hint/status_hint
     返回: list of dict（与 _ai_process() 格式相同），失败的条目对应位置为 None
+    返回不完整时保留可解析的条目，缺失条目再打包请求一次（_requeue=False 时不再重试）。
     调用方收到 None 时应降级为单条 translate_item_fields()。
     """
     if not _HAS_AI or not _AI_CLIENT or not items_data:
@@ -642,56 +697,125 @@ def _ai_process_batch(items_data: list) -> list:
 
     user_msg = (
         f"以下 {n} 篇文章，逐篇按顺序分析，返回长度严格为 {n} 的 JSON 数组，"
-        f"每个元素格式与单篇相同（is_relevant=false 时仍需包含推送判定和原因）。\n\n"
+        f"每个元素格式与单篇相同（is_relevant=false 时仍需包含推送判定和原因），"
+        f"并额外包含 \"index\" 字段，值为对应的文章序号（1-{n}）。\n\n"
         + "\n\n".join(parts)
     )
 
+    results = [None] * n
     try:
-        resp = _AI_CLIENT.chat.completions.create(
-            model=_LLM_MODEL,
-            max_tokens=380 * n,
-            extra_body=_LLM_EXTRA_BODY,
-            messages=[
-                {"role": "system", "content": _AI_SYSTEM},
-                {"role": "user",   "content": user_msg},
-            ],
-        )
-        text = resp.choices[0].message.content.strip()
+        text = _complete(_AI_SYSTEM, user_msg, _BATCH_OUTPUT_TOKENS_PER_ITEM * n, "batch",
+                         accept=_has_json_array(n), items=n)
         logger.info(f"[AI batch raw] n={n} {text[:300]}")
+        results = _match_batch_objects(_parse_batch_objects(text), items_data)
+    except Exception as e:
+        logger.warning(f"[AI batch] 调用失败，降级逐条处理: {type(e).__name__}: {e}")
+        return results
 
-        # 解析顶层 JSON 数组
-        arr_m = re.search(r'\[.*\]', text, re.DOTALL)
-        if arr_m:
-            try:
-                arr = json.loads(arr_m.group())
-                if isinstance(arr, list) and len(arr) == n:
-                    return arr
-                logger.warning(f"[AI batch] 数组长度 {len(arr)} ≠ {n}，降级逐条处理")
-            except json.JSONDecodeError as je:
-                logger.warning(f"[AI batch] JSON 解析失败 ({je})，降级逐条处理")
-        else:
-            # LLM 可能返回单个 JSON 对象（批次为 1 条或忽略数组格式）
-            obj_m = re.search(r'\{.*\}', text, re.DOTALL)
-            if obj_m and n == 1:
+    missing = [i for i, r in enumerate(results) if r is None]
+    _batch_sizer.record(
+        n, n - len(missing),
+        _estimate_tokens(_AI_SYSTEM + user_msg) + _BATCH_OUTPUT_TOKENS_PER_ITEM * n,
+    )
+    if not missing:
+        _count_batch("complete", n)
+        return results
+    if len(missing) == n:
+        logger.warning(f"[AI batch] 未解析出任何有效条目，降级逐条处理: {text[:150]}")
+        return results
+
+    # 部分条目可用：接受已解析的条目，仅把缺失条目打包为更小的批次重新请求一次
+    _count_batch("salvaged", n - len(missing))
+    _count_batch("requeued", len(missing))
+    logger.warning(f"[AI batch] 解析出 {n - len(missing)}/{n} 条，缺失 {len(missing)} 条重新请求")
+    if not _requeue:
+        return results
+    retried = _ai_process_batch([items_data[i] for i in missing], _requeue=False)
+    for i, raw in zip(missing, retried):
+        results[i] = raw
+    return results
+
+
+# ── 批量返回的容错解析 ────────────────────────────────────────────────
+# LLM 偶尔返回长度不符的数组、被 max_tokens 截断的 JSON 或夹带说明文字。
+# 逐个提取结构完整的 {...} 对象，按回显的 index（其次是标题）对应到输入条目，
+# 只有缺失的条目才重新请求，而不是整批降级为逐条调用。
+
+_batch_counters = {"complete": 0, "salvaged": 0, "requeued": 0}
+_batch_counters_lock = threading.Lock()
+
+
+def _count_batch(name: str, value: int) -> None:
+    with _batch_counters_lock:
+        _batch_counters[name] += value
+
+
+def batch_counters() -> dict:
+    with _batch_counters_lock:
+        return dict(_batch_counters)
+
+
+def _parse_batch_objects(text: str) -> list:
+    """提取文本中所有结构完整、可解析的顶层 JSON 对象（跳过截断或损坏的片段）。"""
+    objects = []
+    depth, start, in_string, escaped = 0, -1, False, False
+    for pos, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = depth > 0
+        elif ch == "{":
+            if depth == 0:
+                start = pos
+            depth += 1
+        elif ch == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
                 try:
-                    obj = json.loads(obj_m.group())
-                    if isinstance(obj, dict):
-                        return [obj]
+                    obj = json.loads(text[start:pos + 1])
                 except json.JSONDecodeError:
-                    pass
-            logger.warning(f"[AI batch] 未找到 JSON 数组，降级逐条处理: {text[:150]}")
+                    continue
+                if isinstance(obj, dict):
+                    objects.append(obj)
+    return objects
+
+
+def _batch_index(obj: dict, n: int) -> Optional[int]:
+    value = obj.get("index")
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value.strip())
+    if isinstance(value, int) and not isinstance(value, bool) and 1 <= value <= n:
+        return value - 1
+    return None
 
-    except Exception as e:
-        err_str = str(e)
-        if "429" in err_str or "rate_limit" in err_str.lower():
-            wait = min(float(re.search(r'try again in (\d+\.?\d*)s', err_str, re.IGNORECASE).group(1)) + 1.5
-                       if re.search(r'try again in (\d+\.?\d*)s', err_str, re.IGNORECASE) else 6.0, 35.0)
-            logger.warning(f"[AI batch] 速率限制，等待 {wait:.1f}s")
-            time.sleep(wait)
-        else:
-            logger.warning(f"[AI batch] 调用失败，降级逐条处理: {type(e).__name__}: {e}")
 
-    return [None] * n
+def _match_batch_objects(objects: list, items_data: list) -> list:
+    """把解析出的对象对应回输入顺序：优先回显的 index，其次回显的原标题；
+    都没有回显且对象数恰好等于输入数时按位置对应（兼容未回显 index 的旧式返回）。"""
+    n = len(items_data)
+    results = [None] * n
+    titles = {
+        (d.get("title") or "").strip().lower(): i for i, d in enumerate(items_data)
+    }
+    unmatched = []
+    for obj in objects:
+        idx = _batch_index(obj, n)
+        if idx is None:
+            echoed = (obj.get("title") or "").strip().lower()
+            idx = titles.get(echoed) if echoed else None
+        if idx is not None and results[idx] is None:
+            results[idx] = obj
+        else:
+            unmatched.append(obj)
+    if unmatched and len(objects) == n and not any(results):
+        return objects
+    return results
 
 
 # 地区前缀兜底规则（批量后处理时使用，与 _ai_process 内保持一致）
@@ -710,121 +834,336 @@ _REGION_PREFIX_RULES = [
 ]
 
 
-def translate_items_batch(items_dicts: list, batch_size: int = 3) -> list:
+# ── 自适应批大小 ──────────────────────────────────────────────────────
+# 按估算的输入 + 输出 token 把文章装入一次调用（不超过 LLM_BATCH_TOKEN_BUDGET），
+# 每批条数上限按解析成功率调整：连续完整解析则 +1，出现截断/缺条则减半（加性增、乘性减）。
+
+_BATCH_OUTPUT_TOKENS_PER_ITEM = 380   # 单篇 JSON 结果（中文标题 + 摘要 + 分类/风险字段）的输出预算
+_BATCH_ITEM_OVERHEAD_TOKENS = 40      # 【文章N】标题、提示行等模板文字
+_BATCH_GROW_AFTER = 2                 # 连续多少批完整解析后上限 +1
+
+
+class _BatchSizer:
+    """线程安全的批大小控制器，同时累计每次调用的条数与 token 估算。"""
+
+    def __init__(self, initial: int = LLM_BATCH_INITIAL_SIZE,
+                 max_size: int = LLM_BATCH_MAX_SIZE,
+                 token_budget: int = LLM_BATCH_TOKEN_BUDGET):
+        self.max_size = max(1, max_size)
+        self.limit = max(1, min(initial, self.max_size))
+        self.token_budget = token_budget
+        self._streak = 0
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.items = 0
+        self.tokens = 0
+
+    @staticmethod
+    def item_tokens(data: dict) -> int:
+        text = (data.get("title") or "") + (data.get("summary") or "")
+        return _estimate_tokens(text) + _BATCH_ITEM_OVERHEAD_TOKENS + _BATCH_OUTPUT_TOKENS_PER_ITEM
+
+    def take(self, items_data: list, start: int) -> list:
+        """从 start 起按当前上限与 token 预算取出下一批（至少 1 条）。"""
+        with self._lock:
+            limit = self.limit
+        available = self.token_budget - _estimate_tokens(_AI_SYSTEM)
+        end, used = start, 0
+        while end < len(items_data) and end - start < limit:
+            cost = self.item_tokens(items_data[end])
+            if end > start and used + cost > available:
+                break
+            used += cost
+            end += 1
+        return items_data[start:end]
+
+    def record(self, n: int, parsed: int, tokens: int) -> None:
+        """回报一批的解析结果：n 条中成功对应 parsed 条。"""
+        with self._lock:
+            self.calls += 1
+            self.items += n
+            self.tokens += tokens
+            if parsed == n:
+                if n >= self.limit:
+                    self._streak += 1
+                if self._streak >= _BATCH_GROW_AFTER and self.limit < self.max_size:
+                    self._streak = 0
+                    self.limit += 1
+                    logger.info(f"[AI batch] 连续完整解析，批大小上限 → {self.limit}")
+            elif n > 1:
+                self._streak = 0
+                shrunk = max(1, min(self.limit, n) // 2)
+                if shrunk < self.limit:
+                    self.limit = shrunk
+                    logger.warning(f"[AI batch] 返回截断/缺条（{parsed}/{n}），批大小上限 → {self.limit}")
+
+    def log_summary(self) -> None:
+        with self._lock:
+            if not self.calls:
+                return
+            logger.info(
+                f"[AI batch] 平均每次调用 {self.items / self.calls:.1f} 条，"
+                f"每条约 {self.tokens / self.items:.0f} tokens，当前批大小上限 {self.limit}"
+            )
+
+
+_batch_sizer = _BatchSizer()
+
+
+def _batch_input(d: dict) -> dict:
+    return {
+        "title":         (d.get("title")       or "").strip(),
+        "summary":       (d.get("summary")     or "").strip(),
+        "region_hint":   (d.get("region")      or "").strip(),
+        "jurisdiction_hint": (d.get("jurisdiction") or "").strip(),
+        "category_hint": (d.get("category_l1") or "").strip(),
+        "status_hint":   (d.get("status")      or "").strip(),
+        "lang":          (d.get("lang")        or "en"),
+    }
+
+
+def _apply_batch_result(item_dict: dict, source_title: str, raw: dict) -> bool:
+    """将批量返回的单条结果写回 item_dict；字段为空或摘要复读标题时返回 False（需单条降级）。"""
+    title_zh   = (raw.get("title_zh")   or "").strip()
+    summary_zh = (raw.get("summary_zh") or "").strip()
+
+    if not title_zh or not summary_zh:
+        logger.info(f"[batch fallback] 字段为空 → 单条降级: {item_dict.get('title','')[:40]}")
+        return False
+
+    # 清理 JSON 残留字符
+    title_zh   = re.sub(r'[\}\{"\s,]+$', '', title_zh).strip()
+    summary_zh = re.sub(r'[\}\{"\s,]+$', '', summary_zh).strip()
+
+    # [地区] 前缀兜底
+    if not re.match(r'^\[.+?\]', title_zh):
+        for region_cn, pattern in _REGION_PREFIX_RULES:
+            if re.search(pattern, source_title, re.IGNORECASE):
+                title_zh = f"[{region_cn}] {title_zh}"
+                break
+
+    # 专有名词纠错
+    title_zh   = _apply_term_corrections(title_zh)
+    summary_zh = _apply_term_corrections(summary_zh)
+
+    # bigram 相似度过高 → 单条重试
+    if _bigram_similarity(title_zh, summary_zh) > 0.55:
+        logger.warning(f"[batch] bigram 过高，单条重试: {title_zh[:40]}")
+        return False
+
+    # 校验分类字段合法性
+    llm_region   = (raw.get("region")      or "").strip()
+    llm_jurisdiction = normalize_jurisdiction(
+        raw.get("jurisdiction") or llm_region
+    )
+    llm_scope = (raw.get("applicability_scope") or "").strip().lower()
+    if llm_scope not in _VALID_APPLICABILITY_SCOPES:
+        llm_scope = normalize_applicability_scope("", llm_jurisdiction)
+    llm_jurisdiction, llm_scope = normalize_geography(
+        llm_jurisdiction, llm_scope
+    )
+    llm_category = (raw.get("category_l1") or "").strip()
+    llm_status   = (raw.get("status")      or "").strip()
+    if llm_region   not in _VALID_REGIONS:        llm_region   = ""
+    if llm_category not in _VALID_CATEGORIES_L1:  llm_category = ""
+    if llm_status   not in _VALID_STATUSES:        llm_status   = ""
+
+    item_dict["title_zh"]         = title_zh
+    item_dict["summary_zh"]       = summary_zh
+    item_dict["_llm_is_relevant"] = True
+    item_dict["_llm_region"]      = llm_region
+    item_dict["_llm_jurisdiction"] = llm_jurisdiction
+    item_dict["_llm_applicability_scope"] = llm_scope
+    item_dict["_llm_category_l1"] = llm_category
+    item_dict["_llm_status"]      = llm_status
+    item_dict["_llm_risk_revenue"] = _clamp_risk(raw.get("risk_revenue"))
+    item_dict["_llm_risk_product"] = _clamp_risk(raw.get("risk_product"))
+    item_dict["_llm_risk_urgency"] = _clamp_risk(raw.get("risk_urgency"))
+    item_dict["_llm_risk_scope"]   = _clamp_risk(raw.get("risk_scope"))
+    _attach_push_fields(item_dict, raw)
+    return True
+
+
+# ── LLM 前聚类：同一报道只送一条代表 ─────────────────────────────────
+# 转载、聚合页和跟踪参数不同的同一链接会作为多条进入翻译。规范化 URL 相同，或
+# 归一化标题 bigram Jaccard ≥ LLM_CLUSTER_SIMILARITY 的条目归为一簇，只有代表
+# 进入 LLM；其余成员复制代表的 _llm_* 分类/推送字段与中文摘要，标题不同时单独翻译。
+
+def _llm_clusters(items_dicts: list) -> list:
+    """返回每条所属簇的代表位置（代表指向自身，代表总是簇内最靠前的条目）。"""
+    index = BigramIndex(LLM_CLUSTER_SIMILARITY)
+    rep_bigrams: dict = {}
+    by_url: dict = {}
+    rep_of = []
+    for i, d in enumerate(items_dicts):
+        url = canonical_url(d.get("source_url") or d.get("url") or "")
+        rep = by_url.get(url) if url else None
+        bigrams = features_for(d).normalized_title_bigrams
+        # 过短的标题（"Press release" 之类）相似度不可靠，只按 URL 聚类
+        if len(bigrams) < LLM_CLUSTER_MIN_BIGRAMS:
+            bigrams = frozenset()
+        if rep is None and bigrams:
+            for j in sorted(index.candidates(bigrams)):
+                if _bigram_jaccard(bigrams, rep_bigrams[j]) >= LLM_CLUSTER_SIMILARITY:
+                    rep = j
+                    break
+        if rep is None:
+            rep = i
+            if bigrams:
+                index.add(i, bigrams)
+                rep_bigrams[i] = bigrams
+        if url:
+            by_url.setdefault(url, rep)
+        rep_of.append(rep)
+    return rep_of
+
+
+def _propagate_cluster_result(member: dict, rep_source: dict, rep_result: dict) -> dict:
+    """把代表的 LLM 结果复制给簇成员；标题与代表不同的成员单独翻译标题。"""
+    for key, value in rep_result.items():
+        if key.startswith("_llm_"):
+            member[key] = value
+    member["summary_zh"] = rep_result.get("summary_zh", "")
+
+    from event_dedup import normalize_title
+    if normalize_title(member.get("title") or "") == normalize_title(rep_source.get("title") or ""):
+        member["title_zh"] = rep_result.get("title_zh", "")
+        return member
+    title = (member.get("title") or "").strip()
+    title_zh = title if _is_mostly_chinese(title) else translate_to_zh(title[:200])
+    prefix = re.match(r'^\[.+?\]\s*', rep_result.get("title_zh") or "")
+    if prefix and rep_result.get("_llm_is_relevant") is not False and not title_zh.startswith("["):
+        title_zh = prefix.group() + title_zh
+    member["title_zh"] = _apply_term_corrections(title_zh)
+    return member
+
+
+def _prefetch_fallback_translations(items_dicts: list) -> None:
+    """Google 回退路径：把所有标题与摘要原文合并请求翻译，逐条处理时直接命中缓存。"""
+    texts = []
+    for d in items_dicts:
+        texts.append(((d.get("title") or "").strip())[:200])
+        texts.append(_build_source_text(d))
+    translate_batch_to_zh(texts)
+
+
+def translate_items_batch(items_dicts: list, batch_size: Optional[int] = None) -> list:
     """
-    批量翻译和分类：每 batch_size 条发一次 LLM 请求（一次 4s sleep），
-    单条失败时自动降级为 translate_item_fields()。
-    返回列表与 items_dicts 等长，每条格式与 translate_item_fields() 相同。
+    批量翻译和分类：先做 LLM 前聚类，只把每簇代表送入 LLM，结果复制给簇内其余成员。
+    代表按自适应批大小与 token 预算打包为 LLM 请求（指定 batch_size 时固定条数），
+    每轮最多 max_in_flight 个批次经 llm_dispatch 并发发出，解析结果随即反馈给下一轮的批大小；
+    需要单条降级的条目随后同样并发走 translate_item_fields()。
+    本地相关性预筛（relevance_model）处于 active 模式时，高置信无价值条目不进入 LLM，
+    只做 Google 翻译并直接入池（decision_source="model"）。
+    返回列表与 items_dicts 等长且顺序一致，每条格式与 translate_item_fields() 相同。
     """
+    from relevance_model import get_prefilter
+
     if not items_dicts:
         return []
 
-    # LLM 不可用时直接逐条 Google Translate
+    # LLM 不可用时逐条 Google Translate（先合并请求预热翻译缓存）
     if not (_HAS_AI and _check_ai_reachable()):
+        _prefetch_fallback_translations(items_dicts)
         return [translate_item_fields(d) for d in items_dicts]
 
+    prefilter = get_prefilter()
+    if prefilter is None:
+        return _translate_with_llm(items_dicts, batch_size)
+
+    flagged = prefilter.route(items_dicts)
+    if not (prefilter.active and any(flagged)):
+        results = _translate_with_llm(items_dicts, batch_size)
+        prefilter.observe(flagged, results)
+        return results
+
+    skipped = [d for d, low in zip(items_dicts, flagged) if low]
+    logger.info(f"[相关性预筛] {len(skipped)}/{len(items_dicts)} 条判定为无价值，直接入池不调用 LLM")
+    _prefetch_fallback_translations(skipped)
+    llm_results = iter(_translate_with_llm(
+        [d for d, low in zip(items_dicts, flagged) if not low], batch_size
+    ))
+    return [
+        _google_fallback_fields(d, noise_reason="模型预筛", decision_source="model")
+        if low else next(llm_results)
+        for d, low in zip(items_dicts, flagged)
+    ]
+
+
+def _translate_with_llm(items_dicts: list, batch_size: Optional[int] = None) -> list:
+    if not items_dicts:
+        return []
+    rep_of = _llm_clusters(items_dicts)
+    reps = sorted(set(rep_of))
+    if len(reps) == len(items_dicts):
+        return _translate_representatives(items_dicts, batch_size)
+
+    logger.info(
+        f"[LLM聚类] {len(items_dicts)} 条归为 {len(reps)} 簇，"
+        f"{len(items_dicts) - len(reps)} 条转载/近似重复不单独调用 LLM"
+    )
+    rep_results = dict(zip(reps, _translate_representatives(
+        [items_dicts[i] for i in reps], batch_size
+    )))
     results = []
+    for i, rep in enumerate(rep_of):
+        if i == rep:
+            results.append(rep_results[i])
+        else:
+            results.append(_propagate_cluster_result(items_dicts[i], items_dicts[rep], rep_results[rep]))
+    return results
 
-    for batch_start in range(0, len(items_dicts), batch_size):
-        batch = items_dicts[batch_start: batch_start + batch_size]
-
-        # 准备批量输入
-        batch_data = [
-            {
-                "title":         (d.get("title")       or "").strip(),
-                "summary":       (d.get("summary")     or "").strip(),
-                "region_hint":   (d.get("region")      or "").strip(),
-                "jurisdiction_hint": (d.get("jurisdiction") or "").strip(),
-                "category_hint": (d.get("category_l1") or "").strip(),
-                "status_hint":   (d.get("status")      or "").strip(),
-                "lang":          (d.get("lang")        or "en"),
-            }
-            for d in batch
-        ]
-
-        raw_results = _ai_process_batch(batch_data)
-
-        for item_dict, raw in zip(batch, raw_results):
-            if raw is None:
-                # 批次失败 → 单条降级（已含内部 sleep）
-                logger.info(f"[batch fallback] {item_dict.get('title','')[:40]}")
-                results.append(translate_item_fields(item_dict))
-                continue
-
-            # LLM 判定不相关
-            if raw.get("is_relevant") is False:
-                # 保留原有小语种安全回退，同时把结果锁定为仅入池。
-                item_dict = translate_item_fields(item_dict)
-                item_dict["_llm_is_relevant"] = False
-                _attach_push_fields(item_dict, raw)
-                logger.info(f"[LLM仅入池] {item_dict.get('title','')[:40]}")
-                results.append(item_dict)
-                continue
 
-            title_zh   = (raw.get("title_zh")   or "").strip()
-            summary_zh = (raw.get("summary_zh") or "").strip()
-
-            if not title_zh or not summary_zh:
-                logger.info(f"[batch fallback] 字段为空 → 单条降级: {item_dict.get('title','')[:40]}")
-                results.append(translate_item_fields(item_dict))
-                continue
-
-            # 清理 JSON 残留字符
-            title_zh   = re.sub(r'[\}\{"\s,]+$', '', title_zh).strip()
-            summary_zh = re.sub(r'[\}\{"\s,]+$', '', summary_zh).strip()
-
-            # [地区] 前缀兜底
-            if not re.match(r'^\[.+?\]', title_zh):
-                for region_cn, pattern in _REGION_PREFIX_RULES:
-                    if re.search(pattern, batch_data[batch.index(item_dict)]["title"], re.IGNORECASE):
-                        title_zh = f"[{region_cn}] {title_zh}"
-                        break
-
-            # 专有名词纠错
-            title_zh   = _apply_term_corrections(title_zh)
-            summary_zh = _apply_term_corrections(summary_zh)
-
-            # bigram 相似度过高 → 单条重试（含内部 sleep）
-            if _bigram_similarity(title_zh, summary_zh) > 0.55:
-                logger.warning(f"[batch] bigram 过高，单条重试: {title_zh[:40]}")
-                results.append(translate_item_fields(item_dict))
-                continue
-
-            # 校验分类字段合法性
-            llm_region   = (raw.get("region")      or "").strip()
-            llm_jurisdiction = normalize_jurisdiction(
-                raw.get("jurisdiction") or llm_region
-            )
-            llm_scope = (raw.get("applicability_scope") or "").strip().lower()
-            if llm_scope not in _VALID_APPLICABILITY_SCOPES:
-                llm_scope = normalize_applicability_scope("", llm_jurisdiction)
-            llm_jurisdiction, llm_scope = normalize_geography(
-                llm_jurisdiction, llm_scope
-            )
-            llm_category = (raw.get("category_l1") or "").strip()
-            llm_status   = (raw.get("status")      or "").strip()
-            if llm_region   not in _VALID_REGIONS:        llm_region   = ""
-            if llm_category not in _VALID_CATEGORIES_L1:  llm_category = ""
-            if llm_status   not in _VALID_STATUSES:        llm_status   = ""
-
-            item_dict["title_zh"]         = title_zh
-            item_dict["summary_zh"]       = summary_zh
-            item_dict["_llm_is_relevant"] = True
-            item_dict["_llm_region"]      = llm_region
-            item_dict["_llm_jurisdiction"] = llm_jurisdiction
-            item_dict["_llm_applicability_scope"] = llm_scope
-            item_dict["_llm_category_l1"] = llm_category
-            item_dict["_llm_status"]      = llm_status
-            item_dict["_llm_risk_revenue"] = _clamp_risk(raw.get("risk_revenue"))
-            item_dict["_llm_risk_product"] = _clamp_risk(raw.get("risk_product"))
-            item_dict["_llm_risk_urgency"] = _clamp_risk(raw.get("risk_urgency"))
-            item_dict["_llm_risk_scope"]   = _clamp_risk(raw.get("risk_scope"))
-            _attach_push_fields(item_dict, raw)
-            results.append(item_dict)
-
-        # 每批次 sleep 一次（代替原来每条 sleep）
-        time.sleep(4)
+def _translate_representatives(items_dicts: list, batch_size: Optional[int] = None) -> list:
+    from llm_dispatch import get_dispatcher
+    dispatcher = get_dispatcher()
+    counters_before = batch_counters()
 
+    batch_data = [_batch_input(d) for d in items_dicts]
+    raw_results = []
+    pos = 0
+    while pos < len(batch_data):
+        wave = []
+        while pos < len(batch_data) and len(wave) < dispatcher.max_in_flight:
+            if batch_size:
+                batch = batch_data[pos: pos + batch_size]
+            else:
+                batch = _batch_sizer.take(batch_data, pos)
+            wave.append(batch)
+            pos += len(batch)
+        for batch_raw in dispatcher.map(_ai_process_batch, wave):
+            raw_results.extend(batch_raw)
+
+    results = list(items_dicts)
+    fallback = []   # (位置, LLM 判定不相关时的原始结果 / None)
+    for i, (item_dict, data, raw) in enumerate(zip(items_dicts, batch_data, raw_results)):
+        if raw is None:
+            # 批次失败 → 单条降级
+            logger.info(f"[batch fallback] {item_dict.get('title','')[:40]}")
+            fallback.append((i, None))
+        elif raw.get("is_relevant") is False:
+            # LLM 判定不相关：保留原有小语种安全回退，同时把结果锁定为仅入池。
+            fallback.append((i, raw))
+        elif not _apply_batch_result(item_dict, data["title"], raw):
+            fallback.append((i, None))
+
+    translated = dispatcher.map(
+        lambda entry: translate_item_fields(items_dicts[entry[0]]), fallback
+    )
+    for (i, negative), item_dict in zip(fallback, translated):
+        if negative is not None:
+            item_dict["_llm_is_relevant"] = False
+            _attach_push_fields(item_dict, negative)
+            logger.info(f"[LLM仅入池] {item_dict.get('title','')[:40]}")
+        results[i] = item_dict
+
+    counters = {k: v - counters_before[k] for k, v in batch_counters().items()}
+    if counters["salvaged"] or counters["requeued"]:
+        logger.info(
+            f"[AI batch] 完整解析 {counters['complete']} 条，部分返回中挽回 {counters['salvaged']} 条，"
+            f"重新请求 {counters['requeued']} 条，单条降级 {len(fallback)} 条"
+        )
+    _batch_sizer.log_summary()
     return results
 
 
@@ -857,16 +1196,12 @@ def verify_duplicate_pairs(pairs: list) -> list:
     )
 
     try:
-        resp = _AI_CLIENT.chat.completions.create(
-            model=_LLM_MODEL,
-            max_tokens=60 + len(pairs) * 8,
-            extra_body=_LLM_EXTRA_BODY,
-            messages=[
-                {"role": "system", "content": _PROMPT_VERIFY_DUP},
-                {"role": "user", "content": user_msg},
-            ],
+        text = _complete(
+            _PROMPT_VERIFY_DUP, user_msg, 60 + len(pairs) * 8, "verify_dup",
+            accept=lambda t: (_has_json_array(len(pairs))(t)
+                              or len(re.findall(r'\b(true|false)\b', t.lower())) == len(pairs)),
+            items=len(pairs),
         )
-        text = resp.choices[0].message.content.strip()
         logger.info(f"[AI verify_dup] {text[:200]}")
 
         # 尝试解析 JSON 数组
@@ -926,16 +1261,8 @@ def merge_duplicate_summaries(primary: dict, duplicates: list) -> str:
     )
 
     try:
-        resp = _AI_CLIENT.chat.completions.create(
-            model=_LLM_MODEL,
-            max_tokens=250,
-            extra_body=_LLM_EXTRA_BODY,
-            messages=[
-                {"role": "system", "content": _PROMPT_MERGE_DUP},
-                {"role": "user",   "content": user_msg},
-            ],
-        )
-        result = resp.choices[0].message.content.strip()
+        result = _complete(_PROMPT_MERGE_DUP, user_msg, 250, "merge",
+                           items=len(dup_lines) + 1)
         logger.info(f"[merge] 摘要融合成功: {primary_title[:30]}…")
         return result
     except Exception as e:
@@ -993,16 +1320,8 @@ def generate_executive_summary(items: list) -> str:
     )
 
     try:
-        resp = _AI_CLIENT.chat.completions.create(
-            model=_LLM_MODEL,
-            max_tokens=600,
-            extra_body=_LLM_EXTRA_BODY,
-            messages=[
-                {"role": "system", "content": _PROMPT_EXEC_SUMMARY},
-                {"role": "user",   "content": user_msg},
-            ],
-        )
-        text = resp.choices[0].message.content.strip()
+        text = _complete(_PROMPT_EXEC_SUMMARY, user_msg, 600, "executive_summary",
+                         items=len(material_lines))
         # 截断到 300 字以内（中文字符数）
         if len(text) > 320:
             # 找最后一个句号截断
@@ -1061,16 +1380,8 @@ def generate_weekly_card_summary(news_items: list) -> str:
     )
 
     try:
-        resp = _AI_CLIENT.chat.completions.create(
-            model=_LLM_MODEL,
-            max_tokens=200,
-            extra_body=_LLM_EXTRA_BODY,
-            messages=[
-                {"role": "system", "content": _PROMPT_WEEKLY_CARD},
-                {"role": "user",   "content": user_msg},
-            ],
-        )
-        text = resp.choices[0].message.content.strip()
+        text = _complete(_PROMPT_WEEKLY_CARD, user_msg, 200, "weekly_card",
+                         items=len(material_lines))
         logger.info(f"[周报卡片摘要] 生成成功，{len(text)} 字")
         return text
     except Exception as e:
@@ -1131,16 +1442,9 @@ def generate_daily_summary(items: list) -> str:
     )
 
     try:
-        resp = _AI_CLIENT.chat.completions.create(
-            model=_LLM_MODEL,
-            max_tokens=300,
-            extra_body=_LLM_EXTRA_BODY,
-            messages=[
-                {"role": "system", "content": _PROMPT_DAILY_SUMMARY},
-                {"role": "user",   "content": user_msg},
-            ],
-        )
-        text = resp.choices[0].message.content.strip()
+        text = _complete(_PROMPT_DAILY_SUMMARY, user_msg, 300, "daily_summary",
+                         accept=lambda t: not _DAILY_ADVISORY_OUTPUT.search(t),
+                         items=len(material_lines))
         if _DAILY_ADVISORY_OUTPUT.search(text):
             logger.warning("[日报客观摘要] 检测到建议或行动结论，跳过展示")
             return ""
@@ -1183,7 +1487,15 @@ def translate_item_fields(item_dict: dict) -> dict:
         category_hint = (item_dict.get("category_l1") or "").strip()
         status_hint   = (item_dict.get("status")      or "").strip()
 
-        result = _ai_process(title, summary,
+        # 摘要过短时使用日期校正阶段已缓存的正文片段（不额外发起请求）
+        body_snippet = ""
+        if len(summary) <= 40:
+            body_snippet = _fetch_article_body(
+                item_dict.get("source_url") or item_dict.get("url") or "",
+                cached_only=True,
+            )
+
+        result = _ai_process(title, summary, body_snippet=body_snippet,
                              region_hint=region_hint,
                              category_hint=category_hint,
                              status_hint=status_hint)
@@ -1212,28 +1524,28 @@ def translate_item_fields(item_dict: dict) -> dict:
             item_dict["_llm_risk_urgency"] = _clamp_risk(result.get("risk_urgency", 0))
             item_dict["_llm_risk_scope"]   = _clamp_risk(result.get("risk_scope", 0))
             _attach_push_fields(item_dict, result)
-            time.sleep(4)   # 硅基流动免费层限速，4s 间隔确保不超限
             return item_dict
         logger.warning(f"AI 处理未返回有效结果，回退到 Google Translate: {title[:50]}")
 
     # ── 路径二：Google Translate 回退 ─────────────────────────────────
-    if title and not _is_mostly_chinese(title):
-        item_dict["title_zh"] = translate_to_zh(title[:200])
-        time.sleep(0.15)
-    else:
-        item_dict["title_zh"] = title
+    return _google_fallback_fields(item_dict)
+
 
+def _google_fallback_fields(item_dict: dict, noise_reason: str = "判定失败",
+                            decision_source: str = "fallback") -> dict:
+    """Google Translate 字面翻译（标题与摘要合并为一次请求，按域名限速），并强制仅入池。"""
+    title = (item_dict.get("title") or "").strip()
     source_text = _build_source_text(item_dict)
+    title_zh, summary_raw = translate_batch_to_zh([title[:200], source_text])
+    item_dict["title_zh"] = title_zh if title else title
     if _is_mostly_chinese(source_text):
         item_dict["summary_zh"] = source_text
     else:
-        raw = translate_to_zh(source_text)
-        item_dict["summary_zh"] = _ensure_complete_sentence(raw)
-        time.sleep(0.2)
+        item_dict["summary_zh"] = _ensure_complete_sentence(summary_raw)
 
     item_dict["_llm_push_decision"] = "pool_only"
     item_dict["_llm_value_score"] = 0
-    item_dict["_llm_noise_reason"] = "判定失败"
-    item_dict["_llm_decision_source"] = "fallback"
+    item_dict["_llm_noise_reason"] = noise_reason
+    item_dict["_llm_decision_source"] = decision_source
 
     return item_dict
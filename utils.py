@@ -9,8 +9,10 @@
 
 from __future__ import annotations
 
+import math
 import re
 from datetime import date, datetime, timedelta, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 _TZ_CST = timezone(timedelta(hours=8))
 
@@ -287,15 +289,99 @@ def _impact_emoji(score: float) -> str:
     return "🔵"
 
 
+def _bigram_set(text: str) -> frozenset:
+    """小写后的字符 bigram 集合；不足 2 个字符时为空集。"""
+    text = (text or "").lower()
+    return frozenset(text[i:i + 2] for i in range(len(text) - 1))
+
+
+def _bigram_jaccard(bg_a: frozenset, bg_b: frozenset) -> float:
+    """两个 bigram 集合的 Jaccard 相似度；任一为空时为 0。"""
+    if not bg_a or not bg_b:
+        return 0.0
+    shared = len(bg_a & bg_b)
+    return shared / (len(bg_a) + len(bg_b) - shared)
+
+
 def _bigram_sim(a: str, b: str) -> float:
     """Jaccard bigram 相似度（0~1），用于标题去重。"""
-    a, b = (a or "").lower(), (b or "").lower()
-    if len(a) < 2 or len(b) < 2:
-        return 0.0
-    bg_a = {a[i:i + 2] for i in range(len(a) - 1)}
-    bg_b = {b[i:i + 2] for i in range(len(b) - 1)}
-    union = bg_a | bg_b
-    return len(bg_a & bg_b) / len(union) if union else 0.0
+    return _bigram_jaccard(_bigram_set(a), _bigram_set(b))
+
+
+def bigram_rank_order(bigram_sets) -> dict:
+    """按文档频率升序给 bigram 编号（越稀有越靠前），作为 BigramIndex 的全局排序。"""
+    freq: dict = {}
+    for bigrams in bigram_sets:
+        for token in bigrams:
+            freq[token] = freq.get(token, 0) + 1
+    return {token: rank for rank, token in enumerate(sorted(freq, key=lambda t: (freq[t], t)))}
+
+
+class BigramIndex:
+    """
+    Jaccard 相似度候选检索：前缀过滤倒排索引。
+
+    集合按全局排序（越稀有越靠前）取前缀登记/检索。Jaccard ≥ t 时两集合重叠至少
+    ⌈t·max(|x|,|y|)⌉ 个元素，二者的检索前缀 |x| - ⌈t·|x|⌉ + 1 必有交集——候选不会
+    漏掉，调用方再对候选做精确比较即可得到与两两比较完全相同的结果。
+    block 用于分桶（如 区域 × 日期段），只在同桶内检索。
+
+    自连接时若按集合大小升序“先检索、后登记”（add 传 ascending=True），已登记的
+    集合都不大于检索集合，登记前缀可缩短到 |y| - ⌈2t/(1+t)·|y|⌉ + 1（PPJoin）。
+
+    排序中未出现的 bigram 首次见到时分配更小（更稀有）的编号，且编号此后不变，
+    因此可以边检索边增量 add。
+    """
+
+    def __init__(self, threshold: float, order: dict | None = None):
+        self.threshold = threshold
+        self._order = dict(order or {})
+        self._next_unseen = 0
+        self._postings: dict = {}
+        self._last_sorted: tuple = (None, [])  # 同一集合先检索后登记时复用排序
+
+    def _prefix(self, bigrams: frozenset, overlap: float) -> list:
+        size = len(bigrams)
+        if not size:
+            return []
+        last, ranked = self._last_sorted
+        if last is not bigrams:
+            order = self._order
+            for token in bigrams:
+                if token not in order:
+                    self._next_unseen -= 1
+                    order[token] = self._next_unseen
+            ranked = sorted(bigrams, key=order.__getitem__)
+            self._last_sorted = (bigrams, ranked)
+        # 减去极小量：避免 0.55 * 20 = 11.000000000000002 向上取整成 12 而缩短前缀
+        keep = size - math.ceil(overlap * size - 1e-9) + 1
+        return ranked[:max(1, keep)]
+
+    def prefix(self, bigrams: frozenset) -> list:
+        """检索前缀：Jaccard ≥ threshold 的任意两集合在此前缀上必有交集。"""
+        return self._prefix(bigrams, self.threshold)
+
+    def add(self, key, bigrams: frozenset, block=None, ascending: bool = False) -> None:
+        t = self.threshold
+        tokens = self._prefix(bigrams, 2 * t / (1 + t)) if ascending else self.prefix(bigrams)
+        postings = self._postings.setdefault(block, {})
+        for token in tokens:
+            if token in postings:
+                postings[token].append(key)
+            else:
+                postings[token] = [key]
+
+    def candidates(self, bigrams: frozenset, blocks=(None,)) -> set:
+        """与 bigrams 可能达到阈值的已登记 key；blocks 为要检索的桶。"""
+        found: set = set()
+        tables = [self._postings[block] for block in blocks if block in self._postings]
+        if not tables:
+            return found
+        for token in self.prefix(bigrams):
+            for postings in tables:
+                if token in postings:
+                    found.update(postings[token])
+        return found
 
 
 def _pick_group_items(candidates: list, max_items: int) -> list:
@@ -326,3 +412,26 @@ MEDIA_SUFFIX_RE = re.compile(
     r"|Game Developer|Develop(?:er)?|MCV|Pocketgamer(?:\.biz)?|Pocket Gamer)\s*$",
     re.IGNORECASE,
 )
+
+
+# ── URL 规范化（转载 / 跟踪参数归一）──────────────────────────────────
+
+_TRACKING_PARAMS = {"fbclid", "gclid", "ocid", "cmpid", "ref", "mc_cid", "mc_eid", "guccounter"}
+
+
+def canonical_url(url: str) -> str:
+    """忽略协议、www./m. 前缀、跟踪参数、锚点、AMP 后缀与结尾斜杠后的 URL，用于识别同一页面。"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "m.", "amp."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    path = re.sub(r"/amp/?$|/+$", "", parts.path) or "/"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    return f"{host}{path}" + (f"?{urlencode(query)}" if query else "")